@@ -0,0 +1,120 @@
+#    ArachNURBS
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#    
+#    ArachNURBS is a library of functions and classes to manipulate NURBS
+#    curves, surfaces, and the associated control polygons and grids.
+#    ArachNURBS is built on top FreeCAD's standard NURBS functions.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+# package layout. each submodule is imported on first use, so a document only loads the submodules
+# of the object types it contains:
+#	kernels		direct functions, ControlGrid, shape cache, output commits. imported by all the others
+#	pose		SilkPose feature classes
+#	curves		control polygons, cubic curves, points on curves
+#	grids		control grids
+#	surfaces	cubic surfaces
+#	nstar		N sided star grids and surfaces
+#	legacy		feature classes no longer offered by the workbench, kept for the documents that use them
+#
+# ArachNURBS.name still works for every class, function and setting: feature classes are found through
+# feature_classes below, everything else in kernels. documents store a Proxy as ArachNURBS.<class name>,
+# so the feature classes keep 'ArachNURBS' as their __module__, and new documents store the same.
+# setting ArachNURBS.name (a setting such as default_tol, or a wrapped kernel) sets it in kernels and in
+# every loaded submodule that imported it.
+
+import sys
+import types
+import importlib
+
+submodules = ['kernels', 'pose', 'curves', 'grids', 'surfaces', 'nstar', 'legacy']	# kernels first
+
+feature_classes = {'pose': ['SilkPose_PR', 'SilkPose_3P'],
+				'curves': ['ControlPoly4_3L', 'ControlPoly4_2N', 'ControlPoly4_2P', 'ControlPoly4_FirstElement',
+						'ControlPoly6_5L', 'ControlPoly6_2N', 'ControlPoly6_FirstElement', 'CubicCurve_4', 'CubicCurve_6',
+						'ControlPoly6_FilletBezier', 'Point_onCurve', 'ControlPoly4_segment'],
+				'grids': ['ControlGrid44_4', 'ControlGrid44_3', 'ControlGrid44_3_Rotate', 'ControlGrid44_flow',
+						'ControlGrid66_4', 'ControlGrid64_4', 'ControlGrid44_EdgeSegment', 'ControlGrid44_2EdgeSegments',
+						'ControlGrid64_2Grid44', 'SubGrid33_2Grid64', 'ControlGrid66_4Sub', 'ControlGrid64_3_1Grid44',
+						'ControlGrid64_normal', 'ControlGrid64_Surf44'],
+				'surfaces': ['CubicSurface_44', 'CubicSurface_66', 'CubicSurface_64'],
+				'nstar': ['SubGrid63_2Surf64', 'ControlGridNStar66_NSub', 'CubicNStarSurface_NStar66', 'StarTrim_CubicNStar'],
+				'legacy': ['ControlGrid44_3_Rotate_OLD', 'ControlGrid64_3', 'ControlPoly6_Bezier', 'ControlGridNStar66_StarTrim']}
+
+# feature class name: submodule
+feature_modules = dict((name, submodule) for submodule, names in feature_classes.items() for name in names)
+
+def adopt(submodule, module):
+	# feature classes are saved and restored as ArachNURBS.<class name>
+	for name in feature_classes.get(submodule, []):
+		getattr(module, name).__module__ = __name__
+
+def load(submodule):
+	# the submodule, imported on first use
+	module = sys.modules.get(__name__ + '.' + submodule)
+	if module is None:
+		module = importlib.import_module(__name__ + '.' + submodule)
+		adopt(submodule, module)
+	return module
+
+def loaded():
+	# the submodules imported so far
+	return [sys.modules[__name__ + '.' + s] for s in submodules if __name__ + '.' + s in sys.modules]
+
+def load_all():
+	return [load(submodule) for submodule in submodules]
+
+def reload_all():
+	# reload the imported submodules, kernels first so the others import the new kernels
+	for submodule in submodules:
+		module = sys.modules.get(__name__ + '.' + submodule)
+		if module is not None:
+			importlib.reload(module)
+			adopt(submodule, module)
+
+def __getattr__(name):
+	if name.startswith('__'):
+		raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+	# ArachNURBS.<submodule> before it is imported
+	if name in submodules:
+		return load(name)
+	module = load(feature_modules.get(name, 'kernels'))
+	try:
+		return module.__dict__[name]
+	except KeyError:
+		raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+
+def __dir__():
+	names = set(globals()) | set(submodules) | set(feature_modules)
+	if __name__ + '.kernels' in sys.modules:
+		names = names | set(dir(sys.modules[__name__ + '.kernels']))
+	return sorted(names)
+
+class Package(types.ModuleType):
+	# module type of this package: writes to a submodule attribute go to the submodules, see the top of this file
+	def __setattr__(self, name, value):
+		if name.startswith('__') or name in submodules or name in self.__dict__:
+			types.ModuleType.__setattr__(self, name, value)
+		elif name in feature_modules:
+			setattr(load(feature_modules[name]), name, value)
+		elif name in load('kernels').__dict__:
+			for module in loaded():
+				if name in module.__dict__:
+					setattr(module, name, value)
+		else:
+			types.ModuleType.__setattr__(self, name, value)
+
+sys.modules[__name__].__class__ = Package
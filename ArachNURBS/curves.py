@@ -0,0 +1,1971 @@
+#    ArachNURBS.curves
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    ArachNURBS curves: control polygon, cubic curve, and point feature classes.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+from __future__ import division # allows floating point division from integers
+import Part
+import FreeCAD
+from .kernels import (Bezier_Cubic_curve, ControlGrid, G3_reports, NURBS_Cubic_6P_curve, blendG3_poly_2x4_1x6, blend_poly_2x4_1x6,
+					commit_poles_weights, commit_shape, commit_value, default_tol, equalVectors, orient_a_to_b, polyFromLineSet,
+					shape_cache)
+import SilkLog
+
+log = SilkLog.get('curves')
+
+### control polygons (+sketch to input)
+     
+
+class ControlPoly4_3L:	# made from a single sketch containing 3 line objects connected end to end
+	def __init__(self, obj , sketch):
+		FreeCAD.Console.PrintMessage("\nControlPoly4_3L class Init\n")
+
+		latest_version = "0.02" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		obj.addProperty("App::PropertyLink","Sketch","ControlPoly4_3L","reference Sketch").Sketch = sketch
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlPoly4_3L","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlPoly4_3L","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlPoly4_3L","Weights").Weights = [1.0,1.0,1.0,1.0]
+		obj.Proxy = self
+		'''
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Sketch","C1 - Inputs","reference Sketch").Sketch = sketch
+		obj.addProperty("App::PropertyFloatList","Weights","C1 - Inputs","Weights").Weights = [1.0,1.0,1.0,1.0]
+		obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 3 lines").tolerance = default_tol
+		obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_3L"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		latest_version = "0.02" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_Sketch = obj.Sketch
+			obj.removeProperty("Sketch")
+			old_Weights = obj.Weights
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+				obj.removeProperty("tolerance")
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+				obj.removeProperty("reverse")
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			# the internal name should not be changing. this will be used for a check.
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Sketch","C1 - Inputs","reference Sketch").Sketch = old_Sketch
+			obj.addProperty("App::PropertyFloatList","Weights","C1 - Inputs","Weights").Weights = old_Weights
+			obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 3 lines").tolerance = old_tolerance 
+			obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_3L"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+
+		# need to recompute otherwise the poles remain unpopulated?
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		if prop == "reverse":
+			fp.Weights = list(reversed(fp.Weights))
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# get all points on first three lines...error check later
+		p00s=fp.Sketch.Geometry[0].StartPoint
+		p01s=fp.Sketch.Geometry[0].EndPoint
+		p10s=fp.Sketch.Geometry[1].StartPoint
+		p11s=fp.Sketch.Geometry[1].EndPoint
+		p20s=fp.Sketch.Geometry[2].StartPoint
+		p21s=fp.Sketch.Geometry[2].EndPoint
+		# to world
+		mat=fp.Sketch.Placement.toMatrix()
+		p00=mat.multiply(p00s)
+		p01=mat.multiply(p01s)
+		p10=mat.multiply(p10s)
+		p11=mat.multiply(p11s)
+		p20=mat.multiply(p20s)
+		p21=mat.multiply(p21s)
+
+		lineset = [[p00,p01], [p10,p11], [p20,p21]]
+		poles = polyFromLineSet(lineset, fp.tolerance)
+		# print ("poles", poles)
+
+		if fp.reverse == False:
+			Poles = [poles[0], poles[1], poles[2], poles[3]]
+		else:
+			Poles = [poles[3], poles[2], poles[1], poles[0]]
+
+		if not commit_poles_weights(fp, Poles, fp.Weights):
+			return
+		# prepare the lines to draw the polyline
+		Leg0=Part.LineSegment(fp.Poles[0],fp.Poles[1])
+		Leg1=Part.LineSegment(fp.Poles[1],fp.Poles[2])
+		Leg2=Part.LineSegment(fp.Poles[2],fp.Poles[3])
+		#set the polygon legs property
+		fp.Legs=[Leg0, Leg1, Leg2]
+		# define the shape for visualization
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlPoly4_2N:	# made from 2 node sketches. each node sketch contains one line (tangent), 
+	# and one circle (endpoint) located at one end of the line.
+	def ControlPoly4_2N_Attributes(self, obj, sketch0, sketch1, weights, tolerance, reverse, object_version):
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Sketch0","C1 - Inputs","reference Sketch").Sketch0 = sketch0
+		obj.addProperty("App::PropertyLink","Sketch1","C1 - Inputs","reference Sketch").Sketch1 = sketch1
+		obj.addProperty("App::PropertyFloatList","Weights","C1 - Inputs","Weights").Weights = weights
+		obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the circle-line in each node").tolerance = tolerance
+		obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = reverse
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_2N"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = object_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+
+	def __init__(self, obj , sketch0, sketch1):
+		FreeCAD.Console.PrintMessage("\nControlPoly4_2N class Init\n")
+		
+		latest_version = "0.02" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		obj.addProperty("App::PropertyLink","Sketch0","ControlPoly4_2N","reference Sketch").Sketch0 = sketch0
+		obj.addProperty("App::PropertyLink","Sketch1","ControlPoly4_2N","reference Sketch").Sketch1 = sketch1
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlPoly4_2N","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlPoly4_2N","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlPoly4_2N","Weights").Weights = [1.0,1.0,1.0,1.0]
+		obj.Proxy = self
+		'''
+
+		self.ControlPoly4_2N_Attributes(obj, sketch0, sketch1, [1.0,1.0,1.0,1.0], default_tol, False, latest_version)
+
+		''' # before functionation of attribute creation
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Sketch0","C1 - Inputs","reference Sketch").Sketch0 = sketch0
+		obj.addProperty("App::PropertyLink","Sketch1","C1 - Inputs","reference Sketch").Sketch1 = sketch1
+		obj.addProperty("App::PropertyFloatList","Weights","C1 - Inputs","Weights").Weights = [1.0,1.0,1.0,1.0]
+		obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the circle-line in each node").tolerance = default_tol
+		obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_2N"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)'''
+
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		latest_version = "0.02" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_Sketch0 = obj.Sketch0
+			obj.removeProperty("Sketch0")
+			old_Sketch1 = obj.Sketch1
+			obj.removeProperty("Sketch1")
+			old_Weights = obj.Weights
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+				obj.removeProperty("tolerance")
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+				obj.removeProperty("reverse")
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			# the internal name should not be changing. this will be used for a check.
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			self.ControlPoly4_2N_Attributes(obj, old_Sketch0, old_Sketch1, old_Weights, old_tolerance, old_reverse, latest_version)
+
+			''' # before functionation of attribute creation
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Sketch0","C1 - Inputs","reference Sketch").Sketch0 = old_Sketch0
+			obj.addProperty("App::PropertyLink","Sketch1","C1 - Inputs","reference Sketch").Sketch1 = old_Sketch1
+			obj.addProperty("App::PropertyFloatList","Weights","C1 - Inputs","Weights").Weights = old_Weights
+			obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 3 lines").tolerance = old_tolerance 
+			obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_2N"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+			'''
+
+		# need to recompute otherwise the poles remain unpopulated?
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		if prop == "reverse":
+			fp.Weights = list(reversed(fp.Weights))
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# process Sketch0
+		obj00=fp.Sketch0.Geometry[0]
+		obj01=fp.Sketch0.Geometry[1]
+		if obj00.__class__==Part.Circle:
+			cir0=obj00
+		if obj01.__class__==Part.Circle:
+			cir0=obj01
+		if obj00.__class__==Part.LineSegment:
+			lin0=obj00
+		if obj01.__class__==Part.LineSegment:
+			lin0=obj01
+		p00s=cir0.Center
+		if equalVectors(lin0.StartPoint, p00s, fp.tolerance):
+			p01s=lin0.EndPoint
+		elif equalVectors(lin0.EndPoint, p00s, fp.tolerance):
+			p01s=lin0.StartPoint
+		else:
+			log.warning("%s : in the first sketch, no point on the line connects to the circle center at the current tolerance", fp.Label)
+
+		# to world
+		mat0=fp.Sketch0.Placement.toMatrix()
+		p00=mat0.multiply(p00s)
+		p01=mat0.multiply(p01s)
+		# process Sketch1
+		obj10=fp.Sketch1.Geometry[0]
+		obj11=fp.Sketch1.Geometry[1]
+		if obj10.__class__==Part.Circle:
+			cir1=obj10
+		if obj11.__class__==Part.Circle:
+			cir1=obj11
+		if obj10.__class__==Part.LineSegment:
+			lin1=obj10
+		if obj11.__class__==Part.LineSegment:
+			lin1=obj11
+		p11s=cir1.Center
+		if equalVectors(lin1.StartPoint, p11s, fp.tolerance):
+			p10s=lin1.EndPoint
+		elif equalVectors(lin1.EndPoint, p11s, fp.tolerance):
+			p10s=lin1.StartPoint
+		else:
+			log.warning("%s : in the second sketch, no point on the line connects to the circle center at the current tolerance", fp.Label)
+
+		# to world
+		mat1=fp.Sketch1.Placement.toMatrix()
+		p10=mat1.multiply(p10s)
+		p11=mat1.multiply(p11s)
+		# set the poles
+		if fp.reverse == False:
+			Poles=[p00,p01,p10,p11]
+		else:
+			Poles=[p11,p10,p01,p00]
+		if not commit_poles_weights(fp, Poles, fp.Weights):
+			return
+		# prepare the polygon
+		Leg0=Part.LineSegment(p00,p01)
+		Leg1=Part.LineSegment(p01,p10)
+		Leg2=Part.LineSegment(p10,p11)
+		#set the polygon legs property
+		fp.Legs=[Leg0, Leg1, Leg2]
+		# define the shape for visualization
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlPoly4_2P:	# made from 2 pointOnCurve objects 
+	def ControlPoly4_2P_Attributes(self, obj, 
+									point0, point1, 
+									scale0, scale1, 
+									scale0_abs, scale1_abs,
+									weights, 
+									tolerance, 
+									reverse, 
+									object_version):
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Point0","C1 - Inputs","first reference pointOnCurve object").Point0 = point0
+		obj.addProperty("App::PropertyLink","Point1","C1 - Inputs","second reference pointOnCurve object").Point1 = point1
+		obj.addProperty("App::PropertyFloat","Scale0","C1 - Inputs","Scale start tangent (sum with Scale1 should be less than 3.0 or total length)").Scale0 = scale0
+		obj.addProperty("App::PropertyBool","Scale0_abs","C1 - Inputs","start tangent scale type (False=relative, True=absolute)").Scale0_abs = scale0_abs
+		obj.addProperty("App::PropertyFloat","Scale1","C1 - Inputs","Scale end tangent (sum with Scale0 should be less than 3.0 or total length)").Scale1 = scale1
+		obj.addProperty("App::PropertyBool","Scale1_abs","C1 - Inputs","end tangent scale type (False=relative, True=absolute)").Scale1_abs = scale1_abs
+		obj.addProperty("App::PropertyFloatList","Weights","C1 - Inputs","Weights").Weights = weights
+		obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","no current applcation").tolerance = tolerance
+		obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = reverse
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_2P"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = object_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+
+	def __init__(self, obj , point0, point1):
+		FreeCAD.Console.PrintMessage("\nControlPoly4_2P class Init\n")
+		latest_version = "0.00" # must match in onDocumentRestored()
+		self.ControlPoly4_2P_Attributes(obj, 
+								  		point0, point1, 
+										1.0, 1.0, 
+										False, False,
+										[1.0,1.0,1.0,1.0], 
+										default_tol, 
+										False, 
+										latest_version)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		latest_version = "0.00" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+		if update:
+			#capture, then delete original attribute set values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_Point0 = obj.Point0
+			obj.removeProperty("Point0")
+			old_Point1 = obj.Point1
+			obj.removeProperty("Point1")
+			old_Scale0 = obj.Scale0
+			obj.removeProperty("Scale0")
+			old_Scale0_abs = obj.Scale0_abs
+			obj.removeProperty("Scale0_abs")
+			old_Scale1 = obj.Scale1
+			obj.removeProperty("Scale1")
+			old_Scale1_abs = obj.Scale1_abs
+			obj.removeProperty("Scale1_abs")
+			old_Weights = obj.Weights
+			obj.removeProperty("Weights")
+			old_tolerance = obj.tolerance
+			obj.removeProperty("tolerance") 
+			old_reverse = obj.reverse
+			obj.removeProperty("reverse")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+			obj.removeProperty("object_type")
+			obj.removeProperty("object_version")
+			#capturing, then deleting attributes not part of the original set will require testing for their presence
+			self.ControlPoly4_2N_Attributes(obj, 
+								   			old_Point0, old_Point1, 
+											old_Scale0, old_Scale1, 
+											old_Scale0_abs, old_Scale1_abs,
+											old_Weights, 
+											old_tolerance, 
+											old_reverse, 
+											latest_version)
+		# need to recompute otherwise the poles remain unpopulated?
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		if prop == "reverse":
+			fp.Weights = list(reversed(fp.Weights))
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# process Points
+		p0=fp.Point0.Position
+		p3=fp.Point1.Position
+
+		p03 = p3-p0
+		p30 = p0-p3
+
+		if fp.Scale0_abs == True:
+			p03.normalize()
+		if fp.Scale1_abs == True:
+			p30.normalize()
+
+		p1 = p0+p03*(fp.Scale0 /3.0)
+		p2 = p3+p30*(fp.Scale1 /3.0)
+
+
+		# set the poles
+		if fp.reverse == False:
+			Poles=[p0,p1,p2,p3]
+		else:
+			Poles=[p3,p2,p1,p0]
+		if not commit_poles_weights(fp, Poles, fp.Weights):
+			return
+		# prepare the polygon
+		Leg0=Part.LineSegment(p0,p1)
+		Leg1=Part.LineSegment(p1,p2)
+		Leg2=Part.LineSegment(p2,p3)
+		#set the polygon legs property
+		fp.Legs=[Leg0, Leg1, Leg2]
+		# define the shape for visualization
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlPoly4_FirstElement:	# made from the first element of a single sketch. tested for straight line, circular arc (less than 90 degrees), and elliptic arc. the number of elements in the sketch should not be 3.
+	def __init__(self, obj , sketch):
+		
+		latest_version = "0.02" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlPoly4_FirstElement class Init\n")
+		obj.addProperty("App::PropertyLink","Sketch","ControlPoly4_FirstElement","reference Sketch").Sketch = sketch
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlPoly4_FirstElement","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlPoly4_FirstElement","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlPoly4_FirstElement","Weights").Weights = [1.0,1.0,1.0,1.0]
+		obj.Proxy = self
+		'''
+
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Sketch","C1 - Inputs","reference Sketch").Sketch = sketch
+		obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 3 lines").tolerance = default_tol
+		obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights = [1.0,1.0,1.0,1.0]
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_FirstElement"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+	
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		latest_version = "0.02" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_Sketch = obj.Sketch
+			obj.removeProperty("Sketch")
+			old_Weights = obj.Weights
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+				obj.removeProperty("tolerance")
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+				obj.removeProperty("reverse")
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			# the internal name should not be changing. this will be used for a check.
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Sketch","C1 - Inputs","reference Sketch").Sketch = old_Sketch
+			obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 3 lines").tolerance = old_tolerance 
+			obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights = old_Weights
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_FirstElement"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		if prop == "reverse":
+			fp.Weights = list(reversed(fp.Weights))
+	
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# process the sketch...error check later
+		ElemNurbs=fp.Sketch.Shape.Edges[0].toNurbs().Edge1.Curve
+		ElemNurbs.increaseDegree(3)
+		p0=ElemNurbs.getPole(1)
+		p1=ElemNurbs.getPole(2)
+		p2=ElemNurbs.getPole(3)
+		p3=ElemNurbs.getPole(4)
+		# already to world?
+		#mat=fp.Sketch.Placement.toMatrix()
+		#p0=mat.multiply(p0s)
+		#p1=mat.multiply(p1s)
+		#p2=mat.multiply(p2s)
+		#p3=mat.multiply(p3s)
+
+		if fp.reverse == False:
+			Poles = [p0, p1, p2, p3]
+		else:
+			Poles = [p3, p2, p1, p0]
+		# set the weights
+		Weights = ElemNurbs.getWeights()
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		# prepare the lines to draw the polygon
+		Leg0=Part.LineSegment(p0,p1)
+		Leg1=Part.LineSegment(p1,p2)
+		Leg2=Part.LineSegment(p2,p3)
+		#set the polygon legs property
+		fp.Legs=[Leg0, Leg1, Leg2]
+		# define the shape for visualization
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlPoly6_5L:	# made from a single sketch containing 5 line objects connected end to end
+	def __init__(self, obj , sketch):
+		FreeCAD.Console.PrintMessage("\nControlPoly6_5L class Init\n")
+
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		obj.addProperty("App::PropertyLink","Sketch","ControlPoly4_3L","reference Sketch").Sketch = sketch
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlPoly4_3L","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlPoly4_3L","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlPoly4_3L","Weights").Weights = [1.0,1.0,1.0,1.0,1.0,1.0]
+		obj.Proxy = self
+		'''
+
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Sketch","C1 - Inputs","reference Sketch").Sketch = sketch
+		obj.addProperty("App::PropertyFloatList","Weights","C1 - Inputs","Weights").Weights = [1.0,1.0,1.0,1.0,1.0,1.0]
+		obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 3 lines").tolerance = default_tol
+		obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly6_5L"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_Sketch = obj.Sketch
+			obj.removeProperty("Sketch")
+			old_Weights = obj.Weights
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+				obj.removeProperty("tolerance")
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+				obj.removeProperty("reverse")
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			# the internal name should not be changing. this will be used for a check.
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Sketch","C1 - Inputs","reference Sketch").Sketch = old_Sketch
+			obj.addProperty("App::PropertyFloatList","Weights","C1 - Inputs","Weights").Weights = old_Weights
+			obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 3 lines").tolerance = old_tolerance 
+			obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly6_5L"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+	
+	def onChanged(self, fp, prop):
+		if prop == "reverse":
+			fp.Weights = list(reversed(fp.Weights))
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# get all points
+		p00s=fp.Sketch.Geometry[0].StartPoint
+		p01s=fp.Sketch.Geometry[0].EndPoint
+		p10s=fp.Sketch.Geometry[1].StartPoint
+		p11s=fp.Sketch.Geometry[1].EndPoint
+		p20s=fp.Sketch.Geometry[2].StartPoint
+		p21s=fp.Sketch.Geometry[2].EndPoint
+		p30s=fp.Sketch.Geometry[3].StartPoint
+		p31s=fp.Sketch.Geometry[3].EndPoint
+		p40s=fp.Sketch.Geometry[4].StartPoint
+		p41s=fp.Sketch.Geometry[4].EndPoint
+		# to world
+		mat=fp.Sketch.Placement.toMatrix()
+		p00=mat.multiply(p00s)
+		p01=mat.multiply(p01s)
+		p10=mat.multiply(p10s)
+		p11=mat.multiply(p11s)
+		p20=mat.multiply(p20s)
+		p21=mat.multiply(p21s)
+		p30=mat.multiply(p30s)
+		p31=mat.multiply(p31s)
+		p40=mat.multiply(p40s)
+		p41=mat.multiply(p41s)
+		
+		lineset = [[p00,p01], [p10,p11], [p20,p21], [p30,p31], [p40,p41]]
+		poles = polyFromLineSet(lineset, fp.tolerance)
+		# print ("poles", poles)
+
+		if fp.reverse == False:
+			Poles = [poles[0], poles[1], poles[2], poles[3], poles[4], poles[5]]
+		else:
+			Poles = [poles[5], poles[4], poles[3], poles[2], poles[1], poles[0]]
+
+		if not commit_poles_weights(fp, Poles, fp.Weights):
+			return
+		# prepare the lines to draw the polygon
+		Leg0=Part.LineSegment(fp.Poles[0],fp.Poles[1])
+		Leg1=Part.LineSegment(fp.Poles[1],fp.Poles[2])
+		Leg2=Part.LineSegment(fp.Poles[2],fp.Poles[3])
+		Leg3=Part.LineSegment(fp.Poles[3],fp.Poles[4])
+		Leg4=Part.LineSegment(fp.Poles[4],fp.Poles[5])
+	
+		#set the polygon legs property
+		fp.Legs=[Leg0, Leg1, Leg2, Leg3, Leg4]
+		# define the shape for visualization
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlPoly6_2N:	# made from 2 node sketches. each node sketch contain 2 lines, and one circle.
+	def __init__(self, obj , sketch0, sketch1):
+		FreeCAD.Console.PrintMessage("\nControlPoly6_2N class Init\n")
+
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		obj.addProperty("App::PropertyLink","Sketch0","ControlPoly6_2N","reference Sketch").Sketch0 = sketch0
+		obj.addProperty("App::PropertyLink","Sketch1","ControlPoly6_2N","reference Sketch").Sketch1 = sketch1
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlPoly6_2N","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlPoly6_2N","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlPoly6_2N","Weights").Weights = [1.0,1.0,1.0,1.0,1.0,1.0]
+		obj.Proxy = self
+		'''
+
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Sketch0","C1 - Inputs","reference Sketch").Sketch0 = sketch0
+		obj.addProperty("App::PropertyLink","Sketch1","C1 - Inputs","reference Sketch").Sketch1 = sketch1
+		obj.addProperty("App::PropertyFloatList","Weights","C1 - Inputs","Weights").Weights = [1.0,1.0,1.0,1.0,1.0,1.0]
+		obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the circle-line in each node").tolerance = default_tol
+		obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly6_2N"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_Sketch0 = obj.Sketch0
+			obj.removeProperty("Sketch0")
+			old_Sketch1 = obj.Sketch1
+			obj.removeProperty("Sketch1")
+			old_Weights = obj.Weights
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+				obj.removeProperty("tolerance")
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+				obj.removeProperty("reverse")
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			# the internal name should not be changing. this will be used for a check.
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Sketch0","C1 - Inputs","reference Sketch").Sketch0 = old_Sketch0
+			obj.addProperty("App::PropertyLink","Sketch1","C1 - Inputs","reference Sketch").Sketch1 = old_Sketch1
+			obj.addProperty("App::PropertyFloatList","Weights","C1 - Inputs","Weights").Weights = old_Weights
+			obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 3 lines").tolerance = old_tolerance 
+			obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_3L"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		if prop == "reverse":
+			fp.Weights = list(reversed(fp.Weights))
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# process Sketch0
+		obj = [0,0,0]
+		obj[0]=fp.Sketch0.Geometry[0]
+		obj[1]=fp.Sketch0.Geometry[1]
+		obj[2]=fp.Sketch0.Geometry[2]
+		# find the circle
+		if obj[0].__class__==Part.Circle:
+			cir0=obj[0]
+			lin1=obj[1]
+			lin2=obj[2]
+		if obj[1].__class__==Part.Circle:
+			cir0=obj[1]
+			lin1=obj[0]
+			lin2=obj[2]
+		if obj[2].__class__==Part.Circle:
+			cir0=obj[2]
+			lin1=obj[0]
+			lin2=obj[1]
+		p00s=cir0.Center
+		lin10s = lin1.StartPoint
+		lin11s = lin1.EndPoint
+		lin20s = lin2.StartPoint
+		lin21s = lin2.EndPoint
+		# to world
+		mat0=fp.Sketch0.Placement.toMatrix()
+		p00=mat0.multiply(p00s)
+		lin10=mat0.multiply(lin10s)
+		lin11=mat0.multiply(lin11s)
+		lin20=mat0.multiply(lin20s)
+		lin21=mat0.multiply(lin21s)
+		if equalVectors(p00, lin10, fp.tolerance):
+			p01 = lin11
+			l1 = 1
+		elif equalVectors(p00, lin11, fp.tolerance):
+			p01 = lin10
+			l1 = 1
+		elif equalVectors(p00, lin20, fp.tolerance):
+			p01 = lin21
+			l1 = 2
+		elif equalVectors(p00, lin21, fp.tolerance):
+			p01 = lin20
+			l1 = 2
+		else:
+			log.warning("no connection found between the circle center and a line endpoint at the current tolerance")
+		if l1 == 1:
+			if equalVectors(p01, lin20, fp.tolerance):
+				p02 = lin21
+			if equalVectors(p01, lin21, fp.tolerance):
+				p02 = lin20
+		elif l1 == 2:
+			if equalVectors(p01, lin10, fp.tolerance):
+				p02 = lin11
+			if equalVectors(p01, lin11, fp.tolerance):
+				p02 = lin10
+		else:
+			log.warning("no connection found between the two lines at the current tolerance")
+
+		# process Sketch1
+		obj = [0,0,0]
+		obj[0]=fp.Sketch1.Geometry[0]
+		obj[1]=fp.Sketch1.Geometry[1]
+		obj[2]=fp.Sketch1.Geometry[2]
+		# find the circle
+		if obj[0].__class__==Part.Circle:
+			cir0=obj[0]
+			lin1=obj[1]
+			lin2=obj[2]
+		if obj[1].__class__==Part.Circle:
+			cir0=obj[1]
+			lin1=obj[0]
+			lin2=obj[2]
+		if obj[2].__class__==Part.Circle:
+			cir0=obj[2]
+			lin1=obj[0]
+			lin2=obj[1]
+		p05s=cir0.Center
+		lin10s = lin1.StartPoint
+		lin11s = lin1.EndPoint
+		lin20s = lin2.StartPoint
+		lin21s = lin2.EndPoint
+		# to world
+		mat1=fp.Sketch1.Placement.toMatrix()
+		p05=mat1.multiply(p05s)
+		lin10=mat1.multiply(lin10s)
+		lin11=mat1.multiply(lin11s)
+		lin20=mat1.multiply(lin20s)
+		lin21=mat1.multiply(lin21s)
+		if equalVectors(p05, lin10, fp.tolerance):
+			p04 = lin11
+			l1 = 1
+		elif equalVectors(p05, lin11, fp.tolerance):
+			p04 = lin10
+			l1 = 1
+		elif equalVectors(p05, lin20, fp.tolerance):
+			p04 = lin21
+			l1 = 2
+		elif equalVectors(p05, lin21, fp.tolerance):
+			p04 = lin20
+			l1 = 2
+		else:
+			log.warning("no connection found between the circle center and a line endpoint at the current tolerance")
+		if l1 == 1:
+			if equalVectors(p04, lin20, fp.tolerance):
+				p03 = lin21
+			if equalVectors(p04, lin21, fp.tolerance):
+				p03 = lin20
+		elif l1 == 2:
+			if equalVectors(p04, lin10, fp.tolerance):
+				p03 = lin11
+			if equalVectors(p04, lin11, fp.tolerance):
+				p03 = lin10
+		else:
+			log.warning("no connection found between the two lines at the current tolerance")
+
+		# set the poles
+		if fp.reverse == False:
+			Poles=[p00,p01,p02,p03,p04,p05]
+		else:
+			Poles=[p05,p04,p03,p02,p01,p00]
+		if not commit_poles_weights(fp, Poles, fp.Weights):
+			return
+		# prepare the polygon
+		Leg0=Part.LineSegment(p00,p01)
+		Leg1=Part.LineSegment(p01,p02)
+		Leg2=Part.LineSegment(p02,p03)
+		Leg3=Part.LineSegment(p03,p04)
+		Leg4=Part.LineSegment(p04,p05)
+		#set the polygon legs property
+		fp.Legs=[Leg0, Leg1, Leg2, Leg3, Leg4]
+		# define the shape for visualization
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlPoly6_FirstElement:	# made from the first element of a single sketch
+	def __init__(self, obj , sketch):
+		
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlPoly6_FirstElement class Init\n")
+		obj.addProperty("App::PropertyLink","Sketch","ControlPoly6_FirstElement","reference Sketch").Sketch = sketch
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlPoly6_FirstElement","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlPoly6_FirstElement","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlPoly6_FirstElement","Weights").Weights = [1.0,1.0,1.0,1.0]
+		obj.Proxy = self
+		'''
+
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Sketch","C1 - Inputs","reference Sketch").Sketch = sketch
+		obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 3 lines").tolerance = default_tol
+		obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights = [1.0,1.0,1.0,1.0,1.0,1.0]
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly6_FirstElement"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_Sketch = obj.Sketch
+			obj.removeProperty("Sketch")
+			old_Weights = obj.Weights
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+				obj.removeProperty("tolerance")
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+				obj.removeProperty("reverse")
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			# the internal name should not be changing. this will be used for a check.
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Sketch","C1 - Inputs","reference Sketch").Sketch = old_Sketch
+			obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 3 lines").tolerance = old_tolerance 
+			obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights = old_Weights
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly6_FirstElement"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+
+		# need to recompute otherwise the poles remain unpopulated?
+		obj.recompute()
+	
+	def onChanged(self, fp, prop):
+		if prop == "reverse":
+			fp.recompute()
+	
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		# process the sketch element...error check later
+		ElemNurbs=fp.Sketch.Shape.Edges[0].toNurbs().Edge1.Curve
+		ElemNurbs.increaseDegree(3)
+		start=ElemNurbs.FirstParameter
+		end=ElemNurbs.LastParameter
+		knot1=start+(end-start)/3.0
+		knot2=end-(end-start)/3.0
+		ElemNurbs.insertKnot(knot1)
+		ElemNurbs.insertKnot(knot2)
+		p00=ElemNurbs.getPole(1)
+		p01=ElemNurbs.getPole(2)
+		p02=ElemNurbs.getPole(3)
+		p03=ElemNurbs.getPole(4)
+		p04=ElemNurbs.getPole(5)
+		p05=ElemNurbs.getPole(6)
+		
+		# set the poles and weights
+		if fp.reverse == False:
+			Poles=[p00,p01,p02,p03,p04,p05]
+			Weights = ElemNurbs.getWeights()
+		else:
+			Poles=[p05,p04,p03,p02,p01,p00]
+			Weights = list(reversed(ElemNurbs.getWeights()))		
+			
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		# prepare the lines to draw the polyline
+		Leg0=Part.LineSegment(p00,p01)
+		Leg1=Part.LineSegment(p01,p02)
+		Leg2=Part.LineSegment(p02,p03)
+		Leg3=Part.LineSegment(p03,p04)
+		Leg4=Part.LineSegment(p04,p05)
+		#set the polygon legs property
+		fp.Legs=[Leg0, Leg1, Leg2, Leg3, Leg4]
+		# define the shape for visualization
+		fp.Shape = Part.Shape(fp.Legs)
+
+### NURBS curves (+poly to input)
+
+
+class CubicCurve_4:
+	def __init__(self, obj , poly):
+		
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nCubicCurve_4 class Init\n")
+		obj.addProperty("App::PropertyLink","Poly","CubicCurve_4","control polygon").Poly = poly
+		obj.Proxy = self
+		'''
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Poly","C1 - Inputs","control polygon").Poly = poly
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "CubicCurve_4"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_poly = obj.Poly
+			obj.removeProperty("Poly")
+			
+			#capturing, then deleting versioned attributes will require testing for their presence
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Poly","C1 - Inputs","control polygon").Poly = old_poly
+			obj.addProperty("App::PropertyBool","reverse",
+							"C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", 
+							"C3 - Identifiers", "the workbench class used to create this object").object_type = "CubicCurve_4"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", 
+							"C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", 
+							"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		
+		Poly = ControlGrid.from_object(fp.Poly)
+		# reuse the shape if this exact poly was built before
+		key = shape_cache.key('CubicCurve_4', Poly, fp.reverse)
+		shape = shape_cache.get(key)
+		if shape is None:
+			# get the poles list from the poly. legacy shape function wants 'homogeneous' coords as [[x,y,z],w]
+			WeightedPoles=[[Poly.Poles[0],Poly.Weights[0]],
+					[Poly.Poles[1],Poly.Weights[1]],
+					[Poly.Poles[2],Poly.Weights[2]],
+					[Poly.Poles[3],Poly.Weights[3]]]
+			if fp.reverse == True:
+				WeightedPoles = WeightedPoles[::-1]
+
+			# the legacy function below sets the degree and knot vector
+			shape = Bezier_Cubic_curve(WeightedPoles).toShape()
+			shape_cache.put(key, shape)
+		commit_shape(fp, shape)
+
+class CubicCurve_6:
+	def __init__(self, obj , poly):
+		
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nCubicCurve_6 class Init\n")
+		obj.addProperty("App::PropertyLink","Poly","CubicCurve_6","control polygon").Poly = poly
+		obj.Proxy = self
+		'''
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Poly","C1 - Inputs","control polygon").Poly = poly
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "CubicCurve_6"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_poly = obj.Poly
+			obj.removeProperty("Poly")
+			
+			#capturing, then deleting versioned attributes will require testing for their presence
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Poly","C1 - Inputs","control polygon").Poly = old_poly
+			obj.addProperty("App::PropertyBool","reverse",
+							"C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", 
+							"C3 - Identifiers", "the workbench class used to create this object").object_type = "CubicCurve_6"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", 
+							"C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", 
+							"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		
+		Poly = ControlGrid.from_object(fp.Poly)
+		# reuse the shape if this exact poly was built before
+		key = shape_cache.key('CubicCurve_6', Poly, fp.reverse)
+		shape = shape_cache.get(key)
+		if shape is None:
+			# get the poles list from the poly. legacy shape function wants 'homogeneous' coords as [[x,y,z],w]
+			WeightedPoles=[[Poly.Poles[0],Poly.Weights[0]],
+					[Poly.Poles[1],Poly.Weights[1]],
+					[Poly.Poles[2],Poly.Weights[2]],
+					[Poly.Poles[3],Poly.Weights[3]],
+					[Poly.Poles[4],Poly.Weights[4]],
+					[Poly.Poles[5],Poly.Weights[5]]]
+			if fp.reverse == True:
+				WeightedPoles = WeightedPoles[::-1]
+
+			# the legacy function below sets the degree and knot vector
+			shape = NURBS_Cubic_6P_curve(WeightedPoles).toShape()
+			shape_cache.put(key, shape)
+		commit_shape(fp, shape)
+
+### curve derived objects (+curve to input)
+
+class ControlPoly6_FilletBezier:
+	def __init__(self, obj , cubiccurve4_0, cubiccurve4_1):
+		''' Add the properties '''
+
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlPoly6_FilletBezier class Init\n")
+		obj.addProperty("App::PropertyLink","CubicCurve4_0","ControlPoly6_FilletBezier","First reference Bezier Curve").CubicCurve4_0 = cubiccurve4_0
+		obj.addProperty("App::PropertyLink","CubicCurve4_1","ControlPoly6_FilletBezier","Second reference Bezier Curve").CubicCurve4_1 = cubiccurve4_1
+		obj.addProperty("App::PropertyFloat","Scale_0","ControlPoly6_FilletBezier","First curve tangent scaling").Scale_0 = 2.0
+		obj.addProperty("App::PropertyFloat","Scale_3","ControlPoly6_FilletBezier","Second curve tangent scaling READ ONLY").Scale_3 = 2.0
+		obj.addProperty("App::PropertyFloat","Scale_1","ControlPoly6_FilletBezier","First curve inner scaling READ ONLY").Scale_1 = 2.0
+		obj.setEditorMode("Scale_1", 0)
+		obj.addProperty("App::PropertyFloat","Scale_2","ControlPoly6_FilletBezier","Second curve inner scaling").Scale_2 = 2.0
+		obj.setEditorMode("Scale_2", 0)
+		obj.addProperty("App::PropertyInteger", "autoG3", "ControlPoly6_FilletBezier", "Try to set G3 to the input polys").autoG3 = 0
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlPoly6_FilletBezier","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlPoly6_FilletBezier","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlPoly6_FilletBezier","Weights").Weights = [1.0,1.0,1.0,1.0]
+		obj.Proxy = self
+		'''
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","CubicCurve4_0",
+				  		"C1 - Inputs","First reference Bezier Curve").CubicCurve4_0 = cubiccurve4_0
+		obj.addProperty("App::PropertyLink","CubicCurve4_1",
+				  		"C1 - Inputs","Second reference Bezier Curve").CubicCurve4_1 = cubiccurve4_1
+		obj.addProperty("App::PropertyFloat","Scale_0",
+				  		"C1 - Inputs","First curve tangent scaling").Scale_0 = 2.0
+		obj.addProperty("App::PropertyFloat","Scale_3",
+				  		"C1 - Inputs","Second curve tangent scaling").Scale_3 = 2.0
+		obj.addProperty("App::PropertyFloat","Scale_1",
+				  		"C1 - Inputs","First curve inner scaling").Scale_1 = 2.0
+		obj.addProperty("App::PropertyFloat","Scale_2",
+				  		"C1 - Inputs","Second curve inner scaling").Scale_2 = 2.0
+		obj.addProperty("App::PropertyInteger", "autoG3", 
+				  		"C1 - Inputs", "Try to set G3 to the input polys").autoG3 = 0
+		obj.addProperty("App::PropertyFloat","tolerance",
+				  		"C1 - Inputs","point-to-point connection tolerance for the curves (corner to blend)").tolerance = default_tol
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly6_FilletBezier"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		# G3 solver state saved on the proxy by earlier versions, now kept in G3_reports
+		self.__dict__.pop("G3_report", None)
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_cubiccurve4_0 = obj.CubicCurve4_0
+			obj.removeProperty("CubicCurve4_0")
+			old_cubiccurve4_1 = obj.CubicCurve4_1
+			obj.removeProperty("CubicCurve4_1")
+			old_scale_0 = obj.Scale_0
+			obj.removeProperty("Scale_0")
+			old_scale_1 = obj.Scale_1
+			obj.removeProperty("Scale_1")
+			old_scale_2 = obj.Scale_2
+			obj.removeProperty("Scale_2")
+			old_scale_3 = obj.Scale_3
+			obj.removeProperty("Scale_3")
+			old_autog3 = obj.autoG3
+			obj.removeProperty("autoG3")
+			
+
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","CubicCurve4_0",
+							"C1 - Inputs","First reference Bezier Curve").CubicCurve4_0 = old_cubiccurve4_0
+			obj.addProperty("App::PropertyLink","CubicCurve4_1",
+							"C1 - Inputs","Second reference Bezier Curve").CubicCurve4_1 = old_cubiccurve4_1
+			obj.addProperty("App::PropertyFloat","Scale_0",
+							"C1 - Inputs","First curve tangent scaling").Scale_0 = old_scale_0
+			obj.addProperty("App::PropertyFloat","Scale_3",
+							"C1 - Inputs","Second curve tangent scaling").Scale_3 = old_scale_3
+			obj.addProperty("App::PropertyFloat","Scale_1",
+							"C1 - Inputs","First curve inner scaling").Scale_1 = old_scale_1
+			obj.addProperty("App::PropertyFloat","Scale_2",
+							"C1 - Inputs","Second curve inner scaling").Scale_2 = old_scale_2
+			obj.addProperty("App::PropertyInteger", "autoG3", 
+							"C1 - Inputs", "Try to set G3 to the input polys").autoG3 = old_autog3
+			obj.addProperty("App::PropertyFloat","tolerance",
+							"C1 - Inputs","point-to-point connection tolerance for the curves (at the corner to blend)").tolerance = old_tolerance
+			obj.addProperty("App::PropertyBool","reverse",
+							"C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", 
+							"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly6_FilletBezier"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", 
+							"C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", 
+							"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+			obj.setEditorMode("internalName", 1)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		
+		if fp.reverse == False:
+			poles_0 = fp.CubicCurve4_0.Poly.Poles
+			poles_1 = fp.CubicCurve4_1.Poly.Poles
+			weights_0 = fp.CubicCurve4_0.Poly.Weights
+			weights_1 = fp.CubicCurve4_1.Poly.Weights
+
+			scale_0 = fp.Scale_0 # to first curve
+			scale_1 = fp.Scale_1 # to first curve
+			scale_2 = fp.Scale_2 # to second curve
+			scale_3 = fp.Scale_3 # to second curve
+
+		else:
+			poles_0 = fp.CubicCurve4_1.Poly.Poles # start from second curve
+			poles_1 = fp.CubicCurve4_0.Poly.Poles # go to first curve
+			weights_0 = fp.CubicCurve4_1.Poly.Weights # start from second curve
+			weights_1 = fp.CubicCurve4_0.Poly.Weights # go to first curve
+
+			# scales should be fixed to geometry
+			scale_0 = fp.Scale_3 # to second curve
+			scale_1 = fp.Scale_2 # to second curve
+			scale_2 = fp.Scale_1 # to first curve
+			scale_3 = fp.Scale_0 # to first curve
+
+		# orient first curve to end at shared corner
+		blend_0 = orient_a_to_b(poles_0,poles_1,fp.tolerance)
+		# orient a temp copy of the second curve to end at shared corner
+		blend_1_flip = orient_a_to_b(poles_1,poles_0,fp.tolerance)
+		# reverse this second curve so it starts at shared corner
+		blend_1 = blend_1_flip[::-1]
+
+		escape_malformed_corner = 0
+		if (blend_0 == 0):
+			message = "first and second selected polys do not share endpoints at the current tolerance - no corner to blend/fillet is recognized"
+			escape_malformed_corner = 1
+		
+		if (escape_malformed_corner == 1):
+			log.warning("%s, labeled %s\n%s\nthe object is created in the document, but awaits resolution of endpoint matching. inspect the sketches that define the Controlpoly4 objects that define the curves. prioritize coincident constraints for the endpoints. do not trust a point on object constraint to result in theoretical point matching", fp.Name, fp.Label, message)
+			fake_name_to_trigger_error = please_read_message_above
+			return
+
+		# reverse weights to match the output of the orientations
+		if blend_0[0] != poles_0[0] and blend_0[0] == poles_0[-1]:
+			weights_0=weights_0[::-1]
+		if blend_1[0] != poles_1[0] and blend_1[0] == poles_1[-1]:
+			weights_1=weights_1[::-1]
+
+		if fp.autoG3 == 0:
+			blend = blend_poly_2x4_1x6(blend_0, weights_0, blend_1, weights_1, scale_0, scale_1, scale_2, scale_3)		
+		
+		if fp.autoG3 == 1:
+			# warm start from the inner scales of the previous solve (stored in Scale_1/Scale_2), if it converged
+			G3_report = G3_reports.get((fp.Document.Name, fp.Name))
+			warm_start = G3_report is not None and G3_report[3] == True
+			blend = blendG3_poly_2x4_1x6(blend_0, weights_0, blend_1, weights_1, scale_0, scale_1, scale_2, scale_3, 
+										warm_start = warm_start)
+			# keep the solver state for the next recompute
+			G3_reports[(fp.Document.Name, fp.Name)] = blend[4]
+
+		
+		Poles = blend[0]
+		Weights = blend[1]
+
+		if fp.reverse == False:
+			commit_value(fp, "Scale_1", blend[2])
+			commit_value(fp, "Scale_2", blend[3])
+		else:
+			commit_value(fp, "Scale_1", blend[3])
+			commit_value(fp, "Scale_2", blend[2])
+		
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		# prepare the lines to draw the polyline
+		Leg0=Part.LineSegment(fp.Poles[0],fp.Poles[1])
+		Leg1=Part.LineSegment(fp.Poles[1],fp.Poles[2])
+		Leg2=Part.LineSegment(fp.Poles[2],fp.Poles[3])
+		Leg3=Part.LineSegment(fp.Poles[3],fp.Poles[4])
+		Leg4=Part.LineSegment(fp.Poles[4],fp.Poles[5])
+		#set the polygon legs property
+		fp.Legs=[Leg0, Leg1, Leg2, Leg3, Leg4]
+		# define the shape for visualization
+		fp.Shape = Part.Shape(fp.Legs)
+
+class Point_onCurve:
+	def __init__(self, obj ,NL_Curve, u):
+		
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nPoint_onCurve class Init\n")
+		obj.addProperty("App::PropertyLink","NL_Curve","Point_onCurve","reference curve").NL_Curve = NL_Curve
+		lower = 0.0
+		upper = 1.0
+		step = 0.01
+		obj.addProperty("App::PropertyFloatConstraint","u","Point_onCurve","parameter along curve").u = (u, lower, upper, step)
+		obj.addProperty("App::PropertyVector","Position","Point_onCurve","position vector").Position
+		obj.Proxy = self
+		'''
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","NL_Curve","C1 - Inputs","reference curve").NL_Curve = NL_Curve
+		lower = 0.0
+		upper = 1.0
+		step = 0.01
+		obj.addProperty("App::PropertyFloatConstraint","u","C1 - Inputs","parameter along curve").u = (u, lower, upper, step)
+
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVector","Position","C2 - Outputs","position vector").Position
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "Point_onCurve"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_NL_Curve = obj.NL_Curve
+			obj.removeProperty("NL_Curve")
+			old_u = obj.u
+			obj.removeProperty("u")
+			obj.removeProperty("Position")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","NL_Curve","C1 - Inputs","reference curve").NL_Curve = old_NL_Curve
+			lower = 0.0
+			upper = 1.0
+			step = 0.01
+			obj.addProperty("App::PropertyFloatConstraint","u","C1 - Inputs","parameter along curve").u = (old_u, lower, upper, step)
+
+			obj.addProperty("App::PropertyBool","reverse",
+							"C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVector","Position","C2 - Outputs","position vector").Position
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", 
+							"C3 - Identifiers", "the workbench class used to create this object").object_type = "Point_onCurve"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", 
+							"C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", 
+							"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+			obj.setEditorMode("internalName", 1)
+			
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		
+		if fp.reverse == True:
+			u = 1-fp.u
+		else:
+			u = fp.u
+
+		fp.Position=fp.NL_Curve.Shape.Curve.value(u)
+		fp.Shape = Part.Point(fp.Position).toShape()
+
+### point derived objects (+point to input)
+
+class ControlPoly4_segment:
+	def __init__(self, obj , NL_Curve, Point_onCurve_0, Point_onCurve_1):
+		
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlPoly4_segment class Init\n")
+		obj.addProperty("App::PropertyLink","NL_Curve","ControlPoly4_segment","reference Curve").NL_Curve = NL_Curve
+		obj.addProperty("App::PropertyLink","Point_onCurve_0","ControlPoly4_segment","first reference point").Point_onCurve_0 = Point_onCurve_0
+		obj.addProperty("App::PropertyLink","Point_onCurve_1","ControlPoly4_segment","second reference point").Point_onCurve_1 = Point_onCurve_1
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlPoly4_3L","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlPoly4_3L","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlPoly4_3L","Weights").Weights = [1.0,1.0,1.0,1.0]
+		obj.Proxy = self
+		'''
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","NL_Curve","C1 - Inputs","reference curve").NL_Curve = NL_Curve
+		obj.addProperty("App::PropertyLink","Point_onCurve_0","C1 - Inputs","segment start point").Point_onCurve_0 = Point_onCurve_0
+		obj.addProperty("App::PropertyLink","Point_onCurve_1","C1 - Inputs","segment end point").Point_onCurve_1 = Point_onCurve_1
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights = [1.0,1.0,1.0,1.0]
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_segment"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_NL_Curve = obj.NL_Curve
+			obj.removeProperty("NL_Curve")
+			old_Point_onCurve_0 = obj.Point_onCurve_0
+			obj.removeProperty("Point_onCurve_0")
+			old_Point_onCurve_1 = obj.Point_onCurve_1
+			obj.removeProperty("Point_onCurve_1")
+
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+			obj.removeProperty("Weights")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","NL_Curve","C1 - Inputs","reference curve").NL_Curve = old_NL_Curve
+			obj.addProperty("App::PropertyLink","Point_onCurve_0","C1 - Inputs","segment start point").Point_onCurve_0 = old_Point_onCurve_0
+			obj.addProperty("App::PropertyLink","Point_onCurve_1","C1 - Inputs","segment end point").Point_onCurve_1 = old_Point_onCurve_1
+			obj.addProperty("App::PropertyBool","reverse",
+							"C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights = [1.0,1.0,1.0,1.0]
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", 
+							"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_segment"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", 
+							"C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", 
+							"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+			obj.setEditorMode("internalName", 1)
+				
+			# need to recompute otherwise the poles remain unpopulated
+			obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		
+		# get the curve
+		curve=fp.NL_Curve.Shape.Curve
+		# get the u span
+		u0=curve.parameter(fp.Point_onCurve_0.Position)
+		# print(u0)
+		u1=curve.parameter(fp.Point_onCurve_1.Position)
+		# print(u1)
+		if u0<u1:
+			a=u0
+			b=u1
+		elif u1<u0:
+			a=u1
+			b=u0
+		# cut the curve...need to copy first to keep original?
+		curve.segment(a,b)
+
+		if fp.reverse == False:
+			Poles=curve.getPoles()
+			Weights=curve.getWeights()
+		else:
+			Poles=curve.getPoles()[::-1]
+			Weights=curve.getWeights()[::-1]
+
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		# prepare visualization elements
+		p00=fp.Poles[0]
+		p01=fp.Poles[1]
+		p20=fp.Poles[2]
+		p21=fp.Poles[3]
+
+		# prepare the lines to draw the polyline
+		Leg0=Part.LineSegment(p00,p01)
+		Leg1=Part.LineSegment(p01,p20)
+		Leg2=Part.LineSegment(p20,p21)
+		#set the polygon legs property
+		fp.Legs=[Leg0, Leg1, Leg2]
+		# define the shape for visualization
+		fp.Shape = Part.Shape(fp.Legs)
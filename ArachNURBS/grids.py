@@ -0,0 +1,2991 @@
+#    ArachNURBS.grids
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    ArachNURBS grids: control grid feature classes, from polygons and from surfaces.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+from __future__ import division # allows floating point division from integers
+import Part
+import FreeCAD
+import math
+import GridPermutations as GP
+from .kernels import (ClosestPointOnLine, ControlGrid, G3_reports, blendG3_rows_2x4_1x6, blend_rows_2x4_1x6, commit_poles_weights,
+					commit_value, default_tol, drawGrid, equalVectors, homogeneous_poles, orient_a_to_b,
+					paramsSurface44BorderSegmentCurve, poles_weights_from_homogeneous, seam_rotations_2Grid44, upgrade_4_to_6)
+import SilkLog
+
+log = SilkLog.get('grids')
+
+### control grids (+poly to input)
+
+class ControlGrid44_4:	# made from 4 ControlPoly4.
+	def __init__(self, obj, poly0, poly1, poly2, poly3):
+		
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlGrid44_4 class Init\n")
+		obj.addProperty("App::PropertyLink","Poly0","ControlGrid44_4","control polygon").Poly0 = poly0
+		obj.addProperty("App::PropertyLink","Poly1","ControlGrid44_4","control polygon").Poly1 = poly1
+		obj.addProperty("App::PropertyLink","Poly2","ControlGrid44_4","control polygon").Poly2 = poly2
+		obj.addProperty("App::PropertyLink","Poly3","ControlGrid44_4","control polygon").Poly3 = poly3
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid44_4","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid44_4","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid44_4","Weights").Weights
+		obj.Proxy = self
+		'''
+
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Poly0","C1 - Inputs","first control polygon").Poly0 = poly0
+		obj.addProperty("App::PropertyLink","Poly1","C1 - Inputs","second control polygon").Poly1 = poly1
+		obj.addProperty("App::PropertyLink","Poly2","C1 - Inputs","third control polygon").Poly2 = poly2
+		obj.addProperty("App::PropertyLink","Poly3","C1 - Inputs","fourth control polygon").Poly3 = poly3
+		obj.addProperty("App::PropertyFloat","tolerance",
+				  		"C1 - Inputs","point-to-point connection tolerance for the 4 corners").tolerance = default_tol
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid44_4"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+	
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_poly0 = obj.Poly0
+			obj.removeProperty("Poly0")
+			old_poly1 = obj.Poly1
+			obj.removeProperty("Poly1")
+			old_poly2 = obj.Poly2
+			obj.removeProperty("Poly2")
+			old_poly3 = obj.Poly3
+			obj.removeProperty("Poly3")
+
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Poly0","C1 - Inputs","first control polygon").Poly0 = old_poly0
+			obj.addProperty("App::PropertyLink","Poly1","C1 - Inputs","second control polygon").Poly1 = old_poly1
+			obj.addProperty("App::PropertyLink","Poly2","C1 - Inputs","third control polygon").Poly2 = old_poly2
+			obj.addProperty("App::PropertyLink","Poly3","C1 - Inputs","fourth control polygon").Poly3 = old_poly3
+			obj.addProperty("App::PropertyFloat","tolerance",
+						   "C1 - Inputs","point-to-point connection tolerance for the 4 corners").tolerance = old_tolerance 
+			obj.addProperty("App::PropertyBool","reverse",
+						   "C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", 
+				   			"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid44_4"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", 
+				   			"C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", 
+				   			"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+		
+	def onChanged(self, fp, prop):
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		if fp.reverse == False:
+			poles1=fp.Poly0.Poles
+			poles2=fp.Poly1.Poles
+			poles3=fp.Poly2.Poles
+			poles4=fp.Poly3.Poles
+			weights1=fp.Poly0.Weights
+			weights2=fp.Poly1.Weights
+			weights3=fp.Poly2.Weights
+			weights4=fp.Poly3.Weights
+		else:
+			poles1=fp.Poly3.Poles
+			poles2=fp.Poly2.Poles
+			poles3=fp.Poly1.Poles
+			poles4=fp.Poly0.Poles
+			weights1=fp.Poly3.Weights
+			weights2=fp.Poly2.Weights
+			weights3=fp.Poly1.Weights
+			weights4=fp.Poly0.Weights
+		
+		quad12 = orient_a_to_b(poles1,poles2,fp.tolerance)
+		quad23 = orient_a_to_b(poles2,poles3,fp.tolerance)
+		quad34 = orient_a_to_b(poles3,poles4,fp.tolerance)
+		quad41 = orient_a_to_b(poles4,poles1,fp.tolerance)
+		
+		escape_malformed_loop = 0
+		if (quad12 == 0):
+			message = "first and second selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (quad23 == 0):
+			message = "second and third selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (quad34 == 0):
+			message = "third and fourth selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (quad41 == 0):
+			message = "first and fourth selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (escape_malformed_loop == 1):
+			log.warning("%s, labeled %s\n%s\nthe object is created in the document, but awaits resolution of endpoint matching. inspect the sketches that define the Controloly4 objects. prioritize coincident constraints for the endpoints. do not trust a point on object constraint to result in theoretical point matching", fp.Name, fp.Label, message)
+			fake_name_to_trigger_error = please_read_message_above
+			return
+		if quad12[0]!=poles1[0] and quad12[0]==poles1[-1]:
+			weights1=weights1[::-1]
+		if quad23[0]!=poles2[0] and quad23[0]==poles2[-1]:
+			weights2=weights2[::-1]
+		if quad34[0]!=poles3[0] and quad34[0]==poles3[-1]:
+			weights3=weights3[::-1]
+		if quad41[0]!=poles4[0] and quad41[0]==poles4[-1]:
+			weights4=weights4[::-1]
+		p00 = quad12[0]
+		p01 = quad12[1]
+		p02 = quad12[2]
+		p03 = quad12[3]
+		p13 = quad23[1]
+		p23 = quad23[2]
+		p33 = quad23[3]
+		p32 = quad34[1]
+		p31 = quad34[2]
+		p30 = quad34[3]
+		p20 = quad41[1]
+		p10 = quad41[2]
+		p11 = p00 + (p01 - p00) +  (p10 - p00)
+		p12 = p03 + (p02 - p03) +  (p13 - p03)
+		p21 = p30 + (p31 - p30) +  (p20 - p30)
+		p22 = p33 + (p23 - p33) +  (p32 - p33)
+		Poles = [p00 ,p01, p02, p03,
+					p10, p11, p12, p13,
+					p20, p21, p22, p23,
+					p30, p31, p32, p33]
+		w00 = weights1[0]
+		w01 = weights1[1]
+		w02 = weights1[2]
+		w03 = weights1[3]
+		w13 = weights2[1]
+		w23 = weights2[2]
+		w33 = weights2[3]
+		w32 = weights3[1]
+		w31 = weights3[2]
+		w30 = weights3[3]
+		w20 = weights4[1]
+		w10 = weights4[2]
+		w11 = w01*w10
+		w12 = w02*w13
+		w21 = w20*w31
+		w22 = w23*w32
+		Weights = [w00 ,w01, w02, w03,
+					w10, w11, w12, w13,
+					w20, w21, w22, w23,
+					w30, w31, w32, w33]
+		
+
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		fp.Legs = drawGrid(fp.Poles, 4)
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid44_3:	# made from 3 CubicControlPoly4. 
+						#degenerate grid along one edge (4 points), and two inner points neighboring this edge.
+	def __init__(self, obj , poly0, poly1, poly2):
+		
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlGrid44_3 class Init\n")
+		obj.addProperty("App::PropertyLink","Poly0","ControlGrid44_3","control polygon").Poly0 = poly0
+		obj.addProperty("App::PropertyLink","Poly1","ControlGrid44_3","control polygon").Poly1 = poly1
+		obj.addProperty("App::PropertyLink","Poly2","ControlGrid44_3","control polygon").Poly2 = poly2
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid44_3","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid44_3","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid44_3","Weights").Weights
+		obj.addProperty("App::PropertyFloat","TweakWeight11","ControlGrid44_3","Weights").TweakWeight11 = 1.0
+		obj.Proxy = self
+		'''
+
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Poly0","C1 - Inputs","first control polygon").Poly0 = poly0
+		obj.addProperty("App::PropertyLink","Poly1","C1 - Inputs","second control polygon").Poly1 = poly1
+		obj.addProperty("App::PropertyLink","Poly2","C1 - Inputs","third control polygon").Poly2 = poly2
+		obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 4 corners").tolerance = default_tol
+		obj.addProperty("App::PropertyFloat","TweakWeight11","C1 - Inputs","scale factor for inner control point near degenerate corner").TweakWeight11 = 1.0
+		obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights = [1.0,1.0,1.0,1.0,1.0,1.0]
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid44_3"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_poly0 = obj.Poly0
+			obj.removeProperty("Poly0")
+			old_poly1 = obj.Poly1
+			obj.removeProperty("Poly1")
+			old_poly2 = obj.Poly2
+			obj.removeProperty("Poly2")
+			old_TweakWeight11 = obj.TweakWeight11
+			obj.removeProperty("TweakWeight11")
+
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+				obj.removeProperty("tolerance")
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+				obj.removeProperty("reverse")
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			# the internal name should not be changing. this will be used for a check.
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			# re/create all current version attributes in correct format
+			# this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Poly0","C1 - Inputs","first control polygon").Poly0 = old_poly0
+			obj.addProperty("App::PropertyLink","Poly1","C1 - Inputs","second control polygon").Poly1 = old_poly1
+			obj.addProperty("App::PropertyLink","Poly2","C1 - Inputs","third control polygon").Poly2 = old_poly2
+			obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 4 corners").tolerance = old_tolerance 
+			obj.addProperty("App::PropertyFloat","TweakWeight11","C1 - Inputs","scale factor for inner control point weight near degenerate corner").TweakWeight11 = old_TweakWeight11
+			obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid44_3"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+		
+	def onChanged(self, fp, prop):
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+
+		if fp.reverse == False:
+			poles1=fp.Poly0.Poles
+			poles2=fp.Poly1.Poles
+			poles3=fp.Poly2.Poles
+			weights1=fp.Poly0.Weights
+			weights2=fp.Poly1.Weights
+			weights3=fp.Poly2.Weights
+		else:
+			poles1=fp.Poly2.Poles
+			poles2=fp.Poly1.Poles
+			poles3=fp.Poly0.Poles
+			weights1=fp.Poly2.Weights
+			weights2=fp.Poly1.Weights
+			weights3=fp.Poly0.Weights
+
+		quad12 = orient_a_to_b(poles1,poles2,fp.tolerance)
+		quad23 = orient_a_to_b(poles2,poles3,fp.tolerance)
+		quad31 = orient_a_to_b(poles3,poles1,fp.tolerance)
+
+		# error checking below does not address the 'triangle' issue directly
+		# all issues of matching endpoints handled equally
+		escape_malformed_loop = 0
+		if (quad12 == 0):
+			message = "first and second selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (quad23 == 0):
+			message = "second and third selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (quad31 == 0):
+			message = "third and first selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (escape_malformed_loop == 1):
+			log.warning("%s, labeled %s\n%s\nthe object is created in the document, but awaits resolution of endpoint matching. inspect the sketches that define the Controloly4 objects. prioritize coincident constraints for the endpoints. do not trust a point on object constraint to result in theoretical point matching", fp.Name, fp.Label, message)
+			fake_name_to_trigger_error = please_read_message_above
+			return
+
+		if quad12[0]!=poles1[0] and quad12[0]==poles1[-1]:
+			weights1=weights1[::-1]
+		if quad23[0]!=poles2[0] and quad23[0]==poles2[-1]:
+			weights2=weights2[::-1]
+		if quad31[0]!=poles3[0] and quad31[0]==poles3[-1]:
+			weights3=weights3[::-1]
+
+
+		p00 = quad12[0]
+		p01 = quad12[1]
+		p02 = quad12[2]
+		p03 = quad12[3]
+
+		p13 = quad23[1]
+		p23 = quad23[2]
+		p33 = quad23[3]
+
+		p32 = quad31[1]
+		p31 = quad31[2]
+		p30 = p00
+
+		p20 = p00
+		p10 = p00
+
+		p11 = p01+p31-p30
+		p12 = p02+p13-p03
+		p21 = p11
+		p22 = p23+p32-p33
+
+		Poles = [p00 ,p01, p02, p03,
+					p10, p11, p12, p13,
+					p20, p21, p22, p23,
+					p30, p31, p32, p33]
+
+		# weights below are meh. surface edges follow curves, but internal degenerate point has too much draw.
+		w00 = weights1[0]
+		w01 = weights1[1]
+		w02 = weights1[2]
+		w03 = weights1[3]
+
+		w13 = weights2[1]
+		w23 = weights2[2]
+		w33 = weights2[3]
+
+		w32 = weights3[1]
+		w31 = weights3[2]
+		w30 = weights3[3]
+
+		w10 = fp.TweakWeight11
+		w20 = fp.TweakWeight11
+
+		w11 = w01*w10
+		w12 = w02*w13
+		w21 = w31*w20
+		w22 = w23*w31
+
+
+		Weights = [w00 ,w01, w02, w03,
+					w10, w11, w12, w13,
+					w20, w21, w22, w23,
+					w30, w31, w32, w33]
+		
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		fp.Legs = drawGrid(fp.Poles, 4)
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid44_3_Rotate:	# made from 3 CubicControlPoly4. 
+								# degenerate grid along one edge (4 points). Four inner points are rotated
+								# to align towards the degenerate corner.
+	def __init__(self, obj , poly0, poly1, poly2):
+		
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlGrid44_3 class Init\n")
+		obj.addProperty("App::PropertyLink","Poly0","ControlGrid44_3","control polygon").Poly0 = poly0
+		obj.addProperty("App::PropertyLink","Poly1","ControlGrid44_3","control polygon").Poly1 = poly1
+		obj.addProperty("App::PropertyLink","Poly2","ControlGrid44_3","control polygon").Poly2 = poly2
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid44_3","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid44_3","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid44_3","Weights").Weights
+		obj.addProperty("App::PropertyFloat","TweakWeight11","ControlGrid44_3","Weights").TweakWeight11 = 1.0
+		obj.Proxy = self
+		'''
+
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Poly0","C1 - Inputs","first control polygon").Poly0 = poly0
+		obj.addProperty("App::PropertyLink","Poly1","C1 - Inputs","second control polygon").Poly1 = poly1
+		obj.addProperty("App::PropertyLink","Poly2","C1 - Inputs","third control polygon").Poly2 = poly2
+		obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 4 corners").tolerance = default_tol
+		# obj.addProperty("App::PropertyFloat","TweakWeight11","C1 - Inputs","scale factor for inner control point near degenerate corner").TweakWeight11 = 1.0
+		obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights = [1.0,1.0,1.0,1.0,1.0,1.0]
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid44_3_Rotate"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_poly0 = obj.Poly0
+			obj.removeProperty("Poly0")
+			old_poly1 = obj.Poly1
+			obj.removeProperty("Poly1")
+			old_poly2 = obj.Poly2
+			obj.removeProperty("Poly2")
+
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			# only un-versioned legacy objects have TweakWeight11 attribute
+			if hasattr(obj, "TweakWeight11"): 
+				# old_TweakWeight11 = obj.TweakWeight11
+				obj.removeProperty("TweakWeight11")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+				obj.removeProperty("tolerance")
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+				obj.removeProperty("reverse")
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			# the internal name should not be changing. this will be used for a check.
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			# re/create all current version attributes in correct format
+			# this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Poly0","C1 - Inputs","first control polygon").Poly0 = old_poly0
+			obj.addProperty("App::PropertyLink","Poly1","C1 - Inputs","second control polygon").Poly1 = old_poly1
+			obj.addProperty("App::PropertyLink","Poly2","C1 - Inputs","third control polygon").Poly2 = old_poly2
+			obj.addProperty("App::PropertyFloat","tolerance","C1 - Inputs","point-to-point connection tolerance for the 4 corners").tolerance = old_tolerance 
+			# obj.addProperty("App::PropertyFloat","TweakWeight11","C1 - Inputs","scale factor for inner control point weight near degenerate corner").TweakWeight11 = old_TweakWeight11
+			obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid44_3_Rotate"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+		
+	def onChanged(self, fp, prop):
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		
+		if fp.reverse == False:
+			poles1=fp.Poly0.Poles
+			poles2=fp.Poly1.Poles
+			poles3=fp.Poly2.Poles
+			weights1=fp.Poly0.Weights
+			weights2=fp.Poly1.Weights
+			weights3=fp.Poly2.Weights
+		else:
+			poles1=fp.Poly2.Poles
+			poles2=fp.Poly1.Poles
+			poles3=fp.Poly0.Poles
+			weights1=fp.Poly2.Weights
+			weights2=fp.Poly1.Weights
+			weights3=fp.Poly0.Weights
+
+		quad12 = orient_a_to_b(poles1,poles2,fp.tolerance)
+		quad23 = orient_a_to_b(poles2,poles3,fp.tolerance)
+		quad31 = orient_a_to_b(poles3,poles1,fp.tolerance)
+
+		# error checking below does not address the 'triangle' issue directly
+		# all issues of matching endpoints handled equally
+		escape_malformed_loop = 0
+		if (quad12 == 0):
+			message = "first and second selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (quad23 == 0):
+			message = "second and third selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (quad31 == 0):
+			message = "third and first selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (escape_malformed_loop == 1):
+			log.warning("%s, labeled %s\n%s\nthe object is created in the document, but awaits resolution of endpoint matching. inspect the sketches that define the Controloly4 objects. prioritize coincident constraints for the endpoints. do not trust a point on object constraint to result in theoretical point matching", fp.Name, fp.Label, message)
+			fake_name_to_trigger_error = please_read_message_above
+			return
+
+		if quad12[0]!=poles1[0] and quad12[0]==poles1[-1]:
+			weights1=weights1[::-1]
+		if quad23[0]!=poles2[0] and quad23[0]==poles2[-1]:
+			weights2=weights2[::-1]
+		if quad31[0]!=poles3[0] and quad31[0]==poles3[-1]:
+			weights3=weights3[::-1]
+
+		p00 = quad12[0]
+		p01 = quad12[1]
+		p02 = quad12[2]
+		p03 = quad12[3]
+
+		p13 = quad23[1]
+		p23 = quad23[2]
+		p33 = quad23[3]
+
+		p32 = quad31[1]
+		p31 = quad31[2]
+		p30 = p00
+
+		p20 = p00
+		p10 = p00
+
+		p11_Temp = p01+p31-p30
+		p12_Temp = p02+p13-p03
+		p21_Temp = p11_Temp
+		p22_Temp = p23+p32-p33
+
+		# check that poly0 and poly2 aren't parallel
+		# define the rotation center and axis
+		test_Rot_N = ((p01-p00).cross(p10-p00)).Length
+		# print('test_Rot_N: ',test_Rot_N)
+		if test_Rot_N <= .00001 :
+			Rot_pt = p00
+			Rot_N = (p01-p00).cross(p31-p00)
+		else:
+			log.warning("poly0 / poly2 combination: selected polys do not define a normal at the degenerate point")
+			
+		### define a target 'meridian' plane for p11 and p12
+		# contains p00, p13, and Rot_N
+		Plane1_pt = Rot_pt
+		Plane1_N = Rot_N.cross(p13-p00)
+		
+		## define a line going through p01 and p11_Temp. we will want p11 (final) to be somewhere along his line.
+		Line11_pt = p01
+		Line11_N = p11_Temp-p01
+	
+		# if plane1 and Line11 are not parallel or coincident, set p11 at the intersection.
+		# if they are, [TBD]
+		test11 = math.fabs(Plane1_N.dot(Line11_N))
+		# print('test11: ',test11)
+		if test11 >= .00001 :
+			factor11 = (Plane1_pt-Line11_pt).dot(Plane1_N) / Line11_N.dot(Plane1_N)
+			p11 = Line11_N.multiply(factor11)+Line11_pt
+		else:
+			log.warning("cannot intersect standard p11 with meridian plane 1 to produce rotated inner control point p11")
+		
+		## define a line going through p02 and p12_Temp. we will want p12 (final) to be somewhere along his line.
+		Line12_pt = p02
+		Line12_N = p12_Temp-p02
+		
+		# if plane1 and Line12 are not parallel or coincident, set p12 at the intersection.
+		# if they are, [TBD]
+		test12 = math.fabs(Plane1_N.dot(Line12_N))
+		# print('test12: ',test12)
+		if test12 >= .00001 :
+			factor12 = (Plane1_pt-Line12_pt).dot(Plane1_N) / Line12_N.dot(Plane1_N)
+			p12 = Line12_N.multiply(factor12)+Line12_pt
+		else:
+			log.warning("cannot intersect standard p12 with meridian plane 1 to produce rotated inner control point p12")
+		
+		### define a target 'meridian' plane for p21 and p22
+		# contains p00, p23, and Rot_N
+		Plane2_pt = Rot_pt
+		Plane2_N = Rot_N.cross(p23-p00)
+		
+		## define a line going through p31 and p21_Temp. we will want p21 (final) to be somewhere along his line.
+		Line21_pt = p31
+		Line21_N = p21_Temp-p31			
+		
+		# if plane2 and Line21 are not parallel or coincident, set p21 at the intersection.
+		# if they are, [TBD]
+		test21 = math.fabs(Plane2_N.dot(Line21_N))
+		# print('test21: ',test21)
+		if test21 >= .00001 :
+			factor21 = (Plane2_pt-Line21_pt).dot(Plane2_N) / Line21_N.dot(Plane2_N)
+			p21 = Line21_N.multiply(factor21)+Line21_pt
+		else:
+			log.warning("cannot intersect standard p21 with meridian plane 2 to produce rotated inner control point p21")		
+		
+		## define a line going through p32 and p22_Temp. we will want p22 (final) to be somewhere along his line.
+		Line22_pt = p32
+		Line22_N = p22_Temp-p32
+		
+		# if plane2 and Line22 are not parallel or coincident, set p22 at the intersection.
+		# if they are, [TBD]
+		test22 = math.fabs(Plane2_N.dot(Line22_N))
+		# print('test22: ',test22)
+		if test22 >= .00001 :
+			factor22 = (Plane2_pt-Line22_pt).dot(Plane2_N) / Line22_N.dot(Plane2_N)
+			p22 = Line22_N.multiply(factor22)+Line22_pt
+		else:
+			log.warning("cannot intersect standard p22 with meridian plane 2 to produce rotated inner control point p22")		
+					
+		Poles = [p00 ,p01, p02, p03,
+					p10, p11, p12, p13,
+					p20, p21, p22, p23,
+					p30, p31, p32, p33]
+
+		# weights below are in progress
+		w00 = weights1[0]
+		w01 = weights1[1]
+		w02 = weights1[2]
+		w03 = weights1[3]
+
+		w13 = weights2[1]
+		w23 = weights2[2]
+		w33 = weights2[3]
+
+		w32 = weights3[1]
+		w31 = weights3[2]
+		w30 = weights3[3]
+
+		w10 = w13 #fp.TweakWeight11 # or maybe try = p13?
+		w20 = w23 #fp.TweakWeight11 # or maybe try = p23?
+
+		w11 = w01*w10
+		w12 = w02*w13
+		w21 = w31*w20
+		w22 = w23*w31
+
+
+		Weights = [w00 ,w01, w02, w03,
+					w10, w11, w12, w13,
+					w20, w21, w22, w23,
+					w30, w31, w32, w33]
+		
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		fp.Legs = drawGrid(fp.Poles, 4)
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid44_flow: # create a copy of a ControlGrid44 grid whose internal points will 'flow' instead of providing predictable tangency
+	def __init__(self, obj , input_grid):
+
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlGrid44_flow class Init\n")
+		obj.addProperty("App::PropertyLink","InputGrid","ControlGrid44_flow","input control grid").InputGrid = input_grid
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid44_flow","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid44_flow","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid44_flow","Weights").Weights
+		flow_lower = 0.0
+		flow_upper = 1.0
+		flow_step = 0.01
+		flow_11 = 1.0
+		flow_12 = 1.0
+		flow_21 = 1.0
+		flow_22 = 1.0
+		obj.addProperty("App::PropertyFloatConstraint",
+		  				"flow_11","ControlGrid44_flow",
+						" impact on inner control point 11 \n set 0.0 to 1.0, where 0.0 will match the input grid").flow_11 = (flow_11, flow_lower, flow_upper, flow_step)
+		obj.addProperty("App::PropertyFloatConstraint",
+		  				"flow_12","ControlGrid44_flow",
+						" impact on inner control point 12 \n set 0.0 to 1.0, where 0.0 will match the input grid").flow_12 = (flow_12, flow_lower, flow_upper, flow_step)
+		obj.addProperty("App::PropertyFloatConstraint",
+		  				"flow_21","ControlGrid44_flow",
+						" impact on inner control point 21 \n set 0.0 to 1.0, where 0.0 will match the input grid").flow_21 = (flow_21, flow_lower, flow_upper, flow_step)
+		obj.addProperty("App::PropertyFloatConstraint",
+		  				"flow_22","ControlGrid44_flow",
+						" impact on inner control point 22 \n set 0.0 to 1.0, where 0.0 will match the input grid").flow_22 = (flow_22, flow_lower, flow_upper, flow_step)
+		obj.addProperty("App::PropertyBool",
+						"mirror_u0", "ControlGrid44_flow",
+						" maintain the direction of the original grid line that touch this edge \n inner control points will slide along these lines \n maintains mirrorability if it was present in the original grid").mirror_u0 = False
+		obj.addProperty("App::PropertyBool",
+						"mirror_u1", "ControlGrid44_flow",
+						" maintain the direction of the original grid line that touch this edge \n inner control points will slide along these lines \n maintains mirrorability if it was present in the original grid").mirror_u1 = False
+		obj.addProperty("App::PropertyBool",
+						"mirror_v0", "ControlGrid44_flow",
+						" maintain the direction of the original grid line that touch this edge \n inner control points will slide along these lines \n maintains mirrorability if it was present in the original grid").mirror_v0 = False
+		obj.addProperty("App::PropertyBool",
+						"mirror_v1", "ControlGrid44_flow",
+						" maintain the direction of the original grid line that touch this edge \n inner control points will slide along these lines \n maintains mirrorability if it was present in the original grid").mirror_v1 = False
+		'''
+
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","InputGrid","C1 - Inputs","input control grid").InputGrid = input_grid
+		obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = False
+		flow_lower = 0.0
+		flow_upper = 1.0
+		flow_step = 0.01
+		flow_11 = 1.0
+		flow_12 = 1.0
+		flow_21 = 1.0
+		flow_22 = 1.0
+		obj.addProperty("App::PropertyFloatConstraint",
+		  				"flow_11","C1 - Inputs",
+						''' impact on inner control point 11 \n 
+						set 0.0 to 1.0, where 0.0 will match the input grid''').flow_11 = (flow_11, flow_lower, flow_upper, flow_step)
+		obj.addProperty("App::PropertyFloatConstraint",
+		  				"flow_12","C1 - Inputs",
+						''' impact on inner control point 12 \n 
+						set 0.0 to 1.0, where 0.0 will match the input grid''').flow_12 = (flow_12, flow_lower, flow_upper, flow_step)
+		obj.addProperty("App::PropertyFloatConstraint",
+		  				"flow_21","C1 - Inputs",
+						''' impact on inner control point 21 \n 
+						set 0.0 to 1.0, where 0.0 will match the input grid''').flow_21 = (flow_21, flow_lower, flow_upper, flow_step)
+		obj.addProperty("App::PropertyFloatConstraint",
+		  				"flow_22","C1 - Inputs",
+						''' impact on inner control point 22 \n 
+						set 0.0 to 1.0, where 0.0 will match the input grid''').flow_22 = (flow_22, flow_lower, flow_upper, flow_step)
+		obj.addProperty("App::PropertyBool",
+						"mirror_u0", "C1 - Inputs",
+						''' maintain the direction of the original grid line that touch this edge \n 
+						inner control points will slide along these lines \n 
+						maintains mirrorability if it was present in the original grid''').mirror_u0 = False
+		obj.addProperty("App::PropertyBool",
+						"mirror_u1", "C1 - Inputs",
+						''' maintain the direction of the original grid line that touch this edge \n 
+						inner control points will slide along these lines \n 
+						maintains mirrorability if it was present in the original grid''').mirror_u1 = False
+		obj.addProperty("App::PropertyBool",
+						"mirror_v0", "C1 - Inputs",
+						''' maintain the direction of the original grid line that touch this edge \n 
+						inner control points will slide along these lines \n 
+						maintains mirrorability if it was present in the original grid''').mirror_v0 = False
+		obj.addProperty("App::PropertyBool",
+						"mirror_v1", "C1 - Inputs",
+						''' maintain the direction of the original grid line that touch this edge \n 
+						inner control points will slide along these lines \n 
+						maintains mirrorability if it was present in the original grid''').mirror_v1 = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", 
+				  		"object_type", "C3 - Identifiers", 
+						"the workbench class used to create this object").object_type = "ControlGrid44_flow"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", 
+				  		"object_version", "C3 - Identifiers", 
+						"the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", 
+				  		"internalName", "C3 - Identifiers", 
+						"the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_input_grid = obj.InputGrid
+			obj.removeProperty("InputGrid")
+			old_flow_11 = obj.flow_11
+			obj.removeProperty("flow_11")
+			old_flow_12 = obj.flow_12
+			obj.removeProperty("flow_12")
+			old_flow_21 = obj.flow_21
+			obj.removeProperty("flow_21")
+			old_flow_22 = obj.flow_22
+			obj.removeProperty("flow_22")
+			old_mirror_u0 = obj.mirror_u0
+			obj.removeProperty("mirror_u0")
+			old_mirror_u1 = obj.mirror_u1
+			obj.removeProperty("mirror_u1")
+			old_mirror_v0 = obj.mirror_v0
+			obj.removeProperty("mirror_v0")
+			old_mirror_v1 = obj.mirror_v1
+			obj.removeProperty("mirror_v1")
+
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+				obj.removeProperty("reverse")
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			# the internal name should not be changing. this will be used for a check.
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			# re/create all current version attributes in correct format
+			# this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","InputGrid","C1 - Inputs","input control grid").InputGrid = old_input_grid
+			obj.addProperty("App::PropertyBool","reverse","C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			flow_lower = 0.0
+			flow_upper = 1.0
+			flow_step = 0.01
+			obj.addProperty("App::PropertyFloatConstraint",
+							"flow_11","C1 - Inputs",
+							''' impact on inner control point 11 \n 
+							set 0.0 to 1.0, where 0.0 will match the input grid''').flow_11 = (old_flow_11, flow_lower, flow_upper, flow_step)
+			obj.addProperty("App::PropertyFloatConstraint",
+							"flow_12","C1 - Inputs",
+							''' impact on inner control point 12 \n 
+							set 0.0 to 1.0, where 0.0 will match the input grid''').flow_12 = (old_flow_12, flow_lower, flow_upper, flow_step)
+			obj.addProperty("App::PropertyFloatConstraint",
+							"flow_21","C1 - Inputs",
+							''' impact on inner control point 21 \n 
+							set 0.0 to 1.0, where 0.0 will match the input grid''').flow_21 = (old_flow_21, flow_lower, flow_upper, flow_step)
+			obj.addProperty("App::PropertyFloatConstraint",
+							"flow_22","C1 - Inputs",
+							''' impact on inner control point 22 \n 
+							set 0.0 to 1.0, where 0.0 will match the input grid''').flow_22 = (old_flow_22, flow_lower, flow_upper, flow_step)
+			obj.addProperty("App::PropertyBool",
+							"mirror_u0", "C1 - Inputs",
+							''' maintain the direction of the original grid line that touch this edge \n 
+							inner control points will slide along these lines \n 
+							maintains mirrorability if it was present in the original grid''').mirror_u0 = old_mirror_u0
+			obj.addProperty("App::PropertyBool",
+							"mirror_u1", "C1 - Inputs",
+							''' maintain the direction of the original grid line that touch this edge \n 
+							inner control points will slide along these lines \n 
+							maintains mirrorability if it was present in the original grid''').mirror_u1 = old_mirror_u1
+			obj.addProperty("App::PropertyBool",
+							"mirror_v0", "C1 - Inputs",
+							''' maintain the direction of the original grid line that touch this edge \n 
+							inner control points will slide along these lines \n 
+							maintains mirrorability if it was present in the original grid''').mirror_v0 = old_mirror_v0
+			obj.addProperty("App::PropertyBool",
+							"mirror_v1", "C1 - Inputs",
+							''' maintain the direction of the original grid line that touch this edge \n 
+							inner control points will slide along these lines \n 
+							maintains mirrorability if it was present in the original grid''').mirror_v1 = old_mirror_v1
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString",
+				   			 "object_type", "C3 - Identifiers", 
+							 "the workbench class used to create this object").object_type = "ControlGrid44_flow"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", 
+				   			"object_version", "C3 - Identifiers", 
+							"the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", 
+				   			"internalName", "C3 - Identifiers", 
+							"the permanent internal FreeCAD name for this object").internalName= obj.Name
+			obj.setEditorMode("internalName", 1)
+
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+		
+	def onChanged(self, fp, prop):
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		InputGrid = ControlGrid.from_object(fp.InputGrid)
+
+		if fp.reverse == False:
+			Poles = InputGrid.Poles
+			Weights = InputGrid.Weights
+		else:
+			# swap u and v
+			Poles, Weights = GP.permute_poles_weights(InputGrid.Poles, InputGrid.Weights, '44', 'transpose')
+
+		p00 = Poles[0]
+		p01 = Poles[1]
+		p02 = Poles[2]
+		p03 = Poles[3]
+		p10 = Poles[4]
+		p11 = Poles[5]
+		p12 = Poles[6]
+		p13 = Poles[7]
+		p20 = Poles[8]
+		p21 = Poles[9]
+		p22 = Poles[10]
+		p23 = Poles[11]
+		p30 = Poles[12]
+		p31 = Poles[13]
+		p32 = Poles[14]
+		p33 = Poles[15]
+
+		# first attempt to rotate the first inner legs towards each other	
+		'''
+		def pdir_test_01(p10, p11, p12):
+			# edge to inner point
+			L10_11_dir_u = (p11-p10).Length
+			# inner point to next inner point
+			L11_12_dir_u = (p12-p11).Length
+			# determine scale of first inner leg to second inner leg
+			Lscale_p11_dir_u = L10_11_dir_u / (L10_11_dir_u + L11_12_dir_u)
+			# find the point from edge to second inner point that matches the scale
+			p11_dir_u = p10 + Lscale_p11_dir_u * (p12-p10)
+			return p11_dir_u
+		def run_pdir_test_01(): # pass and handle a grid if you want to use this standalone
+			p11_dir_u = pdir_test_01(p10, p11, p12)
+			p21_dir_u = pdir_test_01(p20, p21, p22)
+			p12_dir_u = pdir_test_01(p13, p12, p11)
+			p22_dir_u = pdir_test_01(p23, p22, p21)
+			p11_dir_v = pdir_test_01(p01, p11, p21)
+			p21_dir_v = pdir_test_01(p31, p21, p11)
+			p12_dir_v = pdir_test_01(p02, p12, p22)
+			p22_dir_v = pdir_test_01(p32, p22, p12)
+			p11a = (p11_dir_u + p11_dir_v) / 2.0
+			p12a = (p12_dir_u + p12_dir_v) / 2.0
+			p21a = (p21_dir_u + p21_dir_v) / 2.0
+			p22a= (p22_dir_u + p22_dir_v) / 2.0
+			Legs=[0]*8
+			Legs[0]=Part.LineSegment(p10,p11a)
+			Legs[1]=Part.LineSegment(p20,p21a)
+			Legs[2]=Part.LineSegment(p13,p12a)
+			Legs[3]=Part.LineSegment(p23,p22a)
+			Legs[4]=Part.LineSegment(p01,p11a)
+			Legs[5]=Part.LineSegment(p31,p21a)
+			Legs[6]=Part.LineSegment(p02,p12a)
+			Legs[7]=Part.LineSegment(p32,p22a)
+			return Legs
+		Legs = run_pdir_test_01()
+	
+		# not great. does what it was told to do, but not very interesting.
+		# dramatically 'deflates' the grid. like overstretched plastic pulled over hard edges.
+		# not sure if it is recursevely stable or not.
+		# not 'flowy', i.e. u=1 row does not look like u=0 morphing into u=3
+		# keeps the new inner points relatively close to old ones (leg angles differ greatly)
+		# keep it around, maybe move it to raw functions as Tighten_Grid(grid44) or something
+		'''
+		# next try. let's interpolate first across-edge legs from two opposite corners to set leg orientation
+		# then scale along the resulting direction.
+		# if the two legs are colinear and dot is positive, great. new orientation equal to either, then scale.
+		# if two legs are colinear and dot is negative, new direction should be perpendicular. 
+		### check next edge segment to perpendicular up or down. this could be different for each inner point?
+		# ok to reject insane folded grids.
+		# if the legs are colinear, opposite, and of equal length, same as above, but also watch out for zeros along the way.
+
+		# if the legs are in plane and dot is positive, simple interp.
+		# if the legs are in plane and dot is negative...figure it out when you get to it. maybe do another perpendicular dealio?
+		# maybe test for in plane before testing colinear? could cover both cases. colinear is super cheap tho.
+
+		# write it for one edge first, then make it a function of a grid. 
+		# then we'll need to rotate the grid to apply it 4 times.../shudder.
+
+		# assume we're adjusting only p11 and p12 (along v=1). we'll also refer to p00, p01, p02, p03, p10, p13, p21, and p22.
+		# lets call this "flowing along v=0, or flow_v0"? this identifies the edge we're flowing along...not the cps we're adjusting tho...
+		L0 = p10 - p00
+		L3 = p13 - p03
+
+		# check if both legs are coplanar
+		# use p00 as origin, p10 as x, p03 as yish, project p13 to plane?
+
+		PlaneNormal = ((p10-p00).cross(p03-p00)).normalize()
+		PointToPlane = (p13-p00).dot(PlaneNormal)
+		# print("PointToPlane, ", PointToPlane)
+		testCoplanar = (PointToPlane < .000001 and PointToPlane > -.000001)
+		# print("testCoplanar, ", testCoplanar)
+		# check cross-product for colinear legs
+		testColinearCross = (p10 - p00).cross(p13 - p03)
+		testColinear = (testColinearCross.Length <= .000001)
+		# print("testColinear, ", testColinear)
+		# these test work, but won't be used yet.
+
+		# Simple case for now, wrap in(/within?) exceptions after
+		# find average leg direction across edge
+		def flowEdge(p00, p01, p02, p03, p10, p13):
+			L0 = p10 - p00
+			L3 = p13 - p03
+			legAvg = ((L0 + L3 ).normalize() * (L0.Length + L3.Length) * .5 )
+			L1 = (1/3)*L0 + (2/3)*legAvg
+			L2 = (1/3)*L3 + (2/3)*legAvg
+			p11_by_v0 = p01 + L1
+			p12_by_v0 = p02 + L2
+			return [p11_by_v0, p12_by_v0]
+
+		flow_v0 = flowEdge(p00, p01, p02, p03, p10, p13)
+		flow_u0 = flowEdge(p00, p10, p20, p30, p01, p31)
+		flow_v1 = flowEdge(p30, p31, p32, p33, p20, p23)
+		flow_u1 = flowEdge(p03, p13, p23, p33, p02, p32)
+		# above tests out ok
+
+		# p11, connects to p01 and p10
+		p11_flow = 0.5 * (flow_v0[0] + flow_u0[0])
+		# p12, connects to p02 and p13
+		p12_flow = 0.5 * (flow_v0[1] + flow_u1[0])
+		# p21, connects to p20 and p31
+		p21_flow = 0.5 * (flow_u0[1] + flow_v1[0])		
+		# p22, connects to p32 and p23
+		p22_flow = 0.5 * (flow_v1[1] + flow_u1[1])
+
+
+		p11_final = p11_flow * fp.flow_11 + p11 * (1-fp.flow_11)
+		p12_final = p12_flow * fp.flow_12 + p12 * (1-fp.flow_12)
+		p21_final = p21_flow * fp.flow_21 + p21 * (1-fp.flow_21)
+		p22_final = p22_flow * fp.flow_22 + p22 * (1-fp.flow_22)
+
+		Poles = [p00 ,p01, p02, p03,
+			p10, p11_final, p12_final, p13,
+			p20, p21_final, p22_final, p23,
+			p30, p31, p32, p33]
+		
+
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		fp.Legs = drawGrid(fp.Poles, 4)
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid66_4:	# made from 4 CubicControlPoly6.
+	# ControlGrid66_4(poly0, poly1, poly2, poly3)
+	def __init__(self, obj , poly0, poly1, poly2, poly3):
+		
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlGrid66_4 class Init\n")
+		obj.addProperty("App::PropertyLink","Poly0","ControlGrid66_4","control polygon").Poly0 = poly0
+		obj.addProperty("App::PropertyLink","Poly1","ControlGrid66_4","control polygon").Poly1 = poly1
+		obj.addProperty("App::PropertyLink","Poly2","ControlGrid66_4","control polygon").Poly2 = poly2
+		obj.addProperty("App::PropertyLink","Poly3","ControlGrid66_4","control polygon").Poly3 = poly3
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid66_4","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid66_4","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid66_4","Weights").Weights
+		obj.Proxy = self
+		'''
+
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Poly0","C1 - Inputs","first control polygon").Poly0 = poly0
+		obj.addProperty("App::PropertyLink","Poly1","C1 - Inputs","second control polygon").Poly1 = poly1
+		obj.addProperty("App::PropertyLink","Poly2","C1 - Inputs","third control polygon").Poly2 = poly2
+		obj.addProperty("App::PropertyLink","Poly3","C1 - Inputs","fourth control polygon").Poly3 = poly3
+		obj.addProperty("App::PropertyFloat","tolerance",
+				  		"C1 - Inputs","point-to-point connection tolerance for the 4 corners").tolerance = default_tol
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid66_4"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+	
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_poly0 = obj.Poly0
+			obj.removeProperty("Poly0")
+			old_poly1 = obj.Poly1
+			obj.removeProperty("Poly1")
+			old_poly2 = obj.Poly2
+			obj.removeProperty("Poly2")
+			old_poly3 = obj.Poly3
+			obj.removeProperty("Poly3")
+
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Poly0","C1 - Inputs","first control polygon").Poly0 = old_poly0
+			obj.addProperty("App::PropertyLink","Poly1","C1 - Inputs","second control polygon").Poly1 = old_poly1
+			obj.addProperty("App::PropertyLink","Poly2","C1 - Inputs","third control polygon").Poly2 = old_poly2
+			obj.addProperty("App::PropertyLink","Poly3","C1 - Inputs","fourth control polygon").Poly3 = old_poly3
+			obj.addProperty("App::PropertyFloat","tolerance",
+						   "C1 - Inputs","point-to-point connection tolerance for the 4 corners").tolerance = old_tolerance 
+			obj.addProperty("App::PropertyBool","reverse",
+						   "C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", 
+				   			"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid66_4"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", 
+				   			"C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", 
+				   			"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		if fp.reverse == False:
+			poles1=fp.Poly0.Poles
+			poles2=fp.Poly1.Poles
+			poles3=fp.Poly2.Poles
+			poles4=fp.Poly3.Poles
+			weights1=fp.Poly0.Weights
+			weights2=fp.Poly1.Weights
+			weights3=fp.Poly2.Weights
+			weights4=fp.Poly3.Weights
+		else:
+			poles1=fp.Poly3.Poles
+			poles2=fp.Poly2.Poles
+			poles3=fp.Poly1.Poles
+			poles4=fp.Poly0.Poles
+			weights1=fp.Poly3.Weights
+			weights2=fp.Poly2.Weights
+			weights3=fp.Poly1.Weights
+			weights4=fp.Poly0.Weights
+
+		'''
+		poles1=fp.Poly0.Poles
+		poles2=fp.Poly1.Poles
+		poles3=fp.Poly2.Poles
+		poles4=fp.Poly3.Poles
+		weights1=fp.Poly0.Weights
+		weights2=fp.Poly1.Weights
+		weights3=fp.Poly2.Weights
+		weights4=fp.Poly3.Weights
+		'''
+
+		sext12 = orient_a_to_b(poles1,poles2,fp.tolerance)
+		sext23 = orient_a_to_b(poles2,poles3,fp.tolerance)
+		sext34 = orient_a_to_b(poles3,poles4,fp.tolerance)
+		sext41 = orient_a_to_b(poles4,poles1,fp.tolerance)
+
+		escape_malformed_loop = 0
+		if (sext12 == 0):
+			message = "first and second selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (sext23 == 0):
+			message = "second and third selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (sext34 == 0):
+			message = "third and fourth selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (sext41 == 0):
+			message = "first and fourth selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (escape_malformed_loop == 1):
+			log.warning("%s, labeled %s\n%s\nthe object is created in the document, but awaits resolution of endpoint matching. inspect the sketches that define the Controloly4 objects. prioritize coincident constraints for the endpoints. do not trust a point on object constraint to result in theoretical point matching", fp.Name, fp.Label, message)
+			fake_name_to_trigger_error = please_read_message_above
+			return
+
+		# the weight orientation check below doesn't look complete.
+		# checking first and last isn't enough. need to fix.
+		if sext12[0]!=poles1[0] and sext12[0]==poles1[-1]:
+			weights1=weights1[::-1]
+		if sext23[0]!=poles2[0] and sext23[0]==poles2[-1]:
+			weights2=weights2[::-1]
+		if sext34[0]!=poles3[0] and sext34[0]==poles3[-1]:
+			weights3=weights3[::-1]
+		if sext41[0]!=poles4[0] and sext41[0]==poles4[-1]:
+			weights4=weights4[::-1]
+		p00 = sext12[0]
+		p01 = sext12[1]
+		p02 = sext12[2]
+		p03 = sext12[3]
+		p04 = sext12[4]
+		p05 = sext12[5]
+		p15 = sext23[1]
+		p25 = sext23[2]
+		p35 = sext23[3]
+		p45 = sext23[4]
+		p55 = sext23[5]
+		p54 = sext34[1]
+		p53 = sext34[2]
+		p52 = sext34[3]
+		p51 = sext34[4]
+		p50 = sext34[5]
+		p40 = sext41[1]
+		p30 = sext41[2]
+		p20 = sext41[3]
+		p10 = sext41[4]
+		p11 = p01 + (p10 - p00)
+		p14 = p04 + (p15 - p05)
+		p41 = p51 + (p40 - p50)
+		p44 = p45 + (p54 - p55)
+		p12 = p02 + (p10 - p00)
+		p13 = p03 + (p15 - p05)
+		p24 = p25 + (p04 - p05)
+		p34 = p35 + (p54 - p55)
+		p42 = p52 + (p40 - p50)
+		p43 = p53 + (p45 - p55)
+		p21 = p20 + (p01 - p00)
+		p31 = p30 + (p51 - p50)
+		p22 = p12 + (p20 - p10)
+		p23 = p13 + (p25 - p15)
+		p32 = p42 + (p30 - p40)
+		p33 = p43 + (p35 - p45)
+		Poles = [p00, p01, p02, p03, p04, p05,
+					p10, p11, p12, p13, p14, p15,
+					p20, p21, p22, p23, p24, p25,
+					p30, p31, p32, p33, p34, p35,
+					p40, p41, p42, p43, p44, p45,
+					p50, p51, p52, p53, p54, p55]
+		w00 = weights1[0]
+		w01 = weights1[1]
+		w02 = weights1[2]
+		w03 = weights1[3]
+		w04 = weights1[4]
+		w05 = weights1[5]
+		w15 = weights2[1]
+		w25 = weights2[2]
+		w35 = weights2[3]
+		w45 = weights2[4]
+		w55 = weights2[5]
+		w54 = weights3[1]
+		w53 = weights3[2]
+		w52 = weights3[3]
+		w51 = weights3[4]
+		w50 = weights3[5]
+		w40 = weights4[1]
+		w30 = weights4[2]
+		w20 = weights4[3]
+		w10 = weights4[4]
+		# maybe i should average instead of multiply? needs testing.
+		# currently based on the idea all weights are between 0 and 1.
+		# previous used cumulative neighbor multiplication. this drives weights too low.
+		# current method multiplies the two weights along isos to the closest edge
+		w11 = w01*w10
+		w12 = w02*w10 
+		w21 = w01*w20
+		w22 = w02*w20
+		w14 = w04*w15
+		w13 = w03*w15
+		w24 = w04*w25
+		w23 = w03*w25
+		w44 = w45*w54
+		w34 = w35*w54
+		w43 = w54*w45
+		w33 = w35*w53
+		w41 = w40*w51
+		w31 = w30*w51
+		w42 = w52*w40
+		w32 = w30*w52
+
+		Weights = [w00, w01, w02, w03, w04, w05,
+					w10, w11, w12, w13, w14, w15,
+					w20, w21, w22, w23, w24, w25,
+					w30, w31, w32, w33, w34, w35,
+					w40, w41, w42, w43, w44, w45,
+					w50, w51, w52, w53, w54, w55]
+
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		fp.Legs = drawGrid(fp.Poles, 6)
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid64_4:	# made from 2 CubicControlPoly6 and 2 CubicControlPoly4.
+	def __init__(self, obj , poly6_0, poly4_1, poly6_2, poly4_3):
+		
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlGrid64_4 class Init\n")
+		obj.addProperty("App::PropertyLink","Poly6_0","ControlGrid64_4","control polygon").Poly6_0 = poly6_0
+		obj.addProperty("App::PropertyLink","Poly4_1","ControlGrid64_4","control polygon").Poly4_1 = poly4_1
+		obj.addProperty("App::PropertyLink","Poly6_2","ControlGrid64_4","control polygon").Poly6_2 = poly6_2
+		obj.addProperty("App::PropertyLink","Poly4_3","ControlGrid64_4","control polygon").Poly4_3 = poly4_3
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid64_4","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid64_4","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid64_4","Weights").Weights
+		obj.Proxy = self
+		'''
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Poly6_0","C1 - Inputs","first control polygon").Poly6_0 = poly6_0
+		obj.addProperty("App::PropertyLink","Poly4_1","C1 - Inputs","second control polygon").Poly4_1 = poly4_1
+		obj.addProperty("App::PropertyLink","Poly6_2","C1 - Inputs","third control polygon").Poly6_2 = poly6_2
+		obj.addProperty("App::PropertyLink","Poly4_3","C1 - Inputs","fourth control polygon").Poly4_3 = poly4_3
+		obj.addProperty("App::PropertyFloat","tolerance",
+				  		"C1 - Inputs","point-to-point connection tolerance for the 4 corners").tolerance = default_tol
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the parameter direction").reverse = False
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid64_4"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_poly6_0 = obj.Poly6_0
+			obj.removeProperty("Poly6_0")
+			old_poly4_1 = obj.Poly4_1
+			obj.removeProperty("Poly4_1")
+			old_poly6_2 = obj.Poly6_2
+			obj.removeProperty("Poly6_2")
+			old_poly4_3 = obj.Poly4_3
+			obj.removeProperty("Poly4_3")
+
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+
+			#capturing, then deleting versioned attributes will require testing for their presence
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Poly6_0","C1 - Inputs","first control polygon").Poly6_0 = old_poly6_0
+			obj.addProperty("App::PropertyLink","Poly4_1","C1 - Inputs","second control polygon").Poly4_1 = old_poly4_1
+			obj.addProperty("App::PropertyLink","Poly6_2","C1 - Inputs","third control polygon").Poly6_2 = old_poly6_2
+			obj.addProperty("App::PropertyLink","Poly4_3","C1 - Inputs","fourth control polygon").Poly4_3 = old_poly4_3
+			obj.addProperty("App::PropertyFloat","tolerance",
+						   "C1 - Inputs","point-to-point connection tolerance for the 4 corners").tolerance = old_tolerance 
+			obj.addProperty("App::PropertyBool","reverse",
+						   "C1 - Inputs","reverse the parameter direction").reverse = old_reverse
+			# outputs
+			obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+			obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+			obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", 
+				   			"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid64_4"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", 
+				   			"C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", 
+				   			"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+			obj.setEditorMode("internalName", 1)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		
+		if fp.reverse == False:
+			poles6_0=fp.Poly6_0.Poles
+			poles4_1=fp.Poly4_1.Poles
+			poles6_2=fp.Poly6_2.Poles
+			poles4_3=fp.Poly4_3.Poles
+			weights6_0=fp.Poly6_0.Weights
+			weights4_1=fp.Poly4_1.Weights
+			weights6_2=fp.Poly6_2.Weights
+			weights4_3=fp.Poly4_3.Weights
+		else:
+			# because we have 4s and 6s, we cannot just reverse everything
+			poles6_0=fp.Poly6_0.Poles # keep as first
+			poles4_1=fp.Poly4_3.Poles # swap the 4s
+			poles6_2=fp.Poly6_2.Poles # keep as third
+			poles4_3=fp.Poly4_1.Poles # swap the 4s
+			weights6_0=fp.Poly6_0.Weights
+			weights4_1=fp.Poly4_3.Weights
+			weights6_2=fp.Poly6_2.Weights
+			weights4_3=fp.Poly4_1.Weights
+
+		sext12 = orient_a_to_b(poles6_0,poles4_1,fp.tolerance)
+		quad23 = orient_a_to_b(poles4_1,poles6_2,fp.tolerance)
+		sext34 = orient_a_to_b(poles6_2,poles4_3,fp.tolerance)
+		quad41 = orient_a_to_b(poles4_3,poles6_0,fp.tolerance)
+
+		escape_malformed_loop = 0
+		if (sext12 == 0):
+			message = "first and second selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (quad23 == 0):
+			message = "second and third selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (sext34 == 0):
+			message = "third and fourth selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (quad41 == 0):
+			message = "first and fourth selected polys do not share endpoints at the current tolerance"
+			escape_malformed_loop = 1
+		if (escape_malformed_loop == 1):
+			log.warning("%s, labeled %s\n%s\nthe object is created in the document, but awaits resolution of endpoint matching. inspect the sketches that define the Controloly4 objects. prioritize coincident constraints for the endpoints. do not trust a point on object constraint to result in theoretical point matching", fp.Name, fp.Label, message)
+			fake_name_to_trigger_error = please_read_message_above
+			return
+
+		if sext12[0]!=poles6_0[0] and sext12[0]==poles6_0[-1]:
+			weights6_0=weights6_0[::-1]
+		if quad23[0]!=poles4_1[0] and quad23[0]==poles4_1[-1]:
+			weights4_1=weights4_1[::-1]
+		if sext34[0]!=poles6_2[0] and sext34[0]==poles6_2[-1]:
+			weights6_2=weights6_2[::-1]
+		if quad41[0]!=poles4_3[0] and quad41[0]==poles4_3[-1]:
+			weights4_3=weights4_3[::-1]
+		
+		p00 = sext12[0]
+		p01 = sext12[1]
+		p02 = sext12[2]
+		p03 = sext12[3]
+		p04 = sext12[4]
+		p05 = sext12[5]
+		p15 = quad23[1]
+		p25 = quad23[2]
+		p35 = quad23[3]
+		p34 = sext34[1]
+		p33 = sext34[2]
+		p32 = sext34[3]
+		p31 = sext34[4]
+		p30 = sext34[5]
+		p20 = quad41[1]
+		p10 = quad41[2]
+		p11 = p01 + (p10 - p00)
+		p14 = p04 + (p15 - p05)
+		p21 = p31 + (p20 - p30)
+		p24 = p25 + (p34 - p35)
+		p12 = p02 + (p10 - p00)
+		p13 = p03 + (p15 - p05)
+		p22 = p32 + (p20 - p30)
+		p23 = p33 + (p25 - p35)
+		Poles = [p00, p01, p02, p03, p04, p05,
+					p10, p11, p12, p13, p14, p15,
+					p20, p21, p22, p23, p24, p25,
+					p30, p31, p32, p33, p34, p35]
+		w00 = weights6_0[0]
+		w01 = weights6_0[1]
+		w02 = weights6_0[2]
+		w03 = weights6_0[3]
+		w04 = weights6_0[4]
+		w05 = weights6_0[5]
+		w15 = weights4_1[1]
+		w25 = weights4_1[2]
+		w35 = weights4_1[3]
+		w34 = weights6_2[1]
+		w33 = weights6_2[2]
+		w32 = weights6_2[3]
+		w31 = weights6_2[4]
+		w30 = weights6_2[5]
+		w20 = weights4_3[1]
+		w10 = weights4_3[2]
+		# maybe i should average instead of multiply? needs testing.
+		# currently based on the idea all weights are between 0 and 1.
+		# previous used cumulative neighbor multiplication. this drives weights too low.
+		# current method multiplies the two weights along isos to the closest edge
+		w11 = w01*w10
+		w12 = w02*w10
+		w13 = w03*w15
+		w14 = w04*w15
+		w21 = w31*w20
+		w22 = w32*w20
+		w23 = w33*w25
+		w24 = w34*w25
+		Weights = [w00, w01, w02, w03, w04, w05,
+					w10, w11, w12, w13, w14, w15,
+					w20, w21, w22, w23, w24, w25,
+					w30, w31, w32, w33, w34, w35]
+
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		fp.Legs = drawGrid(fp.Poles, 6)
+		fp.Shape = Part.Shape(fp.Legs)
+
+#### surface derived objects (+surf to input)
+
+
+class ControlGrid44_EdgeSegment:
+	def ControlGrid44_EdgeSegment_Attributes(self, obj, NL_Surface, NL_Curve, tolerance, reverse, object_version):
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","NL_Surface","C1 - Inputs","control Grid").NL_Surface = NL_Surface
+		obj.addProperty("App::PropertyLink","NL_Curve","C1 - Inputs","control Grid").NL_Curve = NL_Curve
+		obj.addProperty("App::PropertyFloat","tolerance",
+				  		"C1 - Inputs","point-to-point connection tolerance for the 4 corners").tolerance = tolerance
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the surface normal direction").reverse = reverse
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid44_EdgeSegment"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = object_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		return
+
+	def __init__(self, obj , NL_Surface, NL_Curve):
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlGrid44_EdgeSegment class Init\n")
+		obj.addProperty("App::PropertyLink","NL_Surface","ControlGrid44_EdgeSegment","Base Surface").NL_Surface = NL_Surface
+		obj.addProperty("App::PropertyLink","NL_Curve","ControlGrid44_EdgeSegment","reference Curve").NL_Curve = NL_Curve
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid44_EdgeSegment","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid44_EdgeSegment","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid44_EdgeSegment","Weights").Weights
+		obj.Proxy = self
+		'''
+
+		self.ControlGrid44_EdgeSegment_Attributes(obj, NL_Surface, NL_Curve, default_tol, False, latest_version)
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			# capture, then delete attribute values in user input fields
+			# deleting is done because we may be changing the format of pre-existing attributes
+			if hasattr(obj, "NL_Surface"): 
+				old_nl_surface = obj.NL_Surface
+				obj.removeProperty("NL_Surface")
+			if hasattr(obj, "NL_Curve"): 
+				old_nl_curve = obj.NL_Curve
+				obj.removeProperty("NL_Curve")
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all  atributes in current version format
+			self.ControlGrid44_EdgeSegment_Attributes(obj, old_nl_surface, old_nl_curve, old_tolerance, old_reverse, latest_version)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		
+		# we now have a tolerance parameter settable by the user, but no implementation is done to use it. 
+		# # need to choose a scheme for tol vs degen_tol (see below)
+
+		# we now have a reverse parameter settable by the user, but no implementation is done to use it.
+		# there currently is a pole reordering hack to avoid flipping (see below), 
+		# need to review and understand it better before using it as the reverse function
+
+		# get segmentation parameters
+		cutParams = paramsSurface44BorderSegmentCurve(fp.NL_Surface, fp.NL_Curve, .001, .001)
+		segdir = cutParams[0]
+		t0 = cutParams[1]
+		t1 = cutParams[2]
+		#print ('segdir: ', segdir)
+		#print ('t0 ', t0)
+		#print ('t1 ', t1)
+
+		# create surface segment. this works very nicely most of the time, but! 
+		#sometimes .segment returns [[vector],[vector],[vector],[vector]] instead of a whole grid.
+		surface = fp.NL_Surface.Shape.Surface
+
+		if segdir=='u':
+			surface.segment(t0,t1,0,1)
+		if segdir=='v':
+			surface.segment(0,1,t0,t1) # 
+		# extract the control grid information from the surface segment
+		poles_2dArray = surface.getPoles()
+		weights_2dArray = surface.getWeights()
+		# extract the control grid information from the surface segment
+		# first version flips the grid along v???? need to run down 3 to 0 on v while looping 0 to 3 on u ?????
+		# this is internal to ArachNURBS. segmenting directly in FreeCAD python console does not flip control points.
+		# one day i need to revisit my control point ordering scheme to avoid this flip
+		# print(poles_2dArray)
+		if len(poles_2dArray[0]) == 1:
+			log.warning("collapsed surface segment")
+			log.debug("t0 %s", t0)
+			log.debug("t1 %s", t1)
+			log.debug("poles_2dArray %s", poles_2dArray)
+		
+		# the segment comes back indexed [u][v]. flatten it, then run u from 3 down to 0
+		Poles, Weights = GP.permute_poles_weights([pole for row in poles_2dArray for pole in row],
+												[weight for row in weights_2dArray for weight in row],
+												'44', 'reverse_v')
+		
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		fp.Legs = drawGrid(fp.Poles, 4)
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid44_2EdgeSegments:
+	def ControlGrid44_2EdgeSegments_Attributes(self, obj, NL_Surface, NL_Curve_a, NL_Curve_b, tolerance, reverse, object_version):
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","NL_Surface","C1 - Inputs","control Grid").NL_Surface = NL_Surface
+		obj.addProperty("App::PropertyLink","NL_Curve_a","C1 - Inputs","control Grid").NL_Curve_a = NL_Curve_a
+		obj.addProperty("App::PropertyLink","NL_Curve_b","C1 - Inputs","control Grid").NL_Curve_b = NL_Curve_b
+		obj.addProperty("App::PropertyFloat","tolerance",
+				  		"C1 - Inputs","point-to-point connection tolerance for the 4 corners").tolerance = tolerance
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the surface normal direction").reverse = reverse
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid44_2EdgeSegments"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = object_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		return
+
+	def __init__(self, obj , NL_Surface, NL_Curve_a, NL_Curve_b):
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlGrid44_2EdgeSegments class Init\n")
+		obj.addProperty("App::PropertyLink","NL_Surface","ControlGrid44_2EdgeSegments","Base Surface").NL_Surface = NL_Surface
+		obj.addProperty("App::PropertyLink","NL_Curve_a","ControlGrid44_2EdgeSegments","reference Curve a").NL_Curve_a = NL_Curve_a
+		obj.addProperty("App::PropertyLink","NL_Curve_b","ControlGrid44_2EdgeSegments","reference Curve b").NL_Curve_b = NL_Curve_b
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid44_2EdgeSegments","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid44_2EdgeSegments","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid44_2EdgeSegments","Weights").Weights
+		obj.Proxy = self
+		'''
+
+		self.ControlGrid44_2EdgeSegments_Attributes(obj, NL_Surface, NL_Curve_a, NL_Curve_b, default_tol, False, latest_version)
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			# capture, then delete attribute values in user input fields
+			# deleting is done because we may be changing the format of pre-existing attributes
+			if hasattr(obj, "NL_Surface"): 
+				old_nl_surface = obj.NL_Surface
+				obj.removeProperty("NL_Surface")
+			if hasattr(obj, "NL_Curve_a"): 
+				old_nl_curve_a = obj.NL_Curve_a
+				obj.removeProperty("NL_Curve_a")
+			if hasattr(obj, "NL_Curve_b"): 
+				old_nl_curve_b = obj.NL_Curve_b
+				obj.removeProperty("NL_Curve_b")
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all  atributes in current version format
+			self.ControlGrid44_2EdgeSegments_Attributes(obj, old_nl_surface, old_nl_curve_a, old_nl_curve_b, old_tolerance, old_reverse, latest_version)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		
+		# we now have a tolerance parameter settable by the user, but no implementation is done to use it. 
+		# # need to choose a scheme for tol vs degen_tol (see below)
+
+		# we now have a reverse parameter settable by the user, but no implementation is done to use it.
+		# there currently is a pole reordering hack to avoid flipping (see below), 
+		# need to review and understand it better before using it as the reverse function
+		
+		# get segmentation parameters
+		cutParamsa = paramsSurface44BorderSegmentCurve(fp.NL_Surface, fp.NL_Curve_a, .001, .001)
+		segdira = cutParamsa[0]
+		s0 = cutParamsa[1]
+		s1 = cutParamsa[2]
+		#print ('segdira: ', segdira)
+		#print ('s0 ', s0)
+		#print ('s1 ', s1)
+		# get segmentation parameters
+		cutParamsb = paramsSurface44BorderSegmentCurve(fp.NL_Surface, fp.NL_Curve_b, .001, .001)
+		segdirb = cutParamsb[0]
+		t0 = cutParamsb[1]
+		t1 = cutParamsb[2]
+		#print ('segdirb: ', segdirb)
+		#print ('t0 ', t0)
+		#print ('t1 ', t1)
+		
+		
+		'''
+		# get surface
+		surface=fp.NL_Surface.Shape.Surface
+		# get cutting points from curves
+		curve_a=fp.NL_Curve_a.Shape.Curve
+		a0 = curve_a.StartPoint
+		a1 = curve_a.EndPoint
+
+		curve_b=fp.NL_Curve_b.Shape.Curve
+		b0 = curve_b.StartPoint
+		b1 = curve_b.EndPoint
+
+
+		# determine u or v segmentation and get parameter span from cutting points for curve a
+		param_a0=surface.parameter(a0)
+		#print 'param_a0: ', param_a0
+		param_a1=surface.parameter(a1)
+		#print 'param_a1: ', param_a1
+		if ((param_a0[0]<0.001 and param_a1[0]<0.001) or (param_a0[0]>0.999 and param_a1[0]>0.999)): # if u is constant 0 or constant 1 along curve
+			segdira = 'v'
+			if param_a0[1] < param_a1[1]:
+				s0=param_a0[1]
+				s1=param_a1[1]
+			if param_a0[1] > param_a1[1]:
+				s0=param_a1[1]
+				s1=param_a0[1]
+		if ((param_a0[1]<0.001 and param_a1[1]<0.001) or (param_a0[1]>0.999 and param_a1[1]>0.999)): # if v is constant 0 or constant 1 along curve
+			segdira = 'u'
+			if param_a0[0] < param_a1[0]:
+				s0=param_a0[0]
+				s1=param_a1[0]
+			if param_a0[0] > param_a1[0]:
+				s0=param_a1[0]
+				s1=param_a0[0]
+		# filter out s0<0 and s1>1 that may occur when the xyz position is projected to uv
+		if s0<0:
+			s0=0
+		if s1>1:
+			s1=1
+
+		# determine u or v segmentation and get parameter span from cutting points for curve b
+		param_b0=surface.parameter(b0)
+		#print 'param_b0: ', param_b0
+		param_b1=surface.parameter(b1)
+		#print 'param_b1: ', param_b1
+		if ((param_b0[0]<0.001 and param_b1[0]<0.001) or (param_b0[0]>0.999 and param_b1[0]>0.999)): # if u is constant 0 or constant 1 along curve
+			segdirb = 'v'
+			if param_b0[1] < param_b1[1]:
+				t0=param_b0[1]
+				t1=param_b1[1]
+			if param_b0[1] > param_b1[1]:
+				t0=param_b1[1]
+				t1=param_b0[1]
+		if ((param_b0[1]<0.001 and param_b1[1]<0.001) or (param_b0[1]>0.999 and param_b1[1]>0.999)): # if v is constant 0 or constant 1 along curve
+			segdirb = 'u'
+			if param_b0[0] < param_b1[0]:
+				t0=param_b0[0]
+				t1=param_b1[0]
+			if param_b0[0] > param_b1[0]:
+				t0=param_b1[0]
+				t1=param_b0[0]
+		# filter out t0<0 and t1>1 that may occur when the xyz position is projected to uv
+		if t0<0:
+			t0=0
+		if t1>1:
+			t1=1
+		'''
+
+		# create surface segment. this works very nicely most of the time, but! 
+		#sometimes .segment returns [[vector],[vector],[vector],[vector]] instead of a whole grid.
+		surface = fp.NL_Surface.Shape.Surface
+
+		if segdira=='u' and segdirb=='v':
+			surface.segment(s0,s1,t0,t1)
+		if segdira=='v' and segdirb=='u':
+			surface.segment(t0,t1,s0,s1) # 
+		# extract the control grid information from the surface segment
+		# first version flips the grid along v???? need to run down 3 to 0 on v while looping 0 to 3 on u ?????
+		# this is internal to ArachNURBS. segmenting directly in FreeCAD python console does not flip sontrol points.
+		# one day i need to revisit my control point ordering scheme to avoid this flip
+		poles_2dArray = surface.getPoles()
+		if len(poles_2dArray[0]) == 1:
+			log.warning("collapsed surface segment")
+			log.debug("segdira: %s", segdira)
+			log.debug("segdirb: %s", segdirb)
+			log.debug("s0 %s", s0)
+			log.debug("s1 %s", s1)
+			log.debug("t0 %s", t0)
+			log.debug("t1 %s", t1)
+			log.debug("poles_2dArray %s", poles_2dArray)
+
+
+		weights_2dArray = surface.getWeights()
+		# the segment comes back indexed [u][v]. flatten it, then run u from 3 down to 0
+		Poles, Weights = GP.permute_poles_weights([pole for row in poles_2dArray for pole in row],
+												[weight for row in weights_2dArray for weight in row],
+												'44', 'reverse_v')
+
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		fp.Legs = drawGrid(fp.Poles, 4)
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is the logical position, 
+	#							since the input grids are intended to come from surface segmentation
+	def ControlGrid64_2Grid44_Attributes(self, 
+									  	obj, 
+										Grid_0, 
+										Grid_1, 
+										scale_tangent_0, 
+										scale_tangent_1, 
+										scale_inner_0, 
+										scale_inner_1, 
+										autoG3,
+										tolerance, 
+										reverse, 
+										object_version):
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Grid_0","C1 - Inputs","first reference 4X4 grid").Grid_0 = Grid_0
+		obj.addProperty("App::PropertyLink","Grid_1","C1 - Inputs","second reference 4X4 grid").Grid_1 = Grid_1
+		obj.addProperty("App::PropertyFloat","scale_tangent_0",
+				  		"C1 - Inputs","first grid tangent scale").scale_tangent_0 = scale_tangent_0
+		obj.addProperty("App::PropertyFloat","scale_tangent_1",
+				  		"C1 - Inputs","second grid tangent scale").scale_tangent_1 = scale_tangent_1
+		obj.addProperty("App::PropertyFloatList","scale_inner_0",
+				  		"C1 - Inputs","first side inner scale").scale_inner_0 = scale_inner_0
+		obj.addProperty("App::PropertyFloatList","scale_inner_1",
+				  		"C1 - Inputs","second side inner scale").scale_inner_1 = scale_inner_1
+		obj.addProperty("App::PropertyBool","autoG3",
+				  		"C1 - Inputs","set 0 for off, 1 for on").autoG3 = autoG3
+		obj.addProperty("App::PropertyFloat","tolerance",
+				  		"C1 - Inputs","point-to-point connection tolerance for the shared edge").tolerance = tolerance
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the surface normal direction").reverse = reverse
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid64_2Grid44"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = object_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		return
+
+	def __init__(self, obj , Grid_0, Grid_1):
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nControlGrid64_2Grid44 class Init\n")
+		obj.addProperty("App::PropertyLink","Grid_0","ControlGrid64_2Grid44","first reference 4X4 grid").Grid_0 = Grid_0
+		obj.addProperty("App::PropertyLink","Grid_1","ControlGrid64_2Grid44","second reference 4X4 grid").Grid_1 = Grid_1
+		obj.addProperty("App::PropertyFloat","scale_tangent_0","ControlGrid64_2Grid44","first grid tangent scale").scale_tangent_0 = 2.0
+		obj.addProperty("App::PropertyFloat","scale_tangent_1","ControlGrid64_2Grid44","second grid tangent scale").scale_tangent_1 = 2.0
+		obj.addProperty("App::PropertyFloatList","scale_inner_0","ControlGrid64_2Grid44","first side inner scale").scale_inner_0 = [2.0, 2.0, 2.0, 2.0]
+		#obj.setEditorMode("scale_inner_0", 0)
+		obj.addProperty("App::PropertyFloatList","scale_inner_1","ControlGrid64_2Grid44","second side inner scale").scale_inner_1 = [2.0, 2.0, 2.0, 2.0]
+		#obj.setEditorMode("scale_inner_1", 0)
+		obj.addProperty("App::PropertyInteger", "autoG3", "ControlGrid64_2Grid44", "Try to set G3 along the external seams").autoG3 = 0
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid64_2Grid44","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid64_2Grid44","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid64_2Grid44","Weights").Weights
+		obj.Proxy = self
+		'''
+		self.ControlGrid64_2Grid44_Attributes(obj, 
+											Grid_0, 
+											Grid_1, 
+											2.0, 
+											2.0, 
+											[2.0, 2.0, 2.0, 2.0], 
+											[2.0, 2.0, 2.0, 2.0], 
+											False,
+											default_tol, 
+											False, 
+											latest_version)
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		# G3 solver state saved on the proxy by earlier versions, now kept in G3_reports
+		self.__dict__.pop("G3_report", None)
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			# capture, then delete attribute values in user input fields
+			# deleting is done because we may be changing the format of pre-existing attributes
+			if hasattr(obj, "Grid_0"): 
+				old_Grid_0 = obj.Grid_0
+				obj.removeProperty("Grid_0")
+			if hasattr(obj, "Grid_1"): 
+				old_Grid_1 = obj.Grid_1
+				obj.removeProperty("Grid_1")
+			if hasattr(obj, "scale_tangent_0"): 
+				old_scale_tangent_0 = obj.scale_tangent_0
+				obj.removeProperty("scale_tangent_0")
+			if hasattr(obj, "scale_tangent_1"): 
+				old_scale_tangent_1 = obj.scale_tangent_1
+				obj.removeProperty("scale_tangent_1")
+			if hasattr(obj, "scale_inner_0"): 
+				old_scale_inner_0 = obj.scale_inner_0
+				obj.removeProperty("scale_inner_0")
+			if hasattr(obj, "scale_inner_1"): 
+				old_scale_inner_1 = obj.scale_inner_1
+				obj.removeProperty("scale_inner_1")
+			if hasattr(obj, "autoG3"):
+				if obj.autoG3 == 0 or obj.autoG3 == False:
+					old_autoG3 = False
+				else:
+					old_autoG3 = False
+				obj.removeProperty("autoG3")
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all attributes in current version format
+			self.ControlGrid64_2Grid44_Attributes(obj, 
+												old_Grid_0, 
+												old_Grid_1, 
+												old_scale_tangent_0, 
+												old_scale_tangent_1, 
+												old_scale_inner_0, 
+												old_scale_inner_1, 
+												old_autoG3,
+												old_tolerance, 
+												old_reverse, 
+												latest_version)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		
+		# -find seam points (look out for degenerate edges)
+		# -rotate grids to match uv flow
+		# -blend all grid row pairs: upgrade, stitch, scale
+		# -stack the blend rows back into a grid
+
+		# read both grids once
+		Grid_0 = ControlGrid.from_object(fp.Grid_0)
+		Grid_1 = ControlGrid.from_object(fp.Grid_1)
+
+		# find the seam, including degenerate grids
+		tol = fp.tolerance
+		rotate_0, rotate_1 = seam_rotations_2Grid44(Grid_0, Grid_1, tol)
+
+		# apply rotation correction to the homogeneous grid arrays
+		Pw_0 = GP.permute_array(Grid_0.Pw, GP.rotations[rotate_0])
+		Pw_1 = GP.permute_array(Grid_1.Pw, GP.rotations[rotate_1])
+
+		# blend each pair of rows running across the seam
+		if fp.autoG3 == True:
+			# warm start each row from its previous inner scales (stored in scale_inner_0/1), if that row converged
+			G3_report = G3_reports.get((fp.Document.Name, fp.Name))
+			if G3_report is not None and len(G3_report) == 4:
+				warm_start = [report[3] == True for report in G3_report]
+			else:
+				warm_start = [False, False, False, False]
+			Pw_64, scale_inner_0, scale_inner_1, G3_report = blendG3_rows_2x4_1x6(Pw_0,
+																				Pw_1,
+																				fp.scale_tangent_0,
+																				fp.scale_inner_0,
+																				fp.scale_inner_1,
+																				fp.scale_tangent_1,
+																				warm_start)
+			commit_value(fp, "scale_inner_0", scale_inner_0)
+			commit_value(fp, "scale_inner_1", scale_inner_1)
+			# keep the solver state of each row for the next recompute
+			G3_reports[(fp.Document.Name, fp.Name)] = G3_report
+
+		if fp.autoG3 == False:
+			Pw_64 = blend_rows_2x4_1x6(Pw_0,
+									Pw_1,
+									fp.scale_tangent_0,
+									fp.scale_inner_0,
+									fp.scale_inner_1,
+									fp.scale_tangent_1)
+
+		# stack the ControlPoly6s into a 64 grid - poles and weights
+		if fp.reverse == True:
+			# keep row positions, reverse columns
+			Pw_64 = GP.permute_array(Pw_64, 'reverse_u')
+		Poles, Weights = poles_weights_from_homogeneous(Pw_64.reshape(24, 4))
+
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		# build the leg list for viz
+		fp.Legs = drawGrid(fp.Poles, 6)
+		fp.Shape = Part.Shape(fp.Legs)
+
+class SubGrid33_2Grid64:
+
+	def SubGrid33_2Grid64_Attributes(self, 
+								 	obj, 
+									Grid_0, 
+									Grid_1, 
+									adjust_0,
+									adjust_1,
+									tolerance, 
+									reverse,
+									object_version):
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Grid_0","C1 - Inputs","first reference 6X4 grid").Grid_0 = Grid_0
+		obj.addProperty("App::PropertyLink","Grid_1","C1 - Inputs","second reference 6X4 grid").Grid_1 = Grid_1
+		obj.addProperty("App::PropertyFloat","adjust_0",
+				  		"C1 - Inputs","first grid tangent scale").adjust_0 = adjust_0
+		obj.addProperty("App::PropertyFloat","adjust_1",
+				  		"C1 - Inputs","second grid tangent scale").adjust_1 = adjust_1
+		obj.addProperty("App::PropertyFloat","tolerance",
+				  		"C1 - Inputs","point-to-point connection tolerance for the shared corner").tolerance = tolerance
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the surface normal direction").reverse = reverse
+		# outputs
+		obj.addProperty("App::PropertyVectorList","Poles","C2 - Outputs","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","C2 - Outputs","Weights").Weights
+		obj.addProperty("Part::PropertyGeometryList","Legs","C2 - Outputs","control segments").Legs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "SubGrid33_2Grid64"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = object_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		return
+
+	def __init__(self, obj , Grid_0, Grid_1):
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nSubGrid33_2Grid64 class Init\n")
+		obj.addProperty("App::PropertyLink","Grid_0","SubGrid33_2Grid64","first reference 6X4 grid").Grid_0 = Grid_0
+		obj.addProperty("App::PropertyLink","Grid_1","SubGrid33_2Grid64","second reference 6X4 grid").Grid_1 = Grid_1
+		obj.addProperty("App::PropertyFloat","adjust_0","SubGrid33_2Grid64","adjust along Grid_0").adjust_0 = 0
+		obj.addProperty("App::PropertyFloat","adjust_1","SubGrid33_2Grid64","adjust along Grid_1").adjust_1 = 0
+		obj.addProperty("Part::PropertyGeometryList","Legs","SubGrid33_2Grid64","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","SubGrid33_2Grid64","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","SubGrid33_2Grid64","Weights").Weights
+
+		obj.Proxy = self
+		'''
+		self.SubGrid33_2Grid64_Attributes(obj, 
+											Grid_0, 
+											Grid_1, 
+											0,
+											0,
+											default_tol, 
+											False, 
+											latest_version)
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			# capture, then delete attribute values in user input fields
+			# deleting is done because we may be changing the format of pre-existing attributes
+			if hasattr(obj, "Grid_0"): 
+				old_Grid_0 = obj.Grid_0
+				obj.removeProperty("Grid_0")
+			if hasattr(obj, "Grid_1"): 
+				old_Grid_1 = obj.Grid_1
+				obj.removeProperty("Grid_1")
+			if hasattr(obj, "adjust_0"): 
+				old_adjust_0 = obj.adjust_0
+				obj.removeProperty("adjust_0")
+			if hasattr(obj, "adjust_1"): 
+				old_adjust_1 = obj.adjust_1
+				obj.removeProperty("adjust_1")
+			if hasattr(obj, "tolerance"): 
+				old_tolerance = obj.tolerance
+				obj.removeProperty("tolerance")
+			else:
+				old_tolerance = default_tol
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+			obj.removeProperty("Weights")
+			obj.removeProperty("Legs")
+			obj.removeProperty("Poles")
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all attributes in current version format
+			self.SubGrid33_2Grid64_Attributes(obj, 
+												old_Grid_0, 
+												old_Grid_1, 
+												old_adjust_0, 
+												old_adjust_1, 
+												old_tolerance, 
+												old_reverse, 
+												latest_version)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		
+		# outline:
+		# -find shared corner
+		# -set 'u' row - imagine the future surface as uvn (n is normal). 
+		# -set 'v' row - imagine the future surface as uvn (n is normal).
+		# -build a corner focused 33 grid using similar logic as the corner focused 66 grid. 
+		#the $10 question here is whether this even maintains G1? maybe...it has been many steps since the bezier surface was segmented.
+
+		# read both grids once
+		Grid_0 = ControlGrid.from_object(fp.Grid_0)
+		Grid_1 = ControlGrid.from_object(fp.Grid_1)
+
+		# extract corner points, in [0, 5, 18, 23] order
+		corners_0=[Grid_0.corners[0],Grid_0.corners[1],Grid_0.corners[3],Grid_0.corners[2]]
+		corners_1=[Grid_1.corners[0],Grid_1.corners[1],Grid_1.corners[3],Grid_1.corners[2]]
+		# find the common point
+		common = 'not_found_yet'
+		for i in range(0,4):
+			for j in range(0,4):
+				if equalVectors(corners_0[i],corners_1[j],fp.tolerance):
+					if common == 'not_found_yet':
+						common=[i,j]
+					else:
+						log.warning("multiple common corners found at the current tolerance.\nreduce tolerance, or improve corner matching")
+						fake_name_to_trigger_error = please_read_message_above
+
+		if common == 'not_found_yet':
+			log.warning("common point of grids not found. If this object was working previously, this is an evaluation error.\n\n if this is a new object, check the corner matching vs tolerance")
+		#print ('common ', common)
+		# tested-runs-
+
+		# the two 6P sides of each grid should form a V when looking at the future grid
+		# a is the left leg of the V, i.e. common[0] = 0 or 3
+		# b is the right leg of the V i.e. common[1] = 2 or 1
+
+		# check input grid order, swap grids if necessary
+		if (common[0] == 1 or common[0] == 2) and (common[1] == 0 or common[1] == 3):
+			log.debug("swapping grid order")
+			temp=fp.Grid_0
+			fp.Grid_0=fp.Grid_1
+			fp.Grid_1=temp
+			Grid_0, Grid_1 = Grid_1, Grid_0
+			# get the corners again
+			corners_0=[Grid_0.corners[0],Grid_0.corners[1],Grid_0.corners[3],Grid_0.corners[2]]
+			corners_1=[Grid_1.corners[0],Grid_1.corners[1],Grid_1.corners[3],Grid_1.corners[2]]
+			# find common again
+			for i in range(0,4):
+				for j in range(0,4):
+					if equalVectors(corners_0[i],corners_1[j],fp.tolerance):
+						common=[i,j]
+			#print ('common ', common)
+
+		if common[0] == 0:
+			v_col0_poles = [Grid_0.Poles[0],Grid_0.Poles[1],Grid_0.Poles[2]]
+			v_col0_weights = [Grid_0.Weights[0],Grid_0.Weights[1],Grid_0.Weights[2]]
+			v_col1_poles = [Grid_0.Poles[6],Grid_0.Poles[7],Grid_0.Poles[8]]
+			v_col1_weights = [Grid_0.Weights[6],Grid_0.Weights[7],Grid_0.Weights[8]]
+
+		if common[0] == 3:
+			v_col0_poles = [Grid_0.Poles[23],Grid_0.Poles[22],Grid_0.Poles[21]]
+			v_col0_weights = [Grid_0.Weights[23],Grid_0.Weights[22],Grid_0.Weights[21]]
+			v_col1_poles = [Grid_0.Poles[17],Grid_0.Poles[16],Grid_0.Poles[15]]
+			v_col1_weights = [Grid_0.Weights[17],Grid_0.Weights[16],Grid_0.Weights[15]]
+
+		if common[1] == 1:
+			u_row0_poles = [Grid_1.Poles[5],Grid_1.Poles[4],Grid_1.Poles[3]]
+			u_row0_weights = [Grid_1.Weights[5],Grid_1.Weights[4],Grid_1.Weights[3]]
+			u_row1_poles = [Grid_1.Poles[11],Grid_1.Poles[10],Grid_1.Poles[9]]
+			u_row1_weights = [Grid_1.Weights[11],Grid_1.Weights[10],Grid_1.Weights[9]]
+
+		if common[1] == 2:
+			u_row0_poles = [Grid_1.Poles[18],Grid_1.Poles[19],Grid_1.Poles[20]]
+			u_row0_weights = [Grid_1.Weights[18],Grid_1.Weights[19],Grid_1.Weights[20]]
+			u_row1_poles = [Grid_1.Poles[12],Grid_1.Poles[13],Grid_1.Poles[14]]
+			u_row1_weights = [Grid_1.Weights[12],Grid_1.Weights[13],Grid_1.Weights[14]]
+
+		u_tan_ratio = (u_row0_poles[1]-u_row0_poles[0]).Length / (v_col1_poles[0]-v_col0_poles[0]).Length
+		v_tan_ratio = (v_col0_poles[1]-v_col0_poles[0]).Length / (u_row1_poles[0]-u_row0_poles[0]).Length
+
+		p00 = u_row0_poles[0]
+		p01 = u_row0_poles[1]
+		p02 = u_row0_poles[2]
+		p10 = v_col0_poles[1]
+		p20 = v_col0_poles[2]
+		p11_u = p01 + (u_row0_poles[1]-u_row1_poles[1])*v_tan_ratio
+		p12 = p02 + (u_row0_poles[2]-u_row1_poles[2])*v_tan_ratio
+		p11_v = p10 + (v_col0_poles[1]-v_col1_poles[1])*u_tan_ratio
+		p21 = p20 + (v_col0_poles[2]-v_col1_poles[2])*u_tan_ratio
+		p11 = (p11_u + p11_v) * 0.5
+		p22_u = p12 + (p21-p11)
+		p22_v = p21 + (p12-p11)
+		p22_temp = (p22_u + p22_v) * 0.5
+
+		p22 = p22_temp + fp.adjust_0 * (p01-p00) + fp.adjust_1 * (p10-p00)
+
+		Poles = [p00, p01, p02, p10, p11, p12, p20, p21, p22]
+
+		w00 = u_row0_weights[0]
+		w01 = u_row0_weights[1]
+		w02 = u_row0_weights[2]
+		w10 = v_col0_weights[1]
+		w20 = v_col0_weights[2]
+
+		w11 = w01 * w10
+		w12 = w02 * w10
+		w21 = w01 * w20
+		w22 = w02 * w20
+
+		Weights = [w00, w01, w02, w10, w11, w12, w20, w21, w22]
+
+		if fp.reverse == True:
+			# diagonal flip
+			Poles = [p00, p10, p20, p01, p11, p21, p02, p12, p22]
+			Weights = [w00, w10, w20, w01, w11, w21, w02, w12, w22]
+
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		fp.Legs = drawGrid(fp.Poles, 3)
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid66_4Sub:
+	def __init__(self, obj , SubGrid_0, SubGrid_1, SubGrid_2, SubGrid_3):
+		''' Add the properties '''
+		FreeCAD.Console.PrintMessage("\nControlGrid66_4Sub class Init\n")
+		obj.addProperty("App::PropertyLink","SubGrid_0","ControlGrid66_4Sub","first reference 3X3 sub grid").SubGrid_0 = SubGrid_0
+		obj.addProperty("App::PropertyLink","SubGrid_1","ControlGrid66_4Sub","second reference 3X3 sub grid").SubGrid_1 = SubGrid_1
+		obj.addProperty("App::PropertyLink","SubGrid_2","ControlGrid66_4Sub","third reference 3X3 sub grid").SubGrid_2 = SubGrid_2
+		obj.addProperty("App::PropertyLink","SubGrid_3","ControlGrid66_4Sub","fourth reference 3X3 sub grid").SubGrid_3 = SubGrid_3
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid66_4Sub","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid66_4Sub","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid66_4Sub","Weights").Weights
+		obj.Proxy = self
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		SubGrid_0 = ControlGrid.from_object(fp.SubGrid_0)
+		SubGrid_1 = ControlGrid.from_object(fp.SubGrid_1)
+		SubGrid_2 = ControlGrid.from_object(fp.SubGrid_2)
+		SubGrid_3 = ControlGrid.from_object(fp.SubGrid_3)
+
+		p00 = SubGrid_0.Poles[0]
+		p01 = SubGrid_0.Poles[1]
+		p02 = SubGrid_0.Poles[2]
+		p03 = SubGrid_1.Poles[6]
+		p04 = SubGrid_1.Poles[3]
+		p05 = SubGrid_1.Poles[0]
+
+		p15 = SubGrid_1.Poles[1]
+		p25 = SubGrid_1.Poles[2]
+		p35 = SubGrid_2.Poles[6]
+		p45 = SubGrid_2.Poles[3]
+		p55 = SubGrid_2.Poles[0]
+
+		p54 = SubGrid_2.Poles[1]
+		p53 = SubGrid_2.Poles[2]
+		p52 = SubGrid_3.Poles[6]
+		p51 = SubGrid_3.Poles[3]
+		p50 = SubGrid_3.Poles[0]
+
+		p40 = SubGrid_3.Poles[1]
+		p30 = SubGrid_3.Poles[2]
+		p20 = SubGrid_0.Poles[6]
+		p10 = SubGrid_0.Poles[3]
+
+		p11 = SubGrid_0.Poles[4]
+		p12 = SubGrid_0.Poles[5]
+		p13 = SubGrid_1.Poles[7]
+		p14 = SubGrid_1.Poles[4]
+
+		p24 = SubGrid_1.Poles[5]
+		p34 = SubGrid_2.Poles[7]
+		p44 = SubGrid_2.Poles[4]
+
+		p43 = SubGrid_2.Poles[5]
+		p42 = SubGrid_3.Poles[7]
+		p41 = SubGrid_3.Poles[4]
+
+		p31 = SubGrid_3.Poles[5]
+		p21 = SubGrid_0.Poles[7]
+
+		p22 = SubGrid_0.Poles[8]
+		p23 = SubGrid_1.Poles[8]
+		p33 = SubGrid_2.Poles[8]
+		p32 = SubGrid_3.Poles[8]
+
+		Poles = [p00, p01, p02, p03, p04, p05,
+					p10, p11, p12, p13, p14, p15,
+					p20, p21, p22, p23, p24, p25,
+					p30, p31, p32, p33, p34, p35,
+					p40, p41, p42, p43, p44, p45,
+					p50, p51, p52, p53, p54, p55]
+
+		w00 = SubGrid_0.Weights[0]
+		w01 = SubGrid_0.Weights[1]
+		w02 = SubGrid_0.Weights[2]
+		w03 = SubGrid_1.Weights[6]
+		w04 = SubGrid_1.Weights[3]
+		w05 = SubGrid_1.Weights[0]
+
+		w15 = SubGrid_1.Weights[1]
+		w25 = SubGrid_1.Weights[2]
+		w35 = SubGrid_2.Weights[6]
+		w45 = SubGrid_2.Weights[3]
+		w55 = SubGrid_2.Weights[0]
+
+		w54 = SubGrid_2.Weights[1]
+		w53 = SubGrid_2.Weights[2]
+		w52 = SubGrid_3.Weights[6]
+		w51 = SubGrid_3.Weights[3]
+		w50 = SubGrid_3.Weights[0]
+
+		w40 = SubGrid_3.Weights[1]
+		w30 = SubGrid_3.Weights[2]
+		w20 = SubGrid_0.Weights[6]
+		w10 = SubGrid_0.Weights[3]
+
+		w11 = SubGrid_0.Weights[4]
+		w12 = SubGrid_0.Weights[5]
+		w13 = SubGrid_1.Weights[7]
+		w14 = SubGrid_1.Weights[4]
+
+		w24 = SubGrid_1.Weights[5]
+		w34 = SubGrid_2.Weights[7]
+		w44 = SubGrid_2.Weights[4]
+
+		w43 = SubGrid_2.Weights[5]
+		w42 = SubGrid_3.Weights[7]
+		w41 = SubGrid_3.Weights[4]
+
+		w31 = SubGrid_3.Weights[5]
+		w21 = SubGrid_0.Weights[7]
+
+		w22 = SubGrid_0.Weights[8]
+		w23 = SubGrid_1.Weights[8]
+		w33 = SubGrid_2.Weights[8]
+		w32 = SubGrid_3.Weights[8]
+
+		Weights = [w00, w01, w02, w03, w04, w05,
+					w10, w11, w12, w13, w14, w15,
+					w20, w21, w22, w23, w24, w25,
+					w30, w31, w32, w33, w34, w35,
+					w40, w41, w42, w43, w44, w45,
+					w50, w51, w52, w53, w54, w55]
+		
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		fp.Legs = drawGrid(fp.Poles, 6)
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid64_3_1Grid44:
+	def __init__(self, obj , ControlGrid44, Corner):
+		''' Add the properties '''
+		FreeCAD.Console.PrintMessage("\nControlGrid64_3_1Grid44 class Init\n")
+		obj.addProperty("App::PropertyLink","ControlGrid44","ControlGrid64_3_1Grid44","Reference Bezier Surface").ControlGrid44 = ControlGrid44
+		obj.addProperty("App::PropertyFloat","Corner","ControlGrid64_3_1Grid44","Corner blending curve").Corner = Corner
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid64_3_1Grid44","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid64_3_1Grid44","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid64_3_1Grid44","Weights").Weights
+		obj.Proxy = self
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# get the control poly of the bezier
+		grid_44 = ControlGrid.from_object(fp.ControlGrid44)
+		# get the target corner
+		corner = fp.Corner
+
+		if corner == 0:
+			rotate = 0
+		elif corner == 1:
+			rotate = 1
+		elif corner == 2:
+			rotate = 2
+		elif corner == 3:
+			rotate = 3
+
+		# rotate the grid so that the corner is in the 00 position
+		set_poles, set_weights = GP.permute_poles_weights(grid_44.Poles, grid_44.Weights, '44', GP.rotations[rotate])
+
+		#first degenerate topology try. naive Grid44 to Grid64 triangle mapping with some midpoints. p22=p23=p24=p25=set_poles[10]. this causes folding.
+		#second iteration: add tiny spacing around p22, p23, p24, p25. this will break G1 slightly. The goal is to balance G1 loss versus folding over.
+		#as these point 'un-degenerate' it is tempting to reintroduce curvature matching. On the other hand, aligning them for 0 curvature may help get G1 back.
+		#maybe some weighted average of these various avenues will be best.
+		p00=set_poles[12]
+		p01=set_poles[8]
+		p02=set_poles[4]
+		p03=set_poles[1]
+		p04=set_poles[2]
+		p05=set_poles[3]
+
+		p10=set_poles[13]
+		p11=set_poles[9]
+
+		p14=set_poles[6]
+		p15=set_poles[7]
+
+
+		p20=set_poles[14]
+		''' # 1st strategy
+		p21=set_poles[10]
+		p22=set_poles[10]
+		p23=set_poles[10]
+		p24=set_poles[10]
+		'''
+		p25=set_poles[11]
+
+
+		# 2nd strategy
+		''' this was better, sure, but it stills folds. going to set the whole corner planar, but non collapsed for third try.
+		degen_tan_factor=0.5 #initial was 0.75
+		degen_curv_factor=1.0/6.0 #initial was 0.1
+		#trim tangent
+		p21=p20+(set_poles[10]-p20)*degen_tan_factor
+		# add a segment control line snippet towards the third control point of the underlying 44 grid
+		p22=p21+(p14-p21)*degen_curv_factor
+		#trim tangent
+		p24=p25+(set_poles[10]-p25)*degen_tan_factor
+		# add a segment control line snippet towards the third control point of the underlying 44 grid
+		p23=p24+(p11-p24)*degen_curv_factor
+		'''
+
+		#third strategy
+		p21=p20+(set_poles[10]-p20)*.5 # trim tangent
+		p22=p21+(set_poles[10]-p21)*.5 # 0 curvature along tangent trim
+
+		p24=p25+(set_poles[10]-p25)*.5 # trim tangent
+		p23=p24+(set_poles[10]-p24)*.5 # 0 curvature along tangent trim
+
+
+		p30=set_poles[15]
+		p31=set_poles[15]
+		p32=set_poles[15]
+		p33=set_poles[15]
+		p34=set_poles[15]
+		p35=set_poles[15]
+
+		p12=(set_poles[5]+p11).multiply(0.5)
+		p13=(set_poles[5]+p14).multiply(0.5)
+
+
+		Poles = [p00, p01, p02, p03, p04, p05,
+					p10, p11, p12, p13, p14, p15,
+					p20, p21, p22, p23, p24, p25,
+					p30, p31, p32, p33, p34, p35]
+
+		w00=set_weights[12]
+		w01=set_weights[8]
+		w02=set_weights[4]
+		w03=set_weights[1]
+		w04=set_weights[2]
+		w05=set_weights[3]
+
+		w10=set_weights[13]
+		w11=set_weights[9]
+
+		w14=set_weights[6]
+		w15=set_weights[7]
+
+		w20=set_weights[14]
+		w21=set_weights[10]
+		w22=set_weights[10]
+		w23=set_weights[10]
+		w24=set_weights[10]
+		w25=set_weights[11]
+
+		w30=set_weights[15]
+		w31=set_weights[15]
+		w32=set_weights[15]
+		w33=set_weights[15]
+		w34=set_weights[15]
+		w35=set_weights[15]
+
+		w12=(w02+w21)/2
+		w13=(w03+w24)/2
+
+		Weights = [w00, w01, w02, w03, w04, w05,
+					w10, w11, w12, w13, w14, w15,
+					w20, w21, w22, w23, w24, w25,
+					w30, w31, w32, w33, w34, w35]
+		
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		fp.Legs = drawGrid(fp.Poles, 6)
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid64_normal:
+	def __init__(self, obj , Grid64, v0_normalize_2, v0_normalize_3, v3_normalize_20, v3_normalize_21):
+		''' Add the properties '''
+		FreeCAD.Console.PrintMessage("\nControlGrid64_normal class Init\n")
+		obj.addProperty("App::PropertyLink","Input_Grid","ControlGrid64_normal","Reference 6X4 Grid").Input_Grid = Grid64
+		obj.addProperty("App::PropertyFloat","v0_normalize_2","ControlGrid64_normal","Normalization factor along v0 edge, third point").v0_normalize_2 = v0_normalize_2
+		obj.addProperty("App::PropertyFloat","v0_normalize_3","ControlGrid64_normal","Normalization factor along v0 edge, fourth point").v0_normalize_3 = v0_normalize_3
+		obj.addProperty("App::PropertyFloat","v3_normalize_20","ControlGrid64_normal","Normalization factor along v3 edge, third point").v3_normalize_20 = v3_normalize_20
+		obj.addProperty("App::PropertyFloat","v3_normalize_21","ControlGrid64_normal","Normalization factor along v3 edge, fourth point").v3_normalize_21 = v3_normalize_21
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid64_normal","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid64_normal","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid64_normal","Weights").Weights
+		obj.Proxy = self
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		Poles = fp.Input_Grid.Poles
+		Weights = fp.Input_Grid.Weights
+
+		# do stuff here
+
+		# basic use case: 2 grid44s are mirrorable G1 across a plane, but the grid64 blend that results is not 
+		# necessarily mirrorable g1 across the original plane (existing models show this to be the case). 
+		# we want to modify the control points of this grid64 so that it becomes mirrorable G1 across the plane
+
+		# in practice, this simply means that all grid legs reaching the mirror plane must be perpendicaulr to this plane*.
+		# the naming comes from this 'perpendicularity/normal' aspect of the method: the tool returns a 'normalized' 
+		# version of the grid64. 
+		# *use of weights complicates this, and weight matching is required in addition to alignment of grid legs.
+
+		# there may be cases where we can extend from 'mirroring' to G1 continuation, allowing us to have 2 grid64s 
+		# side by side with good G1, even though the edge is not planar (exsiting models appears to indicate this is possible)
+		# in light of this goal, the 'normal' name seems more appropriate long term than 'mirrorable' or some such.
+
+		# in the simple mirroring case, the mirrorability of the base grid44s plays an important role in limiting the problem.
+		# since all tangents in the grid44s are normal, the ControlGrid64_2Gridd44 blend grid will have the first 2 and
+		# last 2 u rows perpendicular to the mirror plane
+		# it is only the 3rd and 4th inner leges reaching the edge that can have the issue.
+
+		# v0 runs on poles 0->5, v3 runs on poles 18->23
+
+		# step 1, braindead solution: project inner control point to a line normal to the assumed mirror plane. slide adjustment along this line
+		
+		if (fp.v0_normalize_2 != 0.0):
+			# get normal direction, one per corner allows use on non planar edges
+			v0_tan_1 = Poles[7]- Poles[1]
+			Poles_8_temp = ClosestPointOnLine(Poles[2], Poles[2] + v0_tan_1, Poles[8])
+			Poles[8] = Poles[2] + fp.v0_normalize_2 * (Poles_8_temp - Poles[2])
+
+		if (fp.v0_normalize_3 != 0.0):
+			# get normal direction, one per corner allows use on non planar edges
+			v0_tan_4 = Poles[10]- Poles[4]
+			Poles_9_temp = ClosestPointOnLine(Poles[3], Poles[3] + v0_tan_4, Poles[9])
+			Poles[9] = Poles[3] + fp.v0_normalize_3 * (Poles_9_temp - Poles[3])
+
+
+
+		if (fp.v3_normalize_20 != 0.0):
+			# get normal directions, one per corner allows use on non planar edges
+			v3_tan_1 = Poles[13]- Poles[19]
+			Poles_14_temp = ClosestPointOnLine(Poles[20], Poles[20] + v3_tan_1, Poles[14])
+			Poles[14] = Poles[20] + fp.v3_normalize_20 * (Poles_14_temp - Poles[20])
+
+		
+		if (fp.v3_normalize_21 != 0.0):
+			# get normal directions, one per corner allows use on non planar edges
+			v3_tan_4 = Poles[16]- Poles[22]
+			Poles_15_temp = ClosestPointOnLine(Poles[21], Poles[21] + v3_tan_4, Poles[15])
+			Poles[15] = Poles[21] + fp.v3_normalize_21 * (Poles_15_temp - Poles[21])
+
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		Legs = drawGrid(fp.Poles, 6)
+		# the intermediary step makes the 'Legs' object list appendable. 
+		fp.Legs = Legs
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid64_Surf44:
+	def __init__(self, obj , Input_Surf44, direction_to_raise):
+		''' Add the properties '''
+		FreeCAD.Console.PrintMessage("\nControlGrid64_Surf44 class Init\n")
+		obj.addProperty("App::PropertyLink","Input_Surf44","ControlGrid64_Surf44","Reference 4X4 Surface").Input_Surf44 = Input_Surf44
+		obj.addProperty("App::PropertyString","direction_to_raise","ControlGrid64_Surf44","parameter direction to raise (u or v)").direction_to_raise = direction_to_raise
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid64_normal","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid64_normal","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid64_normal","Weights").Weights
+		obj.Proxy = self
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+
+		Surf44 = fp.Input_Surf44.Shape.Surface
+		# homogeneous poles of the input surface, indexed [u][v]
+		Pw_44 = homogeneous_poles(Surf44.getPoles(), Surf44.getWeights())
+
+		if (fp.direction_to_raise == "u"):
+			# raise each u row (one per v), output rows run along u in v order
+			Pw_64 = upgrade_4_to_6(GP.permute_array(Pw_44, 'transpose'))
+		if (fp.direction_to_raise == "v"):
+			# raise each v row (one per u), output rows run along v in reverse u order
+			Pw_64 = GP.permute_array(upgrade_4_to_6(Pw_44), 'reverse_v')
+
+		Poles, Weights = poles_weights_from_homogeneous(Pw_64.reshape(24, 4))
+
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		fp.Legs = drawGrid(fp.Poles, 6)
+		fp.Shape = Part.Shape(fp.Legs)
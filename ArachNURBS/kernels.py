@@ -0,0 +1,2355 @@
+#    ArachNURBS.kernels
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    ArachNURBS kernels: the direct functions (NURBS math, curve and surface construction, blends),
+#    and the helpers shared by the feature classes (ControlGrid, shape cache, output commits).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+from __future__ import division # allows floating point division from integers
+import Part
+import FreeCAD
+from FreeCAD import Base
+if FreeCAD.GuiUp:	# the Gui is optional. the kernels also run in FreeCADCmd, or headless on the standin modules
+	from FreeCAD import Gui
+import math
+import base64
+import concurrent.futures
+from collections import OrderedDict
+import numpy as np
+import SilkLog
+
+log = SilkLog.get('kernels')
+blend_log = SilkLog.get('blend')			# seam and G3 blend solvers
+recompute_log = SilkLog.get('recompute')	# output report after each document recompute
+
+# test message to verify load and reloads
+log.info("importing ArachNURBS")
+
+
+#
+## Basic NURBS rules and terms
+## Order >= 2
+## Order:  2 = line, 3 = quadratic, 4 = cubic ...
+## Degree = Order - 1
+## Order = Degree + 1
+## nPoles >= Order
+## nPoles >= Degree + 1
+## nKnots = nPoles + Order
+## nKnots = nPoles + degree + 1
+## knot vector strictly ascending
+## Pinned knot vector: k=Order, first k knots are equal, last k knots are equal
+
+####
+#### SECTION 1: DIRECT FUNCTIONS - NO PARAMETRIC LINKING BETWEEN OBJECTS (this module)
+#### SECTION 2: PYTHON FEATURE CLASSES - PARAMETRIC LINKING BETWEEN OBJECTS (pose, curves, grids, surfaces, nstar, legacy)
+####
+
+### SECTION 1: DIRECT FUNCTIONS - NO PARAMETRIC LINKING BETWEEN OBJECTS
+## Bottom up view:
+## poles = 3D points with weights, as [[x,y,z],w], or [x,y,z] (these are leftovers waiting to receive weights).
+## These are the basic input data for all that follows.
+## They are obtained from the FreeCAD functions .getPoles() and .getWeights()
+## NOTE: Poles in FreeCAD, such as returned by .getPoles(), refer only to xyz coordinates of a control point,
+## THROUGHOUT the following functions, pole means [[x,y,z],w]
+## lists are probably not efficient, but until FreeCAD has fully integrated homogeneous coordinates
+## for all NURBS functions, this is easier for me :)
+## Right now, the computation of these scripts is ridiculously fast compared
+## to the time taken to generate the surfaces using the FreeCAD Part.BSplineSurface() function
+
+## global variables
+default_tol = 0.000001
+dCds_method = 'analytic'	# 'analytic' (closed form) or 'segment' (legacy iterative segmentation) for Cubic_Bezier_dCds and Cubic_6P_dCds
+G3_solver = 'newton'	# 'newton' (2x2 Newton iteration) or 'search' (legacy step halving search) for blendG3_poly_2x4_1x6
+shape_cache_max_bytes = 64 * 1024 * 1024	# memory cap of the shape cache shared by CubicSurface_44/64/66 and CubicCurve_4/6
+output_report = True	# log a summary of unchanged outputs and skipped executes after each document recompute
+surface_threads = 0	# worker threads for the batched NStar surface builds, 0 builds serially. measure with benchmarks/bench_nstar first:
+					# the Part surface constructors hold the GIL for most of their work
+
+## direct functions actually used in the Classes / available through the Silk FreeCAD workbench:
+
+def equalVectors(vector0,vector1,tol):	# 3D point equality test
+	if (vector1-vector0).Length <= tol:
+		return 1
+	elif (vector1-vector0).Length > tol:
+		return 0
+
+def polyFromLineSet(lines, tol): # build a control polygon from a list of line segments
+	# input parameter 'lines' format = 
+	# [[startpoint0, endpoint0], [startpoint1, endpoint1],[startpoint2, endpoint2],...]
+	# these point pairs are expected to originate in sketches, 
+	# so there should not be any zero length lines
+
+	# we need a list of unique points
+	# points = [pnt0, pnt2, pnt3,...]
+	# we need a list of point multiplicities
+	# mults = [2, 1, 2, 2,....]
+	# and we also need to build a list of lines by index,
+	# as we process the points
+	# lines_indexed = [[i,j], [l,m], [f,g]]
+	# where i, j, k, l, f, g are indices in the unique points list
+
+	# add in first line
+	points = [lines[0][0], lines[0][1]]
+	mults = [1, 1]
+	lines_indexed = [[0,1]]
+
+	# for all lines except the first one (preprocessed)
+	for l_i in range(1, lines.__len__()):
+		# print("processing line: ", l_i)
+		# grab the current line's start and end points
+		a = lines[l_i][0]
+		b = lines[l_i][1]
+		# are this line's points already in the point list?
+		a_in = False
+		b_in = False
+
+		for p_i in range(0, points.__len__()):
+			if equalVectors(a, points[p_i], tol):
+				a_in = True
+				mults[p_i] = mults[p_i]+1
+				a_i = p_i
+				#break
+
+		for p_i in range(0, points.__len__()):
+			if equalVectors(b, points[p_i], tol):
+				b_in = True
+				mults[p_i] = mults[p_i]+1
+				b_i = p_i
+				#break
+
+		if a_in == False:
+			points.append(a)
+			mults.append(1)
+			a_i = points.__len__()-1
+		
+		if b_in == False:
+			points.append(b)
+			mults.append(1)
+			b_i = points.__len__()-1
+
+		lines_indexed.append([a_i, b_i])
+
+	# print("lines \n", lines)
+	# print("points \n", points)
+	# print("mults \n", mults)
+	# print("lines_indexed \n", lines_indexed)
+
+	# check mult for 2s, and max of two 1s
+	ones = mults.count(1)
+	# print("ones, ", ones)
+	twos = mults.count(2)	
+	# print("twos, ", twos)
+
+	if ones != 0 and ones != 2:
+		log.warning("the input line set does not have two clear ends, and does not form a loop at\n the given tolerance. no single path can be formed into a control polygon")
+		return
+	
+	if ones+twos != mults.__len__():
+		log.warning("some points in the input line set appear to be shared by more than 2 lines\nat the given tolerance. no single path can be formed into a control polygon")
+		return
+
+	if ones == 2: # open polygon case
+		# print("open polygon")
+		# use the first singly connected point as the start of the polygon
+		start_i = mults.index(1)
+		# build the indexed polygon with the starting point index
+		poly_indexed = [start_i]
+		# set the search starting point
+		current_point_i = start_i
+		# find the line it is used in
+		current_line_i = None
+
+		# use the second singly connected point as the end of the polygon
+		# only used for error checking?
+		end_i = mults.index(1, start_i+1)
+
+	if ones == 0: # closed polygon case
+		# print("closed polygon")
+		# use the first point and second points as the start of the control polygon
+		poly_indexed = [0,1]
+		# the search will start from the second point
+		current_point_i = 1
+		# we already know we are on the first line
+		current_line_i = 0
+
+		# use the first point as the end of the polygon (loop)
+		# only used for error checking?
+		end_i = 0
+	
+	# search through all the lines for the current point
+	# add the opposite line point to the poly
+	# set this opposite point as the current search point
+	# set the line it was found on current
+	# loop
+
+	while poly_indexed.__len__() < points.__len__(): # this will miss the last point on loops
+		# search for the current point through all the lines
+		for line_i in range(0,lines_indexed.__len__()):
+			# ignore the current line, which is the only place
+			# the current search point could be duplicated
+			if line_i == current_line_i:
+				continue # to next line
+
+			# if the matching point is at the first point of the current line
+			if lines_indexed[line_i][0] == current_point_i:
+				# use the second point as the next point in the poly
+				poly_indexed.append(lines_indexed[line_i][1])
+				# use the second point as the next point to search for
+				current_point_i = lines_indexed[line_i][1]
+				# set the current line
+				current_line_i = line_i
+				break # out of this point search, start over through all the lines
+
+			# if the matching point is at the second point of the current line
+			if lines_indexed[line_i][1] == current_point_i:
+				# use the first point as the next point in the poly
+				poly_indexed.append(lines_indexed[line_i][0])
+				# use the first point as the next point to search for
+				current_point_i = lines_indexed[line_i][0]
+				# set the current line
+				current_line_i = line_i
+				break # out of this point search, start over through all the lines
+
+	# repeat first point as last point for loops
+	if ones == 0:
+		poly_indexed.append(poly_indexed[0])
+	
+	# print("poly_indexed", poly_indexed)
+	polyFromLineSet = []
+	for i in poly_indexed:
+		polyFromLineSet.append(points[i])
+	# print("polyFromLineSet", polyFromLineSet)
+	return polyFromLineSet
+
+def ClosestPointOnLine(a, b, p):
+    ap = p-a
+    ab = b-a
+    result = a + ap.dot(ab)/ab.dot(ab) * ab
+    return result
+
+def int_2l(la,lb):
+	pa1=la.StartPoint
+	pa2=la.EndPoint
+	pb1=lb.StartPoint
+	pb2=lb.EndPoint
+	va=pa2-pa1
+	vb=pb2-pb1
+	lab=Part.Line(pa1,pb1)
+	ab=lab.length()
+	van=va.normalize()
+	vbn=vb.normalize()
+	pa3=pa1+van.multiply(10*ab)
+	pb3=pb1+vbn.multiply(10*ab)
+	lax=Part.Line(pa1,pa3)
+	lbx=Part.Line(pb1,pb3)
+	pln=Part.Plane(pa1,pb1,pa2)
+	int_0_1= lax.intersect2d(lbx,pln) # works down to 5.73 degrees between the lines
+	if int_0_1==[]:
+		return 'intersection failed'
+	int_abs_coord=pln.value(int_0_1[0][0],int_0_1[0][1])
+	return int_abs_coord
+
+def lineOrPoint(p0,p1):
+	if equalVectors(p0, p1, .000001):
+		return [0]
+	else:
+		return [1, Part.LineSegment(p0, p1)]
+
+def drawGrid(poles, columns):
+	nbPoles = len(poles)
+	# print ('nbPoles = ', nbPoles)
+	# print ('columns = ', columns)
+	rows = int(len(poles) / columns)
+	# print ('rows = ', rows)
+	#legs_total = 2 * rows * columns - rows - columns
+	#print ('legs_total = ', legs_total)
+	#legs = [0] * legs_total
+	legs = []
+
+	leg_index = 0
+	# loop all rows
+	for i in range(0,rows):
+		# loop over a row
+		for j in range(0, columns-1):
+			# print ('in row ', i)
+			start = i*columns + j
+			# print ('start = ', start)
+			end = i*columns + j + 1
+			# print ('end = ', end)
+			leg = lineOrPoint(poles[start], poles[end])
+			if (leg[0] == 1):
+				legs.append(leg[1])
+
+	# loop all columns
+	for i in range(0,columns):
+		# loop over a column
+		for j in range(0, rows-1):
+			# print ('in column ', i)
+			start = j*columns + i
+			# print ('start = ', start)
+			end = j*columns + columns + i
+			# print ('end = ', end)
+			leg = lineOrPoint(poles[start], poles[end])
+			if (leg[0] == 1):
+				legs.append(leg[1])
+
+	return legs
+
+def orient_a_to_b(polesa,polesb, tol):   # polesa and polesb are lists of poles that share one endpoint.
+                                    # if needed, this function reorders a so that a.end = b.start or b.end. b is never modified
+
+	if equalVectors(polesa[-1],polesb[0],tol):     # last point of first curve is first point of second curve
+		# curve 1 is oriented properly
+		return polesa
+	elif equalVectors(polesa[-1],polesb[-1],tol):  # last point of first curve is last point of second curve
+		# curve 1 is oriented properly
+		return polesa
+	elif equalVectors(polesa[0],polesb[0],tol):    # first point of first curve is first point of second curve
+		# curve 1 is reversed
+		return polesa[::-1]
+	elif equalVectors(polesa[0],polesb[-1],tol):   # first point of first curve is last point of second curve
+		# curve 1 is reversed
+		return polesa[::-1]
+	else:
+		log.warning("curves do not share endpoints at the current tolerance")
+		return 0
+
+def Cubic_Bezier_ddu(pole0, pole1):          # cubic derivative at curve start (pole1) based on first 
+                                             # two poles (no curve required). Weights not included yet
+	P0=Base.Vector(pole0)
+	P1=Base.Vector(pole1)
+	Cubic_Bezier_ddu = (P1 - P0)*3
+	return Cubic_Bezier_ddu
+
+def Cubic_6P_ddu(pole0, pole1):              # cubic derivative at curve start (pole1) based on first 
+                                             # two poles (no curve required). Weights not included yet.
+	P0=Base.Vector(pole0)
+	P1=Base.Vector(pole1)
+	Cubic_6P_ddu = (P1 - P0)*9
+	return Cubic_6P_ddu
+
+def Cubic_Bezier_d2du2(pole0, pole1, pole2): # cubic second derivative at curve start (pole1) based on first 
+                                             # three poles (no curve required). Weights not included yet.
+	P0=Base.Vector(pole0)
+	P1=Base.Vector(pole1)
+	P2=Base.Vector(pole2)
+	Cubic_Bezier_d2du2 = (P0- P1*2 + P2)*6
+	return Cubic_Bezier_d2du2
+
+def Cubic_6P_d2du2(pole0, pole1, pole2):     # cubic second derivative at curve start (pole1) based on first
+                                             # three poles (no curve required). Weights not included yet.
+	P0=Base.Vector(pole0)
+	P1=Base.Vector(pole1)
+	P2=Base.Vector(pole2)
+	Cubic_6P_d2du2 = (P0*2- P1*3 + P2)*27
+	return Cubic_6P_d2du2
+
+def Cubic_Bezier_curvature(pole0, pole1, pole2): # curvature at curve start (pole1) based on the first three 
+                                                 # poles (no curve required). Weights not included yet.
+	ddu = Cubic_Bezier_ddu(pole0, pole1)
+	d2du2 = Cubic_Bezier_d2du2(pole0, pole1, pole2)
+	Cubic_Bezier_curvature = ddu.cross(d2du2).Length/ddu.Length.__pow__(3)
+	return Cubic_Bezier_curvature
+
+def Cubic_6P_curvature(pole0, pole1, pole2):     # curvature at curve start (pole1) based on the first three
+                                                 # poles (no curve required). Weights not included yet
+	ddu = Cubic_6P_ddu(pole0, pole1)
+	d2du2 = Cubic_6P_d2du2(pole0, pole1, pole2)
+	Cubic_6P_curvature = ddu.cross(d2du2).Length/ddu.Length.__pow__(3)
+	return Cubic_6P_curvature
+
+# Silk cubic knot vectors, as the (knots, mults) pairs taken by buildFromPolesMultsKnots()
+cubic_knots_mults = {4: ((0.0, 1.0), (4, 4)),								# bezier
+					6: ((0.0, 1.0/3.0, 2.0/3.0, 1.0), (4, 1, 1, 4))}		# 6P
+
+def Cubic_curve(poles, weights):	# pinned cubic rational B spline in Silk form, 4 (bezier) or 6 (6P) control points
+	# built in a single call, from the poles, weights, and the cached knots and mults of its type
+	knots, mults = cubic_knots_mults[len(poles)]
+	bs = Part.BSplineCurve()
+	bs.buildFromPolesMultsKnots(poles, mults, knots, False, 3, weights)
+	return bs
+
+def Cubic_surf(grid, nPoles_u, nPoles_v):	# cubic rational B spline surface in Silk form, 4 or 6 poles along u and v
+	# grid is a flat list of [pole, weight], u varying fastest: grid[jj * nPoles_u + ii] is pole (ii, jj).
+	# built in a single call, from the poles, weights, and the cached knots and mults of each direction
+	knots_u, mults_u = cubic_knots_mults[nPoles_u]
+	knots_v, mults_v = cubic_knots_mults[nPoles_v]
+	poles = [[grid[jj * nPoles_u + ii][0] for jj in range(0, nPoles_v)] for ii in range(0, nPoles_u)]
+	weights = [[grid[jj * nPoles_u + ii][1] for jj in range(0, nPoles_v)] for ii in range(0, nPoles_u)]
+	surf = Part.BSplineSurface()
+	surf.buildFromPolesMultsKnots(poles, mults_u, mults_v, knots_u, knots_v, False, False, 3, 3, weights)
+	return surf
+
+def Bezier_Cubic_curve(poles):      # pinned cubic rational B spline, 4 control points
+                                    # Part.BSplineCurve(), cubic bezier form
+#draws a degree 3 rational bspline from first to last point,
+# second and third act as tangents
+# poles is a list: [[[x,y,z],w],[[x,y,z],w],[[x,y,z],w],[[x,y,z],w]]
+## nKnot = 4 + 3 +1 = 8
+## Order = 3 + 1 = 4
+	return Cubic_curve([pole[0] for pole in poles], [pole[1] for pole in poles])
+
+def Bezier_Bicubic_surf(grid_44):   # given a 4 x 4 control grid, build the bicubic bezier
+                                    # surface from a Part.BSplineSurface() in Bicubic Bezier form
+	return Cubic_surf(grid_44, 4, 4)
+
+def NURBS_Cubic_6P_curve(poles):    # pinned cubic rational Bspline, 6 control points
+                                    # Part.BSplineCurve(), just enough to have independent endpoint curvature
+# draws a degree 3 rational bspline from first to last point,
+# second and third act as tangents
+# poles is a list: [[[x,y,z],w],[[x,y,z],w],[[x,y,z],w],[[x,y,z],w],[[x,y,z],w],[[x,y,z],w]]
+## nKnot = 6 + 3 +1 = 10
+## Order = 3 + 1 = 4
+	return Cubic_curve([pole[0] for pole in poles], [pole[1] for pole in poles])
+
+def NURBS_Cubic_66_surf(grid_66):	# given a 6 x 6 control grid, build the cubic
+									# NURBS surface from a Part.BSplineSurface().
+	return Cubic_surf(grid_66, 6, 6)
+
+def NURBS_Cubic_64_surf(grid_64):	# given a 6 x 4 control grid, build the cubic
+									# NURBS surface from a Part.BSplineSurface().
+	return Cubic_surf(grid_64, 6, 4)
+
+def isWeightVectorRational(weights, tol):
+	isItTho = True
+	# compare weights 1, 2, 3, 4 to weight 0
+	if ((abs(weights[1]-weights[0] / weights[0]) < tol) and 
+     	(abs(weights[2]-weights[0] / weights[0]) < tol) and 
+		(abs(weights[3]-weights[0] / weights[0]) < tol)):
+		isItTho = False
+	return isItTho
+
+def homogeneous_poles(poles, weights):
+	# pack poles and weights into homogeneous (4D) coordinates [w*x, w*y, w*z, w].
+	# poles is a (nested) list of vectors, weights the matching (nested) list of floats,
+	# e.g. one row [P0, P1, P2, P3] or several rows [[P0, P1, P2, P3], [...]].
+	# returns a float array of shape (..., nPoles, 4)
+	P = np.array(poles, dtype = float)
+	W = np.array(weights, dtype = float)
+	return np.concatenate((P * W[..., np.newaxis], W[..., np.newaxis]), axis = -1)
+
+def poles_weights_from_homogeneous(Pw):
+	# unpack homogeneous poles (..., nPoles, 4) back to [poles, weights],
+	# with poles as a (nested) list of Base.Vector and weights the matching (nested) list of floats
+	if np.ndim(Pw) > 2:
+		rows = [poles_weights_from_homogeneous(row) for row in Pw]
+		return [[row[0] for row in rows], [row[1] for row in rows]]
+	poles = []
+	weights = []
+	for i in range(0, len(Pw)):
+		w = float(Pw[i][3])
+		poles.append(Base.Vector(Pw[i][0] / w, Pw[i][1] / w, Pw[i][2] / w))
+		weights.append(w)
+	return [poles, weights]
+
+# flat pole count to poles per row, for the Silk grid types. anything else is read as a single row (a poly)
+grid_columns = {9: 3, 16: 4, 24: 6, 36: 6}
+
+class ControlGrid:
+	# compact value type for a Silk control grid (or control poly, as a single row), backed by one
+	# (rows, cols, 4) float64 array of homogeneous poles. flat order is row by row, u along a row.
+	# the Poles and Weights lists, corners, edge polys, degenerate edge flags, and content hash are
+	# derived on first use, then cached. treat instances as immutable.
+	__slots__ = ('Pw', '_Poles', '_Weights', '_corners', '_edges', '_degenerate', '_hash')
+
+	degen_tol = .000001
+
+	def __init__(self, Pw, Poles = None, Weights = None):
+		self.Pw = Pw
+		self._Poles = Poles
+		self._Weights = Weights
+		self._corners = None
+		self._edges = None
+		self._degenerate = None
+		self._hash = None
+
+	@classmethod
+	def from_lists(cls, Poles, Weights, cols = None):
+		# build from flat Poles and Weights lists. the lists are kept, so indexing them costs nothing
+		if cols == None:
+			cols = grid_columns.get(len(Poles), len(Poles))
+		Pw = homogeneous_poles(Poles, Weights).reshape(-1, cols, 4)
+		return cls(Pw, Poles, Weights)
+
+	@classmethod
+	def from_object(cls, obj):
+		# read the Poles and Weights properties of a linked grid (or poly) object once.
+		# each obj.Poles access converts the whole property list from C++, so an execute
+		# reads each linked object once, then indexes the ControlGrid instead of the property.
+		return cls.from_lists(obj.Poles, obj.Weights)
+
+	@property
+	def rows(self):
+		return self.Pw.shape[0]
+
+	@property
+	def cols(self):
+		return self.Pw.shape[1]
+
+	@property
+	def Poles(self):
+		# flat list of Base.Vector
+		if self._Poles is None:
+			self._Poles, self._Weights = poles_weights_from_homogeneous(self.Pw.reshape(-1, 4))
+		return self._Poles
+
+	@property
+	def Weights(self):
+		# flat list of floats
+		if self._Weights is None:
+			self._Poles, self._Weights = poles_weights_from_homogeneous(self.Pw.reshape(-1, 4))
+		return self._Weights
+
+	@property
+	def corners(self):
+		# corner poles, looping around the grid: [first, end of first row, last, start of last row].
+		# for a 4X4 grid these are Poles [0, 3, 15, 12]
+		if self._corners is None:
+			last = self.rows * self.cols - 1
+			index = [0, self.cols - 1, last, last - self.cols + 1]
+			self._corners = [self.Poles[i] for i in index]
+		return self._corners
+
+	@property
+	def edges(self):
+		# the 4 edge polys as homogeneous arrays, in the same loop as the corners:
+		# edge i runs from corner i to corner i+1
+		if self._edges is None:
+			self._edges = [self.Pw[0, :], self.Pw[:, -1], self.Pw[-1, ::-1], self.Pw[::-1, 0]]
+		return self._edges
+
+	@property
+	def degenerate(self):
+		# one flag per edge (same loop as the corners), True when the edge is collapsed to a point
+		if self._degenerate is None:
+			corners = self.corners
+			self._degenerate = tuple(equalVectors(corners[i], corners[(i + 1) % 4], self.degen_tol) == 1 for i in range(0, 4))
+		return self._degenerate
+
+	def __hash__(self):
+		# content hash: identical poles and weights give the same hash
+		if self._hash is None:
+			self._hash = hash((self.Pw.shape, self.Pw.tobytes()))
+		return self._hash
+
+	def __eq__(self, other):
+		return isinstance(other, ControlGrid) and self.Pw.shape == other.Pw.shape and np.array_equal(self.Pw, other.Pw)
+
+class ShapeCache:
+	# least recently used cache of built shapes, keyed on the content of their inputs.
+	# FreeCAD touches every dependent when any upstream property is written, so a CubicSurface
+	# or CubicCurve often recomputes with bit identical poles and weights. a hit skips the OCC build.
+	# memory use is estimated per entry as the input pole bytes plus entry_overhead.
+	entry_overhead = 16 * 1024	# rough size of a small OCC face or edge, with its python wrapper
+
+	def __init__(self, max_bytes):
+		self.max_bytes = max_bytes
+		self.entries = OrderedDict()	# key: [shape, size]
+		self.size = 0
+		self.hits = 0
+		self.misses = 0
+
+	def key(self, kind, grid, reverse):
+		# kind is the class name of the consumer, grid a ControlGrid
+		return (kind, bool(reverse), grid.Pw.shape, grid.Pw.tobytes())
+
+	def get(self, key):
+		# the cached shape, or None. counts the hit or miss
+		entry = self.entries.get(key)
+		if entry is None:
+			self.misses = self.misses + 1
+			return None
+		self.entries.move_to_end(key)
+		self.hits = self.hits + 1
+		return entry[0]
+
+	def put(self, key, shape):
+		if key in self.entries:
+			self.size = self.size - self.entries.pop(key)[1]
+		size = len(key[3]) + self.entry_overhead
+		self.entries[key] = [shape, size]
+		self.size = self.size + size
+		self.trim()
+
+	def trim(self):
+		# drop the least recently used entries until the cache fits in max_bytes
+		while self.size > self.max_bytes and len(self.entries) > 0:
+			shape, size = self.entries.popitem(last = False)[1]
+			self.size = self.size - size
+
+	def set_max_bytes(self, max_bytes):
+		self.max_bytes = max_bytes
+		self.trim()
+
+	def clear(self):
+		self.entries.clear()
+		self.size = 0
+
+	def stats(self):
+		# counters for tuning the memory cap
+		lookups = self.hits + self.misses
+		if lookups > 0:
+			hit_rate = self.hits / lookups
+		else:
+			hit_rate = 0.0
+		return {'hits': self.hits,
+				'misses': self.misses,
+				'hit_rate': hit_rate,
+				'entries': len(self.entries),
+				'bytes': self.size,
+				'max_bytes': self.max_bytes}
+
+# shared by CubicSurface_44/64/66 and CubicCurve_4/6
+shape_cache = ShapeCache(shape_cache_max_bytes)
+
+class OutputStats:
+	# per document record of the Silk objects that wrote new outputs, of those whose recomputed outputs matched
+	# the stored ones, and of every object that executed. unchanged outputs are not written, so they do not re-mark dependents.
+	def __init__(self):
+		self.records = {}	# document name: [changed object names, unchanged object names, executed object names]
+		self.last = {}	# document name: summary of the last recompute
+
+	def get_record(self, doc):
+		return self.records.setdefault(doc.Name, [set(), set(), set()])
+
+	def record(self, fp, changed):
+		# called at the output commit of a Silk execute
+		record = self.get_record(fp.Document)
+		if changed:
+			record[0].add(fp.Name)
+		else:
+			record[1].add(fp.Name)
+		record[2].add(fp.Name)
+
+	def executed(self, obj):
+		# called for every object of the document that executed, Silk or not
+		self.get_record(obj.Document)[2].add(obj.Name)
+
+	def summary(self, doc):
+		# dependents of unchanged outputs that did not execute in this recompute: their executes were skipped.
+		# a dependent that also reads a changed output executed, and is not counted
+		record = self.records.get(doc.Name, [set(), set(), set()])
+		reached = set()
+		for name in record[1]:
+			obj = doc.getObject(name)
+			if obj is not None:
+				reached.update(o.Name for o in obj.InListRecursive)
+		skipped = reached - record[2]
+		return {'changed': len(record[0]),
+				'unchanged': len(record[1]),
+				'executed': len(record[2]),
+				'skipped': len(skipped),
+				'skipped_objects': sorted(skipped)}
+
+	def close(self, doc):
+		# called once the document recompute is done. keeps the summary, starts a new record.
+		# None if no Silk object executed
+		record = self.records.get(doc.Name)
+		if record is None:
+			return None
+		summary = None
+		if len(record[0]) + len(record[1]) > 0:
+			summary = self.summary(doc)
+			self.last[doc.Name] = summary
+		del self.records[doc.Name]
+		return summary
+
+output_stats = OutputStats()
+
+class OutputObserver:
+	# FreeCAD document observer, records the objects that execute and closes the output record of each recompute.
+	# also drops the G3 solver state of deleted objects and closed documents
+	def slotRecomputedObject(self, obj):
+		output_stats.executed(obj)
+
+	def slotDeletedObject(self, obj):
+		forget_G3_reports(obj.Document.Name, obj.Name)
+
+	def slotDeletedDocument(self, doc):
+		forget_G3_reports(doc.Name)
+		output_stats.records.pop(doc.Name, None)
+		output_stats.last.pop(doc.Name, None)
+
+	def slotRecomputedDocument(self, doc):
+		summary = output_stats.close(doc)
+		if summary is not None and output_report == True:
+			recompute_log.info("Silk recompute: %s outputs changed, %s unchanged, %s objects executed, %s downstream executes skipped", summary['changed'], summary['unchanged'], summary['executed'], summary['skipped'])
+
+# reloading this module (Reload_Silk) runs this again, replace the observer instead of adding a second one
+if 'output_observer' in globals():
+	FreeCAD.removeDocumentObserver(output_observer)
+output_observer = OutputObserver()
+FreeCAD.addDocumentObserver(output_observer)
+
+def commit_poles_weights(fp, Poles, Weights, tol = default_tol):
+	# output commit for grids and polys. Poles and Weights are written only if they differ from the
+	# stored values by more than tol, so unchanged outputs do not re-mark the dependents of fp.
+	# returns True if the outputs changed (or Legs / Shape were never built), the caller then rebuilds Legs and Shape.
+	old_Poles = fp.Poles
+	old_Weights = fp.Weights
+	poles_changed = len(old_Poles) != len(Poles)
+	i = 0
+	while poles_changed == False and i < len(Poles):
+		poles_changed = (Poles[i] - old_Poles[i]).Length > tol
+		i = i + 1
+	weights_changed = len(old_Weights) != len(Weights)
+	i = 0
+	while weights_changed == False and i < len(Weights):
+		weights_changed = abs(Weights[i] - old_Weights[i]) > tol
+		i = i + 1
+	if poles_changed:
+		fp.Poles = Poles
+	if weights_changed:
+		fp.Weights = Weights
+	changed = poles_changed or weights_changed or fp.Shape.isNull() or (hasattr(fp, 'Legs') and len(fp.Legs) == 0)
+	output_stats.record(fp, changed)
+	return changed
+
+def commit_shape(fp, shape):
+	# output commit for curves and surfaces. a shape cache hit on unchanged inputs returns the shape
+	# already stored on fp, which is then not written again. returns True if the Shape was written
+	if not fp.Shape.isNull() and fp.Shape.isSame(shape):
+		output_stats.record(fp, False)
+		return False
+	fp.Shape = shape
+	output_stats.record(fp, True)
+	return True
+
+def commit_value(fp, name, value, tol = default_tol):
+	# output commit for a float or float list property that execute writes back, such as the solved inner scales.
+	# value is written only if it differs from the stored one by more than tol, writing an equal value would still
+	# touch fp. returns True if the property was written
+	old = getattr(fp, name)
+	if isinstance(value, (list, tuple)):
+		value = [float(v) for v in value]
+		changed = len(old) != len(value) or any(abs(value[i] - old[i]) > tol for i in range(len(value)))
+	else:
+		value = float(value)
+		changed = abs(value - old) > tol
+	if changed:
+		setattr(fp, name, value)
+	return changed
+
+class StarBuffer:
+	# local working copy of an NStar control grid. the Star building steps read and write poles here and
+	# append their control legs, instead of round tripping fp.StarGrid and fp.Legs through the document.
+	# StarGrid[n][i] is [Base.Vector, weight], pole i of SubGrid n
+	def __init__(self, N, SquishDiag4 = 0):
+		self.N = N
+		self.SquishDiag4 = SquishDiag4
+		self.StarGrid = [0] * N
+		self.Legs = []
+		self.Grid = None	# (N, 36, 4) array [x, y, z, weight] instead of StarGrid, when built by nstar_grid
+
+	def array(self):
+		# the star as an (N, 36, 4) array [x, y, z, weight], the form packed into the StarGrid property
+		if self.Grid is not None:
+			return self.Grid
+		return np.array([[[p[0].x, p[0].y, p[0].z, p[1]] for p in SubGrid] for SubGrid in self.StarGrid], dtype = float)
+
+# the StarGrid PythonObject property holds the star as a packed float64 buffer: {'format', 'shape', 'data'}, with the
+# (N, 36, 4) array [x, y, z, weight] as little endian bytes, base64 encoded for the JSON the property is saved as.
+# documents saved before packing hold nested [[x, y, z], weight] lists. star_grid_view() reads both, and the next
+# execute repacks the old form through commit_star(). nothing is written on restore, so opening a document does not modify it
+star_grid_format = 'f8le-base64'
+
+def pack_star_grid(G):
+	G = np.ascontiguousarray(G, dtype = '<f8')
+	return {'format': star_grid_format, 'shape': list(G.shape), 'data': base64.b64encode(G.tobytes()).decode('ascii')}
+
+def is_packed_star_grid(StarGrid):
+	return isinstance(StarGrid, dict) and StarGrid.get('format') == star_grid_format
+
+def star_grid_view(StarGrid):
+	# read only (N, 36, 4) array of a saved StarGrid. a packed StarGrid is viewed in place in its decoded bytes,
+	# without a per pole conversion. nested lists from before packing are converted
+	if is_packed_star_grid(StarGrid):
+		return np.frombuffer(base64.b64decode(StarGrid['data']), dtype = '<f8').reshape(StarGrid['shape'])
+	G = np.array([[[p[0][0], p[0][1], p[0][2], p[1]] for p in SubGrid] for SubGrid in StarGrid], dtype = float).reshape(-1, 36, 4)
+	G.flags.writeable = False
+	return G
+
+def commit_star(fp, star, tol = default_tol):
+	# output commit for NStar control grids: N, StarGrid, Legs and Shape are each written once, at the end of
+	# execute. an unchanged StarGrid is not written again. returns True if the StarGrid was written
+	G = star.array()
+	old = fp.StarGrid
+	changed = True
+	if is_packed_star_grid(old) and tuple(old['shape']) == G.shape:
+		changed = G.size > 0 and np.abs(star_grid_view(old) - G).max() > tol
+	if fp.N != star.N:
+		fp.N = star.N
+	if changed:
+		fp.StarGrid = pack_star_grid(G)
+	if changed or fp.Shape.isNull() or len(fp.Legs) == 0:
+		fp.Legs = star.Legs
+		fp.Shape = Part.Shape(star.Legs)
+		changed = True
+	output_stats.record(fp, changed)
+	return changed
+
+# NStar diagonal 4 scale per N, spreads out (N = 3) or pulls in the star center. other N use the raw diagonal
+star_diag4_scale = {3: 0.75, 5: 1.25, 6: 1.5}
+
+# control legs of the NStar stages, as pole index pairs: per pair of neighboring SubGrids (Sub_0, Sub_1)
+# or per SubGrid. nstar_legs() draws them in stage order, the order the Star building steps append them
+star_legs_Row2 = [[[9,15],[10,16],[11,17],[14,15],[15,16],[16,17]],[[14,20],[19,20],[20,26],[25,26],[26,32]]]
+star_legs_Diag3 = [[15,21],[20,21]]
+star_legs_Row3 = [[[16,22],[17,23],[21,22],[22,23]],[[21,27],[26,27],[27,33]]]
+star_legs_Diag4 = [[22,28],[27,28]]
+star_legs_Row4 = [[[23,29],[28,29]],[[28,34]]]
+star_legs_Center = [[29,35]]
+
+def star_array(SubGrids):
+	# the StarGrid of N 6x6 SubGrids as an (N, 36, 4) array [x, y, z, weight]. the poles are cartesian,
+	# the NStar construction works on the poles and carries the weights through.
+	# SubGrids is a list of [Poles, Weights], flat with u varying fastest
+	return np.array([[[p[0], p[1], p[2], w] for p, w in zip(Poles, Weights)] for Poles, Weights in SubGrids], dtype = float)
+
+def cross_rows(a, b):
+	# row wise cross product of two (N, 3) arrays. np.cross does the same, with a much larger call overhead at small N
+	return np.stack((a[:,1]*b[:,2] - a[:,2]*b[:,1], a[:,2]*b[:,0] - a[:,0]*b[:,2], a[:,0]*b[:,1] - a[:,1]*b[:,0]), axis = 1)
+
+def project_to_planes(P, origins, normals):
+	# orthogonal projection of points P (N, 3) on N planes. a null normal (degenerate plane) leaves the point
+	length = np.sqrt(np.einsum('ij,ij->i', normals, normals))
+	n = normals / np.where(length > 0.0, length, 1.0)[:, np.newaxis]
+	return P - np.einsum('ij,ij->i', P - origins, n)[:, np.newaxis] * n
+
+def nstar_grid(G, squish = False):
+	# NStar control grid from the N SubGrids around a star center, all SubGrids in one vectorized pass per stage.
+	# G is an (N, 36, 4) array [x, y, z, weight] of SubGrid poles (u varying fastest), ordered around the center.
+	# the u = 5 column of SubGrid i (poles 5, 11, ...35) is the seam to the v = 5 row of SubGrid i+1 (poles 30...35),
+	# pole 35 of every SubGrid is the star center. np.roll gives the previous / next SubGrid around the loop.
+	# stages, as in ControlGridNStar66_NSub: Row2, Diag3, Row3, Diag4 (optionally squished to a plane), Row4, Center.
+	# returns a new (N, 36, 4) array, the weights are unchanged
+	G = np.array(G, dtype = float)
+	N = G.shape[0]
+	P = G[:, :, 0:3]
+	# per SubGrid i, the index of SubGrid i-1 / i+1. indexing with these is cheaper than rolling every operand
+	prev_i = np.roll(np.arange(N), 1)
+	next_i = np.roll(np.arange(N), -1)
+	def L1Scale(p0, p1, p2):
+		d = p1 - p0
+		return np.einsum('ij,ij->i', d, p2 - p1) / np.einsum('ij,ij->i', d, d)
+	def col(a):
+		return a[:, np.newaxis]
+
+	# Row2: seam tangent scale averaged between SubGrid i and i+1
+	P_next = P[next_i]
+	L1Scale_Sub0_v = L1Scale(P[:,2], P[:,8], P[:,14])
+	L1Scale_Sub1_u = L1Scale(P_next[:,12], P_next[:,13], P_next[:,14])
+	L1Scale_Mid = 0.5 * (L1Scale_Sub0_v + L1Scale_Sub1_u)
+	L1Scale_15 = 0.5 * (L1Scale_Sub0_v + L1Scale_Mid)
+	L1Scale_20 = 0.5 * (L1Scale_Sub1_u + L1Scale_Mid)
+	Mid_p2 = P[:,17] + col(L1Scale_Mid) * (P[:,11] - P[:,5])
+	P[:,32] = Mid_p2[prev_i]
+	P[:,26] = P[:,26] + col(L1Scale_Mid[prev_i]) * (P[:,25] - P[:,24])
+	P[:,20] = P[:,20] + col(L1Scale_20[prev_i]) * (P[:,19] - P[:,18])
+	P[:,17] = Mid_p2
+	P[:,16] = P[:,16] + col(L1Scale_Mid) * (P[:,10] - P[:,4])
+	P[:,15] = P[:,15] + col(L1Scale_15) * (P[:,9] - P[:,3])
+
+	# Diag3: parallelogram
+	P[:,21] = P[:,20] + P[:,15] - P[:,14]
+
+	# Row3: seam point from both SubGrids, then averaged to the seam neighbors
+	P_next = P[next_i]
+	Mid_p3 = P[:,17] + 0.5 * (P[:,21] - P[:,15] + P_next[:,21] - P_next[:,20])
+	P[:,23] = Mid_p3
+	P[:,33] = Mid_p3[prev_i]
+	P[:,22] = P[:,16] + 0.5 * (P[:,21] - P[:,15] + P[:,23] - P[:,17])
+	P[:,27] = P[:,26] + 0.5 * (P[:,21] - P[:,20] + P[:,33] - P[:,32])
+
+	# Diag4: parallelogram diagonal, its components scaled by the opposite edge on the adjacent SubGrid,
+	# then averaged with its projections on the planes through the seams to the previous and next SubGrids
+	P_prev = P[prev_i]
+	P_next = P[next_i]
+	u_28 = P[:,22] - P[:,21]
+	v_28 = P[:,27] - P[:,21]
+	u_28_length = np.sqrt(np.einsum('ij,ij->i', u_28, u_28))
+	v_28_length = np.sqrt(np.einsum('ij,ij->i', v_28, v_28))
+	u_28_prev = P_prev[:,27] - P_prev[:,21]
+	v_28_next = P_next[:,22] - P_next[:,21]
+	scaled_u_28 = u_28 * col(1.0 + (np.sqrt(np.einsum('ij,ij->i', u_28_prev, u_28_prev)) - u_28_length) / (3.0 * u_28_length))
+	scaled_v_28 = v_28 * col(1.0 + (np.sqrt(np.einsum('ij,ij->i', v_28_next, v_28_next)) - v_28_length) / (3.0 * v_28_length))
+	Sub_28_scaled = P[:,21] + star_diag4_scale.get(N, 1.0) * (scaled_u_28 + scaled_v_28)
+	seam = P[:,23] - P[:,33]
+	Sub_28_prev_proj = project_to_planes(Sub_28_scaled, P[:,33], cross_rows(seam, P_prev[:,33] - P[:,33]))
+	Sub_28_next_proj = project_to_planes(Sub_28_scaled, P[:,33], cross_rows(seam, P_next[:,23] - P[:,33]))
+	P[:,28] = 0.5 * Sub_28_scaled + 0.25 * (Sub_28_prev_proj + Sub_28_next_proj)
+
+	if squish:
+		# project all poles [28] to the plane through their average, normal to the sum of the cross products around the loop
+		SquishCenter = P[:,28].mean(axis = 0)
+		d = P[:,28] - SquishCenter
+		normal = cross_rows(d, d[next_i]).sum(axis = 0)
+		P[:,28] = project_to_planes(P[:,28], SquishCenter[np.newaxis], normal[np.newaxis])
+
+	# Row4: seam point pulled up between neighboring poles [28]
+	Mid_p4 = 0.5 * (P[:,28] + P[next_i,28])
+	P[:,29] = Mid_p4
+	P[:,34] = Mid_p4[prev_i]
+
+	# Center: average of all poles [29]
+	P[:,35] = P[:,29].mean(axis = 0)
+	return G
+
+def nstar_legs(G):
+	# control leg visualization of an NStar control grid G (N, 36, 4), as Part.LineSegment in stage order
+	N = len(G)
+	V = [[Base.Vector(p[0], p[1], p[2]) for p in SubGrid] for SubGrid in np.asarray(G)[:, :, 0:3].tolist()]
+	Legs = []
+	def add(n, legs):
+		for i in legs:
+			Legs.append(Part.LineSegment(V[n][i[0]], V[n][i[1]]))
+	for n in range(N):
+		add(n, star_legs_Row2[0])
+		add((n + 1) % N, star_legs_Row2[1])
+	for n in range(N):
+		add(n, star_legs_Diag3)
+	for n in range(N):
+		add(n, star_legs_Row3[0])
+		add((n + 1) % N, star_legs_Row3[1])
+	# the Diag4 steps run over SubGrids 1, 2, ... N-1, 0
+	for n in range(1, N + 1):
+		add(n % N, star_legs_Diag4)
+	for n in range(N):
+		add(n, star_legs_Row4[0])
+		add((n + 1) % N, star_legs_Row4[1])
+	for n in range(N):
+		add(n, star_legs_Center)
+	return Legs
+
+def knot_insertion_matrix(knots, degree, u):
+	# the linear map of a single knot insertion (Boehm), as a (nPoles + 1) x nPoles matrix.
+	# knots is the full knot vector before insertion. returns [M, new_knots]
+	nPoles = len(knots) - degree - 1
+	# knot span containing u: knots[k] <= u < knots[k+1]
+	k = int(np.searchsorted(knots, u, side = 'right')) - 1
+	M = np.zeros((nPoles + 1, nPoles))
+	for i in range(0, nPoles + 1):
+		if i <= k - degree:
+			M[i][i] = 1.0
+		elif i > k:
+			M[i][i-1] = 1.0
+		else:
+			a = (u - knots[i]) / (knots[i + degree] - knots[i])
+			M[i][i] = a
+			M[i][i-1] = 1.0 - a
+	new_knots = list(knots[:k+1]) + [u] + list(knots[k+1:])
+	return [M, new_knots]
+
+def insert_knot_homogeneous(Pw, knots, degree, u):
+	# exact knot insertion on homogeneous poles, for any number of curves sharing a knot vector.
+	# working in 4D keeps the weights exact, instead of letting them collapse to 1 as the
+	# Part.BSplineCurve insertKnot() route can.
+	# Pw is an array (..., nPoles, 4). returns [Pw_new (..., nPoles + 1, 4), new_knots]
+	M, new_knots = knot_insertion_matrix(knots, degree, u)
+	return [np.matmul(M, Pw), new_knots]
+
+def knot_insertion_operator(knots, degree, u_list):
+	# the product of successive knot insertions at each u in u_list, as a single matrix.
+	# returns [M, new_knots]
+	nPoles = len(knots) - degree - 1
+	M = np.identity(nPoles)
+	for u in u_list:
+		M_u, knots = knot_insertion_matrix(knots, degree, u)
+		M = np.matmul(M_u, M)
+	return [M, knots]
+
+def split_6P_operator(half):
+	# the first (half = 0) or second (half = 1) half of a 6P cubic NURBS, re-established as a 6P.
+	# saturate the knot at 1/2, keep the 5 poles of the requested half, then insert 1/6 or 5/6
+	# so the half has evenly spaced inner knots again. returns a 6 x 6 matrix
+	M, knots = knot_insertion_operator(knots_6P, 3, [0.5, 0.5, 0.5])
+	if half == 0:
+		M_half, knots_half = knot_insertion_operator(knots[0:9], 3, [1.0/6.0])
+		return np.matmul(M_half, M[0:5])
+	M_half, knots_half = knot_insertion_operator(knots[4:13], 3, [5.0/6.0])
+	return np.matmul(M_half, M[4:9])
+
+# Silk only uses two cubic knot vectors, so the upgrades between them are constant matrices on
+# homogeneous poles. compute them once here, instead of inserting knots on every recompute.
+knots_Bezier = [0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0]
+knots_6P = [0.0, 0.0, 0.0, 0.0, 1.0/3.0, 2.0/3.0, 1.0, 1.0, 1.0, 1.0]
+# 6 x 4: one bezier row to one 6P row
+upgrade_4_to_6_matrix = knot_insertion_operator(knots_Bezier, 3, [1.0/3.0, 2.0/3.0])[0]
+# 36 x 16: a flattened 4x4 grid to a flattened 6x6 grid, upgrading both directions at once
+upgrade_44_to_66_matrix = np.kron(upgrade_4_to_6_matrix, upgrade_4_to_6_matrix)
+# 6 x 6: each half of a 6P row as a 6P row
+split_6P_matrix_0 = split_6P_operator(0)
+split_6P_matrix_1 = split_6P_operator(1)
+# 5 x 6: each half of a 6P row split at 1/2, the knot saturated there (the de Casteljau split of the middle span).
+# the halves keep the parameter range of the original, [0, 1/2] and [1/2, 1], as segment() does
+split_half_operator = knot_insertion_operator(knots_6P, 3, [0.5, 0.5, 0.5])[0]
+split_half_matrix_0 = split_half_operator[0:5]
+split_half_matrix_1 = split_half_operator[4:9]
+# (knots, mults) of the quadrant directions: first half, second half, and second half with 5/6 inserted (split_6P_matrix_1)
+split_knots_mults = {0: ((0.0, 1.0/3.0, 0.5), (4, 1, 4)),
+					1: ((0.5, 2.0/3.0, 1.0), (4, 1, 4)),
+					'6P': ((0.5, 2.0/3.0, 5.0/6.0, 1.0), (4, 1, 1, 4))}
+
+def split_66_quadrants(Pw):
+	# the four quadrants of 6x6 cubic NURBS split at (1/2, 1/2), every surface and quadrant in one pass on the control grids.
+	# Pw is an array (N, 6, 6, 4) of homogeneous poles [u][v], as getPoles() / getWeights(). returns
+	# [main, lead, lag, center]: main [0, 1/2] x [0, 1/2], lead [1/2, 1] x [0, 1/2], lag [0, 1/2] x [1/2, 1], each (N, 5, 5, 4),
+	# and center [1/2, 1] x [1/2, 1] as (N, 6, 6, 4), with 5/6 inserted in both directions to make it a 6P grid again
+	Pw = np.asarray(Pw, dtype = float)
+	u_0 = np.einsum('iu,nuvk->nivk', split_half_matrix_0, Pw)
+	u_1 = np.einsum('iu,nuvk->nivk', split_half_matrix_1, Pw)
+	main = np.einsum('jv,nivk->nijk', split_half_matrix_0, u_0)
+	lead = np.einsum('jv,nivk->nijk', split_half_matrix_0, u_1)
+	lag = np.einsum('jv,nivk->nijk', split_half_matrix_1, u_0)
+	u_center = np.einsum('iu,nuvk->nivk', split_6P_matrix_1, Pw)
+	center = np.einsum('jv,nivk->nijk', split_6P_matrix_1, u_center)
+	return [main, lead, lag, center]
+
+def Cubic_surf_homogeneous(Pw, knots_mults_u, knots_mults_v):
+	# cubic rational B spline surface from homogeneous poles Pw (nPoles_u, nPoles_v, 4) [u][v], and (knots, mults) per direction
+	poles, weights = poles_weights_from_homogeneous(Pw)
+	surf = Part.BSplineSurface()
+	surf.buildFromPolesMultsKnots(poles, knots_mults_u[1], knots_mults_v[1], knots_mults_u[0], knots_mults_v[0], False, False, 3, 3, weights)
+	return surf
+
+def build_surfaces(function, args_list, threads = None):
+	# [function(*args) for args in args_list], in a pool of worker threads if threads (default surface_threads) > 1
+	if threads is None:
+		threads = surface_threads
+	if threads > 1 and len(args_list) > 1:
+		with concurrent.futures.ThreadPoolExecutor(max_workers = threads) as pool:
+			return list(pool.map(lambda args: function(*args), args_list))
+	return [function(*args) for args in args_list]
+
+def upgrade_4_to_6(rows):
+	# upgrade cubic bezier rows to 6P cubic NURBS rows, exactly (this is knot insertion at 1/3 and 2/3).
+	# rows is an array (..., 4, 4) of homogeneous poles, e.g. one row, a 4x4 grid, or a stack of grids,
+	# all upgraded in a single matrix multiply. returns an array (..., 6, 4)
+	return np.matmul(upgrade_4_to_6_matrix, rows)
+
+def upgrade_44_to_66(grid):
+	# upgrade a bicubic bezier grid to a 6x6 NURBS grid, in both directions.
+	# grid is an array (..., 4, 4, 4) of homogeneous poles [row][col]. returns an array (..., 6, 6, 4)
+	grid = np.asarray(grid, dtype = float)
+	flat = grid.reshape(grid.shape[:-3] + (16, 4))
+	return np.matmul(upgrade_44_to_66_matrix, flat).reshape(grid.shape[:-3] + (6, 6, 4))
+
+def blend_rows_2x4_1x6(Pw_0, Pw_1, scale_0, scale_1, scale_2, scale_3):
+	# blend rows of cubic bezier pairs into rows of 6 point cubic NURBS, all rows in one vectorized pass.
+	# this function assumes each row of Pw_0 flows into the same row of Pw_1 without checking.
+	# Pw_0, Pw_1 are arrays (nRows, 4, 4) of homogeneous poles.
+	# scale_0 and scale_3 are the outer tangent scales, shared by all rows.
+	# scale_1 and scale_2 are the inner tangent scales, one per row (or a single value for all rows).
+	# returns an array (nRows, 6, 4) of homogeneous poles
+	degen_tol = .000001
+
+	# upgrade both bezier inputs to 6P. the inner weights are exact, so rationality is preserved,
+	# and the outer weights match the inputs (G0)
+	Pw_6_0 = upgrade_4_to_6(np.asarray(Pw_0, dtype = float))
+	Pw_6_1 = upgrade_4_to_6(np.asarray(Pw_1, dtype = float))
+	X_0 = Pw_6_0[..., 0:3] / Pw_6_0[..., 3:4]
+	X_1 = Pw_6_1[..., 0:3] / Pw_6_1[..., 3:4]
+
+	# the blend keeps the first half of the first 6P and the second half of the second 6P
+	X = np.concatenate((X_0[:, 0:3], X_1[:, 3:6]), axis = 1)
+	W = np.concatenate((Pw_6_0[:, 0:3, 3], Pw_6_1[:, 3:6, 3]), axis = 1)
+	nRows = X.shape[0]
+	scale_1 = np.broadcast_to(np.asarray(scale_1, dtype = float), (nRows,))[:, np.newaxis]
+	scale_2 = np.broadcast_to(np.asarray(scale_2, dtype = float), (nRows,))[:, np.newaxis]
+
+	# a collapsed input row keeps its poles. collapsed rows come from degenerate grid edges
+	degen_0 = np.linalg.norm(X_0[:, 3] - X_0[:, 0], axis = -1) <= degen_tol
+	degen_1 = np.linalg.norm(X_1[:, 2] - X_1[:, 5], axis = -1) <= degen_tol
+
+	def scale_end(p0, p1, p2, scale_tan, scale_inner, degen):
+		# scale the end leg p0-p1 along its tangent, and the next leg p1-p2 along the tangent (inner scale)
+		# and orthogonal to it (height, scaled by the square of the tangent scale)
+		l0 = p1 - p0											# end control leg
+		l0_len = np.linalg.norm(l0, axis = -1)[:, np.newaxis]
+		tan0 = l0 / np.where(l0_len > 0.0, l0_len, 1.0)			# unit tangent direction
+		l1 = tan0 * np.sum(tan0 * (p2 - p1), axis = -1)[:, np.newaxis]	# projection of next control leg along tangent
+		h1 = (p2 - p1) - l1										# height of next control leg orthogonal to tangent
+		p1_scl = p0 + l0 * scale_tan							# reposition second control point
+		H1 = h1 * scale_tan ** 2								# apply height scale
+		L1 = (p1_scl - p0) * scale_inner						# apply inner tangent scale
+		p2_scl = p1_scl + H1 + L1								# reposition third control point
+		keep = degen[:, np.newaxis]
+		return [np.where(keep, p1, p1_scl), np.where(keep, p2, p2_scl)]
+
+	p1_scl, p2_scl = scale_end(X[:, 0], X[:, 1], X[:, 2], scale_0, scale_1, degen_0)
+	p4_scl, p3_scl = scale_end(X[:, 5], X[:, 4], X[:, 3], scale_3, scale_2, degen_1)
+
+	X_blend = np.stack((X[:, 0], p1_scl, p2_scl, p3_scl, p4_scl, X[:, 5]), axis = 1)
+	# set the weights. No scaling at this point.
+	return np.concatenate((X_blend * W[..., np.newaxis], W[..., np.newaxis]), axis = -1)
+
+def blend_poly_2x4_1x6(poles_0,weights_0, poles_1, weights_1, scale_0, scale_1, scale_2, scale_3):	
+	# blend two cubic bezier into a 6 point cubic NURBS. this function assumes poles_0 flow into poles_1 without checking.
+	# single row version of blend_rows_2x4_1x6
+	Pw_0 = homogeneous_poles([poles_0], [weights_0])
+	Pw_1 = homogeneous_poles([poles_1], [weights_1])
+	poles, weights = poles_weights_from_homogeneous(blend_rows_2x4_1x6(Pw_0, Pw_1, scale_0, scale_1, scale_2, scale_3)[0])
+
+	# we need to return the scales so the function result is compatible with the
+	#'Fair' and 'G3' version of the blend function, which modify these values
+	# not a strict requirement
+	return [poles,weights, scale_1, scale_2]
+
+def seam_rotations_2Grid44(grid_0, grid_1, tol):
+	# find the seam between two 4X4 ControlGrids, and the number of 90 degree clockwise rotations
+	# that put the seam on the right side of the first grid and on the left side of the second grid.
+	# returns [rotate_0, rotate_1]
+
+	# corner points [0, 3, 15, 12]
+	corners_0 = grid_0.corners
+	corners_1 = grid_1.corners
+
+	# additional processing for degenerate grids
+	# do not assume which edge is collapsed. it is predictable for ControlGrid44_3_Rotate and its segmentation,
+	# but future segments may not be. for example when we eventually segment 64s and 66s, which may also include
+	# degenerate grids
+	# edge i runs from corner i to corner i+1. only the first collapsed edge is considered
+	degen_edges = [[0, 1], [1, 2], [2, 3], [0, 3]]
+
+	# grid 0
+	degen_0 = 0
+	degen_0_index = []
+	if True in grid_0.degenerate:
+		degen_0 = 1
+		degen_0_index = degen_edges[grid_0.degenerate.index(True)]
+	
+	blend_log.debug("degen_0: %s", degen_0)
+	blend_log.debug("degen_0_index: %s", degen_0_index)
+
+	# grid 1
+	degen_1 = 0
+	degen_1_index = []
+	if True in grid_1.degenerate:
+		degen_1 = 1
+		degen_1_index = degen_edges[grid_1.degenerate.index(True)]
+
+	blend_log.debug("degen_1: %s", degen_1)
+	blend_log.debug("degen_1_index: %s", degen_1_index)
+	
+	degen = degen_0 + degen_1
+
+	# find all matching corner points across the two grids
+	# degenerate edges will cause repeat values
+	seam_index_raw_0 = []
+	seam_index_raw_1 = []
+	for i in range(0,4):
+		for j in range(0,4):
+			if equalVectors(corners_0[i],corners_1[j], tol):
+				seam_index_raw_0.append(i)
+				seam_index_raw_1.append(j)
+	seam_index_dedupe_0 = [*set(seam_index_raw_0)] # the * unpacks the set into the list
+	seam_index_dedupe_0.sort()
+	blend_log.debug("seam_index_dedupe_0: %s", seam_index_dedupe_0)
+	seam_index_dedupe_1 = [*set(seam_index_raw_1)]
+	seam_index_dedupe_1.sort()
+	blend_log.debug("seam_index_dedupe_1: %s", seam_index_dedupe_1)
+
+	if (len(seam_index_dedupe_0) == 3):
+		# the true seam is the non-degenerate point, and the degenerate point closest to it
+		for i in range(0,3):
+			if (seam_index_dedupe_0[i] not in degen_0_index):
+				non_degen_index_0 = i
+				non_degen_corner_0 = seam_index_dedupe_0[i]
+		blend_log.debug("non_degen_index_0: %s", non_degen_index_0)
+		blend_log.debug("non_degen_corner_0: %s", non_degen_corner_0)
+		if (non_degen_index_0 == 0 ):
+			if ((seam_index_dedupe_0[1]-seam_index_dedupe_0[0]) == 1 ):
+				seam_0 = [seam_index_dedupe_0[0], seam_index_dedupe_0[1]]
+			else:
+				seam_0 = [seam_index_dedupe_0[0], seam_index_dedupe_0[2]]
+		if (non_degen_index_0 == 1 ):
+			if ((seam_index_dedupe_0[1]-seam_index_dedupe_0[0]) == 1 ):
+				seam_0 = [seam_index_dedupe_0[0], seam_index_dedupe_0[1]]
+			else:
+				seam_0 = [seam_index_dedupe_0[1], seam_index_dedupe_0[2]]
+		if (non_degen_index_0 == 2 ):
+			if ((seam_index_dedupe_0[2]-seam_index_dedupe_0[1]) == 1 ):
+				seam_0 = [seam_index_dedupe_0[1], seam_index_dedupe_0[2]]
+			else:
+				seam_0 = [seam_index_dedupe_0[0], seam_index_dedupe_0[2]]
+	elif (len(seam_index_dedupe_0) == 2):
+		seam_0 = seam_index_dedupe_0
+	blend_log.debug("seam_0 %s", seam_0)
+
+
+	if (len(seam_index_dedupe_1) == 3):
+		# the true seam is the non-degenerate point, and the degenerate point closest to it
+		for i in range(0,3):
+			if (seam_index_dedupe_1[i] not in degen_1_index):
+				non_degen_index_1 = i
+				non_degen_corner_1 = seam_index_dedupe_1[i]
+		blend_log.debug("non_degen_index_1: %s", non_degen_index_1)
+		blend_log.debug("non_degen_corner_1: %s", non_degen_corner_1)
+		if (non_degen_index_1 == 0 ):
+			if ((seam_index_dedupe_1[1]-seam_index_dedupe_1[0]) == 1 ):
+				seam_1 = [seam_index_dedupe_1[0], seam_index_dedupe_1[1]]
+			else:
+				seam_1 = [seam_index_dedupe_1[0], seam_index_dedupe_1[2]]
+		if (non_degen_index_1 == 1 ):
+			if ((seam_index_dedupe_1[1]-seam_index_dedupe_1[0]) == 1 ):
+				seam_1 = [seam_index_dedupe_1[0], seam_index_dedupe_1[1]]
+			else:
+				seam_1 = [seam_index_dedupe_1[1], seam_index_dedupe_1[2]]
+		if (non_degen_index_1 == 2 ):
+			if ((seam_index_dedupe_1[2]-seam_index_dedupe_1[1]) == 1 ):
+				seam_1 = [seam_index_dedupe_1[1], seam_index_dedupe_1[2]]
+			else:
+				seam_1 = [seam_index_dedupe_1[0], seam_index_dedupe_1[2]]
+	elif (len(seam_index_dedupe_1) == 2):
+		seam_1 = seam_index_dedupe_1
+	blend_log.debug("seam_1 %s", seam_1)
+
+	# rotate the grids so that the seam is on the right side for Grid_0 and the left side for Grid_1
+	# in the ideal case, no rotation is required:
+	# seam_index[0]=[1,0], and
+	# seam_index[1]=[2,3]
+
+	# left grid correction rotation
+	if seam_0 == [1,2]:
+		rotate_0 = 0 # times 90 degrees clockwise
+	if seam_0 == [2,3]:
+		rotate_0 = 1
+	if seam_0 == [0,3]:
+		rotate_0 = 2 
+	if seam_0 == [0,1]:
+		rotate_0 = 3 
+
+	# right grid correction rotation
+	if seam_1 == [0,3] or seam_1 == [3,0]:
+		rotate_1 = 0 # times 90 degrees clockwise
+	if seam_1 == [0,1] or seam_1 == [1,0]:
+		rotate_1 = 1 
+	if seam_1 == [1,2] or seam_1 == [2,1]:
+		rotate_1 = 2 
+	if seam_1 == [3,2] or seam_1 == [2,3]:
+		rotate_1 = 3
+
+	blend_log.debug("rotate left: %s", rotate_0)
+	blend_log.debug("rotate right: %s", rotate_1)
+
+	return [rotate_0, rotate_1]
+
+def rational_curvature_dCds(P0, w0, dA, d2A, d3A, dw, d2w, d3w):
+	# curvature and rate of change of curvature per unit length (arc) at a curve point,
+	# given the point P0, its weight w0, and the first three derivatives of the homogeneous curve
+	# at that point, split into xyz part (dA, d2A, d3A) and weight part (dw, d2w, d3w).
+	# returns [C, dCds]
+	# derivatives of the rational curve (quotient rule, applied recursively)
+	dC = (dA - P0 * dw) * (1.0 / w0)
+	d2C = (d2A - dC * (2 * dw) - P0 * d2w) * (1.0 / w0)
+	d3C = (d3A - d2C * (3 * dw) - dC * (3 * d2w) - P0 * d3w) * (1.0 / w0)
+	# speed along the curve. a collapsed first leg has no defined curvature
+	speed = dC.Length
+	if speed < 1.0e-12:
+		return [0.0, 0.0]
+	# curvature = |C' x C''| / |C'|^3
+	B = dC.cross(d2C)
+	dB = dC.cross(d3C)
+	B_len = B.Length
+	C = B_len / speed.__pow__(3)
+	# derivative of |C' x C''|. at a zero curvature point, the one sided limit is |d/dt (C' x C'')|
+	if B_len <= 1.0e-12 * speed * d2C.Length:
+		dB_len = dB.Length
+	else:
+		dB_len = B.dot(dB) / B_len
+	dCdt = dB_len / speed.__pow__(3) - 3 * B_len * dC.dot(d2C) / speed.__pow__(5)
+	# chain rule to arc length
+	dCds = dCdt / speed
+	return [C, dCds]
+
+def Cubic_Bezier_dCds(pole0, pole1, pole2, pole3):
+	# calculate the rate of change of curvature per unit length
+	# at the beginning of a cubic bezier curve defined by the given poles.
+	# dispatches to the closed form or the legacy segmentation version, as set by dCds_method
+	if dCds_method == 'segment':
+		return Cubic_Bezier_dCds_segment(pole0, pole1, pole2, pole3)
+	return Cubic_Bezier_dCds_analytic(pole0, pole1, pole2, pole3)
+
+def Cubic_Bezier_dCds_analytic(pole0, pole1, pole2, pole3):
+	# calculate the rate of change of curvature per unit length (arc)
+	# at the beginning of a rational cubic bezier curve defined by the given poles.
+	# closed form from the first, second, and third derivatives at t = 0. no curve object required.
+	# poles are [[x,y,z],w]
+	w0 = pole0[1]
+	w1 = pole1[1]
+	w2 = pole2[1]
+	w3 = pole3[1]
+	P0 = Base.Vector(pole0[0])
+	# homogeneous (weighted) poles, xyz part
+	A0 = P0 * w0
+	A1 = Base.Vector(pole1[0]) * w1
+	A2 = Base.Vector(pole2[0]) * w2
+	A3 = Base.Vector(pole3[0]) * w3
+	# derivatives of the homogeneous curve at t = 0, xyz part and weight part
+	dA = (A1 - A0) * 3
+	d2A = (A0 - A1 * 2 + A2) * 6
+	d3A = (A3 - A2 * 3 + A1 * 3 - A0) * 6
+	dw = (w1 - w0) * 3
+	d2w = (w0 - w1 * 2 + w2) * 6
+	d3w = (w3 - w2 * 3 + w1 * 3 - w0) * 6
+	dCds = rational_curvature_dCds(P0, w0, dA, d2A, d3A, dw, d2w, d3w)[1]
+	return dCds
+
+def Cubic_Bezier_rational_curvature(pole0, pole1, pole2):	# curvature at the start of a rational cubic bezier,
+															# from the first three poles [[x,y,z],w]
+	return Cubic_Bezier_curvature(pole0[0], pole1[0], pole2[0]) * pole0[1] * pole2[1] / (pole1[1] * pole1[1])
+
+def Cubic_Bezier_dCds_segment(pole0, pole1, pole2, pole3):  
+	# calculate the rate of change of curvature per unit length (chord) 
+     # at the beginning of a cubic bezier curve defined by the given poles
+	# legacy version: iterative segmentation of a Part.BSplineCurve. kept as a fallback, see dCds_method
+	# calculate start point curvature directly from poles
+	C0 = Cubic_Bezier_curvature(pole0[0], pole1[0], pole2[0])
+	if math.fabs(C0) < 1.0e-6:
+		C0= 0.0
+	# prepare cubic bezier object to subdivide
+	Curve = Bezier_Cubic_curve([pole0, pole1, pole2, pole3])
+	# setup refinement loop
+	t_seg = 0.05	# initial segmentation value
+	segment_degen = 'false'
+	tol= 0.01
+	error = 1.0
+	loop_count = 0
+	dCds_last = None	# no valid segment yet
+	while (error > tol  and loop_count < 100 and segment_degen != 'true'):
+		Curve.segment(0,t_seg)
+		Poles = Curve.getPoles()
+		# check start curvature after segmentation
+		C0_seg = Cubic_Bezier_curvature(Poles[0], Poles[1], Poles[2])
+		if math.fabs(C0_seg) < 1.0e-6:
+			C0_seg= 0.0 
+		# if the start curvature changes dramatically after segmentation,
+		# the new values are invalid. not a valid test when C0 = 0.0 to begin with
+		if C0 != 0.0:
+			if math.fabs((C0_seg - C0)/C0) > 5*tol:
+				segment_degen = 'true'
+				log.warning("segmentation has collapsed the curve")
+				log.debug("C0 %s C0_check %s", C0, C0_seg)
+				log.debug("Cubic_Bezier_dCds step %s", loop_count)
+		elif C0 == 0.0:
+			if math.fabs((C0_seg - C0)) > .00001:
+				segment_degen = 'true'
+				log.warning("segmentation has collapsed the curve")
+				log.debug("C0 %s C0_check %s", C0, C0_seg)
+				log.debug("Cubic_Bezier_dCds step %s", loop_count)
+		
+		# calculate curvature at the end of the current segment
+		Cs =  Cubic_Bezier_curvature(Poles[3], Poles[2], Poles[1])
+		
+		#if the start curvature and first cut curvature are equal, then dCds is 0
+		if math.fabs(C0-Cs) <= 1.0e-6 and loop_count == 0:
+			return 0.0
+				
+		# calculate chord length of current segment
+		S = Base.Vector(Poles[3])-Base.Vector(Poles[0])
+		s = S.Length
+		dCds_seg = (Cs-C0)/s
+		#print ('step ', loop_count, '  dCds_seg ', dCds_seg)
+		if loop_count > 1:
+			error = math.fabs((dCds_seg - dCds_last)/dCds_last)
+		if segment_degen != 'true':
+			dCds_last = dCds_seg
+		t_seg = t_seg * 0.9
+		loop_count=loop_count + 1
+	#print 'step ', loop_count, '  dCds_seg ', dCds_seg, '  error ', error
+	if dCds_last is None:
+		# the first segment already collapsed the curve, there is no estimate to return
+		raise ValueError("Cubic_Bezier_dCds_segment: segmentation has collapsed the curve")
+	if error > tol:
+		#print 'no dCds found within ', tol, ' Cubic_Bezier_dCds'
+		dCds = dCds_last
+		#print 'returning dCds = ', dCds, ' within ', error, ' Cubic_Bezier_dCds'
+	else:
+		dCds = dCds_seg
+	return dCds
+
+def Cubic_Bezier_dCds_richardson(pole0, pole1, pole2, pole3, tol = 1.0e-9):
+	# calculate the rate of change of curvature per unit length
+	# at the beginning of a rational cubic bezier curve defined by the given poles [[x,y,z],w]
+	# converged segmentation reference for the closed form, not used by the workbench. like Cubic_Bezier_dCds_segment
+	# it segments a Part.BSplineCurve, but it measures the rational curvature and halves the segment each step.
+	# the difference quotient (C(s) - C0) / s over ever shorter segments is first order in the segment length s.
+	# successive quotients are Richardson extrapolated to s = 0 twice, to remove the first and second order terms.
+	# the extrapolations converge to the closed form value until round off takes over,
+	# the estimate where two successive ones agree best is returned.
+	# raises ValueError if segmentation collapses the curve before an estimate is found
+	C0 = Cubic_Bezier_rational_curvature(pole0, pole1, pole2)
+	# prepare cubic bezier object to subdivide
+	Curve = Bezier_Cubic_curve([pole0, pole1, pole2, pole3])
+	# setup refinement loop
+	t_seg = 0.05	# initial segmentation value
+	s_seg = []		# segment lengths, last three
+	dCds_seg = []	# difference quotients, last two
+	dCds_1 = []		# first extrapolations, last two
+	dCds_last = None
+	best = None		# [difference to the previous estimate, estimate]
+	worse = 0	# steps since the best estimate
+	loop_count = 0
+	while loop_count < 40 and worse < 3:
+		Curve.segment(0, t_seg)
+		Poles = Curve.getPoles()
+		Weights = Curve.getWeights()
+		WeightedPoles = [[Poles[i], Weights[i]] for i in range(4)]
+		# the start curvature must survive segmentation, or the segment is degenerate
+		C0_seg = Cubic_Bezier_rational_curvature(WeightedPoles[0], WeightedPoles[1], WeightedPoles[2])
+		if math.fabs(C0_seg - C0) > 1.0e-6 * max(C0, 1.0):
+			log.debug("C0 %s C0_check %s Cubic_Bezier_dCds step %s", C0, C0_seg, loop_count)
+			break
+		# curvature at the end of the current segment, and chord length of the segment
+		Cs = Cubic_Bezier_rational_curvature(WeightedPoles[3], WeightedPoles[2], WeightedPoles[1])
+		s = (Base.Vector(Poles[3]) - Base.Vector(Poles[0])).Length
+		s_seg = s_seg[-2:] + [s]
+		dCds_seg = dCds_seg[-1:] + [(Cs - C0) / s]
+		if len(s_seg) > 1:
+			# first order term, error of the quotient ~ s
+			s0 = s_seg[-2]
+			dCds_1 = dCds_1[-1:] + [(s0 * dCds_seg[1] - s * dCds_seg[0]) / (s0 - s)]
+		if len(s_seg) > 2:
+			# second order term, error of the first extrapolation ~ s * previous s
+			h0 = s_seg[0] * s_seg[1]
+			h1 = s_seg[1] * s_seg[2]
+			dCds = (h0 * dCds_1[1] - h1 * dCds_1[0]) / (h0 - h1)
+			if dCds_last is not None:
+				difference = math.fabs(dCds - dCds_last)
+				if difference <= tol * math.fabs(dCds):
+					return dCds
+				if best is None or difference < best[0]:
+					best = [difference, dCds]
+					worse = 0
+				else:
+					worse = worse + 1
+			dCds_last = dCds
+		t_seg = t_seg * 0.5
+		loop_count = loop_count + 1
+	if best is None:
+		raise ValueError("Cubic_Bezier_dCds_richardson: segmentation has collapsed the curve")
+	log.debug("Cubic_Bezier_dCds_richardson: best estimate %s, within %s after %s steps", best[1], best[0], loop_count)
+	return best[1]
+
+def Cubic_6P_curvature_dCds(WeightedPoles, end = 'start'):
+	# curvature and rate of change of curvature per unit length (arc) at either end of a 6P cubic NURBS
+	# with the fixed knot vector [0,0,0,0,1/3,2/3,1,1,1,1], directly from the B spline derivative poles.
+	# WeightedPoles is a list of 6 [[x,y,z],w]. end is 'start' or 'end'.
+	# dC/ds is measured from the selected end towards the inside of the curve.
+	# returns [C, dCds]
+	# the knot vector is symmetric, so the end of the curve is the start of the reversed curve
+	if end == 'end':
+		WeightedPoles = WeightedPoles[::-1]
+	# only the first 4 poles affect the first knot span
+	w0 = WeightedPoles[0][1]
+	w1 = WeightedPoles[1][1]
+	w2 = WeightedPoles[2][1]
+	w3 = WeightedPoles[3][1]
+	P0 = Base.Vector(WeightedPoles[0][0])
+	# homogeneous (weighted) poles, xyz part
+	A0 = P0 * w0
+	A1 = Base.Vector(WeightedPoles[1][0]) * w1
+	A2 = Base.Vector(WeightedPoles[2][0]) * w2
+	A3 = Base.Vector(WeightedPoles[3][0]) * w3
+	# first derivative poles: 3 (P[i+1] - P[i]) / (u[i+4] - u[i+1]) -> spans 1/3, 2/3, 1
+	QA0 = (A1 - A0) * 9
+	QA1 = (A2 - A1) * 4.5
+	QA2 = (A3 - A2) * 3
+	Qw0 = (w1 - w0) * 9
+	Qw1 = (w2 - w1) * 4.5
+	Qw2 = (w3 - w2) * 3
+	# second derivative poles: 2 (Q[i+1] - Q[i]) / (u[i+4] - u[i+2]) -> spans 1/3, 2/3
+	RA0 = (QA1 - QA0) * 6
+	RA1 = (QA2 - QA1) * 3
+	Rw0 = (Qw1 - Qw0) * 6
+	Rw1 = (Qw2 - Qw1) * 3
+	# third derivative pole: (R[1] - R[0]) / (u[4] - u[3]) -> span 1/3. constant over the first knot span
+	SA0 = (RA1 - RA0) * 3
+	Sw0 = (Rw1 - Rw0) * 3
+	return rational_curvature_dCds(P0, w0, QA0, RA0, SA0, Qw0, Rw0, Sw0)
+
+def Cubic_6P_dCds(pole0, pole1, pole2, pole3, pole4, pole5):
+	# calculate the rate of change of curvature per unit length
+	# at the beginning of a cubic 6P curve defined by the given poles.
+	# dispatches to the closed form or the legacy segmentation version, as set by dCds_method
+	if dCds_method == 'segment':
+		return Cubic_6P_dCds_segment(pole0, pole1, pole2, pole3, pole4, pole5)
+	return Cubic_6P_curvature_dCds([pole0, pole1, pole2, pole3, pole4, pole5], 'start')[1]
+
+def Cubic_6P_dCds_segment(pole0, pole1, pole2, pole3, pole4, pole5):    
+	# calculate the rate of change of curvature per unit length (chord)
+    # at the beginning of a cubic 6P curve defined by the given poles
+	# legacy version: segments a Part.BSplineCurve, then hands off to Cubic_Bezier_dCds_segment
+	
+	# calculate start point curvature directly from poles.
+	C0 = Cubic_6P_curvature(pole0[0], pole1[0], pole2[0])
+	if math.fabs(C0) < 1.0e-5:
+		C0= 0.0		
+	# prepare cubic 6P object to segment
+	Curve = NURBS_Cubic_6P_curve([pole0, pole1, pole2, pole3, pole4, pole5])
+	# cut the 6P below the first internal knot
+	Curve.segment(0,.25)
+	poles = Curve.getPoles()
+	weights = Curve.getWeights()
+	# rebuild the weighted poles
+	WeightedPoles = [[poles[0],weights[0]], [poles[1],weights[1]], [poles[2],weights[2]], [poles[3],weights[3]]]
+	# pass the weighted poles down to the Bezier dCds function
+	dCds = Cubic_Bezier_dCds_segment(WeightedPoles[0], WeightedPoles[1], WeightedPoles[2], WeightedPoles[3])
+
+	return dCds
+
+def G3_blend_poles(p0, p1_scl, p4_scl, p5, H1, H3, scale_1i, scale_2i):
+	# the 6 poles of a G3 blend candidate, for a given pair of inner tangent scales.
+	# p0, p1_scl, p4_scl, p5 are the fixed outer poles (vectors), H1, H3 the scaled inner heights
+	L1 = (p1_scl - p0) * scale_1i			# inner tangent, along the scaled first leg
+	L3 = (p4_scl - p5) * scale_2i			# inner tangent, along the scaled last leg
+	poles = [p0, p1_scl, p1_scl + H1 + L1, p4_scl + H3 + L3, p4_scl, p5]
+	return poles
+
+def G3_residuals(poles, weights, dCds_target_0, dCds_target_1):
+	# G3 error of a 6P blend candidate: dC/ds at each end minus the target value at that end.
+	# returns [residual_0, residual_1]
+	WeightedPoles = [[poles[0],weights[0]],
+					[poles[1],weights[1]],
+					[poles[2],weights[2]],
+					[poles[3],weights[3]],
+					[poles[4],weights[4]],
+					[poles[5],weights[5]]]
+	residual_0 = Cubic_6P_curvature_dCds(WeightedPoles, 'start')[1] - dCds_target_0
+	residual_1 = Cubic_6P_curvature_dCds(WeightedPoles, 'end')[1] - dCds_target_1
+	return [residual_0, residual_1]
+
+def G3_newton_solve(p0, p1_scl, p4_scl, p5, H1, H3, weights, dCds_target_0, dCds_target_1, scale_1i, scale_2i, tol):
+	# solve the two inner tangent scales of a G3 blend by 2x2 Newton iteration on the two dC/ds residuals.
+	# the jacobian is built by forward finite differences (each residual evaluation is closed form and cheap).
+	# steps are damped by halving until the residual norm decreases, and scales are kept within the
+	# same limits as the legacy search.
+	# returns [scale_1i, scale_2i, iterations, residual, converged]
+	upper_limit = 3.0
+	lower_limit = 0.75
+	h = 1.0e-6				# finite difference step on the scales
+	max_iterations = 20
+	tol_0 = tol * (1 + math.fabs(dCds_target_0))
+	tol_1 = tol * (1 + math.fabs(dCds_target_1))
+
+	poles = G3_blend_poles(p0, p1_scl, p4_scl, p5, H1, H3, scale_1i, scale_2i)
+	r = G3_residuals(poles, weights, dCds_target_0, dCds_target_1)
+	norm = math.fabs(r[0]) + math.fabs(r[1])
+	iterations = 0
+	converged = False
+	while iterations < max_iterations:
+		if math.fabs(r[0]) <= tol_0 and math.fabs(r[1]) <= tol_1:
+			converged = True
+			break
+		# jacobian of the residuals with respect to the scales
+		poles_1 = G3_blend_poles(p0, p1_scl, p4_scl, p5, H1, H3, scale_1i + h, scale_2i)
+		r_1 = G3_residuals(poles_1, weights, dCds_target_0, dCds_target_1)
+		poles_2 = G3_blend_poles(p0, p1_scl, p4_scl, p5, H1, H3, scale_1i, scale_2i + h)
+		r_2 = G3_residuals(poles_2, weights, dCds_target_0, dCds_target_1)
+		J00 = (r_1[0] - r[0]) / h
+		J10 = (r_1[1] - r[1]) / h
+		J01 = (r_2[0] - r[0]) / h
+		J11 = (r_2[1] - r[1]) / h
+		det = J00 * J11 - J01 * J10
+		if math.fabs(det) < 1.0e-30:
+			# singular jacobian, no usable Newton direction
+			break
+		# newton step: solve J * step = -r
+		step_1 = -( J11 * r[0] - J01 * r[1]) / det
+		step_2 = -(-J10 * r[0] + J00 * r[1]) / det
+		# damped update
+		damping = 1.0
+		improved = False
+		for halving in range(0, 10):
+			scale_1n = min(max(scale_1i + damping * step_1, lower_limit), upper_limit)
+			scale_2n = min(max(scale_2i + damping * step_2, lower_limit), upper_limit)
+			poles_n = G3_blend_poles(p0, p1_scl, p4_scl, p5, H1, H3, scale_1n, scale_2n)
+			r_n = G3_residuals(poles_n, weights, dCds_target_0, dCds_target_1)
+			norm_n = math.fabs(r_n[0]) + math.fabs(r_n[1])
+			if norm_n < norm:
+				improved = True
+				break
+			damping = damping / 2.0
+		iterations = iterations + 1
+		if improved == False:
+			# stalled, most likely against the scale limits
+			break
+		scale_1i = scale_1n
+		scale_2i = scale_2n
+		r = r_n
+		norm = norm_n
+
+	residual = max(math.fabs(r[0]), math.fabs(r[1]))
+	return [scale_1i, scale_2i, iterations, residual, converged]
+
+def blendG3_poly_2x4_1x6(poles_0,weights_0, poles_1, weights_1, scale_0, scale_1, scale_2, scale_3, solver = None, warm_start = False):	# work in progress. complete mess
+	# blend two cubic bezier into a 6 point cubic NURBS. 
+	# this function assumes poles_0 flow into poles_1 without checking.
+	# solver selects 'newton' or the legacy 'search'. defaults to the module setting G3_solver.
+	# warm_start = True uses scale_1 and scale_2 (typically the previous converged solution) as the initial
+	# inner scales instead of 1.0, and returns them directly if they already satisfy the G3 tolerance.
+	# returns [poles, weights, scale_1i, scale_2i, G3_report], G3_report = [solver, iterations, residual, converged]
+	if solver == None:
+		solver = G3_solver
+
+	# rebuild both bezier inputs from the poles and weights
+	WeightedPoles_0=[[poles_0[0],weights_0[0]], [poles_0[1],weights_0[1]], [poles_0[2],weights_0[2]], [poles_0[3],weights_0[3]]]
+	WeightedPoles_1=[[poles_1[0],weights_1[0]], [poles_1[1],weights_1[1]], [poles_1[2],weights_1[2]], [poles_1[3],weights_1[3]]]
+
+	# set end point dC/ds targets
+	
+	C0 = Cubic_6P_curvature(WeightedPoles_0[0][0], WeightedPoles_0[1][0], WeightedPoles_0[2][0])
+	C1 = Cubic_6P_curvature(WeightedPoles_1[3][0], WeightedPoles_1[2][0], WeightedPoles_1[1][0])
+	DC = math.fabs(C0-C1)
+	
+	dCds0 = Cubic_Bezier_dCds(WeightedPoles_0[0], WeightedPoles_0[1], WeightedPoles_0[2], WeightedPoles_0[3])
+	dCds1 = Cubic_Bezier_dCds(WeightedPoles_1[3], WeightedPoles_1[2], WeightedPoles_1[1], WeightedPoles_1[0])
+	DdCds = math.fabs(dCds0-dCds1)
+	
+	# quick, cheap, and very incomplete symmetry test.
+	if DC < 1.0e-8 and DdCds < 1.0e-8:
+		symmetric = 1
+	else:
+		symmetric = 0
+	
+	#print "dCds inputs: " "dCds0, ", dCds0, " dCds1, ", dCds1
+	
+	if math.fabs(dCds0) < 5.0e-6:
+		dCds0 = 0.0
+	if math.fabs(dCds1) < 5.0e-6:
+		dCds1 = 0.0		
+
+	# print ("dCds targets: " "dCds0, ", dCds0, " dCds1, ", dCds1," C0, ", C0, " C1, ", C1, "symmetric: ", symmetric)
+	
+	# convert 4P inputs to 6P, both at once, by knot insertion in homogeneous coordinates (exact weights)
+	Pw_6 = upgrade_4_to_6(homogeneous_poles([poles_0, poles_1], [weights_0, weights_1]))
+	poles_6_0, weights_6_0 = poles_weights_from_homogeneous(Pw_6[0])
+	poles_6_1, weights_6_1 = poles_weights_from_homogeneous(Pw_6[1])
+
+	# check Cubic_6P_dCds
+	WeightedPoles_6_0=[[poles_6_0[0],weights_6_0[0]],
+						[poles_6_0[1],weights_6_0[1]],
+						[poles_6_0[2],weights_6_0[2]],
+						[poles_6_0[3],weights_6_0[3]],
+						[poles_6_0[4],weights_6_0[4]],
+						[poles_6_0[5],weights_6_0[5]]]
+
+	dCds6_0 = Cubic_6P_dCds(WeightedPoles_6_0[0],
+							WeightedPoles_6_0[1],
+							WeightedPoles_6_0[2],
+							WeightedPoles_6_0[3],
+							WeightedPoles_6_0[4],
+							WeightedPoles_6_0[5])
+
+	WeightedPoles_6_1=[[poles_6_1[0],weights_6_1[0]],
+						[poles_6_1[1],weights_6_1[1]],
+						[poles_6_1[2],weights_6_1[2]],
+						[poles_6_1[3],weights_6_1[3]],
+						[poles_6_1[4],weights_6_1[4]],
+						[poles_6_1[5],weights_6_1[5]]]
+
+	dCds6_1 = Cubic_6P_dCds(WeightedPoles_6_1[5],
+							WeightedPoles_6_1[4],
+							WeightedPoles_6_1[3],
+							WeightedPoles_6_1[2],
+							WeightedPoles_6_1[1],
+							WeightedPoles_6_1[0])
+
+	# print ("dCds 6P check: " "dCds6_0, ", dCds6_0, " dCds6_1, ", dCds6_1)
+
+	# compile the blend poly. this initial form is G2, but clumped towards the outer points.
+	p0=[poles_6_0[0],weights_6_0[0]]
+	p1=[poles_6_0[1],weights_6_0[1]]
+	p2=[poles_6_0[2],weights_6_0[2]]
+	p3=[poles_6_1[3],weights_6_1[3]]
+	p4=[poles_6_1[4],weights_6_1[4]]
+	p5=[poles_6_1[5],weights_6_1[5]]
+
+	### calculate curvature components
+	## start point
+	l0 = p1[0]-p0[0]					# first control leg
+	tan0=Base.Vector(l0)				# make clean copy
+	tan0.normalize()					# unit tangent direction
+	l1=Base.Vector(tan0)				# make clean copy
+	l1.multiply(tan0.dot(p2[0]-p1[0])) 	# scalar projection of second control leg along unit tangent
+	h1=(p2[0]-p1[0])-l1					# height of second control leg orthogonal to tangent
+	## end point
+	l4 = p4[0]-p5[0]					# last control leg
+	tan4=Base.Vector(l4)				# make clean copy
+	tan4.normalize()					# unit tangent direction
+	l3=Base.Vector(tan4)				# make clean copy
+	l3.multiply(tan4.dot(p3[0]-p4[0])) 	# scalar projection of second to last control leg along unit tangent
+	h3=(p3[0]-p4[0])-l3					# height of second control leg orthogonal to tangent
+	### scale first and last control legs
+	L0=Base.Vector(l0)					# make clean copy
+	L0.multiply(scale_0)				# apply tangent scale
+	p1_scl = [p0[0] + L0, p1[1]]		# reposition second control point
+	L4=Base.Vector(l4)					# make clean copy
+	L4.multiply(scale_3)				# apply tangent scale
+	p4_scl = [p5[0] + L4, p4[1]]		# reposition fifth control point
+	### calc new heights for inner control legs
+	H1 = Base.Vector(h1)				# make clean copy
+	H1.multiply(scale_0.__pow__(2))		# apply height scale
+	H3 = Base.Vector(h3)				# make clean copy
+	H3.multiply(scale_3.__pow__(2))		# apply height scale
+
+	weights = [p0[1], p1[1], p2[1], p3[1], p4[1], p5[1]]
+	tol= 1.0e-5
+
+	# initial inner scales
+	if warm_start == True:
+		scale_1_start = scale_1
+		scale_2_start = scale_2
+		# fast path: the previous solution still holds
+		poles = G3_blend_poles(p0[0], p1_scl[0], p4_scl[0], p5[0], H1, H3, scale_1_start, scale_2_start)
+		r = G3_residuals(poles, weights, dCds6_0, dCds6_1)
+		if math.fabs(r[0]) <= tol * (1 + math.fabs(dCds6_0)) and math.fabs(r[1]) <= tol * (1 + math.fabs(dCds6_1)):
+			return [poles, weights, scale_1_start, scale_2_start, [solver, 0, max(math.fabs(r[0]), math.fabs(r[1])), True]]
+	else:
+		scale_1_start = 1.0
+		scale_2_start = 1.0
+
+	if solver == 'newton':
+		G3 = G3_newton_solve(p0[0], p1_scl[0], p4_scl[0], p5[0], H1, H3, weights, dCds6_0, dCds6_1, scale_1_start, scale_2_start, tol)
+		if G3[4] == False and warm_start == True:
+			# the previous solution led nowhere, retry from a cold start and keep the better result
+			G3_cold = G3_newton_solve(p0[0], p1_scl[0], p4_scl[0], p5[0], H1, H3, weights, dCds6_0, dCds6_1, 1.0, 1.0, tol)
+			G3_cold[2] = G3_cold[2] + G3[2]
+			if G3_cold[4] == True or G3_cold[3] < G3[3]:
+				G3 = G3_cold
+		scale_1i = G3[0]
+		scale_2i = G3[1]
+		poles = G3_blend_poles(p0[0], p1_scl[0], p4_scl[0], p5[0], H1, H3, scale_1i, scale_2i)
+		blend_log.debug("G3 newton: %s iterations, residual %s, converged %s", G3[2], G3[3], G3[4])
+		return [poles, weights, scale_1i, scale_2i, ['newton', G3[2], G3[3], G3[4]]]
+
+	# search loop initial parameters
+	scale_1i = scale_1_start
+	scale_2i = scale_2_start
+	error = 1.0
+	step_size = 0.1
+	dir_0_prev = 0.0
+	dir_1_prev = 0.0
+	nudge_prev = 'none'
+	streak_0_count = 0
+	streak_1_count = 0
+	#step_stage_complete = 0
+	loop_count = 0
+	while (error > tol  and loop_count < 200 ):
+		# reset for next iteration
+		L1 = p1_scl[0] - p0[0]				# rescale to new tangent (scale_0 already applied)
+		L3 = p4_scl[0] - p5[0]				# rescale to new tangent (scale_3 already applied)
+		# apply scales
+		L1 = L1.multiply(scale_1i)			# apply inner tangent scale
+		p2_scl = [p1_scl[0] + H1 + L1, p2[1]]	# reposition third control point
+		L3 = L3.multiply(scale_2i)			# apply inner tangent scale
+		p3_scl = [p4_scl[0] + H3 + L3, p3[1]]	# reposition third control point
+		# prepare poles and weights function output
+		poles=[p0[0], p1_scl[0], p2_scl[0], p3_scl[0], p4_scl[0], p5[0]]
+		weights = [p0[1], p1[1], p2[1], p3[1], p4[1], p5[1]]
+		# prepare weighted poles for curvature analysis
+		WeightedPoles_6_i = [[poles[0],weights[0]],
+							[poles[1],weights[1]],
+							[poles[2],weights[2]],
+							[poles[3],weights[3]],
+							[poles[4],weights[4]],
+							[poles[5],weights[5]]]
+		# check both end curvatures
+		dCds6_0i = Cubic_6P_dCds(WeightedPoles_6_i[0],
+								WeightedPoles_6_i[1],
+								WeightedPoles_6_i[2],
+								WeightedPoles_6_i[3],
+								WeightedPoles_6_i[4],
+								WeightedPoles_6_i[5])
+
+		dCds6_1i = Cubic_6P_dCds(WeightedPoles_6_i[5],
+								WeightedPoles_6_i[4],
+								WeightedPoles_6_i[3],
+								WeightedPoles_6_i[2],
+								WeightedPoles_6_i[1],
+								WeightedPoles_6_i[0])
+
+		# define current G3 error
+		# proportional in non-zero cases,? absolute if target is 0
+		# the proportional error is a problem.
+		# it prioritizes smaller errors near zero than large errors proportionally closer to the target.
+		# in practice, this causes divergent run away situations
+		if dCds0 != 0.0:
+			error_0 = (dCds6_0i - dCds6_0) * ( 1 + 1 / math.fabs(dCds0)) / 2
+		elif dCds0 == 0.0:
+			error_0 = (dCds6_0i - dCds6_0) * ( 1 + 1 / math.fabs(dCds6_0i)) / 2
+		#else:
+			# print ("dCds0, ", dCds0, "returned from Cubic_6P_dCds()")
+		
+		if dCds1 != 0.0:
+			error_1 = (dCds6_1i - dCds6_1) * ( 1 + 1 / math.fabs(dCds1)) / 2
+		elif dCds1 == 0.0:	
+			error_1 = (dCds6_1i - dCds6_1) * ( 1 + 1 / math.fabs(dCds6_1i)) / 2 # < this has caused div by 0 errors
+		#else:
+			# print ("dCds1, ", dCds1, "returned from Cubic_6P_dCds()")
+		
+		# success criteria for normal exit
+		if math.fabs(error_0) <= tol and math.fabs(error_1) <= tol:
+			# print ("final ", loop_count, ": ","scl[", scale_1i, ", ", scale_2i,	"] dCds[", dCds6_0i, ", ", dCds6_1i,"] err[", error_0, ", ", error_1,"]")
+			residual = max(math.fabs(dCds6_0i - dCds6_0), math.fabs(dCds6_1i - dCds6_1))
+			return [poles,weights,scale_1i,scale_2i,['search', loop_count, residual, True]]
+		
+		error = math.fabs(error_0) + math.fabs(error_1)
+		
+		# establish bounds for the errors based on initial guess
+		if loop_count == 0:
+			error_0_max = error_0
+			error_1_max = error_1
+		
+		# if the loop takes BOTH errors beyond the initial bounds, undo last action, and reduce step size.
+		if loop_count != 0 and math.fabs(error_0) > math.fabs(error_0_max) and math.fabs(error_1) > math.fabs(error_1_max):
+			#undo last action
+			if 	nudge_prev == 0:
+				scale_1i = scale_1i - dir_prev * step_size
+				
+			elif 	nudge_prev == 1:
+				scale_2i = scale_2i - dir_prev * step_size
+				
+			# reduce step size
+			step_size = step_size / 2.0
+			#print "div - error grew"
+
+		# determine the required adjustment direction for each endpoint.
+		if error_0 > tol / 2.0:
+			direction_0 = 1
+		elif error_0 < -tol / 2.0:
+			direction_0 = -1
+		else:
+			direction_0 = 0
+		if error_1 > tol / 2.0:
+			direction_1 = 1
+		elif error_1 < -tol / 2.0:
+			direction_1 = -1
+		else:
+			direction_1 = 0
+			
+		# plan the next action
+		if 	math.fabs(error_0) >= math.fabs(error_1):
+			nudge = 0
+			dir = direction_0
+			if symmetric != 1:
+				streak_0_count = streak_0_count + 1
+				streak_1_count = 0
+		elif 	math.fabs(error_0) < math.fabs(error_1):
+			nudge = 1
+			dir = direction_1
+			if symmetric != 1:
+				streak_1_count = streak_1_count + 1
+				streak_0_count = 0
+		
+		if symmetric == 1 and direction_0 == direction_1:
+			nudge = 2
+			direction_2 = direction_0
+		elif symmetric == 1 and direction_0 != direction_1:
+			nudge = 0
+			direction = 0
+			symmetric = 0
+			# print ("symmetry assumption has broken down.")
+			
+		# compare the next planned action to the last executed action
+		if nudge == nudge_prev and dir != dir_prev:
+			# if we are undoing the previous action, reduce step size
+			step_size = step_size / 2.0
+			#print "div - direct undo"
+			
+		# execute planned action, unless it is the same action 5 times in a row.
+		if 	(nudge == 0 and streak_0_count <= 5) or streak_1_count > 4:
+			scale_1i = scale_1i + direction_0 * step_size
+			dir_prev = direction_0
+			nudge_prev = 0
+			streak_1_count = 0
+		
+		elif (nudge == 1 and streak_1_count <= 5) or streak_0_count > 4:
+			scale_2i = scale_2i + direction_1 * step_size
+			dir_prev = direction_1
+			nudge_prev = 1
+			streak_0_count = 0
+		
+		elif nudge == 2:
+			scale_1i = scale_1i + direction_0 * step_size
+			scale_2i = scale_2i + direction_1 * step_size
+			dir_prev = direction_2
+			nudge_prev = 2
+		
+		upper_limit = 3.0
+		lower_limit = 0.75
+		
+		if scale_1i > upper_limit:
+			scale_1i = upper_limit
+		if scale_2i > upper_limit:
+			scale_2i = upper_limit
+		if scale_1i < lower_limit:
+			scale_1i = lower_limit
+		if scale_2i < lower_limit:
+			scale_2i = lower_limit			
+		
+		# G3 loop message
+		# print (loop_count, ": ","scl[", scale_1i, ", ", scale_2i,	"] dCds[", dCds6_0i, ", ", dCds6_1i,"] err[", error_0, ", ", error_1,"] dir[", direction_0, ", ", direction_1,"]act[",nudge_prev, ", ", dir_prev,"] streaks [", streak_0_count, ", ", streak_1_count, "]")
+		
+		if (scale_1i == upper_limit and scale_2i == upper_limit) or (scale_1i == lower_limit and scale_2i == lower_limit):
+			break
+		
+		if (scale_1i == upper_limit and scale_2i == lower_limit) or (scale_1i == lower_limit and scale_2i == upper_limit):
+			break
+			
+		loop_count=loop_count + 1
+	# G3 final message
+	# print ("final ", loop_count, ": ","scl[", scale_1i, ", ", scale_2i,	"] dCds[", dCds6_0i, ", ", dCds6_1i,"] err[", error_0, ", ", error_1,"]")
+	
+	# make sure the final values have been applied
+	
+	L1 = p1_scl[0] - p0[0]				# rescale to new tangent (scale_0 already applied)
+	L3 = p4_scl[0] - p5[0]				# rescale to new tangent (scale_3 already applied)
+	# apply scales
+	L1 = L1.multiply(scale_1i)			# apply inner tangent scale
+	p2_scl = [p1_scl[0] + H1 + L1, p2[1]]	# reposition third control point
+	L3 = L3.multiply(scale_2i)			# apply inner tangent scale
+	p3_scl = [p4_scl[0] + H3 + L3, p3[1]]	# reposition third control point
+	# prepare poles and weights function output
+	poles=[p0[0], p1_scl[0], p2_scl[0], p3_scl[0], p4_scl[0], p5[0]]
+	weights = [p0[1], p1[1], p2[1], p3[1], p4[1], p5[1]]
+	r = G3_residuals(poles, weights, dCds6_0, dCds6_1)
+	residual = max(math.fabs(r[0]), math.fabs(r[1]))
+	
+	return [poles,weights,scale_1i,scale_2i,['search', loop_count, residual, False]]
+
+def blendG3_rows_2x4_1x6(Pw_0, Pw_1, scale_0, scale_1, scale_2, scale_3, warm_start):
+	# G3 blend of rows of cubic bezier pairs, one G3 solve per row.
+	# Pw_0, Pw_1 are arrays (nRows, 4, 4) of homogeneous poles. scale_1, scale_2 and warm_start are per row lists.
+	# per row on purpose, unlike blend_rows_2x4_1x6: each row is its own Newton solve, with its own iteration count,
+	# warm start and report, in blendG3_poly_2x4_1x6 (shared with ControlPoly6_FilletBezier, on [x,y,z] poles).
+	# the array to pole list round trip of a row costs about 1.5% of its solve
+	# returns [Pw_6 (nRows, 6, 4), scale_1i list, scale_2i list, G3_report list]
+	Pw_6 = []
+	scale_1i = []
+	scale_2i = []
+	G3_report = []
+	for i in range(0, len(Pw_0)):
+		blend_log.debug("G3 on row_%d", i)
+		poles_0, weights_0 = poles_weights_from_homogeneous(Pw_0[i])
+		poles_1, weights_1 = poles_weights_from_homogeneous(Pw_1[i])
+		row = blendG3_poly_2x4_1x6(poles_0,
+									weights_0,
+									poles_1,
+									weights_1,
+									scale_0,
+									scale_1[i],
+									scale_2[i],
+									scale_3,
+									warm_start = warm_start[i])
+		Pw_6.append(homogeneous_poles(row[0], row[1]))
+		scale_1i.append(row[2])
+		scale_2i.append(row[3])
+		G3_report.append(row[4])
+	return [np.array(Pw_6), scale_1i, scale_2i, G3_report]
+
+# G3 solver state of the last execute of each G3 blend object, for the warm start of its next execute.
+# kept here instead of on the proxy, so it is not saved into the document. {(document name, object name): G3_report}
+# OutputObserver drops the entries of deleted objects and closed documents, so a later object of the same name
+# starts cold
+G3_reports = {}
+
+def forget_G3_reports(doc_name, obj_name = None):
+	# drop the G3 solver state of one object, or of every object of the document when obj_name is None
+	for key in list(G3_reports):
+		if key[0] == doc_name and (obj_name is None or key[1] == obj_name):
+			del G3_reports[key]
+
+def blendFair_poly_2x4_1x6(poles_0,weights_0, poles_1, weights_1, scale_0, scale_1, scale_2, scale_3):	# work in progress. complete mess
+	# blend two cubic bezier into a 6 point cubic NURBS. 
+	# this function assumes poles_0 flow into poles_1 without checking.
+
+	# rebuild both bezier inputs from the poles and weights
+	WeightedPoles_0=[[poles_0[0],weights_0[0]], [poles_0[1],weights_0[1]], [poles_0[2],weights_0[2]], [poles_0[3],weights_0[3]]]
+	WeightedPoles_1=[[poles_1[0],weights_1[0]], [poles_1[1],weights_1[1]], [poles_1[2],weights_1[2]], [poles_1[3],weights_1[3]]]
+
+	# set end point dC/ds targets
+	
+	C0 = Cubic_6P_curvature(WeightedPoles_0[0][0], WeightedPoles_0[1][0], WeightedPoles_0[2][0])
+	C1 = Cubic_6P_curvature(WeightedPoles_1[3][0], WeightedPoles_1[2][0], WeightedPoles_1[1][0])
+	DC = math.fabs(C0-C1)
+	
+	dCds0 = Cubic_Bezier_dCds(WeightedPoles_0[0], WeightedPoles_0[1], WeightedPoles_0[2], WeightedPoles_0[3])
+	dCds1 = Cubic_Bezier_dCds(WeightedPoles_1[3], WeightedPoles_1[2], WeightedPoles_1[1], WeightedPoles_1[0])
+	DdCds = math.fabs(dCds0-dCds1)
+	
+	# quick, cheap, and very incomplete symmetry test.
+	if DC < 1.0e-8 and DdCds < 1.0e-8:
+		symmetric = 1
+	else:
+		symmetric = 0
+	
+	#print "dCds inputs: " "dCds0, ", dCds0, " dCds1, ", dCds1
+	
+	if math.fabs(dCds0) < 5.0e-6:
+		dCds0 = 0.0
+	if math.fabs(dCds1) < 5.0e-6:
+		dCds1 = 0.0		
+
+	blend_log.debug("dCds targets: dCds0, %s dCds1, %s C0, %s C1, %s symmetric: %s", dCds0, dCds1, C0, C1, symmetric)
+	
+	# convert 4P inputs to 6P, both at once, by knot insertion in homogeneous coordinates (exact weights)
+	Pw_6 = upgrade_4_to_6(homogeneous_poles([poles_0, poles_1], [weights_0, weights_1]))
+	poles_6_0, weights_6_0 = poles_weights_from_homogeneous(Pw_6[0])
+	poles_6_1, weights_6_1 = poles_weights_from_homogeneous(Pw_6[1])
+
+	# check Cubic_6P_dCds
+	WeightedPoles_6_0=[[poles_6_0[0],weights_6_0[0]],
+						[poles_6_0[1],weights_6_0[1]],
+						[poles_6_0[2],weights_6_0[2]],
+						[poles_6_0[3],weights_6_0[3]],
+						[poles_6_0[4],weights_6_0[4]],
+						[poles_6_0[5],weights_6_0[5]]]
+
+	dCds6_0 = Cubic_6P_dCds(WeightedPoles_6_0[0],
+							WeightedPoles_6_0[1],
+							WeightedPoles_6_0[2],
+							WeightedPoles_6_0[3],
+							WeightedPoles_6_0[4],
+							WeightedPoles_6_0[5])
+
+	WeightedPoles_6_1=[[poles_6_1[0],weights_6_1[0]],
+						[poles_6_1[1],weights_6_1[1]],
+						[poles_6_1[2],weights_6_1[2]],
+						[poles_6_1[3],weights_6_1[3]],
+						[poles_6_1[4],weights_6_1[4]],
+						[poles_6_1[5],weights_6_1[5]]]
+
+	dCds6_1 = Cubic_6P_dCds(WeightedPoles_6_1[5],
+							WeightedPoles_6_1[4],
+							WeightedPoles_6_1[3],
+							WeightedPoles_6_1[2],
+							WeightedPoles_6_1[1],
+							WeightedPoles_6_1[0])
+
+	blend_log.debug("dCds 6P check: dCds6_0, %s dCds6_1, %s", dCds6_0, dCds6_1)
+
+	# compile the blend poly. this initial form is G2, but clumped towards the outer points.
+	p0=[poles_6_0[0],weights_6_0[0]]
+	p1=[poles_6_0[1],weights_6_0[1]]
+	p2=[poles_6_0[2],weights_6_0[2]]
+	p3=[poles_6_1[3],weights_6_1[3]]
+	p4=[poles_6_1[4],weights_6_1[4]]
+	p5=[poles_6_1[5],weights_6_1[5]]
+
+	### calculate curvature components
+	## start point
+	l0 = p1[0]-p0[0]					# first control leg
+	tan0=Base.Vector(l0)				# make clean copy
+	tan0.normalize()					# unit tangent direction
+	l1=Base.Vector(tan0)				# make clean copy
+	l1.multiply(tan0.dot(p2[0]-p1[0])) 	# scalar projection of second control leg along unit tangent
+	h1=(p2[0]-p1[0])-l1					# height of second control leg orthogonal to tangent
+	## end point
+	l4 = p4[0]-p5[0]					# last control leg
+	tan4=Base.Vector(l4)				# make clean copy
+	tan4.normalize()					# unit tangent direction
+	l3=Base.Vector(tan4)				# make clean copy
+	l3.multiply(tan4.dot(p3[0]-p4[0])) 	# scalar projection of second to last control leg along unit tangent
+	h3=(p3[0]-p4[0])-l3					# height of second control leg orthogonal to tangent
+	### scale first and last control legs
+	L0=Base.Vector(l0)					# make clean copy
+	L0.multiply(scale_0)				# apply tangent scale
+	p1_scl = [p0[0] + L0, p1[1]]		# reposition second control point
+	L4=Base.Vector(l4)					# make clean copy
+	L4.multiply(scale_3)				# apply tangent scale
+	p4_scl = [p5[0] + L4, p4[1]]		# reposition fifth control point
+	### calc new heights for inner control legs
+	H1 = Base.Vector(h1)				# make clean copy
+	H1.multiply(scale_0.__pow__(2))		# apply height scale
+	H3 = Base.Vector(h3)				# make clean copy
+	H3.multiply(scale_3.__pow__(2))		# apply height scale
+
+	# output of the G2 portion
+	p0[0]			# start point. unchanged
+	p1_scl			# start tangent point. scaled
+	H1				# start inner tangent height. scaled
+	H3				# end inner tangent height. scaled
+	p4_scl[0]		# end  tangent point. scaled
+	p5[0]			# end point. unchanged	
+
+	
+	
+	# stuff involved in making a single fairing attempt and evaluating dCds to establish G3 error.
+	p0[0]			# start point. unchanged
+	p1_scl[0]		# start tangent point. unchanged
+	scale_1i		# start inner tangent scale : independent variable in the attempt
+	H1				# start inner tangent height. unchanged
+	p2[1]			# start inner tangent weight. unchanged
+	p3[1]			# end inner tangent weight. 
+	scale_2i		# end inner tangent scale : independent variable in the attempt
+	H3				# end inner tangent height. unchanged
+	p4_scl[0]		# end  tangent point. unchanged
+	p5[0]			# end point. unchanged
+	
+	dCds0			# input poly start curvature derivative with respect to arclength (along +t). dependent variable in the attempt
+	dCds1			# input poly end curvature derivative with respect to arclength (along -t). dependent variable in the attempt
+	
+	
+	
+	
+	# search loop initial parameters
+	scale_1i = 1.0
+	scale_2i = 1.0
+	error = 1.0
+	step_size = 0.1
+	dir_0_prev = 0.0
+	dir_1_prev = 0.0
+	nudge_prev = 'none'
+	streak_0_count = 0
+	streak_1_count = 0
+	#step_stage_complete = 0
+	loop_count = 0
+	tol= 5.0e-6
+	while (error > tol  and loop_count < 200 ):
+		# reset for next iteration
+		L1 = p1_scl[0] - p0[0]				# rescale to new tangent (scale_0 already applied)
+		L3 = p4_scl[0] - p5[0]				# rescale to new tangent (scale_3 already applied)
+		# apply scales
+		L1 = L1.multiply(scale_1i)			# apply inner tangent scale
+		p2_scl = [p1_scl[0] + H1 + L1, p2[1]]	# reposition third control point
+		L3 = L3.multiply(scale_2i)			# apply inner tangent scale
+		p3_scl = [p4_scl[0] + H3 + L3, p3[1]]	# reposition third control point
+		# prepare poles and weights function output
+		poles=[p0[0], p1_scl[0], p2_scl[0], p3_scl[0], p4_scl[0], p5[0]]
+		weights = [p0[1], p1[1], p2[1], p3[1], p4[1], p5[1]]
+		# prepare weighted poles for curvature analysis
+		WeightedPoles_6_i = [[poles[0],weights[0]],
+							[poles[1],weights[1]],
+							[poles[2],weights[2]],
+							[poles[3],weights[3]],
+							[poles[4],weights[4]],
+							[poles[5],weights[5]]]
+		# check both end curvatures
+		dCds6_0i = Cubic_6P_dCds(WeightedPoles_6_i[0],
+								WeightedPoles_6_i[1],
+								WeightedPoles_6_i[2],
+								WeightedPoles_6_i[3],
+								WeightedPoles_6_i[4],
+								WeightedPoles_6_i[5])
+
+		dCds6_1i = Cubic_6P_dCds(WeightedPoles_6_i[5],
+								WeightedPoles_6_i[4],
+								WeightedPoles_6_i[3],
+								WeightedPoles_6_i[2],
+								WeightedPoles_6_i[1],
+								WeightedPoles_6_i[0])
+
+		
+
+		loop_count=loop_count + 1
+	# G3 final message
+	blend_log.debug("final %s : scl[ %s, %s ] dCds[ %s, %s ] err[ %s, %s ]", loop_count, scale_1i, scale_2i, dCds6_0i, dCds6_1i, error_0, error_1)
+	return [poles,weights,scale_1i,scale_2i]
+	
+def match_r_6P_6P_Cubic(p0,p1,p2,tanRatio):
+	l1 = p1 - p0
+	l2 = p2 - p1
+
+	h4_scalar = (l1.cross(l2)).Length*tanRatio.__pow__(2)/l1.Length
+
+	test0 = ((l1.cross(l2)).cross(l1))
+	test1 = equalVectors(test0, Base.Vector(0,0,0), .000001)
+	if test1 == 1:
+		hn = Base.Vector(0,0,0)
+	else:
+		hn = ((l1.cross(l2)).cross(l1)).normalize() 
+	h4 = hn * h4_scalar
+
+	p3 = p0 - (p1-p0) * tanRatio
+	p4 = p3 + h4
+
+	matchSet = [p3, p4]
+
+	return matchSet
+
+# the surface paramters corresponding to endpoints of a curve along a border of the surface.
+# used by ControlGrid44_EdgeSegment and ControlGrid44_2EdgeSegments
+
+def paramsSurface44BorderSegmentCurve(AN_Surface, AN_Curve, tol, degenTol):
+	# from a surface and a curve that matches a segment of a border edge of the surface,
+	# return the cut direction (u or v), and the cut parameters
+	# only written for a 16 control point surface (4X4)
+
+	surface=AN_Surface.Shape.Surface
+	curve=AN_Curve.Shape.Curve
+	p0 = curve.StartPoint
+	# print ('p0 = ', p0)
+	p1 = curve.EndPoint
+	# print ('p1 = ', p1)
+	# get parameter span from cutting points
+	param0=surface.parameter(p0) # returns (u,v) on surface of curve start point
+	# print ('param0: ', param0)
+	param1=surface.parameter(p1) # returns (u,v) on surface of curve end point
+	# print ('param1: ', param1)
+	# CAUTION
+	# the values returned by .parameter() are random if the curve point is on a degenerate (collapsed) edge
+
+	# look for and identify degenerate edges
+	Grid = ControlGrid.from_object(AN_Surface.Grid)
+	corners = Grid.corners
+	degenerate = Grid.degenerate
+	if degenerate[0]:
+		degen_grid = 1
+		degen_point = corners[0]
+		degen_t = 0
+	elif degenerate[1]:
+		degen_grid = 1
+		degen_point = corners[1]
+		degen_t = 1
+	elif degenerate[2]:
+		degen_grid = 1
+		degen_point = corners[3]
+		degen_t = 1
+	elif degenerate[3]:
+		degen_grid = 1
+		degen_point = corners[0]
+		degen_t = 0
+	else:
+		degen_grid = 0
+		degen_point = 0
+
+	# even if the grid is degenerate, the degenerate point may not be at the cutting curve endpoints
+	# and therefore may not interfere with parameter determination.
+
+	# determine if cut points are on degenerate edges (degenerate cuts)
+	degen_cut = 0
+	if (degen_grid == 1):
+		# compare to curve start point
+		if (equalVectors(p0, degen_point, .001)):
+			# print ('degenerate point matches curve start')
+			# desired segment include degenerate point
+			degen_cut = 1
+			# the parameter of interest (actual cut) comes from the curve end point (other will be 0)
+			param_cut = param1
+		# compare to curve end point
+		if (equalVectors(p1, degen_point, .001)):
+			# print ('degenerate point matches curve end')
+			# desired segment include degenerate point
+			degen_cut = 1
+			# the parameter of interest (actual cut) comes from the curve start point (other will be 1)
+			param_cut = param0
+
+	# for degenerate cuts
+	if (degen_cut == 1):
+		if (param_cut[0]<0.001 or param_cut[0]>.999):
+			segdir = 'v'
+			# print ("segmentation along", segdir)
+			if (degen_t == 0):
+				t0 = 0.0
+				t1=param_cut[1]
+			if (degen_t == 1):
+				t0 = param_cut[1]
+				t1= 1.0
+
+		if (param_cut[1]<0.001 or param_cut[1]>.999):
+			segdir = 'u'
+			# print ("segmentation along", segdir)
+			if (degen_t == 0):
+				t0 = 0.0
+				t1=param_cut[0]
+			if (degen_t == 1):
+				t0 = param_cut[0]
+				t1= 1.0
+			
+
+	# for non degenerate cuts
+	if (degen_cut == 0):
+		if ((param0[0]<0.001 and param1[0]<0.001) or (param0[0]>0.999 and param1[0]>0.999)): # if u is constant 0 or constant 1 along curve
+			segdir = 'v'
+			# print ("segmentation along", segdir)
+			if param0[1] < param1[1]:
+				t0=param0[1]
+				t1=param1[1]
+			if param0[1] > param1[1]:
+				t0=param1[1]
+				t1=param0[1]
+		if ((param0[1]<0.001 and param1[1]<0.001) or (param0[1]>0.999 and param1[1]>0.999)): # if v is constant 0 or constant 1 along curve
+			segdir = 'u'
+			# print ("segmentation along", segdir)
+			if param0[0] < param1[0]:
+				t0=param0[0]
+				t1=param1[0]
+			if param0[0] > param1[0]:
+				t0=param1[0]
+				t1=param0[0]
+		
+	# filter out t0<0 and t1>1 that may occur when the xyz position is projected to uv
+	if t0<0:
+		t0=0
+	if t1>1:
+		t1=1
+
+	#print ('paramsSurfaceBorderSegmentCurve')
+	#print ('segdir = ', segdir)
+	#print ('t0 = ', t0)
+	#print ('t1 = ', t1)
+	#print ('')
+
+	return [segdir, t0, t1]
+
+## direct functions currently unused in the Classes / unavailable through the Silk FreeCAD workbench:
+## (they are kept here because they were successfully used in the pre-parametric version of the tools)
+
+def isect_test(curve, surf, u):		# provides information about a curve point at parameter u as a surface intersection candidate.
+	test_point = curve.value(u)											# point on curve
+	test_proj_param = surf.parameter(test_point)							# parameter of projection of curve point onto surface
+	test_proj = surf.value(test_proj_param[0],test_proj_param[1])			# projection of curve point onto surface
+	test_proj_tan = surf.tangent(test_proj_param[0],test_proj_param[1])		# tangents of surface at projection
+	test_proj_n = test_proj_tan[0].cross(test_proj_tan[1])					# get surface normal from tangents
+	test_error = test_proj - test_point									# error vector
+	error = test_error.Length											# distance between curve point and its surface projection
+	testdot = test_error.dot(test_proj_n)									# compare orientation of point and surface
+	test_center = [test_point, test_error, error, testdot,test_proj_param]					# prepare list of results
+	return test_center
+
+def isect_curve_surf(curve, surf):	# curve / surface intersection point
+	tol= 0.00000001
+	# setup the parameter search span 
+	test_span = [curve.FirstParameter, curve.LastParameter]
+	# determine whether the curve grows from inside or outside the surface. this will govern how to split the search span
+	test_u_direction =  isect_test(curve, surf, curve.FirstParameter) 	# project curve startpoint to determine if it is 'inside' or 'outside' the surface.
+	if (test_u_direction[3] < 0):								# compare projection path to surface normal: dot product negative
+		direction = 1											# > curve grows 'into' the surface
+	elif (test_u_direction[3] > 0):								# compare projection path to surface normal: dot product positive
+		direction = -1										# > curve grows 'out of' the surface
+	# initialize error
+	error = 1.0
+	# set up binary search loop
+	loop_count = 0
+	while (error > tol  and loop_count < 100):
+		test_u = (test_span[1] + test_span[0]) / 2	# pick u in the center of the search span
+		test =  isect_test(curve, surf, test_u)			# project curve(u) onto surface
+		error = test[2]							# set current intersection error
+		if ((test[3]*direction) < 0):					# is the projection still coming from outside the surface?
+			test_span = [test_u, test_span[1]]		# > use second half of current span for the next search
+		if ((test[3]*direction) > 0):					# is the projection coming from inside the surface?
+			test_span = [test_span[0], test_u]		# > use first half of current span for the next search
+		loop_count=loop_count + 1
+	log.debug("step %s u %s error %s", loop_count, test_u, test[2])
+	if error > tol:
+		log.warning("no intersection found within %s", tol)
+		isect_curve_surf = 'NONE'
+	else:
+		isect_curve_surf = [test[0], test_u, test[4]]
+	return  isect_curve_surf
@@ -0,0 +1,629 @@
+#    ArachNURBS.legacy
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    ArachNURBS legacy: feature classes no longer offered by the workbench. they stay loadable
+#    for the documents that still contain them.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+from __future__ import division # allows floating point division from integers
+import Part
+import FreeCAD
+from FreeCAD import Base
+import math
+from .kernels import (StarBuffer, commit_poles_weights, commit_star, equalVectors, orient_a_to_b)
+import SilkLog
+
+log = SilkLog.get('legacy')
+
+class ControlGrid44_3_Rotate_OLD:	# made from 3 CubicControlPoly4. 
+								# degenerate grid along one edge (4 points). two inner points are rotated
+								# to align towards the degenerate corner.
+	def __init__(self, obj , poly0, poly1, poly2):
+		''' Add the properties '''
+		FreeCAD.Console.PrintMessage("\nControlGrid44_3_Rotate class Init\n")
+		obj.addProperty("App::PropertyLink","Poly0","ControlGrid44_3_Rotate","control polygon").Poly0 = poly0
+		obj.addProperty("App::PropertyLink","Poly1","ControlGrid44_3_Rotate","control polygon").Poly1 = poly1
+		obj.addProperty("App::PropertyLink","Poly2","ControlGrid44_3_Rotate","control polygon").Poly2 = poly2
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid44_3_Rotate","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid44_3_Rotate","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid44_3_Rotate","Weights").Weights
+		obj.addProperty("App::PropertyFloat","TweakWeight11","ControlGrid44_3_Rotate","Weights").TweakWeight11 = 1.0
+		obj.Proxy = self
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		poles1=fp.Poly0.Poles
+		poles2=fp.Poly1.Poles
+		poles3=fp.Poly2.Poles
+		weights1=fp.Poly0.Weights
+		weights2=fp.Poly1.Weights
+		weights3=fp.Poly2.Weights
+		quad12 = orient_a_to_b(poles1,poles2,.000001)
+		quad23 = orient_a_to_b(poles2,poles3,.000001)
+		quad31 = orient_a_to_b(poles3,poles1,.000001)
+
+		if quad12[0]!=poles1[0] and quad12[0]==poles1[-1]:
+			weights1=weights1[::-1]
+		if quad23[0]!=poles2[0] and quad23[0]==poles2[-1]:
+			weights2=weights2[::-1]
+		if quad31[0]!=poles3[0] and quad31[0]==poles3[-1]:
+			weights3=weights3[::-1]
+		# make sure this is a degenerate quadrangle, i.e. a triangle
+		if (not equalVectors(quad31[3],quad12[0],.00001)):
+			log.warning("edge loop does not form a triangle")
+		#no further error handling is implemented
+
+		p00 = quad12[0]
+		p01 = quad12[1]
+		p02 = quad12[2]
+		p03 = quad12[3]
+
+		p13 = quad23[1]
+		p23 = quad23[2]
+		p33 = quad23[3]
+
+		p32 = quad31[1]
+		p31 = quad31[2]
+		p30 = p00
+
+		p20 = p00
+		p10 = p00
+
+		p11_Temp = p01+p31-p30
+		p12 = p02+p13-p03
+		p21_Temp = p11_Temp
+		p22 = p23+p32-p33
+
+		# define a plane going through the degenerate corner, p00, and the last two opposite points of poly0
+		Plane0_pt = p00
+		Plane0_N = (p12-p13).cross(p00-p13)
+		
+		# define a line going through p01 and p11_Temp. we will want p11 (final) to be somewhere along his line.
+		Line0_pt = p01
+		Line0_N = p11_Temp-p01
+		
+		# define a plane going through the degenerate corner, p00, and the last two opposite points of poly3
+		Plane1_pt = p00
+		Plane1_N = (p22-p23).cross(p30-p23)
+		
+		# define a line going through p31 and p21_Temp. we will want p21 (final) to be somewhere along his line.
+		Line1_pt = p31
+		Line1_N = p21_Temp-p31
+		
+		# if the plane0 and Line0 are not parallel or coincident, set p11 at the intersection.
+		# if they are, [TBD]
+		test0 = math.fabs(Plane0_N.dot(Line0_N))
+		log.debug("test0: %s", test0)
+		if test0 >= .00001 :
+			log.debug("test0: %s", test0)
+			factor0 = (Plane0_pt-Line0_pt).dot(Plane0_N) / Line0_N.dot(Plane0_N)
+			p11 = Line0_N.multiply(factor0)+Line0_pt
+		else:
+			log.warning("poly0 / poly2 combination: edge/plane parallel, cannot intersect for inner control point p11")
+		 
+		# if the plane1 and Line1 are not parallel or coincident, set p21 at the intersection.
+		# if they are, [TBD]
+		test1 = math.fabs(Plane1_N.dot(Line1_N))
+		log.debug("test1: %s", test1)
+		if test1 >= .00001 :
+			factor1 = (Plane1_pt-Line1_pt).dot(Plane1_N) / Line1_N.dot(Plane1_N)
+			p21 = Line1_N.multiply(factor1)+Line1_pt
+		else:
+			log.warning("poly2 / poly3 combination: edge/plane parallel, cannot intersect for inner control point p21")
+		 
+
+		Poles = [p00 ,p01, p02, p03,
+					p10, p11, p12, p13,
+					p20, p21, p22, p23,
+					p30, p31, p32, p33]
+
+		# weights below are in progress
+		w00 = weights1[0]
+		w01 = weights1[1]
+		w02 = weights1[2]
+		w03 = weights1[3]
+
+		w13 = weights2[1]
+		w23 = weights2[2]
+		w33 = weights2[3]
+
+		w32 = weights3[1]
+		w31 = weights3[2]
+		w30 = weights3[3]
+
+		w10 = w13 #fp.TweakWeight11 # or maybe try = p13?
+		w20 = w23 #fp.TweakWeight11 # or maybe try = p23?
+
+		w11 = w01*w10
+		w12 = w02*w13
+		w21 = w31*w20
+		w22 = w23*w31
+
+
+		Weights = [w00 ,w01, w02, w03,
+					w10, w11, w12, w13,
+					w20, w21, w22, w23,
+					w30, w31, w32, w33]
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		Legs=[0]*20
+		for i in range(0,3):
+			Legs[i]=Part.LineSegment(fp.Poles[i],fp.Poles[i+1])
+		for i in range(3,6):
+			Legs[i]=Part.LineSegment(fp.Poles[i+1],fp.Poles[i+2])
+		for i in range(6,9):
+			Legs[i]=Part.LineSegment(fp.Poles[i+2],fp.Poles[i+3])
+		for i in range(9,12):
+			Legs[i]=Part.LineSegment(fp.Poles[i+3],fp.Poles[i+4])
+		for i in range(12,15): #skip 0-4
+			Legs[i]=Part.LineSegment(fp.Poles[i-11],fp.Poles[i-7])
+		for i in range(15,17): #skip 4-8 and 5-9
+			Legs[i]=Part.LineSegment(fp.Poles[i-9],fp.Poles[i-5])
+		for i in range(17,20): #skip 8-12
+			Legs[i]=Part.LineSegment(fp.Poles[i-8],fp.Poles[i-4])
+		fp.Legs=Legs
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid64_3:	# made from 2 CubicControlPoly4 and 1 CubicControlPoly6. degenerate grid. NOT IN USE ANYWHERE
+	def __init__(self, obj , poly4_0, poly6_1, poly4_2):
+		''' Add the properties '''
+		FreeCAD.Console.PrintMessage("\nControlGrid64_4 class Init\n")
+		obj.addProperty("App::PropertyLink","Poly4_0","ControlGrid64_3","control polygon").Poly4_0 = poly4_0
+		obj.addProperty("App::PropertyLink","Poly6_1","ControlGrid64_3","control polygon").Poly6_1 = poly6_1
+		obj.addProperty("App::PropertyLink","Poly4_2","ControlGrid64_3","control polygon").Poly4_2 = poly4_2
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlGrid64_3","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlGrid64_3","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlGrid64_3","Weights").Weights
+		obj.Proxy = self
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		log.debug("first one")
+		poles4_0=fp.Poly4_0.Poles
+		poles6_1=fp.Poly6_1.Poles
+		poles4_2=fp.Poly4_2.Poles
+
+		weights4_0=fp.Poly4_0.Weights
+		weights6_1=fp.Poly6_1.Weights
+		weights4_2=fp.Poly4_2.Weights
+
+		sext12 = orient_a_to_b(poles6_1,poles4_2,.000001)
+		quad23 = orient_a_to_b(poles4_2,poles4_0,.000001)
+		quad31 = orient_a_to_b(poles4_0,poles6_1,.000001)
+
+		if sext12[0]!=poles6_1[0] and sext12[0]==poles6_1[-1]:
+			weights6_1=weights6_1[::-1]
+		if quad23[0]!=poles4_2[0] and quad23[0]==poles4_2[-1]:
+			weights4_2=weights4_2[::-1]
+		if quad31[0]!=poles4_0[0] and quad31[0]==poles4_0[-1]:
+			weights4_0=weights4_0[::-1]
+
+		p00 = sext12[0]
+		p01 = sext12[1]
+		p02 = sext12[2]
+		p03 = sext12[3]
+		p04 = sext12[4]
+		p05 = sext12[5]
+
+		p15 = quad23[1]
+		p25 = quad23[2]
+		p35 = quad23[3]
+
+		p34 = p35
+		p33 = p35
+		p32 = p35
+		p31 = p35
+		p30 = p35
+
+		p20 = quad31[1]
+		p10 = quad31[2]
+
+		p11 = p01 + (p10 - p00)
+		p14 = p04 + (p15 - p05)
+		p12 = p11
+		p13 = p14
+		p21 = p20 + (p25 - p35)
+		p22 = p21
+		p23 = p21
+		p24 = p21
+		Poles = [p00, p01, p02, p03, p04, p05,
+					p10, p11, p12, p13, p14, p15,
+					p20, p21, p22, p23, p24, p25,
+					p30, p31, p32, p33, p34, p35]
+
+		w00 = weights6_1[0]
+		w01 = weights6_1[1]
+		w02 = weights6_1[2]
+		w03 = weights6_1[3]
+		w04 = weights6_1[4]
+		w05 = weights6_1[5]
+		w15 = weights4_2[1]
+		w25 = weights4_2[2]
+		w35 = weights4_2[3]
+		w34 = 1
+		w33 = 1
+		w32 = 1
+		w31 = 1
+		w30 = weights4_0[0]
+		w20 = weights4_0[1]
+		w10 = weights4_0[2]
+
+		# maybe i should average instead of multiply? needs testing.
+		# currently based on the idea all weights are between 0 and 1.
+		# previous used cumulative neighbor multiplication. this drives weights too low.
+		# current method multiplies the two weights along isos to the closest edge
+		w11 = w01*w10*0.5
+		w12 = w02*w10*0.5
+		w13 = w03*w15*0.5
+		w14 = w04*w15*0.5
+		w21 = w31*w20*0.25
+		w22 = w32*w20*0.25
+		w23 = w33*w25*0.25
+		w24 = w34*w25*0.25
+		Weights = [w00, w01, w02, w03, w04, w05,
+					w10, w11, w12, w13, w14, w15,
+					w20, w21, w22, w23, w24, w25,
+					w30, w31, w32, w33, w34, w35]
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		Legs=[0]*22
+		for i in range(0,5):
+			Legs[i]=Part.LineSegment(fp.Poles[i],fp.Poles[i+1])
+		Legs[5]=Part.LineSegment(p10,p11)
+		Legs[6]=Part.LineSegment(p12,p13)
+		Legs[7]=Part.LineSegment(p14,p15)
+		Legs[8]=Part.LineSegment(p20,p21)
+		Legs[9]=Part.LineSegment(p24,p25)
+
+		for i in range(10,16):
+			Legs[i]=Part.LineSegment(fp.Poles[i-10],fp.Poles[i-4])
+
+		Legs[16]=Part.LineSegment(p10,p20)
+		Legs[17]=Part.LineSegment(p11,p21)
+		Legs[18]=Part.LineSegment(p14,p24)
+		Legs[19]=Part.LineSegment(p15,p25)
+		Legs[20]=Part.LineSegment(p20,p30)
+		Legs[21]=Part.LineSegment(p25,p35)
+
+		fp.Legs=Legs
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlPoly6_Bezier: # not currently used. ControlPoly6_FirstElement gets the correct result already. also, wrong section
+	def __init__(self, obj , cubiccurve4_0):
+		''' Add the properties '''
+		FreeCAD.Console.PrintMessage("\nControlPoly6_Bezier class Init\n")
+		obj.addProperty("App::PropertyLink","Sketch","ControlPoly6_Bezier","reference Bezier Curve").CubicCurve4_0 = cubiccurve4_0
+		obj.addProperty("Part::PropertyGeometryList","Legs","ControlPoly6_Bezier","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","ControlPoly6_Bezier","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","ControlPoly6_Bezier","Weights").Weights = [1.0,1.0,1.0,1.0]
+		obj.Proxy = self
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# process the sketch arc...error check later
+		curve=fp.fp.CubicCurve4_0.Shape
+		curve.increaseDegree(3)
+		start=curve.FirstParameter
+		end=curve.LastParameter
+		knot1=start+(end-start)/3.0
+		knot2=end-(end-start)/3.0
+		curve.insertKnot(knot1)
+		curve.insertKnot(knot2)
+		p0=curve.getPole(1)
+		p1=curve.getPole(2)
+		p2=curve.getPole(3)
+		p3=curve.getPole(4)
+		p4=curve.getPole(5)
+		p5=curve.getPole(6)
+		Poles=[p0,p1,p2,p3,p4,p5]
+		# set the weights
+		Weights = curve.getWeights()
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		# prepare the lines to draw the polyline
+		Leg0=Part.LineSegment(p0,p1)
+		Leg1=Part.LineSegment(p1,p2)
+		Leg2=Part.LineSegment(p2,p3)
+		Leg3=Part.LineSegment(p3,p4)
+		Leg4=Part.LineSegment(p4,p5)
+		#set the polygon legs property
+		fp.Legs=[Leg0, Leg1, Leg2, Leg3, Leg4]
+		# define the shape for visualization
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGridNStar66_StarTrim: # quick and dirty test for star center refinement. uses a list of subgrids within the single linked StarTrim, instead of a linklist. 
+	def __init__(self, fp , StarTrim):
+		''' Add the properties '''
+		FreeCAD.Console.PrintMessage("\nControlGridNStar66_StarTrim class Init\n")
+		fp.addProperty("App::PropertyLink","StarTrim","ControlGridNStar66_StarTrim","Reference StarTrim").StarTrim = StarTrim
+		fp.addProperty("App::PropertyInteger","N","ControlGridNStar66_StarTrim","N").N
+		fp.setEditorMode("N", 2)
+		fp.addProperty("Part::PropertyGeometryList","Legs","ControlGridNStar66_StarTrim","control segments").Legs
+		fp.addProperty("App::PropertyPythonObject","StarGrid","ControlGridNStar66_StarTrim","Poles").StarGrid
+		fp.addProperty("App::PropertyInteger","SquishDiag4","ControlGridNStar66_NSub","SquishDiag4").SquishDiag4 = 0
+		fp.Proxy = self
+
+	def getL1Scale(self, p0, p1, p2):
+		L1_scale = (((p1 - p0).normalize()).dot(p2-p1)) / ((p1 - p0).Length)
+		return L1_scale
+
+	def StarRow2_2Sub(self, star, Sub_0_i, Sub_1_i):
+		L1Scale_Sub0_v = self.getL1Scale(star.StarGrid[Sub_0_i][2][0], star.StarGrid[Sub_0_i][8][0], star.StarGrid[Sub_0_i][14][0])
+		L1Scale_Sub1_u = self.getL1Scale(star.StarGrid[Sub_1_i][12][0], star.StarGrid[Sub_1_i][13][0], star.StarGrid[Sub_1_i][14][0])
+		L1Scale_Mid = 0.5 * (L1Scale_Sub0_v + L1Scale_Sub1_u)
+		Mid_p2 = star.StarGrid[Sub_0_i][17][0] + L1Scale_Mid * (star.StarGrid[Sub_0_i][11][0]-star.StarGrid[Sub_0_i][5][0])
+
+		star.StarGrid[Sub_0_i][17][0] = Mid_p2
+		star.StarGrid[Sub_1_i][32][0] = Mid_p2
+		star.StarGrid[Sub_0_i][16][0] = star.StarGrid[Sub_0_i][16][0] + L1Scale_Mid * (star.StarGrid[Sub_0_i][10][0]-star.StarGrid[Sub_0_i][4][0])
+		star.StarGrid[Sub_1_i][26][0] = star.StarGrid[Sub_1_i][26][0] + L1Scale_Mid * (star.StarGrid[Sub_1_i][25][0]-star.StarGrid[Sub_1_i][24][0])
+
+		L1Scale_15 = 0.5 * (L1Scale_Sub0_v + L1Scale_Mid)
+		L1Scale_20 = 0.5 * (L1Scale_Sub1_u + L1Scale_Mid)
+		star.StarGrid[Sub_0_i][15][0] = star.StarGrid[Sub_0_i][15][0] + L1Scale_15 * (star.StarGrid[Sub_0_i][9][0]-star.StarGrid[Sub_0_i][3][0])
+		star.StarGrid[Sub_1_i][20][0] = star.StarGrid[Sub_1_i][20][0] + L1Scale_20 * (star.StarGrid[Sub_1_i][19][0]-star.StarGrid[Sub_1_i][18][0])
+
+		# control leg visualization
+		Legs_Row2 = []
+		Legs_Row2_i = [[[9,15],[10,16],[11,17],[14,15],[15,16],[16,17]],[[14,20],[19,20],[20,26],[25,26],[26,32]]]
+		for i in Legs_Row2_i[0]:
+			Legs_Row2.append(Part.LineSegment(star.StarGrid[Sub_0_i][i[0]][0],star.StarGrid[Sub_0_i][i[1]][0]))
+
+		for i in Legs_Row2_i[1]:
+			Legs_Row2.append(Part.LineSegment(star.StarGrid[Sub_1_i][i[0]][0],star.StarGrid[Sub_1_i][i[1]][0]))
+
+		star.Legs.extend(Legs_Row2)
+		return 0
+
+	def StarRow2_SubLoop(self, star, N):
+		# loop in pairs from first element to last
+		for i in range(N-1):
+			self.StarRow2_2Sub(star, i, i+1)
+
+		# close sequence by looping back a pair from last to first element
+		self.StarRow2_2Sub(star, N-1, 0)
+		return 0
+
+	def StarDiag3_Sub(self, star, Sub_i):
+		star.StarGrid[Sub_i][21][0] = star.StarGrid[Sub_i][20][0] + star.StarGrid[Sub_i][15][0] - star.StarGrid[Sub_i][14][0]
+
+		# control leg visualization
+		Legs_Diag3 = [0,0]
+		Legs_Diag3[0] = Part.LineSegment(star.StarGrid[Sub_i][15][0], star.StarGrid[Sub_i][21][0])
+		Legs_Diag3[1] = Part.LineSegment(star.StarGrid[Sub_i][20][0], star.StarGrid[Sub_i][21][0])
+
+		star.Legs.extend(Legs_Diag3)
+		return 0
+
+	def StarDiag3_SubLoop(self, star, N):
+		# loop from first element to last. no pairs, no loop back required.
+		for i in range(N):
+			self.StarDiag3_Sub(star, i)
+		return 0
+
+	def StarRow3_2Sub(self, star, Sub_0_i, Sub_1_i):
+		# prepare seam point
+		Mid_p2 = star.StarGrid[Sub_0_i][17][0] + 0.5 * (star.StarGrid[Sub_0_i][21][0]-star.StarGrid[Sub_0_i][15][0]+star.StarGrid[Sub_1_i][21][0]-star.StarGrid[Sub_1_i][20][0])
+
+		# apply seam point locally
+		star.StarGrid[Sub_0_i][23][0] = Mid_p2
+		star.StarGrid[Sub_1_i][33][0] = Mid_p2
+
+		# average to seam neighbor locally
+		star.StarGrid[Sub_0_i][22][0] = star.StarGrid[Sub_0_i][16][0] + 0.5 * (star.StarGrid[Sub_0_i][21][0]-star.StarGrid[Sub_0_i][15][0]+star.StarGrid[Sub_0_i][23][0]-star.StarGrid[Sub_0_i][17][0])
+		star.StarGrid[Sub_1_i][27][0] = star.StarGrid[Sub_1_i][26][0] + 0.5 * (star.StarGrid[Sub_1_i][21][0]-star.StarGrid[Sub_1_i][20][0]+star.StarGrid[Sub_1_i][33][0]-star.StarGrid[Sub_1_i][32][0])
+
+		Legs_Row3 = []
+		Legs_Row3_i = [[[16,22],[17,23],[21,22],[22,23]],[[21,27],[26,27],[27,33]]]
+		for i in Legs_Row3_i[0]:
+			Legs_Row3.append(Part.LineSegment(star.StarGrid[Sub_0_i][i[0]][0],star.StarGrid[Sub_0_i][i[1]][0]))
+
+		for i in Legs_Row3_i[1]:
+			Legs_Row3.append(Part.LineSegment(star.StarGrid[Sub_1_i][i[0]][0],star.StarGrid[Sub_1_i][i[1]][0]))
+
+		star.Legs.extend(Legs_Row3)
+		return 0
+
+	def StarRow3_SubLoop(self, star, N):
+		# loop in pairs from first element to last
+		for i in range(N-1):
+			self.StarRow3_2Sub(star, i, i+1)
+		# close sequence by looping back a pair from last to first element
+		self.StarRow3_2Sub(star, N-1, 0)
+		return 0
+
+	def StarDiag4_3Sub(self, star, Sub_prev_i, Sub_i, Sub_next_i):
+		# parallelogram diagonal
+		#Sub_28_raw = star.StarGrid[Sub_i][27][0] + (star.StarGrid[Sub_i][22][0]-star.StarGrid[Sub_i][21][0])
+
+		# components of the parallelogram diagonals, scaled by opposite edge on adjacent grid
+		u_28_i = star.StarGrid[Sub_i][22][0] - star.StarGrid[Sub_i][21][0]
+		v_28_i = star.StarGrid[Sub_i][27][0] - star.StarGrid[Sub_i][21][0]
+
+		u_28_prev_i = star.StarGrid[Sub_prev_i][27][0] - star.StarGrid[Sub_prev_i][21][0]
+		v_28_next_i = star.StarGrid[Sub_next_i][22][0] - star.StarGrid[Sub_next_i][21][0]
+
+		scaled_u_28_i = u_28_i * ( 1 +  ( u_28_prev_i.Length - u_28_i.Length ) / ( 3.0 * u_28_i.Length ) )
+		scaled_v_28_i = v_28_i * ( 1 +  ( v_28_next_i.Length - v_28_i.Length ) / ( 3.0 * v_28_i.Length ) )
+
+		Sub_28_raw = star.StarGrid[Sub_i][21][0] + scaled_u_28_i +scaled_v_28_i
+
+		# scaling factor. based on N? 
+		# no. need to fix this. the scaling factor needs to achieve alignment between neighboring subgrids if they align,
+		# and a smooth rotation if they do not align.
+		# something...something...angle in the normal or maybe tangent plane. something...(1-cos()) factor.
+
+		if star.N == 3:
+			scale = 0.75 # scaled down 75% to spread out center this works quite well for triangles actually
+		if star.N == 5:
+			scale = 1.00 # this is a mess. a single factor doesn't do it. oh well, moving on.
+
+
+
+
+		Sub_28_scaled = star.StarGrid[Sub_i][21][0] + scale * (Sub_28_raw - star.StarGrid[Sub_i][21][0])
+
+		Plane_prev = Part.Plane(star.StarGrid[Sub_i][33][0],star.StarGrid[Sub_i][23][0],star.StarGrid[Sub_prev_i][33][0])
+		Plane_next = Part.Plane(star.StarGrid[Sub_i][33][0],star.StarGrid[Sub_i][23][0],star.StarGrid[Sub_next_i][23][0])
+
+		Sub_28_prev_param = Plane_prev.parameter(Sub_28_scaled)
+		Sub_28_prev_proj = Plane_prev.value(Sub_28_prev_param[0],Sub_28_prev_param[1])
+
+		Sub_28_next_param = Plane_next.parameter(Sub_28_scaled)
+		Sub_28_next_proj = Plane_next.value(Sub_28_next_param[0],Sub_28_next_param[1])
+
+		star.StarGrid[Sub_i][28][0] = 0.5 * Sub_28_scaled + 0.25 * (Sub_28_prev_proj + Sub_28_next_proj)
+
+		# control leg visualization
+		Legs_Diag4 = [0,0]
+		Legs_Diag4[0] = Part.LineSegment(star.StarGrid[Sub_i][22][0],star.StarGrid[Sub_i][28][0])
+		Legs_Diag4[1] = Part.LineSegment(star.StarGrid[Sub_i][27][0],star.StarGrid[Sub_i][28][0])
+
+		star.Legs.extend(Legs_Diag4)
+		return 0
+
+	def StarDiag4_SubLoop(self, star, N):
+		# loop in triples from first element to second to last
+		for i in range(N-2):
+			self.StarDiag4_3Sub(star, i, i+1, i+2)
+		# close sequence by looping back two triples spanning first and last elements
+		self.StarDiag4_3Sub(star, N-2, N-1, 0)
+		self.StarDiag4_3Sub(star, N-1, 0, 1)
+		return 0
+
+	def StarDiag4_squish(self, star, N):
+		# we are going to average all poles [28] around the loop to define the squish center
+
+		# sum all poles [28]
+		Poles_28_total = Base.Vector(0,0,0)
+		for i in range(N):
+			Poles_28_total = Poles_28_total + star.StarGrid[i][28][0]
+
+		SquishCenter = (1.0 / N) * Poles_28_total
+
+		# do cross products in pairs around the loops to get a list of normal direction approximations
+		cross_total = Base.Vector(0,0,0)
+		for i in range(N-1):
+			cross_total = cross_total + (star.StarGrid[i][28][0]-SquishCenter).cross(star.StarGrid[i+1][28][0]-SquishCenter)
+		# close sequence by looping back
+		cross_total = cross_total + (star.StarGrid[N-1][28][0]-SquishCenter).cross(star.StarGrid[0][28][0]-SquishCenter)
+
+		# define squish plane from squish center and squish normal
+		Squish_Plane = Part.Plane(SquishCenter, cross_total)
+
+		# project all diag4 points to this plane.
+		projections = [0] * N
+		for i in range(N):
+			param = Squish_Plane.parameter(star.StarGrid[i][28][0])
+			star.StarGrid[i][28][0] = Squish_Plane.value(param[0],param[1])
+
+	def StarRow4_2Sub(self, star, Sub_0_i, Sub_1_i):
+		# pull up the seam at row 4
+		Mid_p4 = 0.5 * (star.StarGrid[Sub_0_i][28][0] + star.StarGrid[Sub_1_i][28][0])
+		star.StarGrid[Sub_0_i][29][0] = Mid_p4
+		star.StarGrid[Sub_1_i][34][0] = Mid_p4
+
+		# control leg visualization
+		Legs_Row4 = [0,0,0]
+		Legs_Row4[0] = Part.LineSegment(star.StarGrid[Sub_0_i][23][0],star.StarGrid[Sub_0_i][29][0])
+		Legs_Row4[1] = Part.LineSegment(star.StarGrid[Sub_0_i][28][0],star.StarGrid[Sub_0_i][29][0])
+		Legs_Row4[2] = Part.LineSegment(star.StarGrid[Sub_1_i][28][0],star.StarGrid[Sub_1_i][34][0])
+
+		star.Legs.extend(Legs_Row4)
+		return 0
+
+	def StarRow4_SubLoop(self, star, N):
+		# loop in pairs from first element to last
+		for i in range(N-1):
+			self.StarRow4_2Sub(star, i, i+1)
+		# close sequence by looping back a pair from last to first element
+		self.StarRow4_2Sub(star, N-1, 0)
+		return 0
+
+	def StarCenter(self, star, N):
+		# we are going to average all poles [29] around the loop to define the center
+		# sum all poles [29]
+		Vector_total = Base.Vector(0,0,0)
+		for i in range(N):
+			Vector_total = Vector_total + star.StarGrid[i][29][0]
+
+		StarCenter = (1.0 / N) * Vector_total 
+
+		# Apply center point to all Poles lists
+		for i in range(N):
+			star.StarGrid[i][35][0] = StarCenter
+
+		# control leg visualization
+		Legs_Row5 = []
+		for i in range(N):
+			Legs_Row5.append(Part.LineSegment(star.StarGrid[i][29][0],star.StarGrid[i][35][0]))
+
+		star.Legs.extend(Legs_Row5)
+
+		return 0
+
+	def execute(self, fp):
+		# instead of a list of Subgrid Links, we have a single link to a list of surface segments. we have to make our own SubGrids
+
+
+		# this version works directly from NSurf_Center. this isn't directly equivalent, because the curvature row/col is not 'collapsed' to the tangent row/col, as it would be in a fresh SubGrid63
+		# refresh properties back to linked Startrim every time the Star gets recomputed
+		# the star is built in a local StarBuffer, N, StarGrid, Legs and Shape are written once at the end
+		# determine number of SubGrids in the StarTrim
+		star = StarBuffer(fp.StarTrim.CubicNStar.NStarGrid.N, fp.SquishDiag4)
+		NSurf_center = fp.StarTrim.NSurf_center
+		# compile all SubGrid Poles and Weights into the StarGrid of the buffer
+		for n in range(star.N):
+			log.debug("n = %s", n)
+			# extract subgrid info from each StarTrim center section
+			PoleArray = NSurf_center[n].getPoles()
+			Poles = [0] *36
+			for v in range(6):
+				for u in range(6):
+					Poles[v*6+u] = PoleArray[u][v]
+
+			WeightArray = NSurf_center[n].getWeights()
+			Weights = [0] *36
+			for v in range(6):
+				for u in range(6):
+					Weights[v*6+u] = WeightArray[u][v]
+
+			StarGrid_n = [0] * 36
+			for i in range(36):
+				# set Pole/Weight format [Base.Vector(), Float]
+				log.debug("i = %s", i)
+				StarGrid_n_i = [0,0]
+				StarGrid_n_i[0] = Poles[i]
+				StarGrid_n_i[1] = Weights[i]
+				StarGrid_n[i] = StarGrid_n_i
+			star.StarGrid[n] = StarGrid_n
+		# a specific Pole is now addressed as StarGrid[n][i][0]
+		# a specific Weight is now addresses as StarGrid[n][i][1]
+
+
+		# now that we effectilvely have a list of N Subgrids, make an NStar control grid
+		# self.StarRow2_SubLoop(star, star.N) # skip row 2 since we carry in the curvature rows? just go right to row 3?
+		self.StarDiag3_SubLoop(star, star.N)
+		self.StarRow3_SubLoop(star, star.N)
+		self.StarDiag4_SubLoop(star, star.N)
+		self.StarDiag4_squish(star, star.N)
+		self.StarRow4_SubLoop(star, star.N)
+		self.StarCenter(star, star.N)
+
+		# StarGrid is saved as a packed float64 buffer, see pack_star_grid()
+		commit_star(fp, star)
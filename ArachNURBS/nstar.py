@@ -0,0 +1,462 @@
+#    ArachNURBS.nstar
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    ArachNURBS nstar: N sided star grids and surfaces, to fill corners where blends meet.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+from __future__ import division # allows floating point division from integers
+import Part
+import FreeCAD
+from FreeCAD import Base
+import numpy as np
+from .kernels import (ControlGrid, Cubic_surf_homogeneous, StarBuffer, build_surfaces, commit_poles_weights,
+					commit_star, cubic_knots_mults, equalVectors, homogeneous_poles, int_2l, match_r_6P_6P_Cubic, nstar_grid,
+					nstar_legs, poles_weights_from_homogeneous, split_66_quadrants, split_6P_matrix_0, split_6P_matrix_1,
+					split_knots_mults, star_array, star_grid_view, upgrade_4_to_6)
+import SilkLog
+
+log = SilkLog.get('nstar')
+
+class SubGrid63_2Surf64:
+	def __init__(self, obj , Surf_0, Surf_1):
+		''' Add the properties '''
+		FreeCAD.Console.PrintMessage("\nSubGrid62Tri_2Surf64 class Init\n")
+		obj.addProperty("App::PropertyLink","Surf_0","SubGrid63_2Surf64","first reference 6X4 surface").Surf_0 = Surf_0
+		obj.addProperty("App::PropertyLink","Surf_1","SubGrid63_2Surf64","second reference 6X4 surface").Surf_1 = Surf_1
+		obj.addProperty("Part::PropertyGeometryList","Legs","SubGrid63_2Surf64","control segments").Legs
+		obj.addProperty("App::PropertyVectorList","Poles","SubGrid63_2Surf64","Poles").Poles
+		obj.addProperty("App::PropertyFloatList","Weights","SubGrid63_2Surf64","Weights").Weights
+
+		obj.Proxy = self
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+
+		# get grids form the surfaces
+		Grid_0=ControlGrid.from_object(fp.Surf_0.Grid)
+		Grid_1=ControlGrid.from_object(fp.Surf_1.Grid)
+
+		#get the FreeCAD surface form the NL surface object
+		Surf_0 = fp.Surf_0.Shape.Surface
+		Surf_1 = fp.Surf_1.Shape.Surface
+
+		# extract corner points, in [0, 5, 18, 23] order
+		corners_0=[Grid_0.corners[0],Grid_0.corners[1],Grid_0.corners[3],Grid_0.corners[2]]
+		corners_1=[Grid_1.corners[0],Grid_1.corners[1],Grid_1.corners[3],Grid_1.corners[2]]
+
+		# find the common point that defines the corner
+		common = 'not_found_yet'
+		for i in range(0,4):
+			for j in range(0,4):
+				if equalVectors(corners_0[i], corners_1[j], 0.000001):
+					common=[i,j]
+		if common == 'not_found_yet':
+			log.warning("common point of grids not found. If this object was working previously, this is an evaluation error")
+		log.debug("common %s", common)
+
+		# the two 6 point sides of each grid should form a V when looking at the future grid
+		# a is the left leg of the V, i.e. common[0] = 0 or 3
+		# b is the right leg of the V i.e. common[1] = 2 or 1
+
+		# check input grid order, swap grids if necessary
+		if (common[0] == 1 or common[0] == 2) and (common[1] == 0 or common[1] == 3):
+			log.debug("swap surfaces - internal only?")
+			temp_grid=Grid_0
+			Grid_0=Grid_1
+			Grid_1=temp_grid
+
+			temp_surf=Surf_0
+			Surf_0=Surf_1
+			Surf_1=temp_surf
+
+			# get the corners again, based on swapped grids
+			corners_0=[Grid_0.corners[0],Grid_0.corners[1],Grid_0.corners[3],Grid_0.corners[2]]
+			corners_1=[Grid_1.corners[0],Grid_1.corners[1],Grid_1.corners[3],Grid_1.corners[2]]
+			# find common again
+			for i in range(0,4):
+				for j in range(0,4):
+					if equalVectors(corners_0[i], corners_1[j], 0.000001):
+						common=[i,j]
+			log.debug("common %s", common)
+
+
+		# homogeneous poles of both surfaces, indexed [u][v]
+		Pw_0 = homogeneous_poles(Surf_0.getPoles(), Surf_0.getWeights())
+		Pw_1 = homogeneous_poles(Surf_1.getPoles(), Surf_1.getWeights())
+
+		# cut surfaces in half, re-establish Poly6 along u
+		if common[0]==0:
+			Pw_0 = np.tensordot(split_6P_matrix_0, Pw_0, axes = 1)
+		if common[0]==3:
+			Pw_0 = np.tensordot(split_6P_matrix_1, Pw_0, axes = 1)
+		if common[1]==2:
+			Pw_1 = np.tensordot(split_6P_matrix_0, Pw_1, axes = 1)
+		if common[1]==1:
+			Pw_1 = np.tensordot(split_6P_matrix_1, Pw_1, axes = 1)
+
+		# raise v to establish Poly6 along v
+		Poles66_0, Weights66_0 = poles_weights_from_homogeneous(upgrade_4_to_6(Pw_0))
+		Poles66_1, Weights66_1 = poles_weights_from_homogeneous(upgrade_4_to_6(Pw_1))
+
+		if common[0] == 0:
+			v_col0_poles = [Poles66_0[0][0],Poles66_0[1][0],Poles66_0[2][0],Poles66_0[3][0],Poles66_0[4][0],Poles66_0[5][0]]
+			v_col0_weights = [Weights66_0[0][0],Weights66_0[1][0],Weights66_0[2][0],Weights66_0[3][0],Weights66_0[4][0],Weights66_0[5][0]]
+			v_col1_poles = [Poles66_0[0][1],Poles66_0[1][1],Poles66_0[2][1],Poles66_0[3][1],Poles66_0[4][1],Poles66_0[5][1]]
+			v_col1_weights = [Weights66_0[0][1],Weights66_0[1][1],Weights66_0[2][1],Weights66_0[3][1],Weights66_0[4][1],Weights66_0[5][1]]
+			v_col2_poles = [Poles66_0[0][2],Poles66_0[1][2],Poles66_0[2][2],Poles66_0[3][2],Poles66_0[4][2],Poles66_0[5][2]]
+			v_col2_weights = [Weights66_0[0][2],Weights66_0[1][2],Weights66_0[2][2],Weights66_0[3][2],Weights66_0[4][2],Weights66_0[5][2]]
+
+		if common[0] == 3:
+			v_col0_poles = [Poles66_0[5][5],Poles66_0[4][5],Poles66_0[3][5],Poles66_0[2][5],Poles66_0[1][5],Poles66_0[0][5]]
+			v_col0_weights = [Weights66_0[5][5],Weights66_0[4][5],Weights66_0[3][5],Weights66_0[2][5],Weights66_0[1][5],Weights66_0[0][5]]
+			v_col1_poles = [Poles66_0[5][4],Poles66_0[4][4],Poles66_0[3][4],Poles66_0[2][4],Poles66_0[1][4],Poles66_0[0][4]]
+			v_col1_weights = [Weights66_0[5][4],Weights66_0[4][4],Weights66_0[3][4],Weights66_0[2][4],Weights66_0[1][4],Weights66_0[0][4]]
+			v_col2_poles = [Poles66_0[5][3],Poles66_0[4][3],Poles66_0[3][3],Poles66_0[2][3],Poles66_0[1][3],Poles66_0[0][3]]
+			v_col2_weights = [Weights66_0[5][3],Weights66_0[4][3],Weights66_0[3][3],Weights66_0[2][3],Weights66_0[1][3],Weights66_0[0][3]]
+
+		if common[1] == 1:
+			u_row0_poles = [Poles66_1[5][0],Poles66_1[4][0],Poles66_1[3][0],Poles66_1[2][0],Poles66_1[1][0],Poles66_1[0][0]]
+			u_row0_weights = [Weights66_1[5][0],Weights66_1[4][0],Weights66_1[3][0],Weights66_1[2][0],Weights66_1[1][0],Weights66_1[0][0]]
+			u_row1_poles = [Poles66_1[5][1],Poles66_1[4][1],Poles66_1[3][1],Poles66_1[2][1],Poles66_1[1][1],Poles66_1[0][1]]
+			u_row1_weights = [Weights66_1[5][1],Weights66_1[4][1],Weights66_1[3][1],Weights66_1[2][1],Weights66_1[1][1],Weights66_1[0][1]]
+			u_row2_poles = [Poles66_1[5][2],Poles66_1[4][2],Poles66_1[3][2],Poles66_1[2][2],Poles66_1[1][2],Poles66_1[0][2]]
+			u_row2_weights = [Weights66_1[5][2],Weights66_1[4][2],Weights66_1[3][2],Weights66_1[2][2],Weights66_1[1][2],Weights66_1[0][2]]
+
+		if common[1] == 2:
+			u_row0_poles = [Poles66_1[0][5],Poles66_1[1][5],Poles66_1[2][5],Poles66_1[3][5],Poles66_1[4][5],Poles66_1[5][5]]
+			u_row0_weights = [Weights66_1[0][5],Weights66_1[1][5],Weights66_1[2][5],Weights66_1[3][5],Weights66_1[4][5],Weights66_1[5][5]]
+			u_row1_poles = [Poles66_1[0][4],Poles66_1[1][4],Poles66_1[2][4],Poles66_1[3][4],Poles66_1[4][4],Poles66_1[5][4]]
+			u_row1_weights = [Weights66_1[0][4],Weights66_1[1][4],Weights66_1[2][4],Weights66_1[3][4],Weights66_1[4][4],Weights66_1[5][4]]
+			u_row2_poles = [Poles66_1[0][3],Poles66_1[1][3],Poles66_1[2][3],Poles66_1[3][3],Poles66_1[4][3],Poles66_1[5][3]]
+			u_row2_weights = [Weights66_1[0][3],Weights66_1[1][3],Weights66_1[2][3],Weights66_1[3][3],Weights66_1[4][3],Weights66_1[5][3]]
+
+		# sorta checked 07/08/2017? rows and cols still dubious
+
+		# set known edges
+		p00 = u_row0_poles[0]
+		p01 = u_row0_poles[1]
+		p02 = u_row0_poles[2]
+		p03 = u_row0_poles[3]
+		p04 = u_row0_poles[4]
+		p05 = u_row0_poles[5]
+
+		w00 = u_row0_weights[0]
+		w01 = u_row0_weights[1]
+		w02 = u_row0_weights[2]
+		w03 = u_row0_weights[3]
+		w04 = u_row0_weights[4]
+		w05 = u_row0_weights[5]
+
+		p10 = v_col0_poles[1]
+		p20 = v_col0_poles[2]
+		p30 = v_col0_poles[3]
+		p40 = v_col0_poles[4]
+		p50 = v_col0_poles[5]
+
+		w10 = v_col0_weights[1]
+		w20 = v_col0_weights[2]
+		w30 = v_col0_weights[3]
+		w40 = v_col0_weights[4]
+		w50 = v_col0_weights[5]
+
+		# set weights
+		w11 = w01 * w10
+		w12 = w02 * w10
+		w13 = w03 * w10
+		w14 = w04 * w10
+		w15 = w05 * w10
+
+		w21 = w01 * w20
+		w22 = w02 * w20
+		w23 = w03 * w20
+		w24 = w04 * w20
+		w25 = w05 * w20
+
+		w31 = w01 * w30
+		w32 = w02 * w30
+		w33 = w03 * w30
+		w34 = w04 * w30
+		w35 = w05 * w30
+
+		w41 = w01 * w40
+		w42 = w02 * w40
+		w43 = w03 * w40
+		w44 = w04 * w40
+		w45 = w05 * w40
+
+		w51 = w01 * w50
+		w52 = w02 * w50
+		w53 = w03 * w50
+		w54 = w04 * w50
+		w55 = w05 * w50
+
+		Weights = [w00, w01, w02, w03, w04, w05,
+					w10, w11, w12, w13, w14, w15,
+					w20, w21, w22, w23, w24, w25,
+					w30, w31, w32, w33, w34, w35,
+					w40, w41, w42, w43, w44, w45,
+					w50, w51, w52, w53, w54, w55,]
+
+
+		# establish tangent ratios for G1
+
+		u_tan_ratio = (p01-p00).Length / (v_col1_poles[0]-p00).Length
+		v_tan_ratio = (p10-p00).Length / (u_row1_poles[0]-p00).Length
+
+
+		# build first row and column of inner control points.
+
+		p11_u = p01 + (p01-u_row1_poles[1])*v_tan_ratio
+		p11_v = p10 + (p10-v_col1_poles[1])*u_tan_ratio
+		p11 = (p11_u + p11_v) * 0.5
+
+		p12 = p02 + (p02-u_row1_poles[2])*v_tan_ratio
+		p13 = p03 + (p03-u_row1_poles[3])*v_tan_ratio
+		p14 = p04 + (p04-u_row1_poles[4])*v_tan_ratio
+		p15 = p05 + (p05-u_row1_poles[5])*v_tan_ratio
+
+		p21 = p20 + (p20-v_col1_poles[2])*u_tan_ratio
+		p31 = p30 + (p30-v_col1_poles[3])*u_tan_ratio
+		p41 = p40 + (p40-v_col1_poles[4])*u_tan_ratio
+		p51 = p50 + (p50-v_col1_poles[5])*u_tan_ratio
+
+
+		# build the second row and column as projections of the input grids
+		# there is some redundancy here, as first inner row/column points are recalculated in the curvature matching function
+
+		# p22 using u_rows : surf_1 points with surf_0 tangent ratio
+		proj_u_rows_u2 = match_r_6P_6P_Cubic(u_row0_poles[2], u_row1_poles[2], u_row2_poles[2], v_tan_ratio)
+		if equalVectors(proj_u_rows_u2[0], p12, 0.0000001):
+			p22_u = proj_u_rows_u2[1]
+		else:
+			log.warning("failed to match tangent segment on p22_u calculation")
+		p22_u_ext = p22_u + (p12 - p02) * 5.0
+		p22_u_ext_L = Part.LineSegment(p22_u,p22_u_ext)
+		# p22 using v_cols : surf_0 points with surf_1 tangent ratio
+		proj_v_cols_v2 = match_r_6P_6P_Cubic(v_col0_poles[2], v_col1_poles[2], v_col2_poles[2], u_tan_ratio)
+		if equalVectors(proj_v_cols_v2[0], p21, 0.0000001):
+			p22_v = proj_v_cols_v2[1]
+		else:
+			log.warning("failed to match tangent segment on p22_v calculation")
+		p22_v_ext = p22_v + (p21 - p20) * 5.0
+		p22_v_ext_L = Part.LineSegment(p22_v,p22_v_ext)
+		# combine both p22 versions
+		p22_u_isect = int_2l(p22_u_ext_L,p22_v_ext_L)
+		p22_v_isect = int_2l(p22_v_ext_L,p22_u_ext_L)
+		p22 = (p22_u_isect +p22_v_isect)*.5 
+
+		# p23 using u_rows: surf_1 points with surf_0 tangent ratio
+		proj_u_rows_u3 = match_r_6P_6P_Cubic(u_row0_poles[3], u_row1_poles[3], u_row2_poles[3], v_tan_ratio)
+		if equalVectors(proj_u_rows_u3[0], p13, 0.0000001):
+			p23_h = proj_u_rows_u3[1]
+		else:
+			log.warning("failed to match tangent segment on p23_h calculation")
+
+		# p24 using u_rows: surf_1 points with surf_0 tangent ratio
+		proj_u_rows_u4 = match_r_6P_6P_Cubic(u_row0_poles[4], u_row1_poles[4], u_row2_poles[4], v_tan_ratio)
+		if equalVectors(proj_u_rows_u4[0], p14, 0.0000001):
+			p24_h = proj_u_rows_u4[1]
+		else:
+			log.warning("failed to match tangent segment on p24_h calculation")
+
+		# p25 using u_rows: surf_1 points with surf_0 tangent ratio
+		proj_u_rows_u5 = match_r_6P_6P_Cubic(u_row0_poles[5], u_row1_poles[5], u_row2_poles[5], v_tan_ratio)
+		if equalVectors(proj_u_rows_u5[0], p15, 0.0000001):
+			p25_h = proj_u_rows_u5[1]
+		else:
+			log.warning("failed to match tangent segment on p25_h calculation")
+
+		# p32 using v_cols : surf_0 points with surf_1 tangent ratio
+		proj_v_cols_v3 = match_r_6P_6P_Cubic(v_col0_poles[3], v_col1_poles[3], v_col2_poles[3], u_tan_ratio)
+		if equalVectors(proj_v_cols_v3[0], p31, 0.0000001):
+			p32_h = proj_v_cols_v3[1]
+		else:
+			log.warning("failed to match tangent segment on p32_h calculation")
+		# p42 using v_cols : surf_0 points with surf_1 tangent ratio
+		proj_v_cols_v4 = match_r_6P_6P_Cubic(v_col0_poles[4], v_col1_poles[4], v_col2_poles[4], u_tan_ratio)
+		if equalVectors(proj_v_cols_v4[0], p41, 0.0000001):
+			p42_h = proj_v_cols_v4[1]
+		else:
+			log.warning("failed to match tangent segment on p42_h calculation")
+		# p52 using v_cols : surf_0 points with surf_1 tangent ratio
+		proj_v_cols_v5 = match_r_6P_6P_Cubic(v_col0_poles[5], v_col1_poles[5], v_col2_poles[5], u_tan_ratio)
+		if equalVectors(proj_v_cols_v5[0], p51, 0.0000001):
+			p52_h = proj_v_cols_v5[1]
+		else:
+			log.warning("failed to match tangent segment on p52_h calculation")
+
+		v00 = Base.Vector(0,0,0)
+
+		Poles = [p00, p01, p02, p03, p04, p05,
+					p10, p11, p12, p13, p14, p15,
+					p20, p21, p22, p23_h, p24_h, p25_h,
+					p30, p31, p32_h, v00, v00, v00,
+					p40, p41, p42_h, v00, v00, v00,
+					p50, p51, p52_h, v00, v00, v00]
+
+
+
+
+
+		if not commit_poles_weights(fp, Poles, Weights):
+			return
+		Legs=[0]*30
+
+		Legs[0]=Part.LineSegment(p00,p01)
+		Legs[1]=Part.LineSegment(p01,p02)
+		Legs[2]=Part.LineSegment(p02,p03)
+		Legs[3]=Part.LineSegment(p03,p04)
+		Legs[4]=Part.LineSegment(p04,p05)
+
+		Legs[5]=Part.LineSegment(p00,p10)
+		Legs[6]=Part.LineSegment(p10,p20)
+		Legs[7]=Part.LineSegment(p20,p30)
+		Legs[8]=Part.LineSegment(p30,p40)
+		Legs[9]=Part.LineSegment(p40,p50)
+
+		Legs[10]=Part.LineSegment(p01,p11_u)
+		Legs[11]=Part.LineSegment(p02,p12)
+		Legs[12]=Part.LineSegment(p03,p13)
+		Legs[13]=Part.LineSegment(p04,p14)
+		Legs[14]=Part.LineSegment(p05,p15)
+
+		Legs[15]=Part.LineSegment(p10,p11_v)
+		Legs[16]=Part.LineSegment(p20,p21)
+		Legs[17]=Part.LineSegment(p30,p31)
+		Legs[18]=Part.LineSegment(p40,p41)
+		Legs[19]=Part.LineSegment(p50,p51)
+
+		Legs[20]=Part.LineSegment(p11,p12)
+		Legs[21]=Part.LineSegment(p12,p13)
+		Legs[22]=Part.LineSegment(p13,p14)
+		Legs[23]=Part.LineSegment(p14,p15)
+
+		Legs[24]=Part.LineSegment(p11,p21)
+		Legs[25]=Part.LineSegment(p21,p31)
+		Legs[26]=Part.LineSegment(p31,p41)
+		Legs[27]=Part.LineSegment(p41,p51)
+
+		Legs[28]=Part.LineSegment(p12,p22_u_isect)
+
+		#Legs[29]=Part.LineSegment(p13,p23_h)  # these points can collapse. need to test before making lines.
+		#Legs[30]=Part.LineSegment(p14,p24_h) 
+		#Legs[31]=Part.LineSegment(p15, p25_h)
+
+		Legs[29]=Part.LineSegment(p21,p22_v_isect)
+
+		#Legs[33]=Part.LineSegment(p31, p32_h)
+		#Legs[34]=Part.LineSegment(p41, p42_h)
+		#Legs[35]=Part.LineSegment(p51, p52_h)
+
+		fp.Legs=Legs
+		fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGridNStar66_NSub:
+	def __init__(self, fp , SubList):
+		''' Add the properties '''
+		FreeCAD.Console.PrintMessage("\nControlGridNStar66_NSub class Init\n")
+		fp.addProperty("App::PropertyLinkList","SubList","ControlGridNStar66_NSub","Reference Sub Grids").SubList = SubList
+		fp.addProperty("App::PropertyInteger","N","ControlGridNStar66_NSub","N").N
+		fp.setEditorMode("N", 2)
+		fp.addProperty("Part::PropertyGeometryList","Legs","ControlGridNStar66_NSub","control segments").Legs
+		fp.addProperty("App::PropertyPythonObject","StarGrid","ControlGridNStar66_NSub","Poles").StarGrid
+		fp.addProperty("App::PropertyInteger","SquishDiag4","ControlGridNStar66_NSub","SquishDiag4").SquishDiag4 = 0
+		fp.Proxy = self
+
+	def execute(self, fp):
+		# refresh properties back to linked SubGrids every time the Star gets recomputed
+		# the star is built in a local StarBuffer, N, StarGrid, Legs and Shape are written once at the end.
+		# nstar_grid runs the Star building steps on all SubGrids at once, as an (N, 36, 4) array.
+		# tests/test_nstar.py checks it against the steps one SubGrid at a time
+		star = StarBuffer(len(fp.SubList), fp.SquishDiag4)
+		if star.SquishDiag4 == 1:
+			log.debug("Squish Diagonal 4")
+		else:
+			log.debug("no Squish Diagonal 4!")
+		star.Grid = nstar_grid(star_array([[SubGrid.Poles, SubGrid.Weights] for SubGrid in fp.SubList]), star.SquishDiag4 == 1)
+		star.Legs = nstar_legs(star.Grid)
+
+		# StarGrid is saved as a packed float64 buffer, see pack_star_grid()
+		commit_star(fp, star)
+
+class CubicNStarSurface_NStar66: 
+	def __init__(self, obj , NStarGrid):
+		''' Add the properties '''
+		FreeCAD.Console.PrintMessage("\nCubicNStarSurface_NStar66 Init\n")
+		obj.addProperty("App::PropertyLink","NStarGrid","CubicNStarSurface_NStar66","control grid star").NStarGrid = NStarGrid
+		obj.addProperty("Part::PropertyGeometryList","NSurf","CubicNStarSurface_NStar66","N Cubic Surfaces").NSurf
+		obj.Proxy = self
+
+	def HomogeneousGrids(self, fp, N):
+		# (N, 6, 6, 4) homogeneous poles [u][v], straight from the array view of the StarGrid (flat, u varying fastest)
+		G = star_grid_view(fp.NStarGrid.StarGrid)[0:N].reshape(N, 6, 6, 4).transpose(0, 2, 1, 3)
+		return np.concatenate((G[..., 0:3] * G[..., 3:4], G[..., 3:4]), axis = -1)
+
+	def makeNSurf(self, fp, HomogeneousGrids, N):
+		# the N surfaces are independent, build_surfaces uses worker threads if surface_threads is set
+		knots_mults = cubic_knots_mults[6]
+		return build_surfaces(Cubic_surf_homogeneous, [[HomogeneousGrids[i], knots_mults, knots_mults] for i in range(N)])
+
+	def execute(self,fp):
+		# homogeneous poles of the linked NStarGrid
+		HomogeneousGrids = self.HomogeneousGrids(fp, fp.NStarGrid.N)
+
+		#loop over the homogeneous grids to make the surfaces
+		NSurf = self.makeNSurf(fp, HomogeneousGrids, fp.NStarGrid.N)
+		fp.NSurf = NSurf
+
+		fp.Shape = Part.Shape(fp.NSurf)
+
+class StarTrim_CubicNStar:
+	def __init__(self, obj , CubicNStar):
+		''' Add the properties '''
+		FreeCAD.Console.PrintMessage("\nStarTrim_CubicNStar Init\n")
+		obj.addProperty("App::PropertyLink","CubicNStar","StarTrim_CubicNStar","base Surface star").CubicNStar = CubicNStar
+		obj.addProperty("Part::PropertyGeometryList","NSurf_main","StarTrim_CubicNStar","N Cubic Surfaces, main corner section").NSurf_main
+		obj.addProperty("Part::PropertyGeometryList","NSurf_lead","StarTrim_CubicNStar","N Cubic Surfaces, leading edge section").NSurf_lead
+		obj.addProperty("Part::PropertyGeometryList","NSurf_lag","StarTrim_CubicNStar","N Cubic Surfaces, lagging edge section").NSurf_lag
+		obj.addProperty("Part::PropertyGeometryList","NSurf_center","StarTrim_CubicNStar","N Cubic Surfaces, center section").NSurf_center
+		obj.Proxy = self
+
+	def execute(self, fp):
+		N = fp.CubicNStar.NStarGrid.N
+
+		# read the N surfaces out of the linked property once, then split all of them into their four quadrants
+		# at (1/2, 1/2) in one batch on the control grids: main [0, 1/2] x [0, 1/2], lead [1/2, 1] x [0, 1/2],
+		# lag [0, 1/2] x [1/2, 1], and center [1/2, 1] x [1/2, 1], with 5/6 inserted in u and v
+		NSurf = fp.CubicNStar.NSurf[0:N]
+		Pw = np.array([homogeneous_poles(surf.getPoles(), surf.getWeights()) for surf in NSurf])
+		main, lead, lag, center = split_66_quadrants(Pw)
+
+		half_0 = split_knots_mults[0]
+		half_1 = split_knots_mults[1]
+		center_6P = split_knots_mults['6P']
+		quadrants = ([[main[i], half_0, half_0] for i in range(N)] +
+					[[lead[i], half_1, half_0] for i in range(N)] +
+					[[lag[i], half_0, half_1] for i in range(N)] +
+					[[center[i], center_6P, center_6P] for i in range(N)])
+		surfs = build_surfaces(Cubic_surf_homogeneous, quadrants)
+
+		fp.NSurf_main = surfs[0:N]
+		fp.NSurf_lead = surfs[N:2*N]
+		fp.NSurf_lag = surfs[2*N:3*N]
+		fp.NSurf_center = surfs[3*N:4*N]
+
+		trim = surfs[0:3*N]
+
+		fp.Shape = Part.Shape(trim)
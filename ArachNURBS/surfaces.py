@@ -0,0 +1,385 @@
+#    ArachNURBS.surfaces
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    ArachNURBS surfaces: cubic surface feature classes, built from control grids.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+from __future__ import division # allows floating point division from integers
+import GridPermutations as GP
+from .kernels import (Bezier_Bicubic_surf, ControlGrid, NURBS_Cubic_64_surf, NURBS_Cubic_66_surf, commit_shape, shape_cache)
+import SilkLog
+
+log = SilkLog.get('surfaces')
+
+### NURBS surfaces (+grid to input)
+
+
+class CubicSurface_44:
+	def __init__(self, obj , grid):
+		
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nCubicSurface_44 class Init\n")
+		obj.addProperty("App::PropertyLink","Grid","CubicSurface_44","control grid").Grid = grid
+		obj.Proxy = self
+		'''
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Grid","C1 - Inputs","control Grid").Grid = grid
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the surface normal direction").reverse = False
+		# outputs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "CubicSurface_44"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = latest_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		# mandatory Proxy assignment
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			#capture, then delete pre-version attribute values in user input fields
+			#deleting is done because we may be changing the format of pre-existing attributes
+			old_grid = obj.Grid
+			obj.removeProperty("Grid")
+			
+			#capturing, then deleting versioned attributes will require testing for their presence
+
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all current version atributes in correct format
+			#this matches __init__, except we use the old values instead of the defaults where they are available
+			# current attribute set
+			# inputs
+			obj.addProperty("App::PropertyLink","Grid","C1 - Inputs","control Grid").Grid = old_grid
+			obj.addProperty("App::PropertyBool","reverse",
+							"C1 - Inputs","reverse the surface normal direction").reverse = old_reverse
+			# outputs
+			# additional object identifiers
+			obj.addProperty("App::PropertyString", "object_type", 
+							"C3 - Identifiers", "the workbench class used to create this object").object_type = "CubicSurface_44"
+			obj.setEditorMode("object_type", 1)
+			obj.addProperty("App::PropertyString", "object_version", 
+							"C3 - Identifiers", "the class version of this object").object_version = latest_version
+			obj.setEditorMode("object_version", 1)
+			obj.addProperty("App::PropertyString", "internalName", 
+							"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+			obj.setEditorMode("internalName", 1)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+		
+		Grid = ControlGrid.from_object(fp.Grid)
+		# reuse the shape if this exact grid was built before
+		key = shape_cache.key('CubicSurface_44', Grid, fp.reverse)
+		shape = shape_cache.get(key)
+		if shape is None:
+			# get the poles list from the poly. legacy shape function wants 'homogeneous' coords as [[x,y,z],w]
+			Poles = Grid.Poles
+			Weights = Grid.Weights
+			if fp.reverse == True:
+				# invert u, keep v
+				Poles, Weights = GP.permute_poles_weights(Poles, Weights, '44', 'reverse_u')
+			WeightedPoles = [[Poles[i], Weights[i]] for i in range(0, 16)]
+
+			# the legacy function below sets the degree and knot vector
+			shape = Bezier_Bicubic_surf(WeightedPoles).toShape()
+			shape_cache.put(key, shape)
+		commit_shape(fp, shape)
+
+class CubicSurface_66:
+	def CubicSurface_66_Attributes(self, obj, grid, reverse, object_version):
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Grid","C1 - Inputs","control Grid").Grid = grid
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the surface normal direction").reverse = reverse
+		# outputs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "CubicSurface_66"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = object_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		return
+
+	def __init__(self, obj , grid):
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nCubicSurface_66 class Init\n")
+		obj.addProperty("App::PropertyLink","Grid","CubicSurface_66","control grid").Grid = grid
+		obj.Proxy = self
+		'''
+		self.CubicSurface_66_Attributes(obj, grid, False, latest_version)
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			# capture, then delete attribute values in user input fields
+			# deleting is done because we may be changing the format of pre-existing attributes
+			if hasattr(obj, "Grid"): 
+				old_grid = obj.Grid
+				obj.removeProperty("Grid")
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all  atributes in current version format
+			self.CubicSurface_66_Attributes(obj, old_grid, old_reverse, latest_version)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+
+		Grid = ControlGrid.from_object(fp.Grid)
+		# reuse the shape if this exact grid was built before
+		key = shape_cache.key('CubicSurface_66', Grid, fp.reverse)
+		shape = shape_cache.get(key)
+		if shape is None:
+			# get the poles list from the poly. legacy shape function wants 'homogeneous' coords as [[x,y,z],w]
+			Poles = Grid.Poles
+			Weights = Grid.Weights
+			if fp.reverse == True:
+				# invert u, keep v
+				Poles, Weights = GP.permute_poles_weights(Poles, Weights, '66', 'reverse_u')
+			WeightedPoles = [[Poles[i], Weights[i]] for i in range(0, 36)]
+
+			# the legacy function below sets the degree and knot vector
+			shape = NURBS_Cubic_66_surf(WeightedPoles).toShape()
+			shape_cache.put(key, shape)
+		commit_shape(fp, shape)
+
+class CubicSurface_64:
+	def CubicSurface_64_Attributes(self, obj, grid, reverse, object_version):
+		# current attribute set
+		# inputs
+		obj.addProperty("App::PropertyLink","Grid","C1 - Inputs","control Grid").Grid = grid
+		obj.addProperty("App::PropertyBool","reverse",
+				  		"C1 - Inputs","reverse the surface normal direction").reverse = reverse
+		# outputs
+		# additional object identifiers
+		obj.addProperty("App::PropertyString", "object_type", 
+				  		"C3 - Identifiers", "the workbench class used to create this object").object_type = "CubicSurface_64"
+		obj.setEditorMode("object_type", 1)
+		obj.addProperty("App::PropertyString", "object_version", 
+				  		"C3 - Identifiers", "the class version of this object").object_version = object_version
+		obj.setEditorMode("object_version", 1)
+		obj.addProperty("App::PropertyString", "internalName", 
+				  		"C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName= obj.Name
+		obj.setEditorMode("internalName", 1)
+		return
+
+	def __init__(self, obj , grid):
+		latest_version = "0.01" # must match in onDocumentRestored()
+		
+		# original attribute set before versioning of classes
+		'''
+		FreeCAD.Console.PrintMessage("\nCubicSurface_64 class Init\n")
+		obj.addProperty("App::PropertyLink","Grid","CubicSurface_64","control grid").Grid = grid
+		obj.Proxy = self
+		'''
+		self.CubicSurface_64_Attributes(obj, grid, False, latest_version)
+		obj.Proxy = self
+
+	def onDocumentRestored(self, obj):
+		# Migration function to set attributes between object versions. Preserves user data in object.
+		# print("onDocumentRestored() invoked")
+		latest_version = "0.01" # must match in __init__
+		update = False
+		if not hasattr(obj, "object_version"):
+			log.info("%s has no version attribute. Attribute format will be updated", obj.Name)
+			update = True
+		else:
+			if not obj.object_version == latest_version:
+				log.info("%s is out of date. Attribute format will be updated", obj.Name)
+				update = True
+
+		if update == True:
+			# capture, then delete attribute values in user input fields
+			# deleting is done because we may be changing the format of pre-existing attributes
+			if hasattr(obj, "Grid"): 
+				old_grid = obj.Grid
+				obj.removeProperty("Grid")
+			if hasattr(obj, "reverse"): 
+				old_reverse = obj.reverse
+				obj.removeProperty("reverse")
+			else:
+				old_reverse = False
+
+			if hasattr(obj, "object_type"):
+				obj.removeProperty("object_type")
+			if hasattr(obj, "object_version"): 
+				obj.removeProperty("object_version")
+			if hasattr(obj, "internalName"): 
+				obj.removeProperty("internalName")
+			
+			#re/create all  atributes in current version format
+			self.CubicSurface_64_Attributes(obj, old_grid, old_reverse, latest_version)
+			
+		# need to recompute otherwise the poles remain unpopulated
+		obj.recompute()
+
+	def onChanged(self, fp, prop):
+		# print("onChanged invoked")
+		if prop == "reverse":
+			fp.recompute()
+
+	def execute(self, fp):
+		'''Do something when doing a recomputation, this method is mandatory'''
+		# print("execute() invoked")
+		if 'Restore' in fp.State:
+			# print("Restore in fp.state")
+			return  # or do some special thing
+
+		Grid = ControlGrid.from_object(fp.Grid)
+		# reuse the shape if this exact grid was built before
+		key = shape_cache.key('CubicSurface_64', Grid, fp.reverse)
+		shape = shape_cache.get(key)
+		if shape is None:
+			# get the poles list from the poly. legacy shape function wants 'homogeneous' coords as [[x,y,z],w]
+			Poles = Grid.Poles
+			Weights = Grid.Weights
+			if fp.reverse == True:
+				# invert u, keep v
+				Poles, Weights = GP.permute_poles_weights(Poles, Weights, '64', 'reverse_u')
+			WeightedPoles = [[Poles[i], Weights[i]] for i in range(0, 24)]
+
+			# the legacy function below sets the degree and knot vector
+			shape = NURBS_Cubic_64_surf(WeightedPoles).toShape()
+			shape_cache.put(key, shape)
+		commit_shape(fp, shape)
+
+# 11/25/2016. update 12/09/2016.
+# There a mess to clean up in re. passing the pole/weight list to FreeCAD. 
+# The 3 legacy _surf functions used above want a list of 16 X [[x,y,z],w] as input,
+# but internally, they run two loops to break it back into 2D array form to feed into the actual BSplineSurface(). 
+# This is only because this was the first working example i found for BSplineSurface. This was fine for a long time. Not anymore.
+# To rotate grids easily, i need to rewrite all the code to stay in 2D array form at all times. 'all the code' means anything related to 
+# grid generators and nurbs surfaces.
+#
+# a BSplineSurface with u along x, v along y, looked at from the top returns the following poles list
+#
+# [[00,01,02,03],[10,11,12,13],[20,21,22,23],[30,31,32,33]]
+#
+# with the following topology (rows of the list read UP in xyz topo)
+#	v=1			1,1
+#	03 13 23 33
+#	02 12 22 32
+#	01 11 21 31
+#	00 10 20 30 
+#u,v=0,0		u=1
+#
+# So the pole list is  list of pole columns
+# But the list reads as follows in the interpreter (rows DOWN)
+#	00 10 20 30
+#	01 11 21 31
+#	02 12 22 23
+#	03 13 23 33
+#
+# numpy.Rot90(array,n) operates ccw on the DOWN version, which is cw in xyz topo.
+#
+# Unfortunately, all my grid numbering schemes so far were row>column, as in
+#
+#	30 31 32 33 
+#	20 21 22 23
+#	10 11 12 13
+#	00 01 02 03
+#
+# this will be annoying to rewrite.
+#
@@ -27,7 +27,7 @@ from popup import tipsDialog
 import tooltips
 
 # get strings
-tooltip = "work in progress" #(tooltips.ControlGrid64_Surf44_baseTip + tooltips.standardTipFooter)
+tooltip = tooltips.ControlGrid64_Surf44_toolTip #(tooltips.ControlGrid64_Surf44_baseTip + tooltips.standardTipFooter)
 moreInfo = "work in progress" #(tooltips.ControlGrid64_Surf44_baseTip + tooltips.ControlGrid64_Surf44_moreInfo)
 
 # Locate Workbench Directory
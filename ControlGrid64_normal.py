@@ -21,6 +21,7 @@ from __future__ import division # allows floating point division from integers
 import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
+import tooltips
 import ArachNURBS as AN
 from ArachNURBS import equalVectors
 
@@ -89,10 +90,8 @@ class ControlGrid64_normal():
 			FreeCAD.ActiveDocument.recompute()
 			
 	def GetResources(self):
-		tooltip = (
-			"ControlGrid64_normal")
-
-		iconpath = path_Silk_icons + '/WIP.svg'
-		return {'Pixmap' :  iconpath, 'MenuText': 'ControlGrid64_normal', 'ToolTip': tooltip}
+		return {'Pixmap' : path_Silk_icons + '/WIP.svg',
+				'MenuText': 'ControlGrid64_normal',
+				'ToolTip': tooltips.ControlGrid64_normal_toolTip}
 
 Gui.addCommand('ControlGrid64_normal', ControlGrid64_normal())
@@ -21,6 +21,7 @@ from __future__ import division # allows floating point division from integers
 import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
+import tooltips
 import ArachNURBS as AN
 
 # Locate Workbench Directory
@@ -39,6 +40,8 @@ class CubicNStarSurface_NStar66():
 		FreeCAD.ActiveDocument.recompute()
 	
 	def GetResources(self):
-		return {'Pixmap' :  path_Silk_icons + '/CubicNStarSurface_NStar66.svg', 'MenuText': 'CubicNStarSurface_NStar66', 'ToolTip': 'Creates a CubicNStar_66 from ControlGridNStar66. \n Select one ControlGridNStar66. \n    \n • Used for filling the corner of blended Silk surfaces'}
+		return {'Pixmap' : path_Silk_icons + '/CubicNStarSurface_NStar66.svg',
+				'MenuText': 'CubicNStarSurface_NStar66',
+				'ToolTip': tooltips.CubicNStarSurface_NStar66_toolTip}
 
 Gui.addCommand('CubicNStarSurface_NStar66', CubicNStarSurface_NStar66())
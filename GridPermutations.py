@@ -0,0 +1,84 @@
+#    GridPermutations
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    GridPermutations is part of Silk. It holds precomputed index tables for the
+#    reverse / rotate / transpose operations on the control grids used by ArachNURBS.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+import numpy as np
+
+## Grid layout
+## grids are stored as flat lists, row by row: index = row * nCols + col
+## u runs along a row (col index), v runs across rows (row index).
+## a 6x4 grid has 6 poles along u, so 4 rows of 6.
+
+# (nRows, nCols) per grid type
+grid_shapes = {'33': (3, 3),
+			'44': (4, 4),
+			'64': (4, 6),
+			'66': (6, 6)}
+
+# the 8 symmetries of a rectangle of poles (dihedral group), applied to the (nRows, nCols) array of a grid.
+# rotations follow np.rot90 (counterclockwise when row 0 is drawn at the top)
+operations = {'identity': lambda a: a,
+			'reverse_u': lambda a: np.flip(a, 1),			# reverse each row, keep row order
+			'reverse_v': lambda a: np.flip(a, 0),			# reverse row order, keep each row
+			'rotate_90': lambda a: np.rot90(a, 1),
+			'rotate_180': lambda a: np.rot90(a, 2),
+			'rotate_270': lambda a: np.rot90(a, 3),
+			'transpose': lambda a: np.swapaxes(a, 0, 1),
+			'antitranspose': lambda a: np.swapaxes(np.rot90(a, 2), 0, 1)}
+
+# np.rot90 style rotation count to operation name
+rotations = ['identity', 'rotate_90', 'rotate_180', 'rotate_270']
+
+def build_tables():
+	# index tables for every grid type and operation: permuted[k] = original[table[k]]
+	tables = {}
+	for grid_type, shape in grid_shapes.items():
+		index = np.arange(shape[0] * shape[1]).reshape(shape)
+		for name, operation in operations.items():
+			tables[(grid_type, name)] = np.ascontiguousarray(operation(index)).reshape(-1)
+	return tables
+
+# computed once at import. integer arrays for numpy indexing, and tuples of ints for python lists
+tables = build_tables()
+index_tuples = dict((key, tuple(table.tolist())) for key, table in tables.items())
+
+def permutation_table(grid_type, operation):
+	# the flat index table of an operation on a grid type. permuted[k] = original[table[k]]
+	return tables[(grid_type, operation)]
+
+def permuted_shape(grid_type, operation):
+	# (nRows, nCols) of the grid after the operation. quarter turns and transposes swap rows and cols
+	return operations[operation](np.empty(grid_shapes[grid_type])).shape
+
+def permute_poles_weights(poles, weights, grid_type, operation):
+	# apply an operation to the flat Poles and Weights lists of a grid, with one shared index table,
+	# so poles and weights cannot get out of step. returns [poles, weights]
+	table = index_tuples[(grid_type, operation)]
+	return [[poles[i] for i in table], [weights[i] for i in table]]
+
+def permute_flat(Pw, grid_type, operation):
+	# apply an operation to flat homogeneous poles (nPoles, 4): poles and weights in one index operation
+	return Pw[tables[(grid_type, operation)]]
+
+def permute_array(grid, operation):
+	# apply an operation to a grid array shaped (nRows, nCols, ...), e.g. homogeneous poles (nRows, nCols, 4).
+	# returns a numpy view, no data is copied
+	return operations[operation](grid)
@@ -28,70 +28,18 @@ class Silk (Workbench):
 
 	def Initialize(self):
 		"This function is executed when FreeCAD starts"
-		import ArachNURBS
-		import SilkPose
-		import ControlPoly4
-		import CubicCurve_4
-		import Point_onCurve
-		import ControlPoly4_segment
-		import ControlGrid44
-		import ControlGrid44_Rotate
-		import ControlGrid44_flow
-		import CubicSurface_44
-		import ControlGrid44_EdgeSegment
-		import ControlGrid44_2EdgeSegments
-		import ControlPoly6
-		import CubicCurve_6
-		import ControlGrid66
-		import CubicSurface_66
-		import ControlGrid64
-		import CubicSurface_64
-		import ControlGrid64_2Grid44
-		import ControlGrid64_3_1Grid44
-		import ControlGrid64_normal
-		import ControlGrid64_Surf44
-		import SubGrid33_2Grid64
-		import ControlGrid66_4Sub
-		import SubGrid63_2Surf64
-		import ControlGridNStar66
-		import CubicNStarSurface_NStar66
-		import StarTrim_CubicNStar
-		import Reload_Silk
+		import time
+		start = time.perf_counter()
+
+		# commands are registered from the SilkCommands manifest. a command module, and ArachNURBS with it,
+		# is only imported when its command is first used
+		import SilkCommands
+		self.list = SilkCommands.register()
 
-		# A list of command names created by the imports above
-		self.list = ["ControlPoly4",
-					"CubicCurve_4", 
-					"Point_onCurve", 
-					"ControlPoly4_segment",
-					"ControlGrid44",
-					"ControlGrid44_Rotate",
-					"ControlGrid44_flow",
-					"CubicSurface_44",
-					"ControlGrid44_EdgeSegment",
-					"ControlGrid44_2EdgeSegments",
-					"ControlPoly6",
-					"CubicCurve_6",
-					"ControlGrid66",
-					"CubicSurface_66",
-					"ControlGrid64",
-					"CubicSurface_64",
-					"ControlGrid64_2Grid44",
-					"ControlGrid64_3_1Grid44",
-					"ControlGrid64_normal",
-					"ControlGrid64_Surf44",
-					"SubGrid33_2Grid64",
-					"ControlGrid66_4Sub",
-					"SubGrid63_2Surf64",
-					"ControlGridNStar66",
-					"CubicNStarSurface_NStar66",
-					"StarTrim_CubicNStar",
-					"Reload_Silk",
-					"SilkPose"] 
-					
-		
 		self.appendToolbar("Silk Commands",self.list) # creates a new toolbar with your commands
 		self.appendMenu("Silk",self.list) # creates a new menu
 		#self.appendMenu(["An existing Menu","My submenu"],self.list) # appends a submenu to an existing menu
+		FreeCAD.Console.PrintLog("Silk: workbench initialized in %.1f ms\n" % ((time.perf_counter() - start) * 1000.0))
 
 	def Activated(self):
 		"This function is executed when the workbench is activated"
@@ -1,5 +1,5 @@
 from FreeCAD import Gui
-from importlib import reload
+import tooltips
 
 # Locate Workbench Directory
 import os, Silk_dummy
@@ -10,12 +10,15 @@ path_Silk_icons =  os.path.join( path_Silk, 'Resources', 'Icons')
 class Reload_Silk():
 	def Activated(self):
 		import ArachNURBS
-		reload(ArachNURBS)
+		ArachNURBS.reload_all()
+		# a profiling session keeps going on the reloaded classes
+		import SilkProfiler
+		SilkProfiler.refresh()
 
 	def GetResources(self):
 		return {'Pixmap' : path_Silk_icons + '/WIP.svg',
 				'MenuText': 'Reload_Silk',
-				'ToolTip': ' reload the Silk workbench (actually just the core library) \n without exiting FreeCAD \n if you have made code changes'}
+				'ToolTip': tooltips.Reload_Silk_toolTip}
 
 Gui.addCommand('Reload_Silk', Reload_Silk())
 
@@ -0,0 +1,112 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# command manifest of the Silk workbench.
+# the workbench registers a LazyCommand per manifest entry: name, icon and tooltip come from the manifest,
+# and the implementing module (with ArachNURBS, popup and the rest of its imports) is only imported when
+# the command is first activated. documents do not depend on this: a Silk object stores ArachNURBS as the
+# module of its Proxy, and FreeCAD imports it when the object is restored.
+#
+# register(lazy = False) imports every command module up front, the way the workbench used to.
+# benchmarks/bench_activation.py times both.
+
+import os
+import importlib
+from FreeCAD import Gui
+
+import Silk_dummy
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons =  os.path.join( path_Silk, 'Resources', 'Icons')
+
+# command name, implementing module, icon file, key in tooltips. toolbar and menu follow this order.
+# tooltips keys ending in _baseTip get the standard footer, like the commands add themselves
+manifest = [('ControlPoly4', 'ControlPoly4', 'ControlPoly4.svg', 'ControlPoly4_baseTip'),
+			('CubicCurve_4', 'CubicCurve_4', 'CubicCurve_4.svg', 'CubicCurve_4_baseTip'),
+			('Point_onCurve', 'Point_onCurve', 'Point_onCurve.svg', 'Point_onCurve_baseTip'),
+			('ControlPoly4_segment', 'ControlPoly4_segment', 'ControlPoly4_segment.svg', 'ControlPoly4_segment_baseTip'),
+			('ControlGrid44', 'ControlGrid44', 'ControlGrid44.svg', 'ControlGrid44_baseTip'),
+			('ControlGrid44_Rotate', 'ControlGrid44_Rotate', 'ControlGrid44_Rotate.svg', 'ControlGrid44_Rotate_baseTip'),
+			('ControlGrid44_flow', 'ControlGrid44_flow', 'WIP.svg', 'ControlGrid44_flow_baseTip'),
+			('CubicSurface_44', 'CubicSurface_44', 'CubicSurface_44.svg', 'CubicSurface_44_baseTip'),
+			('ControlGrid44_EdgeSegment', 'ControlGrid44_EdgeSegment', 'ControlGrid44_EdgeSegment.svg', 'ControlGrid44_EdgeSegment_baseTip'),
+			('ControlGrid44_2EdgeSegments', 'ControlGrid44_2EdgeSegments', 'ControlGrid44_2EdgeSegments.svg', 'ControlGrid44_2EdgeSegments_baseTip'),
+			('ControlPoly6', 'ControlPoly6', 'ControlPoly6.svg', 'ControlPoly6_baseTip'),
+			('CubicCurve_6', 'CubicCurve_6', 'CubicCurve_6.svg', 'CubicCurve_6_baseTip'),
+			('ControlGrid66', 'ControlGrid66', 'ControlGrid66.svg', 'ControlGrid66_baseTip'),
+			('CubicSurface_66', 'CubicSurface_66', 'CubicSurface_66.svg', 'CubicSurface_66_baseTip'),
+			('ControlGrid64', 'ControlGrid64', 'ControlGrid64.svg', 'ControlGrid64_toolTip'),
+			('CubicSurface_64', 'CubicSurface_64', 'CubicSurface_64.svg', 'CubicSurface_64_toolTip'),
+			('ControlGrid64_2Grid44', 'ControlGrid64_2Grid44', 'ControlGrid64_2Grid44.svg', 'ControlGrid64_2Grid44_toolTip'),
+			('ControlGrid64_3_1Grid44', 'ControlGrid64_3_1Grid44', 'ControlGrid64_3_1Grid44.svg', 'ControlGrid64_3_1Grid44_toolTip'),
+			('ControlGrid64_normal', 'ControlGrid64_normal', 'WIP.svg', 'ControlGrid64_normal_toolTip'),
+			('ControlGrid64_Surf44', 'ControlGrid64_Surf44', 'WIP.svg', 'ControlGrid64_Surf44_toolTip'),
+			('SubGrid33_2Grid64', 'SubGrid33_2Grid64', 'SubGrid33_2Grid64.svg', 'SubGrid33_2Grid64_toolTip'),
+			('ControlGrid66_4Sub', 'ControlGrid66_4Sub', 'ControlGrid66_4Sub.svg', 'ControlGrid66_4Sub_toolTip'),
+			('SubGrid63_2Surf64', 'SubGrid63_2Surf64', 'SubGrid63_2Surf64.svg', 'SubGrid63_2Surf64_toolTip'),
+			('ControlGridNStar66', 'ControlGridNStar66', 'ControlGridNStar66.svg', 'ControlGridNStar66_toolTip'),
+			('CubicNStarSurface_NStar66', 'CubicNStarSurface_NStar66', 'CubicNStarSurface_NStar66.svg', 'CubicNStarSurface_NStar66_toolTip'),
+			('StarTrim_CubicNStar', 'StarTrim_CubicNStar', 'StarTrim_CubicNStar.svg', 'StarTrim_CubicNStar_toolTip'),
+			('Reload_Silk', 'Reload_Silk', 'WIP.svg', 'Reload_Silk_toolTip'),
+			('Silk_Profile', 'Silk_Profile', 'WIP.svg', 'Silk_Profile_toolTip'),
+			('SilkPose', 'SilkPose', 'WIP.svg', 'SilkPose_baseTip')]
+
+loaded = {}		# command name: command object of the implementing module, once it is imported
+
+def load(name, module_name):
+	# import the implementing module and return its command object. the module registers that object with
+	# Gui.addCommand at import; the registration is held back so the LazyCommand stays the registered command.
+	# each module defines its command as a class of the same name as the command
+	if name not in loaded:
+		addCommand = Gui.addCommand
+		Gui.addCommand = lambda *args: None
+		try:
+			module = importlib.import_module(module_name)
+		finally:
+			Gui.addCommand = addCommand
+		loaded[name] = getattr(module, name)()
+	return loaded[name]
+
+class LazyCommand:
+	def __init__(self, name, module_name, icon, tip_key):
+		self.name = name
+		self.module_name = module_name
+		self.icon = icon
+		self.tip_key = tip_key
+
+	def GetResources(self):
+		import tooltips		# strings only, the cheap part of a command module
+		tip = getattr(tooltips, self.tip_key)
+		if self.tip_key.endswith('_baseTip'):
+			tip = tip + tooltips.standardTipFooter
+		return {'Pixmap' : os.path.join(path_Silk_icons, self.icon),
+				'MenuText': self.name,
+				'ToolTip': tip}
+
+	def Activated(self):
+		load(self.name, self.module_name).Activated()
+
+def register(lazy = True):
+	# register every manifest command with FreeCAD, returns the command names in toolbar order
+	for name, module_name, icon, tip_key in manifest:
+		if lazy:
+			Gui.addCommand(name, LazyCommand(name, module_name, icon, tip_key))
+		else:
+			importlib.import_module(module_name)
+	return [entry[0] for entry in manifest]
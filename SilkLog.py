@@ -0,0 +1,170 @@
+#    SilkLog
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    SilkLog is part of Silk. It is the level gated logger of ArachNURBS: one logger per subsystem,
+#    output to the FreeCAD report view, and an in memory ring buffer of recent messages for diagnostics.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+# usage, in an ArachNURBS submodule:
+#	log = SilkLog.get('grids')
+#	log.debug("seam_0 %s", seam_0)		# formatted only if the message is shown or buffered
+# from the python console:
+#	SilkLog.set_level('debug', 'blend')		# one subsystem
+#	SilkLog.set_level('warning')			# every subsystem
+#	SilkLog.set_buffer_level('debug')		# keep recent messages in memory, without showing them
+#	SilkLog.dump()
+# or for a batch run, before FreeCAD starts: SILK_LOG="warning,blend=debug,buffer=debug"
+#
+# subsystems: kernels, blend (seam and G3 blend solvers), recompute (output report), pose, curves, grids,
+# surfaces, nstar, legacy, profile (Silk_Profile report). levels: debug, info, warning, error, off.
+# a message below both the subsystem level and the buffer level costs one comparison.
+
+import os
+import time
+from collections import deque
+import FreeCAD
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+levels = {'debug': DEBUG, 'info': INFO, 'warning': WARNING, 'error': ERROR, 'off': OFF}
+level_names = dict((value, name) for name, value in levels.items())
+
+default_level = INFO	# debug messages are the per recompute diagnostics, hidden unless asked for
+buffer_level = OFF
+buffer_size = 2000
+buffer = deque(maxlen = buffer_size)	# (time, subsystem, level, message)
+subsystem_levels = {}	# levels that differ from default_level
+loggers = {}
+
+class Logger:
+	def __init__(self, subsystem, level):
+		self.subsystem = subsystem
+		self.level = level
+		self.threshold = min(level, buffer_level)
+
+	def enabled(self, level):
+		# for callers that build an expensive message
+		return level >= self.threshold
+
+	def log(self, level, message, args):
+		if level < self.threshold:
+			return
+		if len(args) > 0:
+			message = message % args
+		if level >= buffer_level:
+			buffer.append((time.time(), self.subsystem, level, message))
+		if level >= self.level:
+			text = message + "\n"
+			if level >= ERROR:
+				FreeCAD.Console.PrintError(text)
+			elif level >= WARNING:
+				FreeCAD.Console.PrintWarning(text)
+			elif level >= INFO:
+				FreeCAD.Console.PrintMessage(text)
+			else:
+				FreeCAD.Console.PrintLog(text)
+
+	def debug(self, message, *args):
+		if DEBUG >= self.threshold:
+			self.log(DEBUG, message, args)
+
+	def info(self, message, *args):
+		if INFO >= self.threshold:
+			self.log(INFO, message, args)
+
+	def warning(self, message, *args):
+		if WARNING >= self.threshold:
+			self.log(WARNING, message, args)
+
+	def error(self, message, *args):
+		if ERROR >= self.threshold:
+			self.log(ERROR, message, args)
+
+def level_value(level):
+	if isinstance(level, str):
+		return levels[level.lower()]
+	return level
+
+def get(subsystem):
+	# the logger of a subsystem. the same object is returned on every call, so a reloaded module keeps its level
+	if subsystem not in loggers:
+		loggers[subsystem] = Logger(subsystem, subsystem_levels.get(subsystem, default_level))
+	return loggers[subsystem]
+
+def set_level(level, subsystem = None):
+	# level of one subsystem, or of every subsystem when subsystem is None
+	global default_level
+	level = level_value(level)
+	if subsystem is None:
+		default_level = level
+		subsystem_levels.clear()
+		for logger in loggers.values():
+			logger.level = level
+			logger.threshold = min(level, buffer_level)
+	else:
+		subsystem_levels[subsystem] = level
+		logger = get(subsystem)
+		logger.level = level
+		logger.threshold = min(level, buffer_level)
+
+def set_buffer_level(level, size = None):
+	# messages at or above this level are kept in the ring buffer, shown or not. 'off' stops buffering
+	global buffer_level, buffer
+	buffer_level = level_value(level)
+	if size is not None and size != buffer.maxlen:
+		buffer = deque(buffer, maxlen = size)
+	for logger in loggers.values():
+		logger.threshold = min(logger.level, buffer_level)
+
+def records(subsystem = None, level = DEBUG):
+	# buffered messages, oldest first
+	level = level_value(level)
+	return [r for r in buffer if r[2] >= level and (subsystem is None or r[1] == subsystem)]
+
+def dump(subsystem = None, level = DEBUG, path = None):
+	# buffered messages as text, written to path if given
+	lines = []
+	for t, name, value, message in records(subsystem, level):
+		lines.append("%s.%03d %-9s %-7s %s" % (time.strftime("%H:%M:%S", time.localtime(t)), int((t % 1.0) * 1000), name, level_names[value], message))
+	text = "\n".join(lines) + "\n"
+	if path is not None:
+		with open(path, 'w') as f:
+			f.write(text)
+	return text
+
+def clear():
+	buffer.clear()
+
+def configure(spec):
+	# levels from a string such as "warning,blend=debug,grids=info". a bare level applies to every subsystem
+	for item in spec.split(','):
+		item = item.strip()
+		if item == '':
+			continue
+		if '=' in item:
+			subsystem, level = item.split('=', 1)
+			if subsystem.strip() == 'buffer':
+				set_buffer_level(level.strip())
+			else:
+				set_level(level.strip(), subsystem.strip())
+		else:
+			set_level(item)
+
+configure(os.environ.get('SILK_LOG', ''))
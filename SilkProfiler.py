@@ -0,0 +1,344 @@
+#    SilkProfiler
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    SilkProfiler is part of Silk. It is an opt-in instrumentation layer for the feature classes of
+#    ArachNURBS: wall time, call count, and OCC call counts of every Proxy execute, per object and per class,
+#    and a Chrome trace (trace event JSON) recorder of the executes and the expensive kernels they call.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+# usage, from the python console (or the Silk_Profile command):
+#	import SilkProfiler
+#	SilkProfiler.enable()
+#	App.ActiveDocument.recompute()
+#	print(SilkProfiler.table('class'))
+#	SilkProfiler.write_csv('/tmp/silk_profile.csv')
+#	SilkProfiler.disable()
+#
+# enable() replaces the execute method of every ArachNURBS feature class by a timed wrapper, so
+# existing objects are profiled too. disable() puts the original methods back.
+# while an execute runs, a sys.setprofile hook counts the calls to the OCC methods in occ_calls made
+# from python, or to the methods of the same name in the standin modules. the C level work inside
+# one call is not split. the hook slows the execute down, so compare times with the profiler on
+# to each other, not to unprofiled runs.
+#
+# trace, viewable in chrome://tracing or https://ui.perfetto.dev:
+#	SilkProfiler.trace_recompute(App.ActiveDocument, '/tmp/silk_trace.json', touch_all = True)
+# or start_trace(), any recomputes, then stop_trace(path). spans come from each feature execute, with
+# sub-spans for the kernels in trace_kernels and the OCC calls in occ_calls. document recomputes are
+# spans too, and every recomputed object (sketches included) leaves an instant event in the order
+# FreeCAD recomputed it.
+
+import sys
+import time
+import csv
+import json
+import FreeCAD
+import ArachNURBS as AN
+
+occ_calls = ['segment', 'insertKnot', 'parameter', 'setPole', 'toShape']
+
+# ArachNURBS kernel functions traced as sub-spans, by trace category
+trace_kernels = {'blendG3_poly_2x4_1x6': 'G3 solve',
+				'G3_newton_solve': 'G3 solve',
+				'knot_insertion_operator': 'knot insertion',
+				'insert_knot_homogeneous': 'knot insertion',
+				'upgrade_4_to_6': 'knot insertion',
+				'upgrade_44_to_66': 'knot insertion',
+				'split_66_quadrants': 'knot insertion',
+				'Cubic_curve': 'surface build',
+				'Cubic_surf': 'surface build',
+				'Cubic_surf_homogeneous': 'surface build',
+				'nstar_grid': 'star build',
+				'drawGrid': 'legs',
+				'nstar_legs': 'legs'}
+
+enabled = False		# profiling
+tracing = False
+records = {}	# (document name, object name): ExecuteRecord
+stack = []		# records of the executes currently running, innermost last
+previous_profile = None
+events = []		# trace events
+occ_open = []	# [name, start] of the OCC calls currently running, for their trace spans
+
+class ExecuteRecord:
+	# totals of one object. time is inclusive of any nested execute
+	def __init__(self, document, name, label, class_name):
+		self.document = document
+		self.name = name
+		self.label = label
+		self.class_name = class_name
+		self.calls = 0
+		self.seconds = 0.0
+		self.occ = dict((call, 0) for call in occ_calls)
+
+def record_for(fp, class_name):
+	key = (fp.Document.Name, fp.Name)
+	record = records.get(key)
+	if record is None:
+		record = ExecuteRecord(fp.Document.Name, fp.Name, fp.Label, class_name)
+		records[key] = record
+	return record
+
+def count_occ(frame, event, arg):
+	# sys.setprofile hook, attributes OCC calls to the innermost execute. c_call events carry the called
+	# builtin (the real Part module). call events are python functions (the standin Part module)
+	if event == 'c_call':
+		name = getattr(arg, '__name__', None)
+	elif event == 'call':
+		name = frame.f_code.co_name
+	elif tracing and len(occ_open) > 0:
+		# close the span of an OCC call
+		if event in ('c_return', 'c_exception'):
+			name = getattr(arg, '__name__', None)
+		elif event == 'return':
+			name = frame.f_code.co_name
+		else:
+			return
+		if name == occ_open[-1][0]:
+			start = occ_open.pop()[1]
+			add_span(name, 'OCC', start, time.perf_counter())
+		return
+	else:
+		return
+	if tracing and name in occ_calls:
+		occ_open.append([name, time.perf_counter()])
+	if len(stack) > 0:
+		occ = stack[-1].occ
+		if name in occ:
+			occ[name] = occ[name] + 1
+
+def add_span(name, category, start, end, args = None):
+	# complete ('X') trace event, times in microseconds
+	event = {'name': name, 'cat': category, 'ph': 'X', 'pid': 1, 'tid': 1,
+			'ts': start * 1.0e6, 'dur': (end - start) * 1.0e6}
+	if args is not None:
+		event['args'] = args
+	events.append(event)
+
+def add_instant(name, category, args = None):
+	event = {'name': name, 'cat': category, 'ph': 'i', 's': 't', 'pid': 1, 'tid': 1, 'ts': time.perf_counter() * 1.0e6}
+	if args is not None:
+		event['args'] = args
+	events.append(event)
+
+def profiled(execute):
+	# timed wrapper around a Proxy execute, used by both the profiler and the trace
+	def execute_profiled(self, fp):
+		global previous_profile
+		record = record_for(fp, type(self).__name__)
+		stack.append(record)
+		if len(stack) == 1:
+			previous_profile = sys.getprofile()
+			sys.setprofile(count_occ)
+		start = time.perf_counter()
+		try:
+			return execute(self, fp)
+		finally:
+			end = time.perf_counter()
+			if enabled:
+				record.seconds = record.seconds + end - start
+				record.calls = record.calls + 1
+			if tracing:
+				add_span(fp.Label, 'execute', start, end, {'object': fp.Name, 'class': record.class_name})
+			stack.pop()
+			if len(stack) == 0:
+				sys.setprofile(previous_profile)
+	execute_profiled.original = execute
+	return execute_profiled
+
+def traced(function, category):
+	# trace span wrapper around an ArachNURBS kernel function
+	def function_traced(*args, **kwargs):
+		if not tracing:
+			return function(*args, **kwargs)
+		start = time.perf_counter()
+		try:
+			return function(*args, **kwargs)
+		finally:
+			add_span(function.__name__, category, start, time.perf_counter())
+	function_traced.original = function
+	function_traced.__name__ = function.__name__
+	return function_traced
+
+def feature_classes():
+	# the ArachNURBS feature classes with their own execute method. loads every ArachNURBS submodule
+	classes = []
+	for module in AN.load_all():
+		classes = classes + [c for c in vars(module).values() if isinstance(c, type) and c.__module__ == AN.__name__ and 'execute' in c.__dict__]
+	return classes
+
+def wrap():
+	# wrap every feature class execute, and the traced kernels. safe to call again, e.g. after reloading ArachNURBS.
+	# setting an ArachNURBS attribute rebinds the kernel in every loaded submodule that calls it
+	for c in feature_classes():
+		if not hasattr(c.__dict__['execute'], 'original'):
+			c.execute = profiled(c.__dict__['execute'])
+	for name, category in trace_kernels.items():
+		function = getattr(AN, name, None)
+		if function is not None and not hasattr(function, 'original'):
+			setattr(AN, name, traced(function, category))
+
+def unwrap():
+	for c in feature_classes():
+		execute = c.__dict__['execute']
+		if hasattr(execute, 'original'):
+			c.execute = execute.original
+	for name in trace_kernels:
+		function = getattr(AN, name, None)
+		if hasattr(function, 'original'):
+			setattr(AN, name, function.original)
+
+def enable():
+	global enabled
+	wrap()
+	enabled = True
+
+def disable():
+	global enabled
+	enabled = False
+	if not tracing:
+		unwrap()
+
+def refresh():
+	# re-apply the wrappers to the classes and kernels of a reloaded ArachNURBS
+	if enabled or tracing:
+		wrap()
+
+def reset():
+	records.clear()
+
+def rows(by = 'class'):
+	# report rows, slowest first. by = 'class' sums the objects of each class, by = 'object' has one row per object.
+	# each row is a dict: name, label, class, calls, seconds, mean, and one count per OCC call
+	totals = {}
+	for record in records.values():
+		if record.calls == 0:
+			continue	# only traced, not profiled
+		if by == 'class':
+			key = record.class_name
+			name = record.class_name
+			label = ''
+		else:
+			key = (record.document, record.name)
+			name = record.document + '#' + record.name
+			label = record.label
+		row = totals.get(key)
+		if row is None:
+			row = {'name': name, 'label': label, 'class': record.class_name, 'calls': 0, 'seconds': 0.0}
+			for call in occ_calls:
+				row[call] = 0
+			totals[key] = row
+		row['calls'] = row['calls'] + record.calls
+		row['seconds'] = row['seconds'] + record.seconds
+		for call in occ_calls:
+			row[call] = row[call] + record.occ[call]
+	result = sorted(totals.values(), key = lambda row: -row['seconds'])
+	for row in result:
+		row['mean'] = row['seconds'] / max(row['calls'], 1)
+	return result
+
+def table(by = 'class'):
+	# the report rows as aligned text
+	lines = ["%-44s %7s %11s %10s" % (by, 'calls', 'total ms', 'mean ms') + ''.join(' %10s' % call for call in occ_calls)]
+	for row in rows(by):
+		name = row['name']
+		if row['label'] != '' and row['label'] != name.split('#')[-1]:
+			name = name + ' (' + row['label'] + ')'
+		lines.append("%-44s %7d %11.2f %10.3f" % (name[0:44], row['calls'], row['seconds'] * 1.0e3, row['mean'] * 1.0e3)
+					+ ''.join(' %10d' % row[call] for call in occ_calls))
+	return '\n'.join(lines)
+
+def write_csv(path):
+	# both report levels in one file, told apart by the 'level' column
+	columns = ['level', 'name', 'label', 'class', 'calls', 'seconds', 'mean'] + occ_calls
+	with open(path, 'w', newline = '') as f:
+		writer = csv.DictWriter(f, fieldnames = columns)
+		writer.writeheader()
+		for by in ['class', 'object']:
+			for row in rows(by):
+				row['level'] = by
+				writer.writerow(row)
+
+class TraceObserver:
+	# FreeCAD document observer: document recompute spans, and an instant event per recomputed object
+	def __init__(self):
+		self.starts = {}
+
+	def slotBeforeRecomputeDocument(self, doc):
+		self.starts[doc.Name] = time.perf_counter()
+
+	def slotRecomputedDocument(self, doc):
+		start = self.starts.pop(doc.Name, None)
+		if tracing and start is not None:
+			add_span('recompute ' + doc.Name, 'document', start, time.perf_counter())
+
+	def slotRecomputedObject(self, obj):
+		if tracing:
+			add_instant(obj.Label, 'recomputed', {'object': obj.Name, 'type': obj.TypeId})
+
+trace_observer = TraceObserver()
+
+def start_trace():
+	global tracing
+	del events[:]
+	del occ_open[:]
+	wrap()
+	FreeCAD.addDocumentObserver(trace_observer)
+	tracing = True
+
+def stop_trace(path = None):
+	# stop recording. writes the trace to path if given, returns the trace document
+	global tracing
+	tracing = False
+	FreeCAD.removeDocumentObserver(trace_observer)
+	if not enabled:
+		unwrap()
+	trace = trace_document()
+	if path is not None:
+		write_trace(path, trace)
+	return trace
+
+def trace_document():
+	# trace event JSON object. timestamps are shifted to start at 0
+	origin = min([event['ts'] for event in events] or [0.0])
+	trace_events = [{'name': 'process_name', 'ph': 'M', 'pid': 1, 'tid': 1, 'args': {'name': 'FreeCAD'}},
+					{'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': 1, 'args': {'name': 'Silk recompute'}}]
+	for event in events:
+		event = dict(event)
+		event['ts'] = round(event['ts'] - origin, 3)
+		if 'dur' in event:
+			event['dur'] = round(event['dur'], 3)
+		trace_events.append(event)
+	return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+def write_trace(path, trace = None):
+	if trace is None:
+		trace = trace_document()
+	with open(path, 'w') as f:
+		json.dump(trace, f)
+
+def trace_recompute(doc, path, touch_all = False):
+	# trace one recompute of doc. touch_all = True recomputes every object, not only the touched ones
+	start_trace()
+	try:
+		if touch_all:
+			for obj in doc.Objects:
+				obj.touch()
+		doc.recompute()
+	finally:
+		trace = stop_trace(path)
+	return trace
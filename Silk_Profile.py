@@ -0,0 +1,91 @@
+from FreeCAD import Gui
+import tooltips
+from PySide import QtCore, QtGui
+import SilkProfiler
+import SilkLog
+from popup import tipsDialog
+
+# Locate Workbench Directory
+import os, Silk_dummy
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons =  os.path.join( path_Silk, 'Resources', 'Icons')
+
+log = SilkLog.get('profile')
+
+
+class ProfileDialog(QtGui.QDialog):
+	# sortable per class / per object tables of the SilkProfiler records, with CSV export
+	def __init__(self):
+		super(ProfileDialog, self).__init__(Gui.getMainWindow())
+		self.setWindowTitle('Silk: execute profile')
+		self.resize(900, 500)
+		layout = QtGui.QVBoxLayout(self)
+		self.tabs = QtGui.QTabWidget()
+		self.tables = {}
+		for by in ['class', 'object']:
+			table = QtGui.QTableWidget()
+			table.setEditTriggers(QtGui.QAbstractItemView.NoEditTriggers)
+			self.tables[by] = table
+			self.tabs.addTab(table, 'per ' + by)
+		layout.addWidget(self.tabs)
+		buttons = QtGui.QHBoxLayout()
+		for text, slot in [['Export CSV', self.export], ['Reset', self.reset], ['Stop profiling', self.stop], ['Close', self.close]]:
+			button = QtGui.QPushButton(text)
+			button.clicked.connect(slot)
+			buttons.addWidget(button)
+		layout.addLayout(buttons)
+		self.fill()
+
+	def fill(self):
+		columns = ['name', 'label', 'class', 'calls', 'seconds', 'mean'] + SilkProfiler.occ_calls
+		headers = ['name', 'label', 'class', 'calls', 'total ms', 'mean ms'] + SilkProfiler.occ_calls
+		for by, table in self.tables.items():
+			rows = SilkProfiler.rows(by)
+			table.setSortingEnabled(False)
+			table.clear()
+			table.setColumnCount(len(columns))
+			table.setHorizontalHeaderLabels(headers)
+			table.setRowCount(len(rows))
+			for r in range(0, len(rows)):
+				for c in range(0, len(columns)):
+					value = rows[r][columns[c]]
+					item = QtGui.QTableWidgetItem()
+					if columns[c] in ['seconds', 'mean']:
+						value = round(value * 1.0e3, 3)
+					# numbers as data, so the columns sort numerically
+					item.setData(QtCore.Qt.DisplayRole, value)
+					table.setItem(r, c, item)
+			table.setSortingEnabled(True)
+			table.sortItems(4, QtCore.Qt.DescendingOrder)
+			table.resizeColumnsToContents()
+
+	def export(self):
+		path = QtGui.QFileDialog.getSaveFileName(self, 'Export Silk profile', 'silk_profile.csv', 'CSV (*.csv)')[0]
+		if path:
+			SilkProfiler.write_csv(path)
+
+	def reset(self):
+		SilkProfiler.reset()
+		self.fill()
+
+	def stop(self):
+		SilkProfiler.disable()
+		self.close()
+
+
+class Silk_Profile():
+	def Activated(self):
+		if not SilkProfiler.enabled:
+			SilkProfiler.enable()
+			tipsDialog("Silk: Profile", "execute profiling is on. \n\nrecompute, then run Silk_Profile again to see the times per class and per object. \nthe report window can export CSV and stop profiling.")
+			return
+		# the per class table also goes to the report view, where it stays after the dialog is closed
+		log.info("Silk execute profile:\n%s", SilkProfiler.table('class'))
+		ProfileDialog().exec_()
+
+	def GetResources(self):
+		return {'Pixmap' : path_Silk_icons + '/WIP.svg',
+				'MenuText': 'Silk_Profile',
+				'ToolTip': tooltips.Silk_Profile_toolTip}
+
+Gui.addCommand('Silk_Profile', Silk_Profile())
@@ -21,6 +21,7 @@ from __future__ import division # allows floating point division from integers
 import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
+import tooltips
 import ArachNURBS as AN
 
 # Locate Workbench Directory
@@ -39,8 +40,8 @@ class StarTrim_CubicNStar():
 		FreeCAD.ActiveDocument.recompute()
 
 	def GetResources(self):
-		return {'Pixmap' :  path_Silk_icons + '/StarTrim_CubicNStar.svg', 
-	  			'MenuText': 'StarTrim_CubicNStar', 
-				'ToolTip': 'Create a StarTrim_CubicNStar object from a CubicNStarSurface_NStar66 object. \n Select one CubicNStarSurface_NStar66. \n \n • Useful for eliminating pinch in poor corner geometry, and can be patched with \n   a standard Filling Surface'}
+		return {'Pixmap' : path_Silk_icons + '/StarTrim_CubicNStar.svg',
+				'MenuText': 'StarTrim_CubicNStar',
+				'ToolTip': tooltips.StarTrim_CubicNStar_toolTip}
 
 Gui.addCommand('StarTrim_CubicNStar', StarTrim_CubicNStar())
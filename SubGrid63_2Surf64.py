@@ -20,6 +20,7 @@
 import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
+import tooltips
 import ArachNURBS as AN
 
 # Locate Workbench Directory
@@ -43,6 +44,8 @@ class SubGrid63_2Surf64():
 		FreeCAD.ActiveDocument.recompute()
 
 	def GetResources(self):
-		return {'Pixmap' :  path_Silk_icons + '/SubGrid63_2Surf64.svg', 'MenuText': 'SubGrid63_2Surf64', 'ToolTip': 'Create a SubGrid63 subgrid from two CubicSurface64 surfaces. \n Select two CubicSurface64 objects that share a corner. \n \n • Input for ControlGridNStar66 to blend three or more \n   blended edges meeting at a corner '}
+		return {'Pixmap' : path_Silk_icons + '/SubGrid63_2Surf64.svg',
+				'MenuText': 'SubGrid63_2Surf64',
+				'ToolTip': tooltips.SubGrid63_2Surf64_toolTip}
 
 Gui.addCommand('SubGrid63_2Surf64', SubGrid63_2Surf64())
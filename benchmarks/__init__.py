@@ -0,0 +1,27 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Silk benchmarks.
+#	bench_construction	legacy versus factory construction of the curve and surface types (FreeCAD only)
+#	bench_kernels		ArachNURBS hot paths and feature class executes, with a JSON baseline and a compare mode
+#	bench_documents		full recompute of the demo documents, timings per object type and output checksums (FreeCADCmd)
+#	bench_activation	workbench activation time, command modules imported up front versus the SilkCommands manifest
+#	bench_nstar			NStar pipeline for N = 3..8: star grid kernel, surface builds and StarTrim quadrant split, serial and threaded
+#	inputs				seeded random, valid inputs shared by the benchmarks
@@ -0,0 +1,111 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# workbench activation benchmark: command registration with every command module imported up front (eager,
+# the workbench before the SilkCommands manifest) against registration from the manifest (lazy), and the
+# deferred cost the lazy mode pays when the first command is used.
+# every sample runs in a fresh process, so no module is already imported.
+#
+# from the Silk folder:
+#	FreeCADCmd -c "import benchmarks.bench_activation as ba; ba.main()"
+#	FreeCADCmd -c "import benchmarks.bench_activation as ba; ba.main(['--repeat', '9', '--executable', '/usr/bin/FreeCADCmd'])"
+#
+# the child processes are started with the executable given (default sys.executable) and '-c', which
+# both FreeCADCmd and a python with the FreeCAD lib folder on its path accept.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+silk_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+modes = ['eager', 'lazy', 'lazy_first_use']
+first_command = 'ControlPoly4'
+
+child = '''
+import sys, time, json
+sys.path.insert(0, %(path)r)
+import FreeCAD
+import FreeCADGui
+if not FreeCAD.GuiUp:
+	FreeCADGui.setupWithoutGUI()
+modules = len(sys.modules)
+start = time.perf_counter()
+import SilkCommands
+SilkCommands.register(lazy = %(lazy)r)
+registered = time.perf_counter()
+if %(first_use)r:
+	SilkCommands.load(%(command)r, %(command)r)
+end = time.perf_counter()
+sys.stdout.write('\\nSILK_RESULT ' + json.dumps({'register': registered - start, 'total': end - start,
+												'modules': len(sys.modules) - modules,
+												'ArachNURBS': 'ArachNURBS' in sys.modules}) + '\\n')
+'''
+
+def sample(executable, mode):
+	# one measurement in a fresh process
+	code = child % {'path': silk_path, 'lazy': mode != 'eager', 'first_use': mode == 'lazy_first_use', 'command': first_command}
+	output = subprocess.run([executable, '-c', code], stdout = subprocess.PIPE, stderr = subprocess.STDOUT,
+							universal_newlines = True, cwd = silk_path).stdout
+	for line in output.splitlines():
+		if line.startswith('SILK_RESULT '):
+			return json.loads(line[len('SILK_RESULT '):])
+	raise RuntimeError('no result from the child process:\n' + output)
+
+def run(executable, repeat):
+	results = {}
+	for mode in modes:
+		samples = [sample(executable, mode) for i in range(0, repeat)]
+		results[mode] = {'seconds': statistics.median([s['total'] for s in samples]),
+						'best': min([s['total'] for s in samples]),
+						'modules': samples[0]['modules'],
+						'ArachNURBS': samples[0]['ArachNURBS']}
+	return results
+
+def report(results):
+	print ('%-16s %10s %10s %9s %11s' % ('mode', 'median ms', 'best ms', 'modules', 'ArachNURBS'))
+	for mode in modes:
+		r = results[mode]
+		print ('%-16s %10.1f %10.1f %9d %11s' % (mode, r['seconds'] * 1000.0, r['best'] * 1000.0, r['modules'], r['ArachNURBS']))
+	eager = results['eager']['seconds']
+	lazy = results['lazy']['seconds']
+	if lazy > 0.0:
+		print ('activation: %.1f ms eager, %.1f ms lazy (%.1fx)' % (eager * 1000.0, lazy * 1000.0, eager / lazy))
+
+def main(argv = None):
+	parser = argparse.ArgumentParser(description = 'Silk workbench activation benchmark')
+	parser.add_argument('--executable', default = sys.executable, help = 'FreeCADCmd, or a python that can import FreeCAD')
+	parser.add_argument('--repeat', type = int, default = 5, help = 'fresh processes per mode')
+	parser.add_argument('--save', help = 'write the results to this JSON file')
+	args = parser.parse_args(argv)
+
+	results = run(args.executable, args.repeat)
+	report(results)
+	if args.save:
+		with open(args.save, 'w') as f:
+			json.dump(results, f, indent = 1, sort_keys = True)
+		print ("results written to " + args.save)
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
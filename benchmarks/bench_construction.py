@@ -0,0 +1,118 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# microbenchmark: per object construction time of the Silk curve and surface types,
+# legacy step by step construction (increaseDegree, insertKnot loops, setPole) versus
+# the single call factory in ArachNURBS (buildFromPolesMultsKnots).
+#
+# run from the FreeCAD python console, with the Silk folder on the path:
+#	import benchmarks.bench_construction as bc; bc.run()
+
+import time
+import random
+import Part
+from FreeCAD import Base
+import ArachNURBS as AN
+
+knots_Bezier = [0,0,0,0,1,1,1,1]
+knots_6P = [0,0,0,0,1.0/3.0,2.0/3.0,1,1,1,1]
+
+def legacy_curve(poles, knot):
+	# the construction used by Bezier_Cubic_curve and NURBS_Cubic_6P_curve before the factory
+	bs=Part.BSplineCurve()
+	bs.increaseDegree(3)
+	for i in range(0,len(knot)):
+		bs.insertKnot(knot[i],1,0.0000001)
+	for ii in range(0,len(poles)):
+		bs.setPole(ii+1,poles[ii][0],poles[ii][1])
+	return bs
+
+def legacy_surf(grid, knot_u, knot_v, nNodes_u, nNodes_v):
+	# the construction used by Bezier_Bicubic_surf, NURBS_Cubic_66_surf and NURBS_Cubic_64_surf before the factory
+	surf=Part.BSplineSurface()
+	surf.increaseDegree(3,3)
+	for i in range(0,len(knot_u)):
+		surf.insertUKnot(knot_u[i],1,0.0000001)
+	for i in range(0,len(knot_v)):
+		surf.insertVKnot(knot_v[i],1,0.0000001)
+	i=0
+	for jj in range(0,nNodes_v):
+		for ii in range(0,nNodes_u):
+			surf.setPole(ii+1,jj+1,grid[i][0],grid[i][1])
+			i=i+1
+	return surf
+
+def random_grid(nPoles_u, nPoles_v):
+	# a gently curved random grid with rational weights, u varying fastest
+	grid = []
+	for jj in range(0, nPoles_v):
+		for ii in range(0, nPoles_u):
+			pole = Base.Vector(ii, jj, random.uniform(-0.5, 0.5))
+			grid.append([pole, random.uniform(0.8, 1.2)])
+	return grid
+
+def time_per_call(function, args, repeat):
+	# best of 3 runs, seconds per call
+	best = None
+	for run in range(0, 3):
+		start = time.perf_counter()
+		for i in range(0, repeat):
+			function(*args)
+		elapsed = (time.perf_counter() - start) / repeat
+		if best == None or elapsed < best:
+			best = elapsed
+	return best
+
+def cases():
+	# [name, legacy function, legacy args, factory function, factory args]
+	curve_4 = random_grid(4, 1)
+	curve_6 = random_grid(6, 1)
+	grid_44 = random_grid(4, 4)
+	grid_64 = random_grid(6, 4)
+	grid_66 = random_grid(6, 6)
+	return [['Bezier_Cubic_curve', legacy_curve, [curve_4, knots_Bezier], AN.Bezier_Cubic_curve, [curve_4]],
+			['NURBS_Cubic_6P_curve', legacy_curve, [curve_6, knots_6P], AN.NURBS_Cubic_6P_curve, [curve_6]],
+			['Bezier_Bicubic_surf', legacy_surf, [grid_44, knots_Bezier, knots_Bezier, 4, 4], AN.Bezier_Bicubic_surf, [grid_44]],
+			['NURBS_Cubic_64_surf', legacy_surf, [grid_64, knots_6P, knots_Bezier, 6, 4], AN.NURBS_Cubic_64_surf, [grid_64]],
+			['NURBS_Cubic_66_surf', legacy_surf, [grid_66, knots_6P, knots_6P, 6, 6], AN.NURBS_Cubic_66_surf, [grid_66]]]
+
+def check(legacy, factory):
+	# both constructions must give the same geometry
+	for u in [0.0, 0.1, 0.5, 0.77, 1.0]:
+		if hasattr(legacy, 'NbUPoles'):
+			for v in [0.0, 0.3, 0.9]:
+				if (legacy.value(u, v) - factory.value(u, v)).Length > 1.0e-9:
+					return False
+		elif (legacy.value(u) - factory.value(u)).Length > 1.0e-9:
+			return False
+	return True
+
+def run(repeat = 2000):
+	print ("%-22s %12s %12s %8s %6s" % ("type", "legacy (us)", "factory (us)", "speedup", "same"))
+	results = []
+	for name, legacy, legacy_args, factory, factory_args in cases():
+		t_legacy = time_per_call(legacy, legacy_args, repeat)
+		t_factory = time_per_call(factory, factory_args, repeat)
+		same = check(legacy(*legacy_args), factory(*factory_args))
+		print ("%-22s %12.2f %12.2f %8.1f %6s" % (name, t_legacy * 1.0e6, t_factory * 1.0e6, t_legacy / t_factory, same))
+		results.append([name, t_legacy, t_factory, same])
+	return results
+
+if __name__ == '__main__':
+	run()
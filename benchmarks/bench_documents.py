@@ -0,0 +1,215 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# end to end benchmark: full recompute of the demo documents, under FreeCADCmd.
+# reports wall time per object type and per document, and a geometric checksum of every output
+# (Poles, Weights, StarGrid, and points sampled on the Shape), so a speedup can be checked for identical results.
+#
+# from the Silk folder:
+#	FreeCADCmd -c "import benchmarks.bench_documents as bd; bd.main(['--save', 'benchmarks/documents.json'])"
+#	FreeCADCmd -c "import benchmarks.bench_documents as bd; bd.main(['--compare', 'benchmarks/documents.json'])"
+#
+# compare exits with status 1 on any checksum mismatch, or on a document total slower than the baseline
+# by more than the threshold.
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+
+silk_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if silk_path not in sys.path:
+	sys.path.append(silk_path)
+
+import numpy as np
+import FreeCAD
+import ArachNURBS as AN
+
+demo_files = ['Silk_Demo_01.FCStd', 'Silk_Demo_02.FCStd', 'Silk_Demo_03.FCStd', 'CadDivision_19.FCStd']
+demo_path = os.path.join(silk_path, 'Resources', 'Demo_files')
+checksum_decimals = 9	# outputs are rounded before hashing, so the checksum ignores floating point noise
+samples = 5				# sample points per parameter direction on each edge and face
+
+def object_type(obj):
+	# the Silk class name for feature python objects, the FreeCAD type otherwise
+	proxy = getattr(obj, 'Proxy', None)
+	if proxy is not None and not isinstance(proxy, str):
+		return type(proxy).__name__
+	return obj.TypeId
+
+def digest(values):
+	values = np.round(np.asarray(values, dtype = float), checksum_decimals) + 0.0	# + 0.0 folds -0.0 into 0.0
+	return hashlib.sha1(values.tobytes()).hexdigest()[0:16]
+
+def shape_points(shape):
+	# points sampled on every edge and face of a shape
+	points = []
+	for edge in shape.Edges:
+		first, last = edge.ParameterRange
+		for t in np.linspace(first, last, samples):
+			p = edge.valueAt(t)
+			points.append([p.x, p.y, p.z])
+	for face in shape.Faces:
+		u0, u1, v0, v1 = face.ParameterRange
+		for u in np.linspace(u0, u1, samples):
+			for v in np.linspace(v0, v1, samples):
+				p = face.valueAt(u, v)
+				points.append([p.x, p.y, p.z])
+	for vertex in shape.Vertexes:
+		points.append([vertex.X, vertex.Y, vertex.Z])
+	return points
+
+def star_grid_values(star_grid):
+	# flatten the nested StarGrid list ([x,y,z] or Vector poles, and weights) to numbers
+	values = []
+	def walk(item):
+		if isinstance(item, (int, float)):
+			values.append(item)
+		elif hasattr(item, 'x'):
+			values.extend([item.x, item.y, item.z])
+		else:
+			for sub in item:
+				walk(sub)
+	walk(star_grid)
+	return values
+
+def checksums(obj):
+	# {output name: checksum} for the outputs of an object
+	result = {}
+	if hasattr(obj, 'Poles'):
+		result['Poles'] = digest([[p.x, p.y, p.z] for p in obj.Poles])
+	if hasattr(obj, 'Weights'):
+		result['Weights'] = digest(obj.Weights)
+	if hasattr(obj, 'StarGrid') and obj.StarGrid is not None:
+		result['StarGrid'] = digest(star_grid_values(obj.StarGrid))
+	if hasattr(obj, 'Shape') and not obj.Shape.isNull():
+		result['Shape'] = digest(shape_points(obj.Shape))
+	return result
+
+def run_document(path):
+	# open, force a full recompute, then recompute each object on its own in dependency order.
+	# returns the timings and checksums of the document
+	doc = FreeCAD.openDocument(path)
+	AN.shape_cache.clear()
+	try:
+		with contextlib.redirect_stdout(io.StringIO()):
+			# full recompute, everything touched
+			for obj in doc.Objects:
+				obj.touch()
+			start = time.perf_counter()
+			doc.recompute()
+			total = time.perf_counter() - start
+
+			# per object, dependencies first
+			per_type = {}
+			for obj in doc.TopologicalSortedObjects:
+				obj.touch()
+				start = time.perf_counter()
+				obj.recompute()
+				elapsed = time.perf_counter() - start
+				entry = per_type.setdefault(object_type(obj), [0, 0.0])
+				entry[0] = entry[0] + 1
+				entry[1] = entry[1] + elapsed
+
+		invalid = [obj.Name for obj in doc.Objects if 'Invalid' in obj.State or 'Error' in obj.State]
+		objects = {}
+		for obj in doc.Objects:
+			objects[obj.Name] = {'type': object_type(obj), 'checksums': checksums(obj)}
+	finally:
+		FreeCAD.closeDocument(doc.Name)
+	return {'total': total,
+			'per_type': dict((name, {'count': entry[0], 'seconds': entry[1]}) for name, entry in per_type.items()),
+			'invalid': invalid,
+			'objects': objects,
+			'shape_cache': AN.shape_cache.stats()}
+
+def run(files):
+	results = {}
+	for name in files:
+		path = os.path.join(demo_path, name)
+		if not os.path.exists(path):
+			print ("missing demo file: " + path)
+			continue
+		result = run_document(path)
+		results[name] = result
+		print ("%s: full recompute %.3f s, %d objects" % (name, result['total'], len(result['objects'])))
+		for type_name in sorted(result['per_type'], key = lambda t: -result['per_type'][t]['seconds']):
+			entry = result['per_type'][type_name]
+			print ("	%-36s %4d  %10.2f ms" % (type_name, entry['count'], entry['seconds'] * 1.0e3))
+		if len(result['invalid']) > 0:
+			print ("	invalid after recompute: " + ', '.join(result['invalid']))
+	return {'meta': {'freecad': '.'.join(FreeCAD.Version()[0:3]),
+					'date': time.strftime('%Y-%m-%d %H:%M:%S')},
+			'documents': results}
+
+def compare(baseline, current, threshold):
+	# returns [checksum mismatches, slow documents]
+	mismatches = []
+	slow = []
+	for name, result in current['documents'].items():
+		if name not in baseline['documents']:
+			print ("%s: not in baseline" % name)
+			continue
+		base = baseline['documents'][name]
+		ratio = result['total'] / base['total']
+		flag = ''
+		if ratio > 1.0 + threshold:
+			flag = '  REGRESSION'
+			slow.append(name)
+		print ("%s: %.3f s -> %.3f s (%.2fx)%s" % (name, base['total'], result['total'], ratio, flag))
+		for obj_name, obj in result['objects'].items():
+			base_obj = base['objects'].get(obj_name)
+			if base_obj is None:
+				continue
+			for output, checksum in obj['checksums'].items():
+				if base_obj['checksums'].get(output) != checksum:
+					mismatches.append("%s %s.%s" % (name, obj_name, output))
+	for mismatch in mismatches:
+		print ("checksum changed: " + mismatch)
+	return [mismatches, slow]
+
+def main(argv = None):
+	parser = argparse.ArgumentParser(description = 'Silk demo document recompute benchmark')
+	parser.add_argument('--save', help = 'write timings and checksums to this JSON file')
+	parser.add_argument('--compare', help = 'compare timings and checksums with this JSON file')
+	parser.add_argument('--threshold', type = float, default = 0.10, help = 'flag documents slower than the baseline by more than this fraction')
+	parser.add_argument('files', nargs = '*', default = demo_files, help = 'documents in Resources/Demo_files')
+	args = parser.parse_args(argv)
+
+	current = run(args.files)
+	status = 0
+	if args.compare:
+		with open(args.compare) as f:
+			baseline = json.load(f)
+		mismatches, slow = compare(baseline, current, args.threshold)
+		if len(mismatches) > 0 or len(slow) > 0:
+			status = 1
+	if args.save:
+		with open(args.save, 'w') as f:
+			json.dump(current, f, indent = 1, sort_keys = True)
+		print ("results written to " + args.save)
+	return status
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,210 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# benchmark of the ArachNURBS hot paths, with a stored JSON baseline and a compare mode.
+# kernels run on seeded random inputs (see inputs.py). under FreeCAD, the execute of every Silk
+# feature class found in the demo files is timed as well.
+#
+# plain CPython, on the standin modules when FreeCAD is not available:
+#	python -m benchmarks.bench_kernels --save benchmarks/baseline.json
+#	python -m benchmarks.bench_kernels --compare benchmarks/baseline.json --threshold 0.15
+# FreeCADCmd, from the Silk folder:
+#	FreeCADCmd -c "import benchmarks.bench_kernels as bk; bk.main(['--save', 'benchmarks/baseline.json'])"
+#
+# compare exits with status 1 if any case is slower than the baseline by more than the threshold.
+# baselines are only comparable on the same machine, with the same seed.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import types
+
+silk_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if silk_path not in sys.path:
+	sys.path.append(silk_path)
+
+import standin
+standin.install()
+
+import numpy as np
+import FreeCAD
+import Part
+import ArachNURBS as AN
+from benchmarks import inputs
+
+demo_files = ['Silk_Demo_01.FCStd', 'Silk_Demo_02.FCStd', 'Silk_Demo_03.FCStd', 'CadDivision_19.FCStd']
+demo_path = os.path.join(silk_path, 'Resources', 'Demo_files')
+
+def measure(function, args, min_time = 0.05, rounds = 5):
+	# seconds per call: the call count is doubled until one round takes min_time, then the best
+	# and the median of the rounds are kept. kernel prints are discarded while timing
+	with contextlib.redirect_stdout(io.StringIO()):
+		calls = 1
+		while True:
+			start = time.perf_counter()
+			for i in range(0, calls):
+				function(*args)
+			elapsed = time.perf_counter() - start
+			if elapsed >= min_time or calls >= 1 << 20:
+				break
+			calls = calls * 2
+		times = [elapsed / calls]
+		for r in range(1, rounds):
+			start = time.perf_counter()
+			for i in range(0, calls):
+				function(*args)
+			times.append((time.perf_counter() - start) / calls)
+	return {'best': min(times), 'median': float(np.median(times)), 'calls': calls}
+
+def border_segment(rng):
+	# a 4X4 surface, and a curve matching a segment of its v = 0 border edge.
+	# stand-ins for the linked objects of paramsSurface44BorderSegmentCurve
+	grid = inputs.grid(rng, 4, 4)
+	face = AN.Bezier_Bicubic_surf(grid).toShape()
+	curve = AN.Bezier_Cubic_curve(grid[0:4])
+	curve.segment(0.2, 0.7)
+	AN_Surface = types.SimpleNamespace(Shape = face,
+									Grid = types.SimpleNamespace(Poles = [p[0] for p in grid], Weights = [p[1] for p in grid]))
+	AN_Curve = types.SimpleNamespace(Shape = curve.toShape())
+	return [AN_Surface, AN_Curve]
+
+def kernel_cases(seed):
+	# [name, function, args, needs the real FreeCAD]
+	rng = inputs.make_rng(seed)
+	lines = inputs.line_set(rng, 5)
+	polys = inputs.shared_end_polys(rng, 6)
+	pair = inputs.blend_pair(rng)
+	bezier = inputs.weighted_poles(*inputs.wavy_poly(rng, 4, 0.0, 3.0))
+	grid_66 = inputs.grid(rng, 6, 6)
+	cases = [['polyFromLineSet', AN.polyFromLineSet, [lines, AN.default_tol], False],
+			['orient_a_to_b', AN.orient_a_to_b, [polys[0], polys[1], AN.default_tol], False],
+			['blend_poly_2x4_1x6', AN.blend_poly_2x4_1x6, pair + [1.0, 1.0, 1.0, 1.0], False],
+			['blendG3_poly_2x4_1x6', AN.blendG3_poly_2x4_1x6, pair + [1.0, 1.0, 1.0, 1.0], False],
+			['Cubic_Bezier_dCds', AN.Cubic_Bezier_dCds, bezier, False],
+			['NURBS_Cubic_66_surf', AN.NURBS_Cubic_66_surf, [grid_66], False]]
+	for N in [3, 6, 8]:
+		star = AN.star_array(inputs.star_subgrids(rng, N))
+		cases.append(['nstar_grid N=%d' % N, AN.nstar_grid, [star, True], False])
+	if not standin.is_installed():
+		# surface.parameter() and the Face / Edge accessors need OCC
+		cases.append(['paramsSurface44BorderSegmentCurve', AN.paramsSurface44BorderSegmentCurve, border_segment(rng) + [AN.default_tol, .000001], True])
+	return cases
+
+def execute_cases(paths):
+	# one case per Silk feature class found in the documents: the execute of its first instance.
+	# the documents are recomputed once first, so the timed executes see settled inputs
+	cases = []
+	seen = set()
+	for path in paths:
+		if not os.path.exists(path):
+			print ("missing demo file: " + path)
+			continue
+		doc = FreeCAD.openDocument(path)
+		with contextlib.redirect_stdout(io.StringIO()):
+			doc.recompute()
+		for obj in doc.Objects:
+			proxy = getattr(obj, 'Proxy', None)
+			if proxy is None or not hasattr(proxy, 'execute'):
+				continue
+			name = 'execute ' + type(proxy).__name__
+			if name in seen:
+				continue
+			seen.add(name)
+			cases.append([name, proxy.execute, [obj], True])
+	return cases
+
+def run(seed = 0, execute = True):
+	# returns the results document written to / compared with the baseline
+	cases = kernel_cases(seed)
+	if execute and not standin.is_installed():
+		cases = cases + execute_cases([os.path.join(demo_path, f) for f in demo_files])
+	results = {}
+	for name, function, args, needs_freecad in cases:
+		results[name] = measure(function, args)
+		print ("%-40s %12.2f us" % (name, results[name]['best'] * 1.0e6))
+	if standin.is_installed():
+		backend = 'standin'
+	else:
+		backend = 'FreeCAD ' + '.'.join(FreeCAD.Version()[0:3])
+	return {'meta': {'seed': seed,
+					'backend': backend,
+					'python': platform.python_version(),
+					'numpy': np.__version__,
+					'machine': platform.machine(),
+					'node': platform.node(),
+					'date': time.strftime('%Y-%m-%d %H:%M:%S')},
+			'results': results}
+
+def compare(baseline, current, threshold):
+	# ratio of current to baseline best time, per case. returns the names of the regressions
+	regressions = []
+	if baseline['meta'].get('backend') != current['meta'].get('backend'):
+		print ("warning: baseline backend '%s', current backend '%s'" % (baseline['meta'].get('backend'), current['meta'].get('backend')))
+	print ("%-40s %12s %12s %8s" % ("case", "base (us)", "now (us)", "ratio"))
+	for name in sorted(current['results']):
+		if name not in baseline['results']:
+			print ("%-40s %12s %12.2f %8s" % (name, '-', current['results'][name]['best'] * 1.0e6, 'new'))
+			continue
+		base = baseline['results'][name]['best']
+		now = current['results'][name]['best']
+		ratio = now / base
+		flag = ''
+		if ratio > 1.0 + threshold:
+			flag = '  REGRESSION'
+			regressions.append(name)
+		print ("%-40s %12.2f %12.2f %8.2f%s" % (name, base * 1.0e6, now * 1.0e6, ratio, flag))
+	for name in sorted(baseline['results']):
+		if name not in current['results']:
+			print ("%-40s %12.2f %12s %8s" % (name, baseline['results'][name]['best'] * 1.0e6, '-', 'missing'))
+	return regressions
+
+def main(argv = None):
+	parser = argparse.ArgumentParser(description = 'ArachNURBS hot path benchmark')
+	parser.add_argument('--save', help = 'write the results to this JSON baseline file')
+	parser.add_argument('--compare', help = 'compare the results with this JSON baseline file')
+	parser.add_argument('--threshold', type = float, default = 0.10, help = 'flag cases slower than the baseline by more than this fraction')
+	parser.add_argument('--seed', type = int, default = 0)
+	parser.add_argument('--no-execute', action = 'store_true', help = 'skip the feature class executes')
+	args = parser.parse_args(argv)
+
+	current = run(args.seed, not args.no_execute)
+	status = 0
+	if args.compare:
+		with open(args.compare) as f:
+			baseline = json.load(f)
+		if baseline['meta'].get('seed') != args.seed:
+			print ("warning: baseline seed %s, current seed %s" % (baseline['meta'].get('seed'), args.seed))
+		regressions = compare(baseline, current, args.threshold)
+		if len(regressions) > 0:
+			print ("%d regression(s) above %d%%: %s" % (len(regressions), round(args.threshold * 100), ', '.join(regressions)))
+			status = 1
+	if args.save:
+		with open(args.save, 'w') as f:
+			json.dump(current, f, indent = 1, sort_keys = True)
+		print ("baseline written to " + args.save)
+	return status
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,122 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# NStar pipeline benchmark for N = 3..8: the star grid kernel, the N surfaces of CubicNStarSurface_NStar66,
+# and the quadrant split of StarTrim_CubicNStar, serial and in a thread pool.
+# 'quadrants segment' is the StarTrim route before the batched split: four copies and segment() calls per
+# surface. it needs OCC, so it only runs under FreeCAD.
+#
+# plain CPython, on the standin modules when FreeCAD is not available:
+#	python -m benchmarks.bench_nstar --threads 4 --save nstar.json
+# FreeCADCmd, from the Silk folder:
+#	FreeCADCmd -c "import benchmarks.bench_nstar as bn; bn.main(['--threads', '4'])"
+
+import argparse
+import json
+import sys
+
+from benchmarks.bench_kernels import measure, standin
+import numpy as np
+from FreeCAD import Base
+import ArachNURBS as AN
+from benchmarks import inputs
+
+star_sizes = [3, 4, 5, 6, 7, 8]
+
+def quadrants_segment(NSurf):
+	# the StarTrim_CubicNStar route before the batched split. each read of the NSurf property is a copy
+	N = len(NSurf)
+	quadrants = []
+	for u0, u1, v0, v1 in [[0.0, 0.5, 0.0, 0.5], [0.5, 1.0, 0.0, 0.5], [0.0, 0.5, 0.5, 1.0], [0.5, 1.0, 0.5, 1.0]]:
+		for i in range(N):
+			surf = NSurf[i].copy()
+			surf.segment(u0, u1, v0, v1)
+			if u0 == 0.5 and v0 == 0.5:
+				surf.insertUKnots([5.0/6.0],[1],0.000001)
+				surf.insertVKnots([5.0/6.0],[1],0.000001)
+			quadrants.append(surf)
+	return quadrants
+
+def quadrants_batched(NSurf, threads):
+	# the StarTrim_CubicNStar route: one read, one batched split, one build per quadrant
+	N = len(NSurf)
+	Pw = np.array([AN.homogeneous_poles(surf.getPoles(), surf.getWeights()) for surf in NSurf])
+	main, lead, lag, center = AN.split_66_quadrants(Pw)
+	half_0 = AN.split_knots_mults[0]
+	half_1 = AN.split_knots_mults[1]
+	center_6P = AN.split_knots_mults['6P']
+	quadrants = ([[main[i], half_0, half_0] for i in range(N)] +
+				[[lead[i], half_1, half_0] for i in range(N)] +
+				[[lag[i], half_0, half_1] for i in range(N)] +
+				[[center[i], center_6P, center_6P] for i in range(N)])
+	return AN.build_surfaces(AN.Cubic_surf_homogeneous, quadrants, threads)
+
+def star_cases(rng, N, threads):
+	# [name, function, args] for one star size
+	SubGrids = inputs.star_subgrids(rng, N)
+	G = AN.nstar_grid(AN.star_array(SubGrids), True)
+	grids = [[[Base.Vector(p[0], p[1], p[2]), p[3]] for p in SubGrid] for SubGrid in G.tolist()]
+	NSurf = [AN.NURBS_Cubic_66_surf(grid) for grid in grids]
+	cases = [['star grid', AN.nstar_grid, [G, True]],
+			['surfaces serial', AN.build_surfaces, [AN.NURBS_Cubic_66_surf, [[grid] for grid in grids], 0]],
+			['surfaces threads', AN.build_surfaces, [AN.NURBS_Cubic_66_surf, [[grid] for grid in grids], threads]],
+			['quadrants batched', quadrants_batched, [NSurf, 0]],
+			['quadrants threads', quadrants_batched, [NSurf, threads]]]
+	if not standin.is_installed():
+		cases.append(['quadrants segment', quadrants_segment, [NSurf]])
+	return cases
+
+def run(seed = 0, threads = 4):
+	# {N: {case: seconds per call}}
+	rng = inputs.make_rng(seed)
+	results = {}
+	for N in star_sizes:
+		results[N] = {}
+		for name, function, args in star_cases(rng, N, threads):
+			results[N][name] = measure(function, args, min_time = 0.02, rounds = 3)['best']
+	return results
+
+def report(results):
+	names = []
+	for N in star_sizes:
+		for name in results[N]:
+			if name not in names:
+				names.append(name)
+	print ('%-4s' % 'N' + ''.join(['%19s' % name for name in names]) + '   (ms)')
+	for N in star_sizes:
+		print ('%-4d' % N + ''.join(['%19.3f' % (results[N][name] * 1000.0) if name in results[N] else '%19s' % '-' for name in names]))
+
+def main(argv = None):
+	parser = argparse.ArgumentParser(description = 'Silk NStar pipeline benchmark')
+	parser.add_argument('--threads', type = int, default = 4, help = 'worker threads of the threaded cases')
+	parser.add_argument('--seed', type = int, default = 0)
+	parser.add_argument('--save', help = 'write the results to this JSON file')
+	args = parser.parse_args(argv)
+
+	results = run(args.seed, args.threads)
+	report(results)
+	if args.save:
+		with open(args.save, 'w') as f:
+			json.dump({'threads': args.threads, 'seed': args.seed, 'results': results}, f, indent = 1, sort_keys = True)
+		print ("results written to " + args.save)
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,104 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# seeded random, but valid, inputs for the ArachNURBS benchmarks.
+# every generator takes a random.Random, so a seed reproduces the same inputs on every run.
+# import after standin.install() when running without FreeCAD.
+
+import math
+import random
+from FreeCAD import Base
+
+def make_rng(seed):
+	return random.Random(seed)
+
+def wavy_poly(rng, nPoles, x0, x1):
+	# poles spread along x from x0 to x1, random y and z offsets, rational weights.
+	# returns [poles, weights]
+	poles = []
+	weights = []
+	for i in range(0, nPoles):
+		x = x0 + (x1 - x0) * i / (nPoles - 1)
+		poles.append(Base.Vector(x, rng.uniform(0.2, 1.0) * (1 + i % 2), rng.uniform(-0.3, 0.3)))
+		weights.append(rng.uniform(0.8, 1.2))
+	return [poles, weights]
+
+def weighted_poles(poles, weights):
+	# [[pole, weight],...] as used by the legacy shape functions and the dCds helpers
+	return [[poles[i], weights[i]] for i in range(0, len(poles))]
+
+def line_set(rng, nLines):
+	# the lines of a sketched control polygon: connected end to end in space, but listed in random
+	# order and direction, as they come out of a sketch. input of polyFromLineSet
+	poles = wavy_poly(rng, nLines + 1, 0.0, 3.0 * nLines)[0]
+	lines = []
+	for i in range(0, nLines):
+		if rng.random() < 0.5:
+			lines.append([poles[i], poles[i + 1]])
+		else:
+			lines.append([poles[i + 1], poles[i]])
+	rng.shuffle(lines)
+	return lines
+
+def shared_end_polys(rng, nPoles):
+	# two polys that share one endpoint, each in a random direction. input of orient_a_to_b
+	poles_a = wavy_poly(rng, nPoles, -3.0, 0.0)[0]
+	poles_b = wavy_poly(rng, nPoles, 0.0, 3.0)[0]
+	poles_b[0] = poles_a[-1]
+	if rng.random() < 0.5:
+		poles_a = poles_a[::-1]
+	if rng.random() < 0.5:
+		poles_b = poles_b[::-1]
+	return [poles_a, poles_b]
+
+def blend_pair(rng):
+	# two cubic bezier rows with a gap between them, the first flowing into the second.
+	# input of blend_poly_2x4_1x6 and blendG3_poly_2x4_1x6, without the scales
+	poles_0, weights_0 = wavy_poly(rng, 4, 0.0, 3.0)
+	poles_1, weights_1 = wavy_poly(rng, 4, 5.0, 8.0)
+	return [poles_0, weights_0, poles_1, weights_1]
+
+def grid(rng, nPoles_u, nPoles_v):
+	# a gently curved grid with rational weights, flat [[pole, weight],...] with u varying fastest
+	grid = []
+	for jj in range(0, nPoles_v):
+		for ii in range(0, nPoles_u):
+			pole = Base.Vector(ii, jj, rng.uniform(-0.5, 0.5))
+			grid.append([pole, rng.uniform(0.8, 1.2)])
+	return grid
+
+def star_subgrids(rng, N):
+	# N 6x6 SubGrids around a star center at the origin (pole 35), SubGrid n spanning the sector between the
+	# directions n / N and (n + 1) / N of a turn, with random heights and rational weights. the u = 5 column
+	# of SubGrid n runs along the same direction as the v = 5 row of SubGrid n + 1.
+	# [[Poles, Weights],...] as in the SubList of ControlGridNStar66_NSub
+	SubGrids = []
+	for n in range(0, N):
+		a = [math.cos(2.0 * math.pi * n / N), math.sin(2.0 * math.pi * n / N)]
+		b = [math.cos(2.0 * math.pi * (n + 1) / N), math.sin(2.0 * math.pi * (n + 1) / N)]
+		Poles = []
+		Weights = []
+		for i in range(0, 36):
+			s = 0.6 * (5 - i // 6)
+			t = 0.6 * (5 - i % 6)
+			Poles.append(Base.Vector(s * b[0] + t * a[0], s * b[1] + t * a[1], rng.uniform(-0.2, 0.2)))
+			Weights.append(rng.uniform(0.8, 1.2))
+		SubGrids.append([Poles, Weights])
+	return SubGrids
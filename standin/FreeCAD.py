@@ -0,0 +1,209 @@
+#    standin FreeCAD
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    Pure python stand-in for the parts of the FreeCAD module used by the ArachNURBS kernels.
+#    Vector is backed by a NumPy array, and follows the FreeCAD semantics the kernels rely on:
+#    vector * vector is the dot product, multiply() and normalize() work in place and return self.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+import sys
+import types
+import numpy as np
+
+standin = True	# marks this module as the stand-in, see standin.is_installed()
+GuiUp = False
+
+class Vector:
+	__slots__ = ('v',)
+
+	def __init__(self, x = 0.0, y = 0.0, z = 0.0):
+		if isinstance(x, Vector):
+			self.v = x.v.copy()
+		elif isinstance(x, (list, tuple, np.ndarray)):
+			self.v = np.array(x[0:3], dtype = float)
+		else:
+			self.v = np.array([x, y, z], dtype = float)
+
+	@classmethod
+	def from_array(cls, a):
+		# wrap a length 3 array without copying it
+		vector = cls.__new__(cls)
+		vector.v = a
+		return vector
+
+	x = property(lambda self: float(self.v[0]), lambda self, value: self.v.__setitem__(0, value))
+	y = property(lambda self: float(self.v[1]), lambda self, value: self.v.__setitem__(1, value))
+	z = property(lambda self: float(self.v[2]), lambda self, value: self.v.__setitem__(2, value))
+
+	@property
+	def Length(self):
+		return float(np.sqrt(np.dot(self.v, self.v)))
+
+	def __getitem__(self, i):
+		return float(self.v[i])
+
+	def __setitem__(self, i, value):
+		self.v[i] = value
+
+	def __len__(self):
+		return 3
+
+	def __iter__(self):
+		return iter(self.v.tolist())
+
+	def __add__(self, other):
+		return Vector.from_array(self.v + other.v)
+
+	def __sub__(self, other):
+		return Vector.from_array(self.v - other.v)
+
+	def __neg__(self):
+		return Vector.from_array(-self.v)
+
+	def __mul__(self, other):
+		# FreeCAD: vector * vector is the dot product, vector * number scales
+		if isinstance(other, Vector):
+			return float(np.dot(self.v, other.v))
+		return Vector.from_array(self.v * other)
+
+	__rmul__ = __mul__
+
+	def __truediv__(self, other):
+		return Vector.from_array(self.v / other)
+
+	def __eq__(self, other):
+		return isinstance(other, Vector) and bool(np.array_equal(self.v, other.v))
+
+	def __ne__(self, other):
+		return not self.__eq__(other)
+
+	__hash__ = None
+
+	def __repr__(self):
+		return 'Vector (%s, %s, %s)' % (repr(self.x), repr(self.y), repr(self.z))
+
+	def add(self, other):
+		return self + other
+
+	def sub(self, other):
+		return self - other
+
+	def negative(self):
+		return -self
+
+	def dot(self, other):
+		return float(np.dot(self.v, other.v))
+
+	def cross(self, other):
+		return Vector.from_array(np.cross(self.v, other.v))
+
+	def multiply(self, factor):
+		# in place, like FreeCAD
+		self.v *= factor
+		return self
+
+	def scale(self, x, y, z):
+		# in place, like FreeCAD
+		self.v *= [x, y, z]
+		return self
+
+	def normalize(self):
+		# in place, like FreeCAD. a null vector can not be normalized
+		length = self.Length
+		if length == 0.0:
+			raise ValueError('Cannot normalize null vector')
+		self.v /= length
+		return self
+
+	def isEqual(self, other, tol):
+		return (self - other).Length <= tol
+
+	def distanceToPoint(self, other):
+		return (self - other).Length
+
+	def getAngle(self, other):
+		cos = self.dot(other) / (self.Length * other.Length)
+		return float(np.arccos(min(1.0, max(-1.0, cos))))
+
+	def projectToPlane(self, base, normal):
+		# in place, like FreeCAD
+		n = normal.v / np.sqrt(np.dot(normal.v, normal.v))
+		self.v -= np.dot(self.v - base.v, n) * n
+		return self
+
+class Matrix:
+	# 4x4 affine transform, only what the kernels need
+	def __init__(self, *args):
+		self.A = np.identity(4)
+		if len(args) == 16:
+			self.A = np.array(args, dtype = float).reshape(4, 4)
+
+	def multiply(self, other):
+		if isinstance(other, Vector):
+			return Vector.from_array(self.A[0:3, 0:3].dot(other.v) + self.A[0:3, 3])
+		result = Matrix()
+		result.A = self.A.dot(other.A)
+		return result
+
+	def move(self, vector):
+		self.A[0:3, 3] += vector.v
+
+class Placement:
+	# translation only, enough for the identity placements of headless objects
+	def __init__(self, Base = None, Rotation = None):
+		self.Base = Base if Base is not None else Vector()
+		self.Rotation = Rotation
+
+	def toMatrix(self):
+		matrix = Matrix()
+		matrix.move(self.Base)
+		return matrix
+
+	def multVec(self, vector):
+		return vector + self.Base
+
+Base = types.SimpleNamespace(Vector = Vector, Matrix = Matrix, Placement = Placement)
+
+class Console:
+	@staticmethod
+	def PrintMessage(text):
+		sys.stdout.write(str(text))
+
+	@staticmethod
+	def PrintLog(text):
+		pass
+
+	@staticmethod
+	def PrintWarning(text):
+		sys.stderr.write(str(text))
+
+	@staticmethod
+	def PrintError(text):
+		sys.stderr.write(str(text))
+
+# document observers are kept, but there are no documents to recompute
+observers = []
+
+def addDocumentObserver(observer):
+	observers.append(observer)
+
+def removeDocumentObserver(observer):
+	if observer in observers:
+		observers.remove(observer)
+
+ActiveDocument = None
@@ -0,0 +1,348 @@
+#    standin Part
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    Pure python stand-in for the parts of the Part module used by the ArachNURBS kernels.
+#    BSplineCurve and BSplineSurface are non periodic rational B splines stored as homogeneous
+#    poles [w*x, w*y, w*z, w] in NumPy arrays, with a full (flat) knot vector per direction.
+#    Shapes only carry their geometry, there is no topology or display.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+import numpy as np
+from FreeCAD import Vector
+
+## B spline kernels, on homogeneous poles Pw with the spline direction along axis 0.
+## trailing axes are carried along, so the same kernels serve curves (n, 4) and surfaces (nu, nv, 4)
+
+def flat_knots(knots, mults):
+	# unique knots and multiplicities to the full knot vector
+	return np.repeat(np.array(knots, dtype = float), mults)
+
+def unique_knots(flat, tol = 1.0e-12):
+	# full knot vector to [knots, mults]
+	knots = []
+	mults = []
+	for u in flat:
+		if len(knots) > 0 and abs(u - knots[-1]) <= tol:
+			mults[-1] = mults[-1] + 1
+		else:
+			knots.append(float(u))
+			mults.append(1)
+	return [knots, mults]
+
+def find_span(flat, degree, u):
+	# index k of the knot span with flat[k] <= u < flat[k+1], clamped to the last non empty span
+	nPoles = len(flat) - degree - 1
+	if u >= flat[nPoles]:
+		return nPoles - 1
+	if u <= flat[degree]:
+		return degree
+	return int(np.searchsorted(flat, u, side = 'right')) - 1
+
+def basis(flat, degree, u):
+	# the degree + 1 non zero basis functions at u (The NURBS Book, A2.2). returns [span, N]
+	k = find_span(flat, degree, u)
+	N = np.zeros(degree + 1)
+	left = np.zeros(degree + 1)
+	right = np.zeros(degree + 1)
+	N[0] = 1.0
+	for j in range(1, degree + 1):
+		left[j] = u - flat[k + 1 - j]
+		right[j] = flat[k + j] - u
+		saved = 0.0
+		for r in range(0, j):
+			temp = N[r] / (right[r + 1] + left[j - r])
+			N[r] = saved + right[r + 1] * temp
+			saved = left[j - r] * temp
+		N[j] = saved
+	return [k, N]
+
+def evaluate(Pw, flat, degree, u):
+	# homogeneous point at u
+	k, N = basis(flat, degree, u)
+	return np.tensordot(N, Pw[k - degree:k + 1], axes = 1)
+
+def insert_knot(Pw, flat, degree, u):
+	# single knot insertion (Boehm). returns [Pw, flat]
+	k = find_span(flat, degree, u)
+	nPoles = Pw.shape[0]
+	Qw = np.empty((nPoles + 1,) + Pw.shape[1:])
+	Qw[:k - degree + 1] = Pw[:k - degree + 1]
+	Qw[k + 1:] = Pw[k:]
+	for i in range(k - degree + 1, k + 1):
+		alpha = (u - flat[i]) / (flat[i + degree] - flat[i])
+		Qw[i] = alpha * Pw[i] + (1.0 - alpha) * Pw[i - 1]
+	return [Qw, np.insert(flat, k + 1, u)]
+
+def greville(flat, degree):
+	# knot averages, one per pole. distinct for a valid knot vector, good collocation sites
+	nPoles = len(flat) - degree - 1
+	return [float(np.mean(flat[i + 1:i + degree + 1])) for i in range(0, nPoles)]
+
+def elevate_degree(Pw, flat, degree, new_degree):
+	# degree elevation by collocation: the elevated space contains the curve, so solving at the
+	# greville sites of the elevated knot vector is exact. returns [Pw, flat]
+	knots, mults = unique_knots(flat)
+	raise_by = new_degree - degree
+	new_flat = flat_knots(knots, [m + raise_by for m in mults])
+	sites = greville(new_flat, new_degree)
+	nPoles = len(sites)
+	A = np.zeros((nPoles, nPoles))
+	for r in range(0, nPoles):
+		k, N = basis(new_flat, new_degree, sites[r])
+		A[r, k - new_degree:k + 1] = N
+	B = np.array([evaluate(Pw, flat, degree, u) for u in sites])
+	shape = B.shape
+	Qw = np.linalg.solve(A, B.reshape(nPoles, -1)).reshape(shape)
+	return [Qw, new_flat]
+
+def to_homogeneous(poles, weights):
+	P = np.array([[p[0], p[1], p[2]] for p in poles], dtype = float)
+	w = np.array(weights, dtype = float)
+	return np.concatenate([P * w[:, None], w[:, None]], axis = 1)
+
+def to_vector(pw):
+	return Vector(pw[0] / pw[3], pw[1] / pw[3], pw[2] / pw[3])
+
+class BSplineCurve:
+	# default is the FreeCAD default: degree 1, from (0,0,0) to (1,0,0)
+	def __init__(self):
+		self.Degree = 1
+		self.Pw = np.array([[0.0, 0.0, 0.0, 1.0], [1.0, 0.0, 0.0, 1.0]])
+		self.flat = np.array([0.0, 0.0, 1.0, 1.0])
+
+	def buildFromPolesMultsKnots(self, poles, mults, knots, periodic = False, degree = 3, weights = None, CheckRational = False):
+		if periodic:
+			raise NotImplementedError('periodic splines are not covered by the standin')
+		if weights is None:
+			weights = [1.0] * len(poles)
+		self.Degree = degree
+		self.Pw = to_homogeneous(poles, weights)
+		self.flat = flat_knots(knots, mults)
+		return self
+
+	NbPoles = property(lambda self: self.Pw.shape[0])
+	FirstParameter = property(lambda self: float(self.flat[0]))
+	LastParameter = property(lambda self: float(self.flat[-1]))
+
+	def getPoles(self):
+		return [to_vector(pw) for pw in self.Pw]
+
+	def getWeights(self):
+		return self.Pw[:, 3].tolist()
+
+	def getPole(self, i):
+		return to_vector(self.Pw[i - 1])
+
+	def getWeight(self, i):
+		return float(self.Pw[i - 1, 3])
+
+	def getKnots(self):
+		return unique_knots(self.flat)[0]
+
+	def getMultiplicities(self):
+		return unique_knots(self.flat)[1]
+
+	def setPole(self, i, pole, weight = None):
+		# 1 based, like FreeCAD. keeps the current weight if none is given
+		if weight is None:
+			weight = self.Pw[i - 1, 3]
+		self.Pw[i - 1] = [pole[0] * weight, pole[1] * weight, pole[2] * weight, weight]
+
+	def setWeight(self, i, weight):
+		self.Pw[i - 1] = self.Pw[i - 1] * (weight / self.Pw[i - 1, 3])
+
+	def isRational(self):
+		return not np.allclose(self.Pw[:, 3], self.Pw[0, 3])
+
+	def increaseDegree(self, degree):
+		if degree > self.Degree:
+			self.Pw, self.flat = elevate_degree(self.Pw, self.flat, self.Degree, degree)
+			self.Degree = degree
+
+	def insertKnot(self, u, mult = 1, tol = 0.0):
+		# an existing knot within tol gets its multiplicity raised, up to the degree
+		knots, mults = unique_knots(self.flat)
+		for i in range(0, len(knots)):
+			if abs(knots[i] - u) <= tol:
+				if i == 0 or i == len(knots) - 1:
+					return
+				u = knots[i]
+				mult = min(mult, self.Degree - mults[i])
+		for i in range(0, mult):
+			self.Pw, self.flat = insert_knot(self.Pw, self.flat, self.Degree, u)
+
+	def value(self, u):
+		return to_vector(evaluate(self.Pw, self.flat, self.Degree, u))
+
+	def segment(self, u0, u1):
+		# in place, like FreeCAD: keep [u0, u1], parameters unchanged
+		p = self.Degree
+		for u in [u0, u1]:
+			count = int(np.sum(np.abs(self.flat - u) <= 1.0e-12))
+			for i in range(count, p):
+				self.Pw, self.flat = insert_knot(self.Pw, self.flat, p, u)
+		# the curve passes through pole a - p at u0, and through pole b - 1 at u1
+		a = int(np.nonzero(np.abs(self.flat - u0) <= 1.0e-12)[0][-1])
+		b = int(np.nonzero(np.abs(self.flat - u1) <= 1.0e-12)[0][0])
+		self.Pw = self.Pw[a - p:b].copy()
+		flat = self.flat[a - p:b + p + 1].copy()
+		flat[:p + 1] = u0
+		flat[-(p + 1):] = u1
+		self.flat = flat
+
+	def reverse(self):
+		self.Pw = self.Pw[::-1].copy()
+		self.flat = (self.flat[0] + self.flat[-1]) - self.flat[::-1]
+
+	def copy(self):
+		curve = BSplineCurve()
+		curve.Degree = self.Degree
+		curve.Pw = self.Pw.copy()
+		curve.flat = self.flat.copy()
+		return curve
+
+	def toShape(self):
+		return Shape([self])
+
+class BSplineSurface:
+	# default is the FreeCAD default: degree 1 in u and v, the unit square in the xy plane
+	def __init__(self):
+		self.UDegree = 1
+		self.VDegree = 1
+		self.Pw = np.array([[[0.0, 0.0, 0.0, 1.0], [0.0, 1.0, 0.0, 1.0]],
+							[[1.0, 0.0, 0.0, 1.0], [1.0, 1.0, 0.0, 1.0]]])
+		self.flat_u = np.array([0.0, 0.0, 1.0, 1.0])
+		self.flat_v = np.array([0.0, 0.0, 1.0, 1.0])
+
+	def buildFromPolesMultsKnots(self, poles, umults, vmults, uknots, vknots, uperiodic = False, vperiodic = False, udegree = 3, vdegree = 3, weights = None):
+		# poles and weights are indexed [u][v], like getPoles()
+		if uperiodic or vperiodic:
+			raise NotImplementedError('periodic splines are not covered by the standin')
+		if weights is None:
+			weights = [[1.0] * len(row) for row in poles]
+		self.UDegree = udegree
+		self.VDegree = vdegree
+		self.Pw = np.array([to_homogeneous(poles[i], weights[i]) for i in range(0, len(poles))])
+		self.flat_u = flat_knots(uknots, umults)
+		self.flat_v = flat_knots(vknots, vmults)
+		return self
+
+	NbUPoles = property(lambda self: self.Pw.shape[0])
+	NbVPoles = property(lambda self: self.Pw.shape[1])
+
+	def bounds(self):
+		return (float(self.flat_u[0]), float(self.flat_u[-1]), float(self.flat_v[0]), float(self.flat_v[-1]))
+
+	def getPoles(self):
+		return [[to_vector(pw) for pw in row] for row in self.Pw]
+
+	def getWeights(self):
+		return self.Pw[:, :, 3].tolist()
+
+	def getPole(self, i, j):
+		return to_vector(self.Pw[i - 1, j - 1])
+
+	def getUKnots(self):
+		return unique_knots(self.flat_u)[0]
+
+	def getVKnots(self):
+		return unique_knots(self.flat_v)[0]
+
+	def setPole(self, i, j, pole, weight = None):
+		# 1 based, like FreeCAD. keeps the current weight if none is given
+		if weight is None:
+			weight = self.Pw[i - 1, j - 1, 3]
+		self.Pw[i - 1, j - 1] = [pole[0] * weight, pole[1] * weight, pole[2] * weight, weight]
+
+	def increaseDegree(self, udegree, vdegree):
+		if udegree > self.UDegree:
+			self.Pw, self.flat_u = elevate_degree(self.Pw, self.flat_u, self.UDegree, udegree)
+			self.UDegree = udegree
+		if vdegree > self.VDegree:
+			Pw, self.flat_v = elevate_degree(np.swapaxes(self.Pw, 0, 1), self.flat_v, self.VDegree, vdegree)
+			self.Pw = np.ascontiguousarray(np.swapaxes(Pw, 0, 1))
+			self.VDegree = vdegree
+
+	def insertUKnot(self, u, mult = 1, tol = 0.0):
+		knots, mults = unique_knots(self.flat_u)
+		for i in range(0, len(knots)):
+			if abs(knots[i] - u) <= tol:
+				if i == 0 or i == len(knots) - 1:
+					return
+				u = knots[i]
+				mult = min(mult, self.UDegree - mults[i])
+		for i in range(0, mult):
+			self.Pw, self.flat_u = insert_knot(self.Pw, self.flat_u, self.UDegree, u)
+
+	def insertVKnot(self, v, mult = 1, tol = 0.0):
+		knots, mults = unique_knots(self.flat_v)
+		for i in range(0, len(knots)):
+			if abs(knots[i] - v) <= tol:
+				if i == 0 or i == len(knots) - 1:
+					return
+				v = knots[i]
+				mult = min(mult, self.VDegree - mults[i])
+		Pw = np.swapaxes(self.Pw, 0, 1)
+		for i in range(0, mult):
+			Pw, self.flat_v = insert_knot(Pw, self.flat_v, self.VDegree, v)
+		self.Pw = np.ascontiguousarray(np.swapaxes(Pw, 0, 1))
+
+	def value(self, u, v):
+		Pw_v = evaluate(self.Pw, self.flat_u, self.UDegree, u)
+		return to_vector(evaluate(Pw_v, self.flat_v, self.VDegree, v))
+
+	def toShape(self):
+		return Shape([self])
+
+class LineSegment:
+	def __init__(self, StartPoint = None, EndPoint = None):
+		self.StartPoint = Vector(StartPoint) if StartPoint is not None else Vector(0, 0, 0)
+		self.EndPoint = Vector(EndPoint) if EndPoint is not None else Vector(1, 0, 0)
+
+	def value(self, t):
+		return self.StartPoint + (self.EndPoint - self.StartPoint) * t
+
+	def length(self):
+		return (self.EndPoint - self.StartPoint).Length
+
+	def toShape(self):
+		return Shape([self])
+
+class Point:
+	def __init__(self, point = None):
+		point = Vector(point) if point is not None else Vector()
+		self.X = point.x
+		self.Y = point.y
+		self.Z = point.z
+
+	def toShape(self):
+		return Shape([self])
+
+class Shape:
+	# geometry holder. isSame is identity, as there is no shared topology to compare
+	def __init__(self, geometry = None):
+		self.Geometry = list(geometry) if geometry is not None else []
+
+	def isNull(self):
+		return len(self.Geometry) == 0
+
+	def isSame(self, other):
+		return self is other
+
+	def copy(self):
+		return Shape(self.Geometry)
@@ -0,0 +1,68 @@
+#    standin
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    standin is part of Silk. It holds small pure python (NumPy backed) stand-ins for the parts of
+#    the FreeCAD and Part modules used by the ArachNURBS kernels, so the kernels can be tested and
+#    benchmarked in plain CPython, without a FreeCAD install.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+# usage, before importing ArachNURBS:
+#	import standin
+#	standin.install()
+#	import ArachNURBS as AN
+#
+# install() does nothing when the real FreeCAD can be imported, unless force = True.
+# covered: Base.Vector, Part.BSplineCurve, Part.BSplineSurface, Part.LineSegment, Part.Point, Part.Shape,
+# FreeCAD.Console and the document observer hooks. anything else (sketches, documents, Part.Plane
+# intersections, view providers) needs the real FreeCAD.
+
+import os
+import sys
+
+path = os.path.dirname(os.path.abspath(__file__))
+
+def freecad_available():
+	# True if the real FreeCAD python modules can be imported
+	if 'FreeCAD' in sys.modules:
+		return not is_installed()
+	try:
+		import FreeCAD
+		import Part
+	except ImportError:
+		return False
+	return True
+
+def is_installed():
+	# True if the stand-in modules are the ones imported as FreeCAD and Part
+	module = sys.modules.get('FreeCAD')
+	return module is not None and getattr(module, 'standin', False)
+
+def install(force = False):
+	# put the stand-in FreeCAD and Part modules first on the import path.
+	# returns True if the stand-ins are in use
+	if is_installed():
+		return True
+	if freecad_available() and not force:
+		return False
+	if path not in sys.path:
+		sys.path.insert(0, path)
+	for name in ['FreeCAD', 'Part']:
+		if name in sys.modules:
+			del sys.modules[name]
+	import FreeCAD
+	import Part
+	return True
@@ -0,0 +1,140 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# the G3 blend solvers and their warm start state. runs on the standin modules:
+#	python -m pytest tests
+
+import os
+import sys
+
+silk_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if silk_path not in sys.path:
+	sys.path.append(silk_path)
+
+import standin
+standin.install()
+
+import math
+import random
+from FreeCAD import Base
+import ArachNURBS as AN
+
+tol = 1.0e-5			# the G3 tolerance of blendG3_poly_2x4_1x6
+pole_tol = 1.0e-5		# newton against search, where both converge
+count = 20
+
+def smooth_row(rng, side, half, bend, lift, eps):
+	# a smooth cubic row leaving the origin at half a turn off the y axis, bending back towards it
+	b = bend + rng.uniform(-eps, eps)
+	l = lift + rng.uniform(-eps, eps)
+	poles = []
+	weights = []
+	for i in range(4):
+		r = i * (1.0 + rng.uniform(-eps, eps)) if i else 0.0
+		a = side * (math.pi / 2 + half - b * r * r / 9.0)
+		poles.append(Base.Vector(r * math.sin(a), r * math.cos(a), l * r * r / 9.0))
+		weights.append(1.0 + rng.uniform(-eps, eps) if i else 1.0)
+	return [poles, weights]
+
+def smooth_pair(seed, eps = 0.02):
+	# two perturbed mirror rows meeting at the origin, the first flowing into it, the second out of it.
+	# the turn and bend ranges keep the G3 blend solvable within the inner scale limits.
+	# returns [poles_0, weights_0, poles_1, weights_1]
+	rng = random.Random(seed)
+	half = rng.uniform(0.3, 0.5)
+	bend = rng.uniform(0.25, 0.35)
+	lift = rng.uniform(-0.15, 0.15)
+	poles_0, weights_0 = smooth_row(rng, -1, half, bend, lift, eps)
+	poles_1, weights_1 = smooth_row(rng, 1, half, bend, lift, eps)
+	return [poles_0[::-1], weights_0[::-1], poles_1, weights_1]
+
+def dCds_targets(pair):
+	# dC/ds of both rows at their far ends, the values the blend has to match
+	poles_0, weights_0, poles_1, weights_1 = pair
+	dCds_0 = AN.Cubic_Bezier_dCds(*[[poles_0[i], weights_0[i]] for i in range(4)])
+	dCds_1 = AN.Cubic_Bezier_dCds(*[[poles_1[i], weights_1[i]] for i in [3, 2, 1, 0]])
+	return [dCds_0, dCds_1]
+
+class Document:
+	def __init__(self, Name):
+		self.Name = Name
+
+class Object:
+	def __init__(self, Document, Name):
+		self.Document = Document
+		self.Name = Name
+
+def test_G3_reports_pruned():
+	# the observer drops the warm start state of deleted objects and closed documents
+	observer = AN.kernels.output_observer
+	doc_a = Document('Unnamed')
+	doc_b = Document('Other')
+	report = ['newton', 1, 0.0, True]
+	AN.G3_reports.clear()
+	AN.G3_reports[('Unnamed', 'ControlGrid64_2Grid44')] = report
+	AN.G3_reports[('Unnamed', 'ControlPoly6_FilletBezier')] = report
+	AN.G3_reports[('Other', 'ControlGrid64_2Grid44')] = report
+	observer.slotDeletedObject(Object(doc_a, 'ControlPoly6_FilletBezier'))
+	assert sorted(AN.G3_reports) == [('Other', 'ControlGrid64_2Grid44'), ('Unnamed', 'ControlGrid64_2Grid44')]
+	observer.slotDeletedDocument(doc_a)
+	assert list(AN.G3_reports) == [('Other', 'ControlGrid64_2Grid44')]
+	observer.slotDeletedDocument(doc_b)
+	assert AN.G3_reports == {}
+
+def test_G3_newton_converges():
+	for seed in range(count):
+		pair = smooth_pair(seed)
+		poles, weights, scale_1i, scale_2i, G3_report = AN.blendG3_poly_2x4_1x6(*pair, 1.0, 1.0, 1.0, 1.0, solver = 'newton')
+		solver, iterations, residual, converged = G3_report
+		assert solver == 'newton'
+		assert converged
+		assert len(poles) == 6 and len(weights) == 6
+		assert 0.75 <= scale_1i <= 3.0 and 0.75 <= scale_2i <= 3.0
+		dCds_0, dCds_1 = dCds_targets(pair)
+		assert residual <= tol * (1 + max(math.fabs(dCds_0), math.fabs(dCds_1)))
+		# the report agrees with the blend it returned
+		r = AN.G3_residuals(poles, weights, dCds_0, dCds_1)
+		assert math.fabs(r[0]) <= tol * (1 + math.fabs(dCds_0))
+		assert math.fabs(r[1]) <= tol * (1 + math.fabs(dCds_1))
+
+def test_G3_newton_matches_search():
+	both = 0
+	for seed in range(count):
+		pair = smooth_pair(seed)
+		newton = AN.blendG3_poly_2x4_1x6(*pair, 1.0, 1.0, 1.0, 1.0, solver = 'newton')
+		search = AN.blendG3_poly_2x4_1x6(*pair, 1.0, 1.0, 1.0, 1.0, solver = 'search')
+		assert search[4][0] == 'search'
+		if newton[4][3] and search[4][3]:
+			both = both + 1
+			for p_newton, p_search in zip(newton[0], search[0]):
+				assert (p_newton - p_search).Length <= pole_tol
+			for w_newton, w_search in zip(newton[1], search[1]):
+				assert math.fabs(w_newton - w_search) <= pole_tol
+	assert both > count // 2
+
+def test_G3_warm_start():
+	for seed in range(count):
+		pair = smooth_pair(seed)
+		cold = AN.blendG3_poly_2x4_1x6(*pair, 1.0, 1.0, 1.0, 1.0, solver = 'newton')
+		warm = AN.blendG3_poly_2x4_1x6(*pair, 1.0, cold[2], cold[3], 1.0, solver = 'newton', warm_start = True)
+		assert warm[4][3]
+		assert warm[4][1] <= cold[4][1]
+		for p_warm, p_cold in zip(warm[0], cold[0]):
+			assert (p_warm - p_cold).Length <= pole_tol
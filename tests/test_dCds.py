@@ -0,0 +1,108 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# the closed form dC/ds against the converged segmentation reference, and the legacy segmentation fallback
+# (dCds_method = 'segment'), over seeded random non rational and rational curves. runs on the standin modules:
+#	python -m pytest tests
+
+import os
+import sys
+import random
+
+import pytest
+
+silk_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if silk_path not in sys.path:
+	sys.path.append(silk_path)
+
+import standin
+standin.install()
+
+from FreeCAD import Base
+import ArachNURBS as AN
+
+# agreement of the closed form with the converged segmentation reference: relative, with an absolute floor for
+# curves where dC/ds is near zero. Cubic_Bezier_dCds_richardson extrapolates difference quotients and stops where
+# round off takes over, which is about 1e-6 relative, or 1e-10 absolute on these curves (poles ~3 units apart)
+rel_tol = 1.0e-5
+abs_tol = 1.0e-9
+curves = 50
+# the legacy fallback (dCds_method = 'segment') stops at 1% between successive first order difference quotients,
+# on non rational curves it lands within about 11% of the closed form
+legacy_rel_tol = 0.15
+
+def random_poles(rng, nPoles, rational):
+	# a curve running along x, with random y and z offsets and (optionally) random weights. [[pole, weight],...]
+	poles = []
+	for i in range(0, nPoles):
+		pole = Base.Vector(3.0 * i, rng.uniform(-1.0, 1.0) * (i > 0), rng.uniform(-1.0, 1.0) * (i > 1))
+		weight = rng.uniform(0.7, 1.3) if rational else 1.0
+		poles.append([pole, weight])
+	return poles
+
+def check(nPoles, analytic, segment, rational, rel_tol = rel_tol):
+	rng = random.Random(nPoles * 10 + rational)
+	for k in range(0, curves):
+		poles = random_poles(rng, nPoles, rational)
+		a = analytic(*poles)
+		b = segment(*poles)
+		assert isinstance(b, float)
+		assert abs(a - b) <= rel_tol * abs(a) + abs_tol, "curve %d: analytic %r, segment %r" % (k, a, b)
+
+def Cubic_6P_dCds_analytic(*poles):
+	return AN.Cubic_6P_curvature_dCds(list(poles), 'start')[1]
+
+def Cubic_6P_dCds_richardson(*poles):
+	# the first knot span of the 6P as a bezier, as in Cubic_6P_dCds_segment
+	Curve = AN.NURBS_Cubic_6P_curve(list(poles))
+	Curve.segment(0, .25)
+	Poles = Curve.getPoles()
+	Weights = Curve.getWeights()
+	return AN.Cubic_Bezier_dCds_richardson(*[[Poles[i], Weights[i]] for i in range(4)])
+
+def test_Bezier_dCds_non_rational():
+	check(4, AN.Cubic_Bezier_dCds_analytic, AN.Cubic_Bezier_dCds_richardson, False)
+
+def test_Bezier_dCds_rational():
+	check(4, AN.Cubic_Bezier_dCds_analytic, AN.Cubic_Bezier_dCds_richardson, True)
+
+def test_6P_dCds_non_rational():
+	check(6, Cubic_6P_dCds_analytic, Cubic_6P_dCds_richardson, False)
+
+def test_6P_dCds_rational():
+	check(6, Cubic_6P_dCds_analytic, Cubic_6P_dCds_richardson, True)
+
+def test_legacy_segment_non_rational():
+	check(4, AN.Cubic_Bezier_dCds_analytic, AN.Cubic_Bezier_dCds_segment, False, legacy_rel_tol)
+	check(6, Cubic_6P_dCds_analytic, AN.Cubic_6P_dCds_segment, False, legacy_rel_tol)
+
+def test_legacy_segment_collapse():
+	# the legacy fallback measures non rational curvature. on this rational curve the first segment already moves
+	# the start curvature, and it raises instead of returning a non numeric value
+	poles = [[Base.Vector(0.0, 0.0, 0.0), 1.0], [Base.Vector(3.0, 1.0, 0.0), 2.0],
+			[Base.Vector(6.0, 0.0, 0.0), 1.0], [Base.Vector(9.0, 1.0, 0.0), 1.0]]
+	with pytest.raises(ValueError):
+		AN.Cubic_Bezier_dCds_segment(*poles)
+
+def test_straight_line():
+	poles = [[Base.Vector(float(i), 0.0, 0.0), 1.0] for i in range(0, 4)]
+	assert AN.Cubic_Bezier_dCds_segment(*poles) == 0.0
+	assert AN.Cubic_Bezier_dCds_richardson(*poles) == 0.0
+	assert AN.Cubic_Bezier_dCds_analytic(*poles) == 0.0
@@ -0,0 +1,180 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# nstar_grid and nstar_legs against the Star building steps of ControlGridNStar66_NSub before they were
+# vectorized: one SubGrid (pair, triple) at a time, on [[Base.Vector, weight],...] lists. runs on the standin modules:
+#	python -m pytest tests
+# the plane projections of the Diag4 steps are done with Base.Vector.projectToPlane instead of Part.Plane,
+# the same orthogonal projection.
+
+import os
+import sys
+
+silk_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if silk_path not in sys.path:
+	sys.path.append(silk_path)
+
+import standin
+standin.install()
+
+import numpy as np
+from FreeCAD import Base
+import ArachNURBS as AN
+from benchmarks import inputs
+
+tol = 1.0e-12
+
+def getL1Scale(p0, p1, p2):
+	L1_scale = (((p1 - p0).normalize()).dot(p2-p1)) / ((p1 - p0).Length)
+	return L1_scale
+
+def plane_projection(p, p0, p1, p2):
+	# projection of p to the plane through p0, p1, p2
+	return Base.Vector(p).projectToPlane(p0, (p1 - p0).cross(p2 - p0))
+
+def StarRow2_2Sub(S, Legs, Sub_0_i, Sub_1_i):
+	L1Scale_Sub0_v = getL1Scale(S[Sub_0_i][2][0], S[Sub_0_i][8][0], S[Sub_0_i][14][0])
+	L1Scale_Sub1_u = getL1Scale(S[Sub_1_i][12][0], S[Sub_1_i][13][0], S[Sub_1_i][14][0])
+	L1Scale_Mid = 0.5 * (L1Scale_Sub0_v + L1Scale_Sub1_u)
+	Mid_p2 = S[Sub_0_i][17][0] + L1Scale_Mid * (S[Sub_0_i][11][0]-S[Sub_0_i][5][0])
+
+	S[Sub_0_i][17][0] = Mid_p2
+	S[Sub_1_i][32][0] = Mid_p2
+	S[Sub_0_i][16][0] = S[Sub_0_i][16][0] + L1Scale_Mid * (S[Sub_0_i][10][0]-S[Sub_0_i][4][0])
+	S[Sub_1_i][26][0] = S[Sub_1_i][26][0] + L1Scale_Mid * (S[Sub_1_i][25][0]-S[Sub_1_i][24][0])
+
+	L1Scale_15 = 0.5 * (L1Scale_Sub0_v + L1Scale_Mid)
+	L1Scale_20 = 0.5 * (L1Scale_Sub1_u + L1Scale_Mid)
+	S[Sub_0_i][15][0] = S[Sub_0_i][15][0] + L1Scale_15 * (S[Sub_0_i][9][0]-S[Sub_0_i][3][0])
+	S[Sub_1_i][20][0] = S[Sub_1_i][20][0] + L1Scale_20 * (S[Sub_1_i][19][0]-S[Sub_1_i][18][0])
+
+	for i in [[9,15],[10,16],[11,17],[14,15],[15,16],[16,17]]:
+		Legs.append([S[Sub_0_i][i[0]][0], S[Sub_0_i][i[1]][0]])
+	for i in [[14,20],[19,20],[20,26],[25,26],[26,32]]:
+		Legs.append([S[Sub_1_i][i[0]][0], S[Sub_1_i][i[1]][0]])
+
+def StarDiag3_Sub(S, Legs, Sub_i):
+	S[Sub_i][21][0] = S[Sub_i][20][0] + S[Sub_i][15][0] - S[Sub_i][14][0]
+	Legs.append([S[Sub_i][15][0], S[Sub_i][21][0]])
+	Legs.append([S[Sub_i][20][0], S[Sub_i][21][0]])
+
+def StarRow3_2Sub(S, Legs, Sub_0_i, Sub_1_i):
+	Mid_p2 = S[Sub_0_i][17][0] + 0.5 * (S[Sub_0_i][21][0]-S[Sub_0_i][15][0]+S[Sub_1_i][21][0]-S[Sub_1_i][20][0])
+	S[Sub_0_i][23][0] = Mid_p2
+	S[Sub_1_i][33][0] = Mid_p2
+	S[Sub_0_i][22][0] = S[Sub_0_i][16][0] + 0.5 * (S[Sub_0_i][21][0]-S[Sub_0_i][15][0]+S[Sub_0_i][23][0]-S[Sub_0_i][17][0])
+	S[Sub_1_i][27][0] = S[Sub_1_i][26][0] + 0.5 * (S[Sub_1_i][21][0]-S[Sub_1_i][20][0]+S[Sub_1_i][33][0]-S[Sub_1_i][32][0])
+
+	for i in [[16,22],[17,23],[21,22],[22,23]]:
+		Legs.append([S[Sub_0_i][i[0]][0], S[Sub_0_i][i[1]][0]])
+	for i in [[21,27],[26,27],[27,33]]:
+		Legs.append([S[Sub_1_i][i[0]][0], S[Sub_1_i][i[1]][0]])
+
+def StarDiag4_3Sub(S, Legs, N, Sub_prev_i, Sub_i, Sub_next_i):
+	u_28_i = S[Sub_i][22][0] - S[Sub_i][21][0]
+	v_28_i = S[Sub_i][27][0] - S[Sub_i][21][0]
+	u_28_prev_i = S[Sub_prev_i][27][0] - S[Sub_prev_i][21][0]
+	v_28_next_i = S[Sub_next_i][22][0] - S[Sub_next_i][21][0]
+
+	scaled_u_28_i = u_28_i * ( 1 +  ( u_28_prev_i.Length - u_28_i.Length ) / ( 3.0 * u_28_i.Length ) )
+	scaled_v_28_i = v_28_i * ( 1 +  ( v_28_next_i.Length - v_28_i.Length ) / ( 3.0 * v_28_i.Length ) )
+	Sub_28_raw = S[Sub_i][21][0] + scaled_u_28_i +scaled_v_28_i
+
+	scale = AN.star_diag4_scale.get(N, 1.0)
+	Sub_28_scaled = S[Sub_i][21][0] + scale * (Sub_28_raw - S[Sub_i][21][0])
+
+	Sub_28_prev_proj = plane_projection(Sub_28_scaled, S[Sub_i][33][0], S[Sub_i][23][0], S[Sub_prev_i][33][0])
+	Sub_28_next_proj = plane_projection(Sub_28_scaled, S[Sub_i][33][0], S[Sub_i][23][0], S[Sub_next_i][23][0])
+	S[Sub_i][28][0] = 0.5 * Sub_28_scaled + 0.25 * (Sub_28_prev_proj + Sub_28_next_proj)
+
+	Legs.append([S[Sub_i][22][0], S[Sub_i][28][0]])
+	Legs.append([S[Sub_i][27][0], S[Sub_i][28][0]])
+
+def StarDiag4_squish(S, N):
+	SquishCenter = Base.Vector(0,0,0)
+	for i in range(N):
+		SquishCenter = SquishCenter + S[i][28][0]
+	SquishCenter = (1.0 / N) * SquishCenter
+	cross_total = Base.Vector(0,0,0)
+	for i in range(N):
+		cross_total = cross_total + (S[i][28][0]-SquishCenter).cross(S[(i+1) % N][28][0]-SquishCenter)
+	for i in range(N):
+		S[i][28][0] = Base.Vector(S[i][28][0]).projectToPlane(SquishCenter, cross_total)
+
+def StarRow4_2Sub(S, Legs, Sub_0_i, Sub_1_i):
+	Mid_p4 = 0.5 * (S[Sub_0_i][28][0] + S[Sub_1_i][28][0])
+	S[Sub_0_i][29][0] = Mid_p4
+	S[Sub_1_i][34][0] = Mid_p4
+	Legs.append([S[Sub_0_i][23][0], S[Sub_0_i][29][0]])
+	Legs.append([S[Sub_0_i][28][0], S[Sub_0_i][29][0]])
+	Legs.append([S[Sub_1_i][28][0], S[Sub_1_i][34][0]])
+
+def StarCenter(S, Legs, N):
+	StarCenter = Base.Vector(0,0,0)
+	for i in range(N):
+		StarCenter = StarCenter + S[i][29][0]
+	StarCenter = (1.0 / N) * StarCenter
+	for i in range(N):
+		S[i][35][0] = StarCenter
+	for i in range(N):
+		Legs.append([S[i][29][0], S[i][35][0]])
+
+def star_scalar(SubGrids, squish):
+	# the Star building steps in execute order. returns [StarGrid, Legs as [start, end]]
+	N = len(SubGrids)
+	S = [[[Base.Vector(p), w] for p, w in zip(Poles, Weights)] for Poles, Weights in SubGrids]
+	Legs = []
+	for i in range(N):
+		StarRow2_2Sub(S, Legs, i, (i + 1) % N)
+	for i in range(N):
+		StarDiag3_Sub(S, Legs, i)
+	for i in range(N):
+		StarRow3_2Sub(S, Legs, i, (i + 1) % N)
+	for i in range(N):
+		StarDiag4_3Sub(S, Legs, N, i, (i + 1) % N, (i + 2) % N)
+	if squish:
+		StarDiag4_squish(S, N)
+	for i in range(N):
+		StarRow4_2Sub(S, Legs, i, (i + 1) % N)
+	StarCenter(S, Legs, N)
+	return [S, Legs]
+
+def check(N, squish):
+	SubGrids = inputs.star_subgrids(inputs.make_rng(N), N)
+	S, Legs = star_scalar(SubGrids, squish)
+	G = AN.nstar_grid(AN.star_array(SubGrids), squish)
+	G_scalar = np.array([[[p[0].x, p[0].y, p[0].z, p[1]] for p in SubGrid] for SubGrid in S])
+	assert G.shape == (N, 36, 4)
+	assert np.abs(G - G_scalar).max() <= tol
+	Legs_array = AN.nstar_legs(G)
+	assert len(Legs_array) == len(Legs)
+	if not squish:
+		# with squish, the scalar route drew the Diag4 legs before the squish moved pole 28
+		for leg, leg_scalar in zip(Legs_array, Legs):
+			assert (leg.StartPoint - leg_scalar[0]).Length <= tol
+			assert (leg.EndPoint - leg_scalar[1]).Length <= tol
+
+def test_nstar_grid():
+	for N in range(3, 9):
+		check(N, False)
+
+def test_nstar_grid_squish():
+	for N in range(3, 9):
+		check(N, True)
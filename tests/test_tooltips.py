@@ -0,0 +1,45 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2024
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# every command of the SilkCommands manifest has its tooltip in tooltips.py, which imports on its own.
+# SilkCommands imports FreeCAD.Gui, so the manifest is read from its source instead of imported:
+#	python -m pytest tests
+
+import os
+import sys
+import ast
+
+silk_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if silk_path not in sys.path:
+	sys.path.append(silk_path)
+
+import tooltips
+
+def manifest():
+	with open(os.path.join(silk_path, 'SilkCommands.py')) as f:
+		tree = ast.parse(f.read())
+	for node in tree.body:
+		if isinstance(node, ast.Assign) and [target.id for target in node.targets] == ['manifest']:
+			return ast.literal_eval(node.value)
+	raise AssertionError("SilkCommands.py has no manifest")
+
+def test_manifest_tooltips():
+	for name, module_name, icon, key in manifest():
+		assert isinstance(getattr(tooltips, key, None), str), "%s: no tooltips.%s" % (name, key)
@@ -840,4 +840,131 @@ _moreInfo = (
     "\n"
     
     )
-'''
\ No newline at end of file
+'''
+
+# tooltips of the commands that do not follow the baseTip / moreInfo pattern. they live here, with the others,
+# so the workbench can register every command from the SilkCommands manifest without importing it
+
+ControlGrid64_toolTip = (
+	"Create a ControlGrid64 from two ControlPoly4 and two ControlPoly6 matching on opposite edges. \n"
+	"Select each edge in sequence (4,6,4,6), counter clock-wise looking from the outer side. \n"
+	"\n"
+	"Use to create mixed degree contour surfaces \n"
+	"\n"
+	"Input for: \n"
+	"-CubicSurface_64"
+	"\n"
+	"MORE INFO. Typically, these types of grids (64) are created automatically by other tools. Manually \n"
+	"creating this type of grid (and associated surface) directly from polys has limitations, because they \n"
+	"cannot be segmented (yet). They cannot be blended either (yet). They are still compatible with all tools \n"
+	"which take a ControlGrid64 as input, even though those tools assume that the grids were generated \n"
+	"automatically.\n"
+	"\n"
+	"When segmentation does become available, it will be like so: the grid/surface will be cut into three \n"
+	"ControlGrid44s at preset locations. This is an exact conversion with no loss of precision. These three \n"
+	"pieces will then be workable through all the tools available for ControlGrid44s and CubicSurface_44 \n"
+	)
+
+CubicSurface_64_toolTip = (
+	"Creates CubicSurface_64 from a ControlGrid64 of any type. \n"
+	"Select one ControlGrid64 object. \n"
+	"\n"
+	"Used for mixing four point and 6 point polys/edges, or blending edges of four point contours \n"
+	"Can produce blends along edges of CubicSurface_44 objects. The edges touching the blended \n"
+	"objects are four pointed. The edges reaching from one blended object to the other are 6 pointed"
+	"\n"
+	"This is still a cubic grid/surface along both directions, but now one direction is Bezier (4 point), \n"
+	"WHile the other is not Bezier (6 points).The price paid for these extra control points is that \n"
+	"this surface is only garanteed G2 internally along the 6 points (may be G3 under the right setup) \n"
+	"The surface is still Bezier and G3 along the 4 points direction \n"
+	)
+
+ControlGrid64_2Grid44_toolTip = 'Create a ControlGrid64_2Grid44 from two ControlGrid_44 that share a corner. \n Select two grids that share an edge. \n \n • Use to blend the edge of two surfaces segmented with ControlGrid44_EdgeSegment \n • Input for CubicSurface_64 '
+
+ControlGrid64_3_1Grid44_toolTip = (
+	"Select a ControlGrid44 by one of it's corner points in the 3D view, \n"
+	"and apply the function \n"
+	"\n"
+	'This results in a "triangle" grid that "flows" to eliminate the selected corner. \n'
+	"Typical use is to round a corner in a set of surfaces segmented from a larger surface. \n"
+	"the two edges that remain from the original grid are of type poly4, and the new curved \n"
+	"edge is of type poly6. There is a fully collapsed poly6 edge hidden where the two \n"
+	"edges of the original grid meet \n"
+	"\n"
+	"This grid is not intended to produce a final surface, but it is instrumental as a \n"
+	"stepping stone: we will build off of the new curved edge, produce a high quality \n"
+	'surface there, and eventually replace this "triangle" with a higher quality surface \n'
+	"\n"
+	"Input for: \n"
+	"-CubicSurface_64 (temporary and cheap visualization) \n"
+	"-SubGrid33_2Grid64 (the next step towards a high quality surface along the curved \n"
+	"edge of the triangle)"
+	)
+
+ControlGrid64_normal_toolTip = "ControlGrid64_normal"
+
+ControlGrid64_Surf44_toolTip = "work in progress"
+
+SubGrid33_2Grid64_toolTip = (
+	"\n Select two ControlGrid_64 objects meeting at a corner to generate a corner blend partial grid.\n"
+	"(this is a first step in order to fill a four sided hole where four blend grids/surfaces meet) \n"
+	"\n"
+	"This is intended for the case where the two ControlGrid_64 objects are blend grids which have \n"
+	"segments of one common surface as inputs. The two blends 'extend' the common surface, and this \n"
+	"partial grid will effectively 'extend' the common surface into the corner gap"
+	"\n"
+
+	"Input for: \n"
+	"-ControlGrid66_4Sub \n"
+	"\n"
+	"MORE INFO \n"
+	"When blending surfaces across perpendicular edges, you end up with a gap/hole at the corner, because \n"
+	"you have to 'set back' both blends so they don't overlap each other. This object is a partial grid \n"
+	"that extends both input ControlGrid_64s 'into' the gap, beginning the process of filling this gap/hole \n"
+	"between the blends. After making four of these objects, one in each corner of the hole, use \n"
+	"ControlGrid66_4Sub to create the whole grid. The surface made from this grid (using CubicSurface_66), \n"
+	"will then bridge across all four blends, giving good continuity to the orignal surfaces \n"
+	)
+
+ControlGrid66_4Sub_toolTip = (
+	"Select 4 related SubGrid33_2Grid64 objects in a CC loop to form a ControlGrid66_4Sub object. \n"
+	"Read SubGrid33_2Grid64 descrition first.\n"
+	"\n"
+	"Fills four sided holes between blends (only four sided holes). Fairly high quality final surface. \n"
+	"Other tools deal with 3, 5, 6, 7...sided holes but produce lower quality results. \n"
+	"\n"
+	"Input for: \n"
+	"-CubicSurface_66 \n"
+	"\n"
+	"MORE INFO \n"
+	"When blending surfaces across perpendicular edges, you end up with a gap/hole at the corner, because \n"
+	"you have to 'set back' both blends so they don't overlap each other. This object joins the SubGrid33 \n"
+	"partial grids that extend both input ControlGrid_64s 'into' the gap, creating a single grid. The  \n"
+	"surface made from this grid (using CubicSurface_66),will then bridge across all four blends, giving \n"
+	"good continuity to the original surfaces \n"
+	"\n"
+	"Proven use cases (with reasonably high quality results): \n"
+	"\n"
+	"-four surfaces that share a single corner, and have edges matched bewtween then in pairs (2X2 'square' \n"
+	"setup of 4 surfaces). Segment and setback the shared edges, blend them, make corner SubGrids and join \n"
+	"them using this tool this to fill the hole where the shared corner was. Now you have smooth transitions \n"
+	"across the four original faces\n"
+	"\n"
+	"-three surfaces meeting to form a hard corner (like a cube corner). Here more sectioning of the original \n"
+	"surfaces is required. You end up with 2 small blends, and one larger blend. use ControlGrid64_3_1Grid44 \n"
+	"opposite the large blend to create the fourth blend.  Now you have 4 blends across 3 surfaces, and can \n"
+	"make the 4 SubGrids. The new grid/surface will produce a 'rolling fillet' corner between the  two small\n"
+	"blends and the large blend.\n"
+	)
+
+SubGrid63_2Surf64_toolTip = 'Create a SubGrid63 subgrid from two CubicSurface64 surfaces. \n Select two CubicSurface64 objects that share a corner. \n \n • Input for ControlGridNStar66 to blend three or more \n   blended edges meeting at a corner '
+
+ControlGridNStar66_toolTip = 'Creates a ControlGridNStar66 from three or more SubGrid63_2Surf64. \n Select from three to six SubGrid63_2Surf64 sequentially, counter clock-wise \n looking from the outer side. \n \n • Use to create ControlGridNStar66 to blend a corner where three or more \n   CubicSurface_64 meet at a corner \n • Input for CubicNStarSurface66 '
+
+CubicNStarSurface_NStar66_toolTip = 'Creates a CubicNStar_66 from ControlGridNStar66. \n Select one ControlGridNStar66. \n    \n • Used for filling the corner of blended Silk surfaces'
+
+StarTrim_CubicNStar_toolTip = 'Create a StarTrim_CubicNStar object from a CubicNStarSurface_NStar66 object. \n Select one CubicNStarSurface_NStar66. \n \n • Useful for eliminating pinch in poor corner geometry, and can be patched with \n   a standard Filling Surface'
+
+Reload_Silk_toolTip = ' reload the Silk workbench (actually just the core library) \n without exiting FreeCAD \n if you have made code changes'
+
+Silk_Profile_toolTip = ' profile the execute of every Silk object \n first use turns profiling on, next uses show the report \n (time, calls, and OCC calls per class and per object, CSV export)'